@@ -142,6 +142,22 @@ except ImportError:
         # Last resort: set to None (should not happen with frontend/repositories/)
         get_job_repository = None
 
+# Import typeahead search prefixes (same local-then-src lookup as the repository)
+try:
+    from repositories.search_prefixes import JOB_SEARCH_FIELDS, SEARCH_PREFIX_FIELD, query_prefixes, search_prefixes
+except ImportError:
+    try:
+        from src.common.search_prefixes import JOB_SEARCH_FIELDS, SEARCH_PREFIX_FIELD, query_prefixes, search_prefixes
+    except ImportError:
+        # Fallback: no prefixes, free-text search uses $regex
+        JOB_SEARCH_FIELDS = ()
+        SEARCH_PREFIX_FIELD = "search_prefixes"
+
+        def query_prefixes(query_text: str) -> list:
+            return []
+
+        search_prefixes = None
+
 # Session configuration
 flask_secret_key = os.getenv("FLASK_SECRET_KEY")
 
@@ -421,6 +437,9 @@ def serialize_job(job: Dict[str, Any]) -> Dict[str, Any]:
     """
     result = {}
     for key, value in job.items():
+        if key == SEARCH_PREFIX_FIELD:
+            # Index-only field, not part of the job
+            continue
         if key == "_id":
             result["_id"] = str(value)
         elif isinstance(value, datetime):
@@ -696,6 +715,21 @@ def parse_datetime_filter(dt_str: str, is_end_of_day: bool = False) -> Optional[
         return None
 
 
+def _created_at_range(date_from: Optional[datetime], date_to: Optional[datetime]) -> Dict[str, Any]:
+    """
+    Build a createdAt range condition from parsed filter bounds.
+
+    Returns:
+        {"$gte": ..., "$lte": ...} with only the bounds given, or {} for no filter
+    """
+    date_match: Dict[str, Any] = {}
+    if date_from:
+        date_match["$gte"] = date_from
+    if date_to:
+        date_match["$lte"] = date_to
+    return date_match
+
+
 def sanitize_for_path(text: str) -> str:
     """
     Sanitize text for use in filesystem paths and HTTP headers.
@@ -781,7 +815,7 @@ def list_jobs():
     page = max(1, int(request.args.get("page", 1)))
     page_size = int(request.args.get("page_size", 100))
 
-    # Date range filters (MongoDB stores dates as ISO strings)
+    # Date range filters (createdAt is stored as a BSON Date)
     date_from = request.args.get("date_from", "").strip()
     date_to = request.args.get("date_to", "").strip()
 
@@ -815,9 +849,13 @@ def list_jobs():
     mongo_query: Dict[str, Any] = {}
     and_conditions = []
 
-    # Free-text search
-    if search_query:
-        # Search across multiple fields
+    # Free-text search: each query word must prefix a word of title/company/location/jobId,
+    # an index lookup on search_prefixes. Queries with no usable word (e.g. one character)
+    # fall back to a regex scan across the fields.
+    prefixes = query_prefixes(search_query) if search_query else []
+    if prefixes:
+        and_conditions.append({SEARCH_PREFIX_FIELD: {"$all": prefixes}})
+    elif search_query:
         search_or = [
             {"title": {"$regex": search_query, "$options": "i"}},
             {"company": {"$regex": search_query, "$options": "i"}},
@@ -834,9 +872,8 @@ def list_jobs():
     effective_from = datetime_from if datetime_from else date_from
     effective_to = datetime_to if datetime_to else date_to
 
-    # GAP-007 Fix: Handle mixed types (strings from n8n, Date objects from other sources)
-    # We parse the filter values to datetime objects and will use aggregation with $toDate
-    # to normalize the MongoDB field before comparison.
+    # createdAt is always a BSON Date (scripts/migrations/normalize_created_at.py),
+    # so the filter is a plain range on the createdAt index.
     # Uses the module-level parse_datetime_filter() helper function.
     date_filter_from: Optional[datetime] = None
     date_filter_to: Optional[datetime] = None
@@ -845,6 +882,9 @@ def list_jobs():
         date_filter_from = parse_datetime_filter(effective_from, is_end_of_day=False)
     if effective_to:
         date_filter_to = parse_datetime_filter(effective_to, is_end_of_day=True)
+    date_match = _created_at_range(date_filter_from, date_filter_to)
+    if date_match:
+        and_conditions.append({"createdAt": date_match})
 
     # Location filter (multi-select)
     if locations:
@@ -925,49 +965,27 @@ def list_jobs():
         "ai_categories": 1,  # AI category list for badge tooltip
     }
 
-    # GAP-007: Use aggregation pipeline for date filtering to handle mixed types
-    # MongoDB $toDate normalizes both ISO strings AND Date objects to Date objects
-    # This allows hour-level granularity regardless of how createdAt was stored
-    has_date_filter = date_filter_from is not None or date_filter_to is not None
-
     # Performance: when applied_only is active, skip expensive computed sort fields
     # (location priority, seniority rank). Applied view just needs recency sort.
     # This avoids 50+ regex evaluations per doc that can timeout on Vercel (10s limit).
     if applied_only:
         use_default_sort = False
 
-    # Use aggregation for date filtering OR for default multi-criteria sorting OR for leadership/AI filter
-    use_aggregation = has_date_filter or use_default_sort or leadership_only or ai_only
+    # Use aggregation for default multi-criteria sorting OR for leadership/AI filter
+    # (date filters are part of mongo_query and work with plain find())
+    use_aggregation = use_default_sort or leadership_only or ai_only
 
     if use_aggregation:
         # Build aggregation pipeline
         pipeline: List[Dict[str, Any]] = []
 
-        # Stage 1: Initial match (non-date filters) - use index if available
+        # Stage 1: Initial match (including the createdAt range) - use index if available
+        # This narrows the working set early so regex-heavy $addFields runs on fewer docs
         if mongo_query:
             pipeline.append({"$match": mongo_query})
 
-        # Stage 2: Date normalization + date filter (BEFORE expensive computed fields)
-        # This narrows the working set early so regex-heavy $addFields runs on fewer docs
-        if has_date_filter:
-            pipeline.append({"$addFields": {
-                "_normalizedDate": {
-                    "$cond": {
-                        "if": {"$eq": [{"$type": "$createdAt"}, "string"]},
-                        "then": {"$toDate": "$createdAt"},
-                        "else": "$createdAt"  # Already a Date object
-                    }
-                }
-            }})
-            date_match: Dict[str, Any] = {}
-            if date_filter_from:
-                date_match["$gte"] = date_filter_from
-            if date_filter_to:
-                date_match["$lte"] = date_filter_to
-            pipeline.append({"$match": {"_normalizedDate": date_match}})
-
-        # Stage 3: Expensive computed fields for sorting/filtering
-        # Runs AFTER date filter so only the narrowed set gets ~50 regex evaluations per doc
+        # Stage 2: Expensive computed fields for sorting/filtering
+        # Runs AFTER the match so only the narrowed set gets ~50 regex evaluations per doc
         add_fields: Dict[str, Any] = {}
 
         # Add AI job sort field: 0 = AI job (first), 1 = non-AI job
@@ -1908,6 +1926,11 @@ def update_job(job_id: str):
     if not update_data:
         return jsonify({"error": "No valid fields to update"}), 400
 
+    # Keep typeahead prefixes in step with edited title/company/location
+    if search_prefixes is not None and any(field in update_data for field in JOB_SEARCH_FIELDS):
+        current = repo.find_one({"_id": object_id}, {field: 1 for field in JOB_SEARCH_FIELDS}) or {}
+        update_data[SEARCH_PREFIX_FIELD] = search_prefixes({**current, **update_data})
+
     # Add updated_at timestamp
     update_data["updatedAt"] = datetime.utcnow()
 
@@ -2009,42 +2032,24 @@ def get_locations():
         date_filter_to = parse_datetime_filter(datetime_to, is_end_of_day=True)
         logger.debug(f"Locations API: datetime_to={datetime_to} -> {date_filter_to}")
 
-    has_date_filter = date_filter_from is not None or date_filter_to is not None
-
     # Build aggregation pipeline
     pipeline: List[Dict[str, Any]] = []
 
-    # Stage 1: Basic location filter - only jobs with non-empty location
-    pipeline.append({"$match": {"location": {"$exists": True, "$ne": None, "$ne": ""}}})
-
-    # Stage 2: Normalize createdAt to Date type (if date filtering is needed)
-    # This handles mixed types: ISO strings from n8n vs Date objects from other sources
-    if has_date_filter:
-        pipeline.append({"$addFields": {
-            "_normalizedDate": {
-                "$cond": {
-                    "if": {"$eq": [{"$type": "$createdAt"}, "string"]},
-                    "then": {"$toDate": "$createdAt"},
-                    "else": "$createdAt"  # Already a Date object
-                }
-            }
-        }})
-
-        # Stage 3: Filter by date range
-        date_match: Dict[str, Any] = {}
-        if date_filter_from:
-            date_match["$gte"] = date_filter_from
-        if date_filter_to:
-            date_match["$lte"] = date_filter_to
-        pipeline.append({"$match": {"_normalizedDate": date_match}})
+    # Stage 1: Jobs with non-empty location, in the date range if one is given
+    # (createdAt is always a Date, so the range uses the createdAt index)
+    location_match: Dict[str, Any] = {"location": {"$exists": True, "$ne": None, "$ne": ""}}
+    date_match = _created_at_range(date_filter_from, date_filter_to)
+    if date_match:
+        location_match["createdAt"] = date_match
+    pipeline.append({"$match": location_match})
 
-    # Stage 4: Group by location and count
+    # Stage 2: Group by location and count
     pipeline.append({"$group": {"_id": "$location", "count": {"$sum": 1}}})
 
-    # Stage 5: Sort by count descending
+    # Stage 3: Sort by count descending
     pipeline.append({"$sort": {"count": -1}})
 
-    # Stage 6: Project final output format
+    # Stage 4: Project final output format
     pipeline.append({"$project": {"location": "$_id", "count": 1, "_id": 0}})
 
     locations = list(repo.aggregate(pipeline))
@@ -3046,7 +3051,12 @@ def mobile_jobs():
             except Exception:
                 pass  # Invalid cursor, ignore
 
-        # Build initial query from conditions (status filter only, not date)
+        # Date filter (main mode with time filter): createdAt is always a Date,
+        # so this is an indexed range alongside the status filter
+        if date_cutoff:
+            and_conditions.append({"createdAt": {"$gte": date_cutoff}})
+
+        # Build initial query from conditions
         if len(and_conditions) == 1:
             query = and_conditions[0]
         else:
@@ -3055,24 +3065,6 @@ def mobile_jobs():
         # Build aggregation pipeline
         pipeline = [{"$match": query}]
 
-        # GAP-007 Fix: Normalize createdAt to handle mixed types (strings from n8n, Date objects from other sources)
-        # This must happen BEFORE date filtering
-        pipeline.append({
-            "$addFields": {
-                "_normalizedDate": {
-                    "$cond": {
-                        "if": {"$eq": [{"$type": "$createdAt"}, "string"]},
-                        "then": {"$toDate": "$createdAt"},
-                        "else": "$createdAt"
-                    }
-                }
-            }
-        })
-
-        # Apply date filter on normalized field (if main mode with time filter)
-        if date_cutoff:
-            pipeline.append({"$match": {"_normalizedDate": {"$gte": date_cutoff}}})
-
         # Add computed fields for sorting (location and seniority priority)
         pipeline.append({
             "$addFields": {
@@ -3800,6 +3792,17 @@ def get_diagnostics_data():
                         "error": str(e)[:100],
                         "role": "standby"
                     }
+            # Per-stage work-item queue telemetry (best-effort)
+            try:
+                metrics_response = requests.get(
+                    f"{runner_url}/api/metrics/work-items",
+                    headers={"Authorization": f"Bearer {runner_secret}"},
+                    timeout=5,
+                )
+                if metrics_response.status_code == 200:
+                    data["work_item_stages"] = metrics_response.json().get("stages", [])
+            except requests.exceptions.RequestException:
+                data["work_item_stages"] = None
             return render_template(
                 "partials/diagnostics_data.html",
                 diagnostics=data,
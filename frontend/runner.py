@@ -944,6 +944,34 @@ def get_job_queue_status(job_id: str):
         return jsonify({"error": str(e)}), 500
 
 
+@runner_bp.route("/jobs/<job_id>/preenrich", methods=["POST"])
+def request_job_preenrich(job_id: str):
+    """
+    Request preenrich for a job from the UI.
+
+    The runner tags the request with origin "interactive" so it is served
+    ahead of cron and backfill preenrich work.
+
+    Returns:
+        JSON with selected/enqueued flags from the runner
+    """
+    try:
+        response = requests.post(
+            f"{RUNNER_URL}/api/jobs/{job_id}/preenrich",
+            headers=get_headers(),
+            timeout=REQUEST_TIMEOUT,
+        )
+
+        return jsonify(response.json()), response.status_code
+
+    except requests.exceptions.Timeout:
+        return jsonify({"error": "Runner service timeout"}), 504
+    except requests.exceptions.ConnectionError:
+        return jsonify({"error": "Cannot connect to runner service"}), 503
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
 # =============================================================================
 # All Ops Endpoints (Full Pipeline: Extract + Research + Generate CV)
 # =============================================================================
@@ -1767,6 +1767,23 @@ async def startup_queue_cleanup_loop():
     logger.info("Queue cleanup loop started for stale item recovery")
 
 
+@app.on_event("startup")
+async def startup_cli_pool():
+    """Prewarm the batch-tier Claude CLI pool when the warm pool is enabled."""
+    from src.common.claude_cli import CLAUDE_MODEL_TIERS, DEFAULT_BATCH_TIER
+    from src.common.claude_cli_pool import is_cli_pool_enabled, prewarm_cli_pool
+
+    if not is_cli_pool_enabled():
+        return
+
+    model = CLAUDE_MODEL_TIERS[DEFAULT_BATCH_TIER]
+    try:
+        await prewarm_cli_pool(model)
+        logger.info(f"Claude CLI pool prewarmed for {model}")
+    except Exception as e:
+        logger.warning(f"Failed to prewarm Claude CLI pool: {e}")
+
+
 @app.on_event("shutdown")
 async def shutdown_runner_cleanup():
     """Remove this runner from active set on shutdown."""
@@ -1780,6 +1797,14 @@ async def shutdown_runner_cleanup():
         logger.warning(f"Failed to clean up runner on shutdown: {e}")
 
 
+@app.on_event("shutdown")
+async def shutdown_cli_pool():
+    """Close the Claude CLI pools and kill their worker processes."""
+    from src.common.claude_cli_pool import shutdown_cli_pools
+
+    await asyncio.to_thread(shutdown_cli_pools)
+
+
 @app.on_event("shutdown")
 async def shutdown_queue_manager():
     """Disconnect queue manager on shutdown."""
@@ -2790,3 +2815,37 @@ async def get_cost_history(period: str = "hourly", count: int = 24):
     except Exception as e:
         logger.error(f"Error getting cost history: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/metrics/work-items")
+async def get_work_item_metrics(lane: str = "preenrich", hours: int = 24):
+    """
+    Return per-stage work-item queue depth, claim wait and run-time quantiles.
+
+    Reads the work_item_metrics rollup maintained by the queue, never the
+    work_items collection itself.
+
+    Args:
+        lane: Queue lane ("all" for every lane)
+        hours: Look-back for counters and latency histograms
+
+    Used by the frontend diagnostics partial.
+    """
+    if not settings.mongodb_uri:
+        return {"error": "MongoDB URI not configured", "stages": [], "timestamp": datetime.utcnow().isoformat()}
+
+    def _load_summary():
+        from runner_service.routes.operations import _get_mongo_client
+        from src.pipeline.queue_metrics import QueueMetrics
+
+        # Shared pooled client; a client per request pays connection setup every poll
+        db = _get_mongo_client()[settings.mongo_db_name or "jobs"]
+        return QueueMetrics(db).summary(lane=None if lane == "all" else lane, hours=hours)
+
+    try:
+        loop = asyncio.get_event_loop()
+        stages = await loop.run_in_executor(None, _load_summary)
+        return {"lane": lane, "hours": hours, "stages": stages, "timestamp": datetime.utcnow().isoformat()}
+    except Exception as e:
+        logger.error(f"Error getting work item metrics: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
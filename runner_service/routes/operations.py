@@ -30,6 +30,7 @@ from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from pymongo import MongoClient
 
+from src.common.llm_scheduler import llm_scheduling_context
 from src.common.repositories import get_job_repository, get_operation_runs_repository
 from src.common.telegram import notify_pipeline_failed
 
@@ -43,7 +44,7 @@ _db_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="mongo_")
 _service_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="service_")
 
 
-def _run_async_in_thread(coro) -> None:
+def _run_async_in_thread(coro, priority: Optional[str] = None) -> None:
     """
     Run an async coroutine in a separate thread with its own event loop.
 
@@ -58,8 +59,11 @@ def _run_async_in_thread(coro) -> None:
 
     Args:
         coro: The coroutine to run (e.g., execute_extraction())
+        priority: LLM scheduler priority for every call the coroutine makes
+            (None keeps the scheduler default, "batch")
     """
-    asyncio.run(coro)
+    with llm_scheduling_context(priority=priority):
+        asyncio.run(coro)
 
 
 def run_on_main_loop(coro):
@@ -98,11 +102,14 @@ async def run_service_in_executor(coro) -> None:
     It offloads the blocking async operation to a separate thread,
     keeping the main event loop responsive.
 
+    Used for single-job operations started from the UI, so their LLM calls
+    are scheduled as interactive ahead of batch work.
+
     Args:
         coro: The coroutine to run (will be executed in a separate thread)
     """
     loop = asyncio.get_running_loop()
-    await loop.run_in_executor(_service_executor, _run_async_in_thread, coro)
+    await loop.run_in_executor(_service_executor, _run_async_in_thread, coro, "interactive")
 
 
 def submit_service_task(coro) -> None:
@@ -574,11 +581,12 @@ async def structure_jd(
 
         # Execute via service
         service = StructureJDService()
-        result = await service.execute(
-            job_id=job_id,
-            tier=tier,
-            use_llm=request.use_llm,
-        )
+        with llm_scheduling_context(priority="interactive", job_key=job_id):
+            result = await service.execute(
+                job_id=job_id,
+                tier=tier,
+                use_llm=request.use_llm,
+            )
 
         logger.info(
             f"[{result.run_id[:16]}] Completed {operation}: "
@@ -654,11 +662,12 @@ async def research_company(
         # Execute via service
         service = CompanyResearchService()
         try:
-            result = await service.execute(
-                job_id=job_id,
-                tier=tier,
-                force_refresh=request.force_refresh,
-            )
+            with llm_scheduling_context(priority="interactive", job_key=job_id):
+                result = await service.execute(
+                    job_id=job_id,
+                    tier=tier,
+                    force_refresh=request.force_refresh,
+                )
         finally:
             service.close()
 
@@ -736,11 +745,12 @@ async def generate_cv(
         from src.services.cv_generation_service import CVGenerationService
 
         service = CVGenerationService()
-        result = await service.execute(
-            job_id=job_id,
-            tier=tier,
-            use_annotations=request.use_annotations,
-        )
+        with llm_scheduling_context(priority="interactive", job_key=job_id):
+            result = await service.execute(
+                job_id=job_id,
+                tier=tier,
+                use_annotations=request.use_annotations,
+            )
 
         # Persist the operation run for tracking
         service.persist_run(result, job_id, tier)
@@ -818,11 +828,12 @@ async def full_extraction(
 
         # Execute via service
         service = FullExtractionService()
-        result = await service.execute(
-            job_id=job_id,
-            tier=tier,
-            use_llm=request.use_llm,
-        )
+        with llm_scheduling_context(priority="interactive", job_key=job_id):
+            result = await service.execute(
+                job_id=job_id,
+                tier=tier,
+                use_llm=request.use_llm,
+            )
 
         logger.info(
             f"[{result.run_id[:16]}] Completed {operation}: "
@@ -3598,3 +3609,60 @@ async def classify_ai(job_id: str) -> AIClassifyResponse:
         ai_category_count=result.ai_category_count,
         ai_rationale=result.ai_rationale,
     )
+
+
+# =============================================================================
+# Preenrich request (fair-share origin "interactive")
+# =============================================================================
+
+
+class PreenrichRequestResponse(BaseModel):
+    """Response for a user-triggered preenrich request."""
+    success: bool
+    job_id: str
+    origin: str
+    selected: bool = False
+    enqueued: bool = False
+
+
+def _request_preenrich_sync(job_id: str) -> PreenrichRequestResponse:
+    """Select one job for preenrich with origin "interactive" (runs in the Mongo thread pool)."""
+    from src.preenrich.root_enqueuer import RootEnqueuer
+
+    from ..config import settings
+
+    try:
+        object_id = ObjectId(job_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid job ID format")
+
+    db = _get_mongo_client()[settings.mongo_db_name or "jobs"]
+    if db["level-2"].find_one({"_id": object_id}, {"_id": 1}) is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    stats = RootEnqueuer(db).request_preenrich([object_id], origin="interactive")
+    return PreenrichRequestResponse(
+        success=True,
+        job_id=job_id,
+        origin="interactive",
+        selected=stats["selected"] > 0,
+        enqueued=stats["enqueued"] > 0,
+    )
+
+
+@router.post(
+    "/{job_id}/preenrich",
+    response_model=PreenrichRequestResponse,
+    dependencies=[Depends(verify_token)],
+    summary="Request preenrich for a job",
+    description="Select a job for preenrich ahead of cron and backfill work.",
+)
+async def request_preenrich(job_id: str) -> PreenrichRequestResponse:
+    """
+    Request preenrich for a job on behalf of the user.
+
+    The job is tagged with origin "interactive", so its stage work items win
+    fair-share claims over cron and backfill work. A job that is already
+    preenriching or ready is left alone (selected=False).
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_db_executor, _request_preenrich_sync, job_id)
@@ -0,0 +1,248 @@
+"""
+Throughput benchmark for the async scrape mode against a fake LinkedIn.
+
+Starts a local HTTP server that serves LinkedIn guest job-posting pages after
+a fixed latency, then fetches, parses and scores the same jobs twice:
+
+- serial: one requests.get at a time, as NativeScrapeWorker does
+- async: src.pipeline.async_scrape.scrape_jobs with the configured
+  concurrency, keep-alive pools and parse processes
+
+No Mongo is involved; the numbers isolate fetch/parse throughput.
+
+Usage:
+    python scripts/benchmark_async_scrape.py --jobs 200 --latency-ms 100 --concurrency 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Optional
+
+import requests
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.pipeline.async_scrape import AsyncScrapeConfig, scrape_jobs
+from src.pipeline.scrape_common import build_scored_job, raise_for_scrape_status
+from src.services.linkedin_scraper import HEADERS
+
+JOB_PATH = "/jobs-guest/jobs/api/jobPosting/"
+
+_PAGE = """<!DOCTYPE html>
+<html><head><title>Job Posting</title></head>
+<body>
+<section class="top-card-layout">
+  <h1 class="top-card-layout__title">Senior AI Engineer {job_id}</h1>
+  <a class="topcard__org-name-link" href="/company/acme">Acme Labs</a>
+  <span class="topcard__flavor--bullet">Berlin, Germany (Remote)</span>
+</section>
+<section class="description">
+  <div class="show-more-less-html__markup">
+    <p>Build LLM agents, RAG pipelines and evaluation tooling in Python.</p>
+    <ul><li>Own model serving on Kubernetes</li><li>Lead a team of ML engineers</li></ul>
+  </div>
+</section>
+<ul class="job-criteria__list">
+  <li class="job-criteria__item"><h3 class="job-criteria__subheader">Seniority level</h3>
+    <span class="job-criteria__text">Mid-Senior level</span></li>
+  <li class="job-criteria__item"><h3 class="job-criteria__subheader">Employment type</h3>
+    <span class="job-criteria__text">Full-time</span></li>
+</ul>
+</body></html>
+"""
+
+
+def render_job_page(job_id: str) -> str:
+    """HTML for a job page that linkedin_scraper._parse_job_html accepts."""
+    return _PAGE.format(job_id=job_id)
+
+
+class FakeLinkedInServer:
+    """
+    Threaded local server for LinkedIn guest job pages.
+
+    Args:
+        latency_seconds: Delay before each response
+        status_by_job: Non-200 statuses to return for specific job ids
+    """
+
+    def __init__(self, *, latency_seconds: float = 0.05, status_by_job: Optional[dict[str, int]] = None):
+        self.latency_seconds = latency_seconds
+        self.status_by_job = dict(status_by_job or {})
+        self.requests = 0
+        self.max_concurrent = 0
+        self._active = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url_template(self) -> str:
+        assert self._server is not None, "server not started"
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{JOB_PATH}{{job_id}}"
+
+    def _respond(self, handler: BaseHTTPRequestHandler) -> None:
+        with self._lock:
+            self.requests += 1
+            self._active += 1
+            self.max_concurrent = max(self.max_concurrent, self._active)
+        try:
+            time.sleep(self.latency_seconds)
+            job_id = handler.path.rsplit("/", 1)[-1]
+            status = self.status_by_job.get(job_id, 200) if handler.path.startswith(JOB_PATH) else 404
+            body = (render_job_page(job_id) if status == 200 else "").encode()
+            handler.send_response(status)
+            handler.send_header("Content-Type", "text/html; charset=utf-8")
+            handler.send_header("Content-Length", str(len(body)))
+            handler.end_headers()
+            handler.wfile.write(body)
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def start(self) -> "FakeLinkedInServer":
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, so connection pooling is measured
+
+            def do_GET(self) -> None:  # noqa: N802 - http.server naming
+                server._respond(self)
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                return
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "FakeLinkedInServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+def _jobs(count: int) -> list[dict[str, Any]]:
+    return [{"job_id": str(4_000_000 + index), "search_profile": "ai_core"} for index in range(count)]
+
+
+def run_serial(jobs: list[dict[str, Any]], *, url_template: str) -> int:
+    """Fetch and score jobs one at a time; returns successes."""
+    succeeded = 0
+    for job in jobs:
+        try:
+            response = requests.get(url_template.format(job_id=job["job_id"]), headers=HEADERS, timeout=15)
+            raise_for_scrape_status(job["job_id"], response.status_code)
+            build_scored_job(job, response.text, http_status=response.status_code, used_proxy=False)
+            succeeded += 1
+        except Exception:
+            continue
+    return succeeded
+
+
+def run_async(jobs: list[dict[str, Any]], *, config: AsyncScrapeConfig) -> int:
+    """Fetch and score jobs concurrently; returns successes."""
+    results = asyncio.run(scrape_jobs(jobs, config=config))
+    return sum(1 for result in results if not isinstance(result, Exception))
+
+
+def _timed(fn, *args: Any, **kwargs: Any) -> dict[str, Any]:
+    started = time.perf_counter()
+    succeeded = fn(*args, **kwargs)
+    seconds = time.perf_counter() - started
+    return {
+        "succeeded": succeeded,
+        "seconds": round(seconds, 3),
+        "jobs_per_second": round(succeeded / seconds, 1) if seconds else None,
+    }
+
+
+def run_benchmark(
+    *,
+    jobs: int = 200,
+    latency_ms: float = 100.0,
+    concurrency: int = 32,
+    per_host: Optional[int] = None,
+    parse_processes: int = 2,
+) -> dict[str, Any]:
+    """
+    Time serial and async scraping of the same jobs against a fake LinkedIn.
+
+    Args:
+        jobs: Job pages to scrape per mode
+        latency_ms: Server latency per page
+        concurrency: Global in-flight fetches for the async mode
+        per_host: Per-host limit (defaults to concurrency; everything is one host here)
+        parse_processes: Parse process pool size (0 = thread pool)
+
+    Returns:
+        Per-mode successes, wall time and throughput, plus the async speedup
+    """
+    workload = _jobs(jobs)
+    with FakeLinkedInServer(latency_seconds=latency_ms / 1000.0) as server:
+        config = replace(
+            AsyncScrapeConfig(),
+            concurrency=concurrency,
+            per_host=per_host or concurrency,
+            pool_size=per_host or concurrency,
+            parse_processes=parse_processes,
+            url_template=server.url_template,
+        )
+        serial = _timed(run_serial, workload, url_template=server.url_template)
+        concurrent = _timed(run_async, workload, config=config)
+        concurrent["server_max_concurrent"] = server.max_concurrent
+    return {
+        "jobs": jobs,
+        "latency_ms": latency_ms,
+        "serial": serial,
+        "async": concurrent,
+        "speedup": round(serial["seconds"] / concurrent["seconds"], 1) if concurrent["seconds"] else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark serial vs async scraping against a fake LinkedIn")
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=100.0)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--per-host", type=int, default=None)
+    parser.add_argument("--parse-processes", type=int, default=2)
+    args = parser.parse_args()
+
+    print(
+        json.dumps(
+            run_benchmark(
+                jobs=args.jobs,
+                latency_ms=args.latency_ms,
+                concurrency=args.concurrency,
+                per_host=args.per_host,
+                parse_processes=args.parse_processes,
+            ),
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""
+Benchmark work-item claim throughput: claim_next vs claim_batch.
+
+Seeds scrape.hit work items and their scout_search_hits, then drains the
+queue the way the native scrape worker resolves items before fetching:
+
+- next: WorkItemQueue.claim_next plus SearchDiscoveryStore.get_hit per item
+  (the legacy worker loop)
+- batch-N: WorkItemQueue.claim_batch(N) plus one get_hits $in per batch
+
+Every queue, metrics and search-hit collection call is counted as a round
+trip. Against mongomock (the default) each round trip also sleeps --rtt-ms to
+model network latency; pass --mongodb-uri to run against a real server in a
+scratch database instead (dropped afterwards).
+
+Usage:
+    python scripts/benchmark_claim_batch.py --items 500 --rtt-ms 1
+    python scripts/benchmark_claim_batch.py --mongodb-uri mongodb://localhost:27017
+"""
+
+from __future__ import annotations
+
+import argparse
+import inspect
+import json
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.pipeline.discovery import SearchDiscoveryStore, SearchHitWrite
+from src.pipeline.queue import WorkItemQueue
+
+BATCH_SIZES = (1, 10, 50)
+# Collection methods that cost a server round trip
+_ROUND_TRIP_METHODS = frozenset(
+    {
+        "bulk_write",
+        "count_documents",
+        "find",
+        "find_one",
+        "find_one_and_update",
+        "insert_many",
+        "insert_one",
+        "update_many",
+        "update_one",
+    }
+)
+
+
+class RoundTripCollection:
+    """Collection proxy that counts (and optionally delays) round trips."""
+
+    def __init__(self, collection, counter: dict[str, int], *, rtt_seconds: float = 0.0):
+        self._collection = collection
+        self._counter = counter
+        self._rtt_seconds = rtt_seconds
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._collection, name)
+        if name not in _ROUND_TRIP_METHODS:
+            return attribute
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            self._counter["round_trips"] += 1
+            if self._rtt_seconds:
+                time.sleep(self._rtt_seconds)
+            return attribute(*args, **kwargs)
+
+        return call
+
+
+def seed(db, items: int, *, now: datetime) -> None:
+    """Create items search hits and one pending scrape.hit work item each."""
+    store = SearchDiscoveryStore(db)
+    queue = WorkItemQueue(db)
+    store.ensure_indexes()
+    queue.ensure_indexes()
+    hits = store.upsert_search_hits_bulk(
+        [
+            SearchHitWrite(
+                source="linkedin",
+                external_job_id=str(4_000_000_000 + index),
+                job_url=None,
+                title="Senior AI Engineer",
+                company=f"Company {index}",
+                location="Remote",
+                search_profile="ai_core",
+                search_region="eea",
+                source_cron="hourly",
+                run_id="searchrun:benchmark",
+            )
+            for index in range(items)
+        ],
+        now=now,
+    )
+    queue.enqueue_many(
+        [
+            {
+                "task_type": "scrape.hit",
+                "lane": "scrape",
+                "consumer_mode": "native_scrape",
+                "subject_type": "search_hit",
+                "subject_id": hit.hit_id,
+                "priority": 100,
+                "available_at": now,
+                "max_attempts": 5,
+                "idempotency_key": f"scrape.hit:linkedin:{hit.document['external_job_id']}",
+                "correlation_id": hit.document["correlation_id"],
+                "payload": {"job_id": hit.document["external_job_id"]},
+            }
+            for hit in hits
+        ],
+        now=now,
+    )
+
+
+def drain(db, *, batch_size: Optional[int], rtt_seconds: float, now: datetime) -> dict[str, Any]:
+    """
+    Claim every pending item and resolve its search hit.
+
+    Args:
+        db: Seeded database
+        batch_size: claim_batch size, or None for claim_next + get_hit
+        rtt_seconds: Simulated latency per round trip
+        now: Claim time (after every item's available_at)
+
+    Returns:
+        Items claimed, claims/sec and round trips per claim
+    """
+    counter = {"round_trips": 0}
+    queue = WorkItemQueue(db)
+    store = SearchDiscoveryStore(db)
+    queue.collection = RoundTripCollection(queue.collection, counter, rtt_seconds=rtt_seconds)
+    queue.metrics.collection = RoundTripCollection(queue.metrics.collection, counter, rtt_seconds=rtt_seconds)
+    store.search_hits = RoundTripCollection(store.search_hits, counter, rtt_seconds=rtt_seconds)
+    claim = dict(task_type="scrape.hit", lane="scrape", consumer_mode="native_scrape", worker_name="benchmark", now=now)
+
+    claimed = resolved = 0
+    started = time.perf_counter()
+    while True:
+        if batch_size is None:
+            item = queue.claim_next(**claim)
+            if item is None:
+                break
+            claimed += 1
+            resolved += store.get_hit(item["subject_id"]) is not None
+            continue
+        items = queue.claim_batch(batch_size, **claim)
+        if not items:
+            break
+        claimed += len(items)
+        resolved += len(store.get_hits([item["subject_id"] for item in items]))
+    elapsed = time.perf_counter() - started
+    return {
+        "claimed": claimed,
+        "hits_resolved": resolved,
+        "claims_per_second": round(claimed / elapsed, 1) if elapsed else None,
+        "round_trips_per_claim": round(counter["round_trips"] / claimed, 2) if claimed else None,
+    }
+
+
+def _mongomock_accepts_bulk_sort() -> None:
+    """Drop the sort argument pymongo >= 4.9 passes to bulk UpdateOne/ReplaceOne, which mongomock 4.x rejects."""
+    from mongomock.collection import BulkOperationBuilder
+
+    for name in ("add_update", "add_replace"):
+        original = getattr(BulkOperationBuilder, name)
+        if "sort" in inspect.signature(original).parameters:
+            continue
+
+        def accept_sort(self, *args, _original=original, sort=None, **kwargs):
+            return _original(self, *args, **kwargs)
+
+        setattr(BulkOperationBuilder, name, accept_sort)
+
+
+def run_benchmark(
+    *,
+    items: int = 500,
+    rtt_ms: float = 1.0,
+    batch_sizes: tuple[int, ...] = BATCH_SIZES,
+    db_factory: Optional[Callable[[str], Any]] = None,
+) -> dict[str, Any]:
+    """
+    Drain a freshly seeded queue once per claim strategy.
+
+    Args:
+        items: Work items per run
+        rtt_ms: Simulated milliseconds per round trip (mongomock only)
+        batch_sizes: claim_batch sizes to compare with claim_next
+        db_factory: Returns a fresh database for a run name; defaults to mongomock
+
+    Returns:
+        Results keyed by strategy ("next", "batch-1", "batch-10", ...)
+    """
+    if db_factory is None:
+        import mongomock
+
+        _mongomock_accepts_bulk_sort()
+
+        def db_factory(name: str):
+            return mongomock.MongoClient()[name]
+
+        rtt_seconds = rtt_ms / 1000.0
+    else:
+        rtt_seconds = 0.0
+    seeded_at = datetime.now(timezone.utc)
+    results: dict[str, Any] = {}
+    for label, batch_size in [("next", None), *((f"batch-{size}", size) for size in batch_sizes)]:
+        db = db_factory(f"claim_benchmark_{label.replace('-', '_')}")
+        seed(db, items, now=seeded_at)
+        results[label] = drain(db, batch_size=batch_size, rtt_seconds=rtt_seconds, now=seeded_at + timedelta(seconds=1))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark claim_next vs claim_batch throughput")
+    parser.add_argument("--items", type=int, default=500)
+    parser.add_argument("--rtt-ms", type=float, default=1.0, help="Simulated latency per round trip (mongomock)")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=list(BATCH_SIZES))
+    parser.add_argument("--mongodb-uri", default=None, help="Run against a real server in scratch databases")
+    args = parser.parse_args()
+
+    db_factory = None
+    if args.mongodb_uri:
+        from pymongo import MongoClient
+
+        client = MongoClient(args.mongodb_uri)
+
+        def db_factory(name: str):
+            client.drop_database(name)
+            return client[name]
+
+    results = run_benchmark(
+        items=args.items,
+        rtt_ms=args.rtt_ms,
+        batch_sizes=tuple(args.batch_sizes),
+        db_factory=db_factory,
+    )
+    if args.mongodb_uri:
+        for name in client.list_database_names():
+            if name.startswith("claim_benchmark_"):
+                client.drop_database(name)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
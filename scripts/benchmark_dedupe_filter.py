@@ -0,0 +1,121 @@
+"""
+Benchmark the dedupeKey Bloom prefilter.
+
+Builds a filter over --keys synthetic dedupeKeys, then reports:
+
+- build time, bit-array memory and serialized size/load time
+- membership queries per second
+- measured false-positive rate on keys that were never added (against the
+  configured target)
+- the share of dedupe lookups that still reach Mongo for a search pass where
+  --duplicate-share of the candidate keys are already stored
+
+Usage:
+    python scripts/benchmark_dedupe_filter.py --keys 1000000 --fp-rate 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.common.dedupe_filter import BloomFilter, DedupeFilterConfig, DedupePrefilter
+
+
+def synthetic_keys(prefix: str, count: int) -> list[str]:
+    """dedupeKey-shaped keys (linkedin_scout|<id>) unique per prefix."""
+    return [f"{prefix}|{4_000_000_000 + index}" for index in range(count)]
+
+
+def run_benchmark(
+    *,
+    keys: int = 1_000_000,
+    fp_rate: float = 0.01,
+    probes: int = 200_000,
+    duplicate_share: float = 0.1,
+) -> dict[str, Any]:
+    """
+    Build, query and round-trip a filter of keys entries.
+
+    Args:
+        keys: Stored keys
+        fp_rate: Target false-positive rate
+        probes: Absent keys used to measure the false-positive rate
+        duplicate_share: Share of a search pass's candidates already stored
+
+    Returns:
+        Build, memory, query, false-positive and lookup-reduction figures
+    """
+    stored = synthetic_keys("linkedin_scout", keys)
+    bloom = BloomFilter.for_capacity(keys, fp_rate)
+    started = time.perf_counter()
+    bloom.add_many(stored)
+    build_seconds = time.perf_counter() - started
+
+    absent = synthetic_keys("linkedin_import", probes)
+    started = time.perf_counter()
+    false_positives = sum(bloom.contains_many(absent))
+    query_seconds = time.perf_counter() - started
+
+    prefilter = DedupePrefilter(DedupeFilterConfig(fp_rate=fp_rate))
+    prefilter.bloom = bloom
+    prefilter.built_at = prefilter.watermark = datetime.now(timezone.utc)
+    with tempfile.TemporaryDirectory() as scratch:
+        prefilter.path = Path(scratch) / "dedupe_bloom.bin"
+        prefilter.save()
+        serialized_bytes = prefilter.path.stat().st_size
+        loaded = DedupePrefilter(path=prefilter.path)
+        started = time.perf_counter()
+        loaded.load()
+        load_seconds = time.perf_counter() - started
+
+    duplicates = int(probes * duplicate_share)
+    candidates = stored[:duplicates] + absent[: probes - duplicates]
+    to_mongo = len(loaded.possible(candidates))
+
+    return {
+        "keys": keys,
+        "num_hashes": bloom.num_hashes,
+        "memory_mb": round(bloom.memory_bytes / 1024 / 1024, 2),
+        "build_seconds": round(build_seconds, 3),
+        "queries_per_second": round(probes / query_seconds) if query_seconds else None,
+        "target_fp_rate": fp_rate,
+        "measured_fp_rate": round(false_positives / probes, 5),
+        "serialized_mb": round(serialized_bytes / 1024 / 1024, 2),
+        "load_seconds": round(load_seconds, 4),
+        "mongo_lookup_share": round(to_mongo / len(candidates), 4),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the dedupeKey Bloom prefilter")
+    parser.add_argument("--keys", type=int, default=1_000_000)
+    parser.add_argument("--fp-rate", type=float, default=0.01)
+    parser.add_argument("--probes", type=int, default=200_000)
+    parser.add_argument("--duplicate-share", type=float, default=0.1)
+    args = parser.parse_args()
+    print(
+        json.dumps(
+            run_benchmark(
+                keys=args.keys,
+                fp_rate=args.fp_rate,
+                probes=args.probes,
+                duplicate_share=args.duplicate_share,
+            ),
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Simulation benchmark for fair-share work-item claims.
+
+Models a stage DAG drained by a fixed worker pool while a large backfill is
+dumped on the queue at t=0 and interactive/cron jobs trickle in behind it.
+Each job is a chain of stages; finishing one stage enqueues the next with
+the job's origin. Two claim policies are compared:
+
+- priority: the legacy order (priority, available_at) across all origins
+- fair_share: src.pipeline.fair_share.FairShareScheduler picking the origin,
+  then the same order within it
+
+Reports end-to-end job latency (arrival to last stage done) and per-claim
+wait percentiles by origin. The simulation is in-memory and deterministic;
+it exercises the real scheduler, not Mongo.
+
+Usage:
+    python scripts/benchmark_fair_share_claims.py --backfill-jobs 1000 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import itertools
+import json
+import math
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.pipeline.fair_share import ORIGINS, FairShareScheduler
+
+POLICIES = ("priority", "fair_share")
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def percentile(values: list[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile; None for no samples."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _arrivals(
+    *,
+    backfill_jobs: int,
+    interactive_jobs: int,
+    cron_jobs: int,
+    interactive_every_seconds: float,
+    cron_every_seconds: float,
+) -> list[tuple[float, str]]:
+    arrivals = [(0.0, "backfill") for _ in range(backfill_jobs)]
+    arrivals += [(1.0 + i * interactive_every_seconds, "interactive") for i in range(interactive_jobs)]
+    arrivals += [(0.5 + i * cron_every_seconds, "cron") for i in range(cron_jobs)]
+    return sorted(arrivals)
+
+
+def simulate(
+    policy: str,
+    *,
+    backfill_jobs: int = 1000,
+    interactive_jobs: int = 50,
+    cron_jobs: int = 100,
+    workers: int = 4,
+    stages: int = 3,
+    service_seconds: float = 5.0,
+    interactive_every_seconds: float = 60.0,
+    cron_every_seconds: float = 30.0,
+    scheduler: Optional[FairShareScheduler] = None,
+) -> dict[str, Any]:
+    """
+    Run one policy over the workload.
+
+    Args:
+        policy: "priority" or "fair_share"
+        backfill_jobs: Jobs enqueued at t=0
+        interactive_jobs: User-triggered jobs, one every interactive_every_seconds
+        cron_jobs: Scheduled jobs, one every cron_every_seconds
+        workers: Concurrent stage workers
+        stages: Stages per job (each one work item)
+        service_seconds: Time one stage takes
+        scheduler: Scheduler for fair_share (defaults to env-configured weights)
+
+    Returns:
+        Per-origin job latency and claim-wait percentiles, plus makespan
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy '{policy}'; expected one of {POLICIES}")
+    scheduler = scheduler or FairShareScheduler()
+    seq = itertools.count()
+    # Per-origin heaps of (priority, available_at, seq, job_id, stage); all
+    # stages share a priority so ordering within an origin is FIFO.
+    queues: dict[str, list[tuple[int, float, int, int, int]]] = {origin: [] for origin in ORIGINS}
+    events: list[tuple[float, int, int, str, Any]] = []  # (time, kind order, seq, kind, data)
+    job_origin: dict[int, str] = {}
+    job_arrival: dict[int, float] = {}
+    latencies: dict[str, list[float]] = {origin: [] for origin in ORIGINS}
+    waits: dict[str, list[float]] = {origin: [] for origin in ORIGINS}
+    idle_workers = workers
+
+    for job_id, (arrival, origin) in enumerate(
+        _arrivals(
+            backfill_jobs=backfill_jobs,
+            interactive_jobs=interactive_jobs,
+            cron_jobs=cron_jobs,
+            interactive_every_seconds=interactive_every_seconds,
+            cron_every_seconds=cron_every_seconds,
+        )
+    ):
+        job_origin[job_id] = origin
+        job_arrival[job_id] = arrival
+        heapq.heappush(events, (arrival, 0, next(seq), "enqueue", (job_id, 0)))
+
+    def claim(now: float) -> Optional[tuple[int, float, int, int, int]]:
+        active = [origin for origin in ORIGINS if queues[origin]]
+        if not active:
+            return None
+        if policy == "priority":
+            origin = min(active, key=lambda name: queues[name][0][:3])
+        else:
+            oldest = {name: EPOCH + timedelta(seconds=queues[name][0][1]) for name in active}
+            origin = scheduler.order(oldest, now=EPOCH + timedelta(seconds=now))[0]
+        item = heapq.heappop(queues[origin])
+        waits[origin].append(now - item[1])
+        return item
+
+    def dispatch(now: float) -> None:
+        nonlocal idle_workers
+        while idle_workers:
+            item = claim(now)
+            if item is None:
+                return
+            idle_workers -= 1
+            heapq.heappush(events, (now + service_seconds, 1, next(seq), "done", item))
+
+    makespan = 0.0
+    while events:
+        now, _order, _seq, kind, data = heapq.heappop(events)
+        makespan = max(makespan, now)
+        if kind == "enqueue":
+            job_id, stage = data
+            heapq.heappush(queues[job_origin[job_id]], (100, now, next(seq), job_id, stage))
+        else:
+            idle_workers += 1
+            job_id, stage = data[3], data[4]
+            if stage + 1 < stages:
+                heapq.heappush(events, (now, 0, next(seq), "enqueue", (job_id, stage + 1)))
+            else:
+                latencies[job_origin[job_id]].append(now - job_arrival[job_id])
+        if not events or events[0][0] > now:
+            dispatch(now)
+
+    return {
+        "policy": policy,
+        "makespan_seconds": round(makespan, 1),
+        "origins": {
+            origin: {
+                "jobs": len(latencies[origin]),
+                "latency_p50_seconds": percentile(latencies[origin], 0.5),
+                "latency_p95_seconds": percentile(latencies[origin], 0.95),
+                "claim_wait_p95_seconds": percentile(waits[origin], 0.95),
+            }
+            for origin in ORIGINS
+            if latencies[origin]
+        },
+    }
+
+
+def run_benchmark(**workload: Any) -> dict[str, Any]:
+    """Simulate every policy over the same workload."""
+    return {policy: simulate(policy, **workload) for policy in POLICIES}
+
+
+def _format(results: dict[str, Any]) -> str:
+    lines = [f"{'policy':<11} {'origin':<12} {'jobs':>5} {'p50 s':>9} {'p95 s':>9} {'wait p95 s':>11}"]
+    for policy, result in results.items():
+        for origin, row in result["origins"].items():
+            lines.append(
+                f"{policy:<11} {origin:<12} {row['jobs']:>5} {row['latency_p50_seconds']:>9.1f} "
+                f"{row['latency_p95_seconds']:>9.1f} {row['claim_wait_p95_seconds']:>11.1f}"
+            )
+        lines.append(f"{policy:<11} makespan {result['makespan_seconds']:.1f}s")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Simulate interactive latency under a backfill for each claim policy")
+    parser.add_argument("--backfill-jobs", type=int, default=1000)
+    parser.add_argument("--interactive-jobs", type=int, default=50)
+    parser.add_argument("--cron-jobs", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--stages", type=int, default=3)
+    parser.add_argument("--service-seconds", type=float, default=5.0)
+    parser.add_argument("--json", action="store_true", help="Print raw JSON")
+    args = parser.parse_args()
+
+    results = run_benchmark(
+        backfill_jobs=args.backfill_jobs,
+        interactive_jobs=args.interactive_jobs,
+        cron_jobs=args.cron_jobs,
+        workers=args.workers,
+        stages=args.stages,
+        service_seconds=args.service_seconds,
+    )
+    print(json.dumps(results, indent=2) if args.json else _format(results))
+
+
+if __name__ == "__main__":
+    main()
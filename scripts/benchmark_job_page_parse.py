@@ -0,0 +1,123 @@
+"""
+Benchmark job-page parsing: BeautifulSoup extractors vs the lxml fast path.
+
+Parses every LinkedIn and Indeed page in the fixture directory through
+_parse_job_html / _parse_indeed_html, once with SCRAPER_FAST_PARSE_ENABLED
+off (BeautifulSoup with html.parser) and once with it on (lxml, with
+BeautifulSoup only for pages the fast path declines). Reports pages per
+second and per-page milliseconds for each, and checks both paths produce
+the same fields.
+
+Usage:
+    python scripts/benchmark_job_page_parse.py --rounds 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.services.indeed_scraper import _parse_indeed_html
+from src.services.linkedin_scraper import _parse_job_html
+
+DEFAULT_PAGES_DIR = PROJECT_ROOT / "tests" / "fixtures" / "job_pages"
+_VOLATILE_FIELDS = ("scraped_at",)
+
+
+def load_pages(pages_dir: Path) -> list[tuple[str, str]]:
+    """(file name, html) for every LinkedIn/Indeed page in a directory."""
+    return [
+        (path.name, path.read_text(encoding="utf-8"))
+        for path in sorted(pages_dir.glob("*.html"))
+        if path.name.startswith(("linkedin", "indeed"))
+    ]
+
+
+def parse_page(name: str, html: str) -> dict[str, Any]:
+    """Parse one page with whichever path the environment selects."""
+    if name.startswith("linkedin"):
+        data = _parse_job_html("4012345678", html)
+    else:
+        data = _parse_indeed_html("abc123", "https://www.indeed.com/viewjob?jk=abc123", html)
+    fields = dataclasses.asdict(data)
+    for key in _VOLATILE_FIELDS:
+        fields.pop(key, None)
+    return fields
+
+
+def time_parser(pages: list[tuple[str, str]], *, fast: bool, rounds: int) -> dict[str, Any]:
+    """
+    Parse every page rounds times with the fast path on or off.
+
+    Args:
+        pages: (name, html) pairs
+        fast: Value for SCRAPER_FAST_PARSE_ENABLED
+        rounds: Passes over the page set
+
+    Returns:
+        Pages parsed, pages/sec, ms/page and the last parsed fields per page
+    """
+    previous = os.environ.get("SCRAPER_FAST_PARSE_ENABLED")
+    os.environ["SCRAPER_FAST_PARSE_ENABLED"] = "true" if fast else "false"
+    try:
+        fields: dict[str, dict[str, Any]] = {}
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for name, html in pages:
+                fields[name] = parse_page(name, html)
+        elapsed = time.perf_counter() - started
+    finally:
+        if previous is None:
+            os.environ.pop("SCRAPER_FAST_PARSE_ENABLED", None)
+        else:
+            os.environ["SCRAPER_FAST_PARSE_ENABLED"] = previous
+    parsed = rounds * len(pages)
+    return {
+        "pages": parsed,
+        "pages_per_second": round(parsed / elapsed, 1) if elapsed else None,
+        "ms_per_page": round(elapsed * 1000.0 / parsed, 3) if parsed else None,
+        "fields": fields,
+    }
+
+
+def run_benchmark(pages_dir: Path = DEFAULT_PAGES_DIR, *, rounds: int = 200) -> dict[str, Any]:
+    """Time both parsers over the same pages and report speedup and parity."""
+    pages = load_pages(pages_dir)
+    if not pages:
+        raise ValueError(f"No linkedin*/indeed* .html pages in {pages_dir}")
+    soup = time_parser(pages, fast=False, rounds=rounds)
+    fast = time_parser(pages, fast=True, rounds=rounds)
+    mismatched = sorted(name for name in soup["fields"] if soup["fields"][name] != fast["fields"][name])
+    summary = {
+        key: {metric: value for metric, value in result.items() if metric != "fields"}
+        for key, result in (("beautifulsoup", soup), ("lxml", fast))
+    }
+    summary["speedup"] = (
+        round(fast["pages_per_second"] / soup["pages_per_second"], 2)
+        if fast["pages_per_second"] and soup["pages_per_second"]
+        else None
+    )
+    summary["mismatched_pages"] = mismatched
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark BeautifulSoup vs lxml job-page parsing")
+    parser.add_argument("--pages-dir", type=Path, default=DEFAULT_PAGES_DIR)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+    print(json.dumps(run_benchmark(args.pages_dir, rounds=args.rounds), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Simulation benchmark for health-scored proxy selection.
+
+Models a free-proxy population like the validated cache after it has aged:
+a share of proxies are dead (every attempt burns a full timeout), some are
+slow and flaky, some get rate-limited, the rest work. Each request makes up
+to two proxy attempts before going direct, as fetch_with_proxy does. Two
+pickers are compared:
+
+- random: uniform random proxies, the legacy fetch_with_proxy behaviour
+- health: src.common.proxy_health.ProxySelector, fed every outcome
+
+Reports proxy attempt success rate, requests served through a proxy, and
+seconds wasted on timeouts. The simulation is in-memory, uses a simulated
+clock and is deterministic for a seed.
+
+Usage:
+    python scripts/benchmark_proxy_selection.py --proxies 200 --requests 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.common.proxy_health import HealthPolicy, ProxySelector
+
+POLICIES = ("random", "health")
+TIMEOUT_SECONDS = 15.0
+ATTEMPTS = 2
+
+
+@dataclass(frozen=True)
+class SimProxy:
+    """A simulated proxy's behaviour."""
+
+    url: str
+    success_rate: float
+    latency_seconds: float
+    rate_limit_rate: float = 0.0
+
+
+def build_population(
+    proxies: int,
+    *,
+    dead_share: float = 0.4,
+    flaky_share: float = 0.2,
+    throttled_share: float = 0.1,
+    seed: int = 7,
+) -> list[SimProxy]:
+    """Proxies split into dead, flaky, throttled and good, shuffled."""
+    rng = random.Random(seed)
+    population: list[SimProxy] = []
+    for index in range(proxies):
+        url = f"http://10.0.{index // 250}.{index % 250}:8080"
+        position = index / max(1, proxies)
+        if position < dead_share:
+            population.append(SimProxy(url, success_rate=0.0, latency_seconds=TIMEOUT_SECONDS))
+        elif position < dead_share + flaky_share:
+            population.append(SimProxy(url, success_rate=0.5, latency_seconds=rng.uniform(2.0, 6.0)))
+        elif position < dead_share + flaky_share + throttled_share:
+            population.append(SimProxy(url, success_rate=0.95, latency_seconds=rng.uniform(0.5, 1.5), rate_limit_rate=0.5))
+        else:
+            population.append(SimProxy(url, success_rate=0.95, latency_seconds=rng.uniform(0.3, 1.5)))
+    rng.shuffle(population)
+    return population
+
+
+def simulate(policy: str, *, proxies: int = 200, requests: int = 5000, seed: int = 7) -> dict[str, Any]:
+    """
+    Serve requests through one picker over a simulated population.
+
+    Args:
+        policy: "random" or "health"
+        proxies: Population size
+        requests: Requests to serve
+        seed: RNG seed for population, outcomes and picks
+
+    Returns:
+        Attempt success rate, share of requests served via proxy, timeouts
+        and seconds lost to them, and mean seconds per request
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy '{policy}'; expected one of {POLICIES}")
+    population = build_population(proxies, seed=seed)
+    by_url = {proxy.url: proxy for proxy in population}
+    urls = list(by_url)
+    rng = random.Random(seed + 1)
+    selector = ProxySelector(urls, policy=HealthPolicy(), rng=random.Random(seed + 2))
+
+    clock = 0.0
+    attempts = successes = served_via_proxy = timeouts = 0
+    timeout_seconds = 0.0
+    for _ in range(requests):
+        picks = rng.sample(urls, ATTEMPTS) if policy == "random" else selector.choose(ATTEMPTS, now=clock)
+        served = False
+        for url in picks:
+            proxy = by_url[url]
+            attempts += 1
+            if rng.random() >= proxy.success_rate:
+                clock += TIMEOUT_SECONDS if proxy.success_rate == 0.0 else proxy.latency_seconds
+                if proxy.success_rate == 0.0:
+                    timeouts += 1
+                    timeout_seconds += TIMEOUT_SECONDS
+                selector.record(url, "failure", now=clock)
+                continue
+            clock += proxy.latency_seconds
+            if rng.random() < proxy.rate_limit_rate:
+                selector.record(url, "rate_limited", now=clock)
+                continue
+            selector.record(url, "success", latency_ms=proxy.latency_seconds * 1000.0, now=clock)
+            successes += 1
+            served = True
+            break
+        if served:
+            served_via_proxy += 1
+        else:
+            clock += 0.5  # direct fallback
+    return {
+        "policy": policy,
+        "attempt_success_rate": round(successes / attempts, 3) if attempts else None,
+        "served_via_proxy": round(served_via_proxy / requests, 3),
+        "timeouts": timeouts,
+        "timeout_seconds": round(timeout_seconds, 1),
+        "seconds_per_request": round(clock / requests, 2),
+    }
+
+
+def run_benchmark(**workload: Any) -> dict[str, Any]:
+    """Simulate every picker over the same population and outcome stream seed."""
+    return {policy: simulate(policy, **workload) for policy in POLICIES}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Simulate proxy pick quality for random vs health-scored selection")
+    parser.add_argument("--proxies", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    print(json.dumps(run_benchmark(proxies=args.proxies, requests=args.requests, seed=args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
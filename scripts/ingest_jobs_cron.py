@@ -39,6 +39,7 @@ from pymongo import MongoClient
 
 from src.common.config import Config
 from src.common.ingest_config import IngestConfig, get_ingest_config
+from src.common.search_prefixes import SEARCH_PREFIX_FIELD, search_prefixes
 from src.services.job_sources import HimalayasSource, IndeedSource, JobData, JobSource
 from src.services.quick_scorer import derive_tier_from_score, quick_score_job
 
@@ -83,7 +84,7 @@ def create_job_document(
 
     Follows the level-2 schema from linkedin_scraper.py.
     """
-    return {
+    document = {
         "company": job.company,
         "title": job.title,
         "location": job.location,
@@ -103,6 +104,8 @@ def create_job_document(
         "postedDate": job.posted_date,
         "sourceId": job.source_id,
     }
+    document[SEARCH_PREFIX_FIELD] = search_prefixes(document)
+    return document
 
 
 def run_ingestion(
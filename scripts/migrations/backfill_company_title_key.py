@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Migration: Index and backfill the company|title dedupe fingerprint.
+
+The selector's secondary dedupe looks candidate jobs up by the persisted
+`company_title_key` (see src.common.dedupe.company_title_key) instead of
+normalising every company/title pair in the archive on each run. This
+migration:
+    1. Creates { company_title_key: 1 } on level-2 and level-1
+    2. Writes company_title_key on every row that lacks it, in batches
+
+Run it before enabling the native selector on an existing archive; the
+selector also keys a bounded number of stragglers per run
+(SELECTOR_COMPANY_TITLE_CATCHUP_LIMIT) for rows written by other ingest paths.
+
+Idempotent: safe to run multiple times.
+
+Usage:
+    python scripts/migrations/backfill_company_title_key.py
+    python scripts/migrations/backfill_company_title_key.py --dry-run
+"""
+
+import argparse
+import logging
+import os
+import sys
+from pathlib import Path
+
+# Allow running from project root
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT))
+
+try:
+    from dotenv import load_dotenv
+    load_dotenv(_PROJECT_ROOT / ".env")
+except ImportError:
+    pass
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+logger = logging.getLogger("company_title_key_migration")
+
+COLLECTIONS = ("level-2", "level-1")
+
+
+def get_db():
+    """Connect to MongoDB and return the jobs database."""
+    from pymongo import MongoClient
+
+    uri = os.getenv("MONGODB_URI")
+    if not uri:
+        raise RuntimeError("MONGODB_URI not set in environment")
+    client = MongoClient(uri)
+    return client["jobs"]
+
+
+def migrate(db, *, dry_run: bool, batch_size: int = 500) -> dict:
+    """
+    Create the index and backfill every collection.
+
+    Returns a mapping of collection name to rows keyed (or that would be).
+    """
+    from pymongo import ASCENDING
+
+    from src.pipeline.selector_common import backfill_company_title_keys
+
+    keyed = {}
+    for name in COLLECTIONS:
+        collection = db[name]
+        if dry_run:
+            keyed[name] = collection.count_documents({"company_title_key": None})
+            logger.info("[DRY RUN] %s: would create index and key %d rows", name, keyed[name])
+            continue
+        collection.create_index([("company_title_key", ASCENDING)], name="company_title_key")
+        keyed[name] = backfill_company_title_keys(collection, batch_size=batch_size)
+        logger.info("%s: keyed %d rows", name, keyed[name])
+    return keyed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Index and backfill company_title_key on level-1/level-2")
+    parser.add_argument("--dry-run", action="store_true", help="Count rows without making changes")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    keyed = migrate(get_db(), dry_run=args.dry_run, batch_size=args.batch_size)
+    logger.info("Migration complete (dry_run=%s): %s", args.dry_run, keyed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Migration: Index search prefixes for job list typeahead.
+
+/api/jobs free-text search matches query words against `search_prefixes`
+(edge n-grams of title/company/location/jobId, see src.common.search_prefixes)
+instead of running unanchored $regex over every document. This migration:
+    1. Creates { search_prefixes: 1 } on level-2 and level-1
+    2. Writes search_prefixes on every row that lacks it, in batches
+
+Run it before deploying the frontend that searches by prefix; rows without
+the field are otherwise missing from search results. The selector worker
+also fills a bounded number of stragglers per main run
+(SELECTOR_SEARCH_PREFIX_CATCHUP_LIMIT) for rows written by other ingest paths.
+
+Idempotent: safe to run multiple times.
+
+Usage:
+    python scripts/migrations/backfill_search_prefixes.py
+    python scripts/migrations/backfill_search_prefixes.py --dry-run
+"""
+
+import argparse
+import logging
+import os
+import sys
+from pathlib import Path
+
+# Allow running from project root
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT))
+
+try:
+    from dotenv import load_dotenv
+    load_dotenv(_PROJECT_ROOT / ".env")
+except ImportError:
+    pass
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+logger = logging.getLogger("search_prefixes_migration")
+
+COLLECTIONS = ("level-2", "level-1")
+
+
+def get_db():
+    """Connect to MongoDB and return the jobs database."""
+    from pymongo import MongoClient
+
+    uri = os.getenv("MONGODB_URI")
+    if not uri:
+        raise RuntimeError("MONGODB_URI not set in environment")
+    client = MongoClient(uri)
+    return client["jobs"]
+
+
+def migrate(db, *, dry_run: bool, batch_size: int = 500) -> dict:
+    """
+    Create the index and backfill every collection.
+
+    Returns a mapping of collection name to rows written (or, for a dry
+    run, the number of rows that would be written).
+    """
+    from src.common.search_prefixes import (
+        SEARCH_PREFIX_FIELD,
+        backfill_search_prefixes,
+        ensure_search_prefix_index,
+    )
+
+    results = {}
+    for name in COLLECTIONS:
+        collection = db[name]
+        if dry_run:
+            results[name] = collection.count_documents({SEARCH_PREFIX_FIELD: None})
+            logger.info("[DRY RUN] %s: would create index and backfill %d rows", name, results[name])
+            continue
+        ensure_search_prefix_index(collection)
+        results[name] = backfill_search_prefixes(collection, batch_size=batch_size)
+        logger.info("%s: backfilled %d rows", name, results[name])
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Index search prefixes for job list typeahead on level-1/level-2")
+    parser.add_argument("--dry-run", action="store_true", help="Count rows without making changes")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    results = migrate(get_db(), dry_run=args.dry_run, batch_size=args.batch_size)
+    logger.info("Migration complete (dry_run=%s): %s", args.dry_run, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -97,6 +97,12 @@ def build_index_plan() -> dict[str, list[dict[str, Any]]]:
                 "kwargs": {"name": "research_company_cache_key", "unique": True},
             }
         ],
+        "research_company_artifacts": [
+            {
+                "keys": [("company_checksum", ASCENDING), ("prompt_version", ASCENDING)],
+                "kwargs": {"name": "research_company_artifact_key", "unique": True},
+            }
+        ],
         "research_application_cache": [
             {
                 "keys": [("cache_key", ASCENDING)],
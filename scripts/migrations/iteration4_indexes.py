@@ -40,6 +40,8 @@ def get_db() -> Any:
 
 def build_index_plan() -> dict[str, list[dict[str, Any]]]:
     """Return the full iteration-4 index specification plan."""
+    from src.pipeline.queue_metrics import METRICS_COLLECTION, METRICS_INDEXES
+
     return {
         "level-2": [
             {
@@ -62,6 +64,32 @@ def build_index_plan() -> dict[str, list[dict[str, Any]]]:
                 "keys": [("pre_enrichment.pending_next_stages.idempotency_key", ASCENDING)],
                 "kwargs": {"name": "preenrich_pending_next_stages"},
             },
+            {
+                "keys": [
+                    ("lifecycle", ASCENDING),
+                    ("pre_enrichment.orchestration", ASCENDING),
+                    ("pre_enrichment.snapshot_revalidated_at", ASCENDING),
+                ],
+                "kwargs": {"name": "preenrich_snapshot_revalidation"},
+            },
+            {
+                "keys": [
+                    ("lifecycle", ASCENDING),
+                    ("pre_enrichment.orchestration", ASCENDING),
+                    ("pre_enrichment.dag_version", ASCENDING),
+                    ("pre_enrichment.taxonomy_version", ASCENDING),
+                ],
+                "kwargs": {"name": "preenrich_taxonomy_version"},
+            },
+            {
+                "keys": [
+                    ("lifecycle", ASCENDING),
+                    ("pre_enrichment.orchestration", ASCENDING),
+                    ("pre_enrichment.dag_version", ASCENDING),
+                    ("pre_enrichment.priors_version", ASCENDING),
+                ],
+                "kwargs": {"name": "preenrich_priors_version"},
+            },
         ],
         "work_items": [
             {
@@ -73,6 +101,19 @@ def build_index_plan() -> dict[str, list[dict[str, Any]]]:
                 ],
                 "kwargs": {"name": "preenrich_claim"},
             },
+            {
+                "keys": [
+                    ("lane", ASCENDING),
+                    ("task_type", ASCENDING),
+                    ("consumer_mode", ASCENDING),
+                    ("origin", ASCENDING),
+                    ("status", ASCENDING),
+                    ("priority", DESCENDING),
+                    ("available_at", ASCENDING),
+                    ("created_at", ASCENDING),
+                ],
+                "kwargs": {"name": "preenrich_fair_share_claim"},
+            },
             {
                 "keys": [("lane", ASCENDING), ("status", ASCENDING), ("lease_expires_at", ASCENDING)],
                 "kwargs": {"name": "preenrich_stage_sweeper"},
@@ -112,6 +153,7 @@ def build_index_plan() -> dict[str, list[dict[str, Any]]]:
                 "kwargs": {"name": "job_runs_started_status"},
             }
         ],
+        METRICS_COLLECTION: [dict(spec, kwargs=dict(spec["kwargs"])) for spec in METRICS_INDEXES],
     }
 
 
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Migration: Store createdAt as a BSON Date everywhere and index it.
+
+Job listing (/api/jobs, /api/locations, /api/mobile/jobs) filters and sorts
+on `createdAt` directly, which needs every row to hold a Date rather than
+the ISO strings older n8n ingests wrote (see src.common.created_at). This
+migration:
+    1. Creates { createdAt: -1 } on level-2 and level-1
+    2. Rewrites every string createdAt as a Date, in batches
+
+Run it before deploying the frontend that drops the $toDate normalisation;
+string rows are otherwise missing from date-filtered listings. The selector
+worker also normalises a bounded number of stragglers per main run
+(SELECTOR_CREATED_AT_CATCHUP_LIMIT) for rows written by other ingest paths.
+
+Idempotent: safe to run multiple times.
+
+Usage:
+    python scripts/migrations/normalize_created_at.py
+    python scripts/migrations/normalize_created_at.py --dry-run
+"""
+
+import argparse
+import logging
+import os
+import sys
+from pathlib import Path
+
+# Allow running from project root
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT))
+
+try:
+    from dotenv import load_dotenv
+    load_dotenv(_PROJECT_ROOT / ".env")
+except ImportError:
+    pass
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+logger = logging.getLogger("created_at_migration")
+
+COLLECTIONS = ("level-2", "level-1")
+
+
+def get_db():
+    """Connect to MongoDB and return the jobs database."""
+    from pymongo import MongoClient
+
+    uri = os.getenv("MONGODB_URI")
+    if not uri:
+        raise RuntimeError("MONGODB_URI not set in environment")
+    client = MongoClient(uri)
+    return client["jobs"]
+
+
+def migrate(db, *, dry_run: bool, batch_size: int = 500) -> dict:
+    """
+    Create the index and normalise every collection.
+
+    Returns a mapping of collection name to converted/unparseable counts
+    (or, for a dry run, the number of string rows that would be examined).
+    """
+    from src.common.created_at import backfill_created_at, ensure_created_at_index
+
+    results = {}
+    for name in COLLECTIONS:
+        collection = db[name]
+        if dry_run:
+            results[name] = collection.count_documents({"createdAt": {"$type": "string"}})
+            logger.info("[DRY RUN] %s: would create index and normalise %d rows", name, results[name])
+            continue
+        ensure_created_at_index(collection)
+        results[name] = backfill_created_at(collection, batch_size=batch_size)
+        logger.info("%s: %s", name, results[name])
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Index createdAt and rewrite string values as Dates on level-1/level-2")
+    parser.add_argument("--dry-run", action="store_true", help="Count rows without making changes")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    results = migrate(get_db(), dry_run=args.dry_run, batch_size=args.batch_size)
+    logger.info("Migration complete (dry_run=%s): %s", args.dry_run, results)
+
+
+if __name__ == "__main__":
+    main()
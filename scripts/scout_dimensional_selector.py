@@ -44,7 +44,8 @@ from pymongo import MongoClient
 from src.common.blacklist import filter_blacklisted
 from src.common.dedupe import generate_dedupe_key, normalize_for_dedupe
 from src.common.rule_scorer import is_non_english_jd
-from src.common.scout_queue import read_pool
+from src.common.scout_queue import iter_pool_chunks
+from src.common.search_prefixes import SEARCH_PREFIX_FIELD, search_prefixes
 from src.common.telegram import send_telegram
 from src.pipeline.selector_scheduler import SelectorFeatureFlags, SelectorScheduler
 
@@ -272,6 +273,7 @@ def insert_jobs(jobs: List[Dict], collection, source_tag: str, dry_run: bool = F
                 "rule_score_breakdown": job.get("breakdown"),
             },
         }
+        doc[SEARCH_PREFIX_FIELD] = search_prefixes(doc)
         if dry_run:
             logger.info(f"[DRY RUN] Would insert: {job.get('title')} @ {job.get('company')} (score={job.get('score')})")
         else:
@@ -412,34 +414,37 @@ def main():
         logger.info("Legacy profile selector disabled and native profile selector not owning this window. Exiting.")
         return
 
-    # Step 1: Read pool
-    pool = read_pool()
-    if not pool:
+    # Step 1: Stream the pool in chunks, applying the per-job filters to each
+    # chunk so only location matches are held in memory
+    pool_size = blacklisted = lang_filtered = positive = 0
+    matched = []
+    for chunk in iter_pool_chunks():
+        pool_size += len(chunk)
+        # Step 2: Blacklist filter
+        kept = filter_blacklisted(chunk)
+        blacklisted += len(chunk) - len(kept)
+        # Step 2b: Filter non-English JDs
+        before_lang = len(kept)
+        kept = [
+            j for j in kept
+            if not is_non_english_jd(j.get("title", ""), j.get("description", ""))
+        ]
+        lang_filtered += before_lang - len(kept)
+        # Step 3: Score > 0
+        kept = [j for j in kept if j.get("score", 0) > 0]
+        positive += len(kept)
+        # Step 4: Location filter
+        matched.extend(j for j in kept if matches_location(j, patterns, mode=loc_mode))
+
+    if not pool_size:
         logger.info("Pool empty. Exiting.")
         return
 
-    logger.info(f"Pool size: {len(pool)} jobs")
-
-    # Step 2: Blacklist filter
-    pool = filter_blacklisted(pool)
-
-    # Step 2b: Filter non-English JDs
-    before_lang = len(pool)
-    pool = [
-        j for j in pool
-        if not is_non_english_jd(j.get("title", ""), j.get("description", ""))
-    ]
-    lang_filtered = before_lang - len(pool)
+    logger.info(f"Pool size: {pool_size} jobs")
     if lang_filtered:
-        logger.info(f"Non-English filter: {lang_filtered} removed, {len(pool)} remain")
-
-    # Step 3: Score > 0
-    pool = [j for j in pool if j.get("score", 0) > 0]
-    logger.info(f"After score>0: {len(pool)}")
-
-    # Step 4: Location filter
-    matched = [j for j in pool if matches_location(j, patterns, mode=loc_mode)]
-    logger.info(f"Location match: {len(matched)}/{len(pool)}")
+        logger.info(f"Non-English filter: {lang_filtered} removed, {pool_size - blacklisted - lang_filtered} remain")
+    logger.info(f"After score>0: {positive}")
+    logger.info(f"Location match: {len(matched)}/{positive}")
 
     if not matched:
         logger.info("No jobs match location filter. Exiting.")
@@ -486,7 +491,7 @@ def main():
     # Summary
     logger.info("=" * 60)
     logger.info(f"Dimensional Selector [{args.profile}] Summary")
-    logger.info(f"  Pool:           {len(pool)}")
+    logger.info(f"  Pool:           {positive}")
     logger.info(f"  Location match: {len(matched)}")
     logger.info(f"  After dedup:    {len(new_jobs)}")
     logger.info(f"  Selected:       {len(selected)} (quota: {quota})")
@@ -496,7 +501,7 @@ def main():
 
     # Telegram
     try:
-        notify(args.profile, len(pool), len(matched), len(inserted_ids),
+        notify(args.profile, positive, len(matched), len(inserted_ids),
                trigger_stats["queued"], trigger_stats["failed"], selected)
     except Exception:
         pass
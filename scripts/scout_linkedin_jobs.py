@@ -205,9 +205,9 @@ def fetch_search_page(
 ) -> str:
     """Fetch a single page of LinkedIn search results.
 
-    If proxy_pool is provided, each request uses the next round-robin proxy.
-    On 429, the proxy is marked failed and one retry is attempted with a fresh
-    proxy. On other errors, returns empty string (existing behaviour).
+    If proxy_pool is provided, each request uses a health-weighted proxy.
+    On 429, the proxy is cooled down and a retry is attempted with a fresh
+    proxy; connection failures quarantine the proxy. On other errors, returns empty string (existing behaviour).
     """
     params: Dict[str, Any] = {
         "keywords": keywords,
@@ -240,15 +240,18 @@ def fetch_search_page(
     for attempt in range(max_attempts):
         proxy_dict = proxy_pool.get_proxy() if proxy_pool is not None else None
 
+        started = time.monotonic()
         try:
             response = _do_request(proxy_dict)
 
-            # On 429 with a proxy, mark failed and try next attempt
+            # On 429 with a proxy, cool it down and try next attempt
             if response.status_code == 429 and proxy_pool is not None and proxy_dict is not None:
                 proxy_url = proxy_dict.get("http", "")
-                logger.debug(f"429 on proxy {proxy_url} — marking failed (attempt {attempt + 1}/{max_attempts})")
-                proxy_pool.mark_failed(proxy_url)
+                logger.debug(f"429 on proxy {proxy_url} — cooling down (attempt {attempt + 1}/{max_attempts})")
+                proxy_pool.mark_rate_limited(proxy_url)
                 continue
+            if proxy_pool is not None and proxy_dict is not None:
+                proxy_pool.mark_success(proxy_dict.get("http", ""), (time.monotonic() - started) * 1000.0)
 
             response.raise_for_status()
             return response.text
@@ -42,7 +42,8 @@ from pymongo import MongoClient
 from src.common.blacklist import filter_blacklisted
 from src.common.dedupe import consolidate_by_location, generate_dedupe_key
 from src.common.rule_scorer import is_non_english_jd
-from src.common.scout_queue import append_to_pool, purge_pool, read_and_clear_scored
+from src.common.scout_queue import append_to_pool, iter_scored_chunks, purge_pool
+from src.common.search_prefixes import SEARCH_PREFIX_FIELD, search_prefixes
 from src.common.telegram import send_telegram
 from src.pipeline.selector_scheduler import SelectorFeatureFlags, SelectorScheduler
 
@@ -334,6 +335,7 @@ def insert_jobs(
                 "rule_score_breakdown": job.get("breakdown"),
             },
         }
+        doc[SEARCH_PREFIX_FIELD] = search_prefixes(doc)
 
         if dry_run:
             logger.info(
@@ -501,30 +503,33 @@ def main():
         logger.info(f"Purged {purged} old entries from discarded.jsonl")
     purge_pool()
 
-    # Step 1: Read and clear scored.jsonl (atomic)
-    scored_jobs = read_and_clear_scored()
-    if not scored_jobs:
+    # Step 1: Drain scored.jsonl in chunks, applying the per-job filters to
+    # each chunk so only survivors are held in memory
+    read_count = blacklisted = lang_filtered = 0
+    scored_jobs = []
+    for chunk in iter_scored_chunks():
+        read_count += len(chunk)
+        # Step 1b: Apply blacklist filter
+        kept = filter_blacklisted(chunk)
+        blacklisted += len(chunk) - len(kept)
+        # Step 1c: Filter non-English JDs (hard filter — discard before scoring/insertion)
+        before_lang = len(kept)
+        kept = [
+            j for j in kept
+            if not is_non_english_jd(j.get("title", ""), j.get("description", ""))
+        ]
+        lang_filtered += before_lang - len(kept)
+        # Step 2: Filter score > 0
+        scored_jobs.extend(j for j in kept if j.get("score", 0) > 0)
+
+    if not read_count:
         logger.info("No scored jobs. Exiting.")
         return
 
-    logger.info(f"Read {len(scored_jobs)} scored jobs from scored.jsonl")
-
-    # Step 1b: Apply blacklist filter
-    scored_jobs = filter_blacklisted(scored_jobs)
-    logger.info(f"After blacklist filter: {len(scored_jobs)}")
-
-    # Step 1c: Filter non-English JDs (hard filter — discard before scoring/insertion)
-    before_lang = len(scored_jobs)
-    scored_jobs = [
-        j for j in scored_jobs
-        if not is_non_english_jd(j.get("title", ""), j.get("description", ""))
-    ]
-    lang_filtered = before_lang - len(scored_jobs)
+    logger.info(f"Read {read_count} scored jobs from scored.jsonl")
+    logger.info(f"After blacklist filter: {read_count - blacklisted}")
     if lang_filtered:
-        logger.info(f"Non-English filter: {lang_filtered} removed, {len(scored_jobs)} remain")
-
-    # Step 2: Filter score > 0
-    scored_jobs = [j for j in scored_jobs if j.get("score", 0) > 0]
+        logger.info(f"Non-English filter: {lang_filtered} removed, {read_count - blacklisted - lang_filtered} remain")
     logger.info(f"After score>0 filter: {len(scored_jobs)}")
 
     if not scored_jobs:
@@ -25,6 +25,7 @@ Usage:
 """
 
 import asyncio
+import json
 import logging
 import re
 import subprocess
@@ -35,7 +36,15 @@ from dataclasses import asdict, dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional
 
+from src.common.claude_cli_pool import is_cli_pool_enabled, pooled_request
 from src.common.json_utils import parse_llm_json
+from src.common.llm_cache import (
+    CachedResponse,
+    LLMResponseCache,
+    build_cache_key,
+    get_llm_response_cache,
+)
+from src.common.llm_scheduler import scheduled_llm_call
 
 if TYPE_CHECKING:
     from src.common.structured_logger import StructuredLogger
@@ -94,6 +103,7 @@ class CLIResult:
     input_tokens: Optional[int] = None
     output_tokens: Optional[int] = None
     cost_usd: Optional[float] = None
+    cached: bool = False  # True when served from the LLM response cache
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -344,12 +354,19 @@ class ClaudeCLI:
         system_prompt: Optional[str] = None,
         user_prompt: Optional[str] = None,
         struct_logger: Optional['StructuredLogger'] = None,
+        use_cache: bool = True,
+        schema_version: Optional[str] = None,
     ) -> CLIResult:
         """
         Execute Claude CLI with prompt and return parsed result.
 
         Runs: claude -p {prompt} --output-format text --model {model}
 
+        When the LLM response cache is enabled (see src/common/llm_cache.py),
+        identical prompts are served from the cache instead of spawning the CLI.
+        Tool-enabled (research) calls are never cached since their answers
+        depend on live web results.
+
         Args:
             prompt: Full prompt text (system + user combined)
             job_id: Tracking ID for this invocation
@@ -360,10 +377,111 @@ class ClaudeCLI:
             system_prompt: Optional system prompt (for logging only, if provided separately)
             user_prompt: Optional user prompt (for logging only, if provided separately)
             struct_logger: Optional StructuredLogger for Redis live-tail integration
+            use_cache: Set False to bypass the response cache for this call
+            schema_version: Output schema version folded into the cache key
 
         Returns:
             CLIResult with success/failure status and parsed data
         """
+        cache, cache_key, cached = self._cache_lookup(
+            prompt, job_id, validate_json, allow_tools, use_cache, schema_version
+        )
+        if cached is not None:
+            return cached
+
+        result = self._invoke_uncached(
+            prompt, job_id, validate_json, allow_tools,
+            system_prompt, user_prompt, struct_logger,
+        )
+        if cache is not None:
+            self._cache_store(cache, cache_key, prompt, validate_json, result)
+        return result
+
+    def _cache_lookup(
+        self,
+        prompt: str,
+        job_id: str,
+        validate_json: bool,
+        allow_tools: bool,
+        use_cache: bool,
+        schema_version: Optional[str],
+    ) -> tuple[Optional[LLMResponseCache], Optional[str], Optional[CLIResult]]:
+        """
+        Look up a prompt in the LLM response cache.
+
+        Returns:
+            (cache, key, hit) - cache/key are None when caching does not apply;
+            hit is a ready CLIResult on a cache hit, else None.
+        """
+        cache = get_llm_response_cache() if use_cache and not allow_tools else None
+        if cache is None:
+            return None, None, None
+
+        cache_key = build_cache_key(
+            self.model, self.tier, None, prompt,
+            schema_version=schema_version, validate_json=validate_json,
+        )
+        cached = cache.get(cache_key)
+        if cached is None:
+            return cache, cache_key, None
+
+        self._emit_log(
+            job_id, "info",
+            message=f"♻️ CLI response served from cache ({len(cached.content):,} chars)",
+        )
+        return cache, cache_key, CLIResult(
+            job_id=job_id,
+            success=True,
+            result=cached.parsed_json if validate_json else None,
+            raw_result=None if validate_json else cached.content,
+            error=None,
+            model=self.model,
+            tier=self.tier,
+            duration_ms=0,
+            invoked_at=datetime.utcnow().isoformat(),
+            input_tokens=cached.input_tokens,
+            output_tokens=cached.output_tokens,
+            cost_usd=0.0,
+            cached=True,
+        )
+
+    def _cache_store(
+        self,
+        cache: LLMResponseCache,
+        cache_key: str,
+        prompt: str,
+        validate_json: bool,
+        result: CLIResult,
+    ) -> None:
+        """Store a successful CLIResult in the LLM response cache."""
+        if not result.success:
+            return
+        content = result.raw_result if not validate_json else json.dumps(result.result)
+        cost_usd = result.cost_usd
+        if cost_usd is None:
+            cost_usd = self._estimate_cost_from_chars(len(prompt), len(content or ""))
+        cache.put(cache_key, CachedResponse(
+            content=content or "",
+            parsed_json=result.result,
+            model=self.model,
+            tier=self.tier,
+            backend="claude_cli",
+            input_tokens=result.input_tokens,
+            output_tokens=result.output_tokens,
+            cost_usd=cost_usd,
+        ))
+
+    def _invoke_uncached(
+        self,
+        prompt: str,
+        job_id: str,
+        validate_json: bool,
+        allow_tools: bool,
+        system_prompt: Optional[str],
+        user_prompt: Optional[str],
+        struct_logger: Optional['StructuredLogger'],
+    ) -> CLIResult:
+        """Run the CLI subprocess for invoke() (no cache lookup)."""
         start_time = datetime.utcnow()
         self._emit_log(job_id, "info", message=f"Starting CLI invocation with {self.tier} tier ({self.model})")
 
@@ -701,6 +819,139 @@ class ClaudeCLI:
                 invoked_at=start_time.isoformat()
             )
 
+    async def invoke_async(
+        self,
+        prompt: str,
+        job_id: str,
+        validate_json: bool = True,
+        allow_tools: bool = False,
+        use_cache: bool = True,
+        schema_version: Optional[str] = None,
+    ) -> CLIResult:
+        """
+        Async counterpart of invoke().
+
+        With CLAUDE_CLI_POOL_ENABLED=true the prompt is sent to a warm
+        stream-json worker from the process-wide pool in
+        src/common/claude_cli_pool.py. Otherwise the blocking invoke() runs
+        in the default thread pool executor, as before.
+
+        Args:
+            prompt: Full prompt text (system + user combined)
+            job_id: Tracking ID for this invocation
+            validate_json: Whether to parse result as JSON (default True)
+            allow_tools: Whether to enable CLI tools (WebSearch, WebFetch, Read)
+            use_cache: Set False to bypass the response cache for this call
+            schema_version: Output schema version folded into the cache key
+
+        Returns:
+            CLIResult with success/failure status and parsed data
+        """
+        if not is_cli_pool_enabled():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None,
+                lambda: self.invoke(
+                    prompt,
+                    job_id,
+                    validate_json=validate_json,
+                    allow_tools=allow_tools,
+                    use_cache=use_cache,
+                    schema_version=schema_version,
+                ),
+            )
+
+        cache, cache_key, cached = self._cache_lookup(
+            prompt, job_id, validate_json, allow_tools, use_cache, schema_version
+        )
+        if cached is not None:
+            return cached
+
+        result = await self._invoke_pooled(prompt, job_id, validate_json, allow_tools)
+        if cache is not None:
+            self._cache_store(cache, cache_key, prompt, validate_json, result)
+        return result
+
+    async def _invoke_pooled(
+        self,
+        prompt: str,
+        job_id: str,
+        validate_json: bool,
+        allow_tools: bool,
+    ) -> CLIResult:
+        """Run a prompt on a warm pooled worker and interpret its result event."""
+        start_time = datetime.utcnow()
+        self._emit_log(
+            job_id, "info",
+            message=f"⏳ Pooled CLI invocation started ({len(prompt):,} chars, {self.tier} tier)",
+            prompt_length=len(prompt),
+        )
+
+        def failure(error_msg: str, raw_result: Optional[str] = None) -> CLIResult:
+            duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+            self._emit_log(job_id, "error", message=f"CLI failed: {error_msg}")
+            return CLIResult(
+                job_id=job_id,
+                success=False,
+                result=None,
+                raw_result=raw_result,
+                error=error_msg,
+                model=self.model,
+                tier=self.tier,
+                duration_ms=duration_ms,
+                invoked_at=start_time.isoformat(),
+            )
+
+        try:
+            event = await pooled_request(
+                self.model, prompt, timeout=self.timeout, allow_tools=allow_tools
+            )
+        except asyncio.TimeoutError:
+            return failure(f"CLI timeout after {self.timeout}s")
+        except Exception as e:
+            return failure(f"Unexpected error: {str(e)}")
+
+        duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+        raw_output = (event.get("result") or "").strip()
+        if event.get("is_error") or event.get("subtype", "success") != "success":
+            return failure(raw_output or f"CLI result error: {event.get('subtype')}", raw_output or None)
+        if not raw_output:
+            return failure("CLI returned empty response")
+        cli_error = self._detect_cli_error_in_stdout(raw_output)
+        if cli_error:
+            return failure(cli_error, raw_output)
+
+        input_tokens, output_tokens, cost_usd = self._extract_cost_info(event)
+        parsed_data = None
+        if validate_json:
+            try:
+                parsed_data = parse_llm_json(raw_output)
+            except ValueError as e:
+                return failure(f"Failed to parse LLM response as JSON: {e}")
+
+        self._emit_log(
+            job_id, "info",
+            message=f"✅ Pooled CLI complete ({len(raw_output):,} chars, {duration_ms:,}ms)",
+            duration_ms=duration_ms,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cost_usd=cost_usd,
+        )
+        return CLIResult(
+            job_id=job_id,
+            success=True,
+            result=parsed_data,
+            raw_result=None if validate_json else raw_output,
+            error=None,
+            model=self.model,
+            tier=self.tier,
+            duration_ms=duration_ms,
+            invoked_at=start_time.isoformat(),
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cost_usd=cost_usd,
+        )
+
     async def invoke_batch(
         self,
         items: List[Dict[str, str]],
@@ -710,7 +961,10 @@ class ClaudeCLI:
         Invoke CLI for multiple items with controlled concurrency.
 
         Designed for batch operations. Uses asyncio semaphore to limit
-        concurrent CLI processes.
+        concurrent CLI processes, and each item is admitted through the global
+        LLM scheduler so batches share the provider budget with other callers.
+        Each item goes through invoke_async(), so the warm worker pool is used
+        when CLAUDE_CLI_POOL_ENABLED=true.
 
         Args:
             items: List of dicts with keys: job_id, prompt
@@ -723,15 +977,8 @@ class ClaudeCLI:
 
         async def invoke_with_limit(item: Dict[str, str]) -> CLIResult:
             async with semaphore:
-                # Run sync invocation in thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(
-                    None,
-                    lambda: self.invoke(
-                        item["prompt"],
-                        item["job_id"]
-                    )
-                )
+                async with scheduled_llm_call("claude_cli", item["prompt"], job_key=item["job_id"]):
+                    return await self.invoke_async(item["prompt"], item["job_id"])
 
         tasks = [invoke_with_limit(item) for item in items]
         return await asyncio.gather(*tasks)
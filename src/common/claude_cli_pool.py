@@ -0,0 +1,473 @@
+"""
+Warm Claude CLI Worker Pool.
+
+Keeps pre-spawned `claude -p` processes running in streaming JSON mode
+(--input-format stream-json --output-format stream-json) so that process
+start, auth and model-config loading happen before a prompt arrives instead
+of on the critical path of every call.
+
+Each worker is an asyncio subprocess. A request writes one user message as a
+JSON line to the worker's stdin and reads stdout lines until the terminal
+``{"type": "result", ...}`` event. Workers are recycled (killed and replaced
+in the background) after ``max_calls_per_worker`` requests, or immediately
+on timeout, protocol error or process exit.
+
+Note on context: a stream-json session keeps its conversation history, so a
+worker reused for several prompts will see the earlier ones. The default of
+max_calls_per_worker=1 therefore uses each warm process for exactly one
+prompt; raise it only for callers that tolerate shared context.
+
+Configuration (environment):
+    CLAUDE_CLI_POOL_ENABLED=true       Route UnifiedLLM CLI calls through the pool
+    CLAUDE_CLI_POOL_SIZE=3             Warm workers per (model, tools) pool
+    CLAUDE_CLI_POOL_MAX_CALLS=1        Requests served before a worker is recycled
+    CLAUDE_CLI_PATH=claude             CLI executable
+
+Lifecycle: there is one pool per (model, tools) per process, and all pools
+live on a dedicated event loop thread. asyncio subprocesses are bound to the
+loop that spawned them, and callers such as invoke_unified_sync() run each
+call in a short-lived asyncio.run() loop, so workers cannot live on the
+caller's loop. pooled_request() hands the prompt to the pool loop and awaits
+the answer from any loop or thread. The runner prewarms the batch-tier pool
+at startup and calls shutdown_cli_pools() on shutdown; an atexit hook closes
+the pools (and kills their processes) in every other process.
+
+Usage:
+    event = await pooled_request("claude-sonnet-4-5-20250929", "Return JSON ...", timeout=180)
+    print(event["result"], event.get("total_cost_usd"))
+"""
+
+import asyncio
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Any, Awaitable, Dict, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+# asyncio's default StreamReader line limit is 64 KiB; CLI result events for
+# large JSON outputs exceed that easily.
+_STREAM_LIMIT = 16 * 1024 * 1024
+
+T = TypeVar("T")
+
+
+class CLIWorkerError(Exception):
+    """Raised when a pooled CLI worker dies or violates the stream protocol."""
+
+
+def is_cli_pool_enabled() -> bool:
+    """Check whether the warm CLI pool is switched on via environment."""
+    return os.getenv("CLAUDE_CLI_POOL_ENABLED", "false").lower() == "true"
+
+
+def build_stream_command(
+    model: str,
+    allow_tools: bool = False,
+    cli_command: Optional[List[str]] = None,
+) -> List[str]:
+    """
+    Build the streaming-mode CLI command line.
+
+    Args:
+        model: Claude model ID
+        allow_tools: Whether to leave CLI tools (WebSearch etc.) enabled
+        cli_command: Executable prefix (defaults to CLAUDE_CLI_PATH or "claude")
+
+    Returns:
+        argv list for asyncio.create_subprocess_exec
+    """
+    cmd = list(cli_command or [os.getenv("CLAUDE_CLI_PATH", "claude")])
+    cmd.extend([
+        "-p",
+        "--input-format", "stream-json",
+        "--output-format", "stream-json",
+        "--verbose",
+        "--model", model,
+        "--dangerously-skip-permissions",
+    ])
+    if not allow_tools:
+        cmd.extend(["--tools", ""])
+    return cmd
+
+
+class CLIWorker:
+    """A single warm CLI process speaking the stream-json protocol."""
+
+    def __init__(self, process: asyncio.subprocess.Process):
+        self.process = process
+        self.calls = 0
+        self.healthy = True
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    @property
+    def alive(self) -> bool:
+        return self.healthy and self.process.returncode is None
+
+    async def request(self, prompt: str, timeout: float) -> Dict[str, Any]:
+        """
+        Send one user message and wait for its result event.
+
+        Args:
+            prompt: Prompt text
+            timeout: Seconds to wait for the result event
+
+        Returns:
+            The terminal result event dict
+
+        Raises:
+            asyncio.TimeoutError: If no result arrives in time
+            CLIWorkerError: If the process exits or emits a malformed stream
+        """
+        self.calls += 1
+        message = {
+            "type": "user",
+            "message": {"role": "user", "content": [{"type": "text", "text": prompt}]},
+        }
+        try:
+            self.process.stdin.write((json.dumps(message) + "\n").encode("utf-8"))
+            await self.process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            self.healthy = False
+            raise CLIWorkerError(f"CLI worker stdin closed: {e}") from e
+
+        try:
+            return await asyncio.wait_for(self._read_result(), timeout=timeout)
+        except BaseException:
+            self.healthy = False
+            raise
+
+    async def _read_result(self) -> Dict[str, Any]:
+        while True:
+            line = await self.process.stdout.readline()
+            if not line:
+                returncode = await self.process.wait()
+                raise CLIWorkerError(f"CLI worker exited with code {returncode}")
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                # Non-JSON chatter (warnings, banners) is ignored
+                logger.debug(f"[CLIPool] Ignoring non-JSON line: {line[:100]!r}")
+                continue
+            if isinstance(event, dict) and event.get("type") == "result":
+                return event
+
+    async def close(self) -> None:
+        """Terminate the process (kill after a short grace period)."""
+        self.healthy = False
+        if self.process.returncode is not None:
+            return
+        try:
+            self.process.stdin.close()
+        except Exception:
+            pass
+        try:
+            await asyncio.wait_for(self.process.wait(), timeout=2)
+        except asyncio.TimeoutError:
+            try:
+                self.process.kill()
+            except ProcessLookupError:
+                pass
+            await self.process.wait()
+
+
+class ClaudeCLIPool:
+    """
+    Bounded pool of warm CLI workers for one (model, allow_tools) combination.
+
+    At most ``size`` requests run concurrently. Spent or broken workers are
+    replaced in the background so the next request finds a warm process.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        size: int = 3,
+        max_calls_per_worker: int = 1,
+        allow_tools: bool = False,
+        cli_command: Optional[List[str]] = None,
+    ):
+        """
+        Initialize the pool (workers are spawned lazily by start()/request()).
+
+        Args:
+            model: Claude model ID passed to every worker
+            size: Maximum concurrent workers
+            max_calls_per_worker: Requests served before a worker is recycled
+            allow_tools: Whether workers run with CLI tools enabled
+            cli_command: Executable prefix (e.g. [sys.executable, "fake_cli.py"])
+        """
+        self.model = model
+        self.size = max(1, size)
+        self.max_calls_per_worker = max(1, max_calls_per_worker)
+        self.allow_tools = allow_tools
+        self.command = build_stream_command(model, allow_tools, cli_command)
+        self._idle: "asyncio.Queue[CLIWorker]" = asyncio.Queue()
+        self._semaphore = asyncio.Semaphore(self.size)
+        self._background: set = set()
+        self._inflight: set = set()
+        self._closed = False
+        self.stats = {"requests": 0, "spawned": 0, "recycled": 0, "errors": 0}
+
+    async def _spawn(self) -> CLIWorker:
+        process = await asyncio.create_subprocess_exec(
+            *self.command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            cwd=tempfile.gettempdir(),  # avoid loading project CLAUDE.md files
+            limit=_STREAM_LIMIT,
+        )
+        self.stats["spawned"] += 1
+        return CLIWorker(process)
+
+    async def start(self) -> None:
+        """Pre-spawn workers up to the pool size."""
+        missing = self.size - self._idle.qsize()
+        workers = await asyncio.gather(*(self._spawn() for _ in range(max(0, missing))))
+        for worker in workers:
+            self._idle.put_nowait(worker)
+
+    async def _acquire(self) -> CLIWorker:
+        while not self._idle.empty():
+            worker = self._idle.get_nowait()
+            if worker.alive:
+                return worker
+            await worker.close()
+        return await self._spawn()
+
+    def _replenish(self) -> None:
+        async def spawn_idle() -> None:
+            try:
+                worker = await self._spawn()
+            except Exception as e:
+                logger.warning(f"[CLIPool] Failed to pre-spawn replacement worker: {e}")
+                return
+            if self._closed:
+                await worker.close()
+            else:
+                self._idle.put_nowait(worker)
+
+        task = asyncio.ensure_future(spawn_idle())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _release(self, worker: CLIWorker) -> None:
+        if self._closed:
+            await worker.close()
+            return
+        if worker.alive and worker.calls < self.max_calls_per_worker:
+            self._idle.put_nowait(worker)
+            return
+        self.stats["recycled"] += 1
+        closer = asyncio.ensure_future(worker.close())
+        self._background.add(closer)
+        closer.add_done_callback(self._background.discard)
+        self._replenish()
+
+    async def request(self, prompt: str, timeout: float = 300) -> Dict[str, Any]:
+        """
+        Run one prompt on a warm worker.
+
+        Args:
+            prompt: Prompt text
+            timeout: Seconds to wait for the result event
+
+        Returns:
+            The CLI's terminal result event
+
+        Raises:
+            asyncio.TimeoutError, CLIWorkerError, FileNotFoundError
+        """
+        if self._closed:
+            raise CLIWorkerError("CLI pool is closed")
+        task = asyncio.current_task()
+        self._inflight.add(task)
+        try:
+            return await self._request(prompt, timeout)
+        finally:
+            self._inflight.discard(task)
+
+    async def _request(self, prompt: str, timeout: float) -> Dict[str, Any]:
+        async with self._semaphore:
+            worker = await self._acquire()
+            self.stats["requests"] += 1
+            try:
+                return await worker.request(prompt, timeout)
+            except BaseException:
+                self.stats["errors"] += 1
+                raise
+            finally:
+                await self._release(worker)
+
+    async def close(self) -> None:
+        """
+        Terminate every worker the pool owns.
+
+        In-flight requests are cancelled (their workers are closed on
+        release), then pending recycles and replacement spawns are awaited
+        rather than cancelled, so a process spawned mid-close is closed too
+        instead of being orphaned.
+        """
+        self._closed = True
+        current = asyncio.current_task()
+        inflight = [task for task in self._inflight if task is not current]
+        for task in inflight:
+            task.cancel()
+        await asyncio.gather(*inflight, return_exceptions=True)
+        while self._background:
+            await asyncio.gather(*list(self._background), return_exceptions=True)
+        while not self._idle.empty():
+            await self._idle.get_nowait().close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool counters for diagnostics."""
+        return {
+            "model": self.model,
+            "size": self.size,
+            "idle": self._idle.qsize(),
+            "max_calls_per_worker": self.max_calls_per_worker,
+            **self.stats,
+        }
+
+
+# =============================================================================
+# Process-wide pool registry on a dedicated event loop thread
+# =============================================================================
+
+_pools: Dict[Tuple[str, bool], ClaudeCLIPool] = {}
+_pool_loop: Optional[asyncio.AbstractEventLoop] = None
+_pool_thread: Optional[threading.Thread] = None
+_registry_lock = threading.Lock()
+_atexit_registered = False
+
+
+def _get_pool_loop() -> asyncio.AbstractEventLoop:
+    """Start (once) and return the event loop thread that owns every pool."""
+    global _pool_loop, _pool_thread, _atexit_registered
+
+    with _registry_lock:
+        if _pool_loop is None:
+            _pool_loop = asyncio.new_event_loop()
+            _pool_thread = threading.Thread(
+                target=_pool_loop.run_forever, name="claude-cli-pool", daemon=True
+            )
+            _pool_thread.start()
+            if not _atexit_registered:
+                atexit.register(shutdown_cli_pools)
+                _atexit_registered = True
+        return _pool_loop
+
+
+async def _on_pool_loop(coro: Awaitable[T]) -> T:
+    """Run a coroutine on the pool loop and await its result from any loop."""
+    future = asyncio.run_coroutine_threadsafe(coro, _get_pool_loop())
+    return await asyncio.wrap_future(future)
+
+
+def get_cli_pool(
+    model: str,
+    allow_tools: bool = False,
+    cli_command: Optional[List[str]] = None,
+) -> ClaudeCLIPool:
+    """
+    Get the process-wide pool for (model, allow_tools).
+
+    The pool only runs on the dedicated pool loop; use pooled_request() to
+    send it prompts from other loops.
+
+    Args:
+        model: Claude model ID
+        allow_tools: Whether workers run with CLI tools enabled
+        cli_command: Executable prefix, used only when the pool is created
+
+    Returns:
+        The shared ClaudeCLIPool
+    """
+    _get_pool_loop()
+    with _registry_lock:
+        key = (model, allow_tools)
+        pool = _pools.get(key)
+        if pool is None or pool._closed:
+            pool = ClaudeCLIPool(
+                model=model,
+                size=int(os.getenv("CLAUDE_CLI_POOL_SIZE", "3")),
+                max_calls_per_worker=int(os.getenv("CLAUDE_CLI_POOL_MAX_CALLS", "1")),
+                allow_tools=allow_tools,
+                cli_command=cli_command,
+            )
+            _pools[key] = pool
+        return pool
+
+
+async def pooled_request(
+    model: str,
+    prompt: str,
+    timeout: float = 300,
+    allow_tools: bool = False,
+) -> Dict[str, Any]:
+    """
+    Run one prompt on the shared pool for (model, allow_tools).
+
+    Safe to await from any event loop, including short-lived asyncio.run()
+    loops; cancelling the caller cancels the request on the pool loop.
+
+    Args:
+        model: Claude model ID
+        prompt: Prompt text
+        timeout: Seconds to wait for the result event
+        allow_tools: Whether the worker runs with CLI tools enabled
+
+    Returns:
+        The CLI's terminal result event
+    """
+    pool = get_cli_pool(model, allow_tools=allow_tools)
+    return await _on_pool_loop(pool.request(prompt, timeout))
+
+
+async def prewarm_cli_pool(model: str, allow_tools: bool = False) -> None:
+    """Spawn the shared pool's workers ahead of the first request."""
+    pool = get_cli_pool(model, allow_tools=allow_tools)
+    await _on_pool_loop(pool.start())
+
+
+def shutdown_cli_pools(timeout: float = 30) -> None:
+    """
+    Close every pool, kill its processes and stop the pool loop thread.
+
+    Blocking; async callers should run it via asyncio.to_thread(). A later
+    get_cli_pool() starts a fresh loop.
+
+    Args:
+        timeout: Seconds to wait for the pools to close
+    """
+    global _pool_loop, _pool_thread
+
+    with _registry_lock:
+        loop, thread = _pool_loop, _pool_thread
+        pools = list(_pools.values())
+        _pools.clear()
+        _pool_loop = _pool_thread = None
+    if loop is None:
+        return
+
+    async def close_all() -> None:
+        await asyncio.gather(*(pool.close() for pool in pools), return_exceptions=True)
+
+    try:
+        asyncio.run_coroutine_threadsafe(close_all(), loop).result(timeout)
+    except Exception as e:
+        logger.warning(f"[CLIPool] Failed to close pools cleanly: {e}")
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout)
+    if not thread.is_alive():
+        loop.close()
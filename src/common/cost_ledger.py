@@ -0,0 +1,372 @@
+"""
+Persistent LLM Cost Ledger.
+
+Appends TokenUsage records to MongoDB in batches and keeps rolled-up cost
+buckets (hour, day, job, run) up to date with $inc upserts. Cost dashboards
+read the rollups, which costs O(buckets) rather than a scan of every call,
+and the history survives runner restarts and is shared by every process
+that writes to the same database.
+
+Collections (database "jobs"):
+    llm_cost_ledger    One document per LLM call (raw usage)
+    llm_cost_rollups   One document per (granularity, key) bucket:
+                       hour "2025-11-30 10:00", day "2025-11-30",
+                       job <job_id>, run <run_id> (runs also carry
+                       by_provider / by_layer breakdowns)
+
+Configuration (environment):
+    COST_LEDGER_ENABLED=true        Attach the ledger to TokenTrackers
+    COST_LEDGER_BATCH_SIZE=50       Usages buffered before a flush
+    COST_LEDGER_FLUSH_SECONDS=5     Max age of buffered usages before a flush
+
+Usage:
+    ledger = get_cost_ledger()
+    tracker = TokenTracker(ledger=ledger)
+    ...
+    ledger.get_hourly_costs(24)
+"""
+
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from pymongo import ASCENDING
+
+from .token_tracker import TokenUsage, UsageSummary, day_key, hour_key
+
+logger = logging.getLogger(__name__)
+
+def _field_name(value: str) -> str:
+    """Make a provider/layer name safe as a MongoDB field path segment."""
+    return value.replace(".", "_").replace("$", "_")
+
+
+class CostLedger:
+    """
+    Batched writer and rollup reader for persistent LLM cost data.
+
+    record() only appends to an in-memory buffer; the buffer is flushed
+    (one insert_many, then one $inc upsert per touched bucket with the
+    batch pre-merged in memory) when it reaches batch_size entries or its
+    oldest entry is older than flush_interval_seconds. Reads flush first so
+    they include every usage recorded by this process.
+    """
+
+    def __init__(
+        self,
+        ledger_collection: Any,
+        rollup_collection: Any,
+        batch_size: int = 50,
+        flush_interval_seconds: float = 5.0,
+    ):
+        """
+        Initialize the ledger.
+
+        Args:
+            ledger_collection: MongoDB collection for raw usage documents
+            rollup_collection: MongoDB collection for rolled-up buckets
+            batch_size: Usages buffered before a flush
+            flush_interval_seconds: Max age of buffered usages before a flush
+        """
+        self.ledger_collection = ledger_collection
+        self.rollup_collection = rollup_collection
+        self.batch_size = max(1, batch_size)
+        self.flush_interval_seconds = flush_interval_seconds
+        self._pending: List[TokenUsage] = []
+        self._oldest_pending_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self.stats = {"recorded": 0, "flushed": 0, "flushes": 0, "errors": 0}
+
+    def ensure_indexes(self) -> None:
+        """Create the indexes the ledger and rollup queries rely on."""
+        self.rollup_collection.create_index(
+            [("granularity", ASCENDING), ("key", ASCENDING)],
+            unique=True,
+            name="granularity_key_unique",
+        )
+        self.ledger_collection.create_index([("timestamp", ASCENDING)], name="timestamp")
+        self.ledger_collection.create_index([("run_id", ASCENDING)], name="run_id", sparse=True)
+        self.ledger_collection.create_index([("job_id", ASCENDING)], name="job_id", sparse=True)
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def record(self, usage: TokenUsage) -> None:
+        """Buffer a usage; flushes when the batch is full or old enough."""
+        with self._lock:
+            self._pending.append(usage)
+            self.stats["recorded"] += 1
+            if self._oldest_pending_at is None:
+                self._oldest_pending_at = time.monotonic()
+            due = (
+                len(self._pending) >= self.batch_size
+                or time.monotonic() - self._oldest_pending_at >= self.flush_interval_seconds
+            )
+        if due:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write buffered usages and their rollup increments.
+
+        Returns:
+            Number of usages written (0 if nothing was pending or the write failed)
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+                self._oldest_pending_at = None
+            if not batch:
+                return 0
+
+            try:
+                self.ledger_collection.insert_many(
+                    [self._usage_document(u) for u in batch], ordered=False
+                )
+            except Exception as e:
+                # Nothing reliable was written; keep the batch for the next flush
+                logger.warning(f"[CostLedger] Failed to append {len(batch)} usages: {e}")
+                self.stats["errors"] += 1
+                with self._lock:
+                    self._pending[:0] = batch
+                    self._oldest_pending_at = time.monotonic()
+                return 0
+
+            try:
+                now = datetime.utcnow()
+                for (granularity, key), increments in self._rollup_increments(batch).items():
+                    self.rollup_collection.update_one(
+                        {"granularity": granularity, "key": key},
+                        {"$inc": increments, "$set": {"updated_at": now}},
+                        upsert=True,
+                    )
+            except Exception as e:
+                logger.warning(f"[CostLedger] Failed to update rollups for {len(batch)} usages: {e}")
+                self.stats["errors"] += 1
+
+            self.stats["flushed"] += len(batch)
+            self.stats["flushes"] += 1
+            return len(batch)
+
+    @staticmethod
+    def _usage_document(usage: TokenUsage) -> Dict[str, Any]:
+        return {
+            "provider": usage.provider,
+            "model": usage.model,
+            "input_tokens": usage.input_tokens,
+            "output_tokens": usage.output_tokens,
+            "cost_usd": usage.estimated_cost_usd,
+            "layer": usage.layer,
+            "run_id": usage.run_id,
+            "job_id": usage.job_id,
+            "timestamp": usage.timestamp,
+            "cache_hit": usage.cache_hit,
+            "saved_cost_usd": usage.saved_cost_usd,
+        }
+
+    @staticmethod
+    def _rollup_increments(batch: List[TokenUsage]) -> Dict[tuple, Dict[str, float]]:
+        """Merge a batch into one $inc document per touched (granularity, key) bucket."""
+        increments: Dict[tuple, Dict[str, float]] = defaultdict(lambda: defaultdict(int))
+
+        for usage in batch:
+            values = {
+                "cost_usd": usage.estimated_cost_usd,
+                "calls": 1,
+                "input_tokens": usage.input_tokens,
+                "output_tokens": usage.output_tokens,
+                "cache_hits": 1 if usage.cache_hit else 0,
+                "saved_cost_usd": usage.saved_cost_usd,
+            }
+            buckets = [("hour", hour_key(usage.timestamp)), ("day", day_key(usage.timestamp))]
+            if usage.job_id:
+                buckets.append(("job", usage.job_id))
+            for bucket in buckets:
+                for name, value in values.items():
+                    increments[bucket][name] += value
+
+            if usage.run_id:
+                run = increments[("run", usage.run_id)]
+                for name, value in values.items():
+                    run[name] += value
+                for prefix, key in (
+                    ("by_provider", usage.provider),
+                    ("by_layer", usage.layer or "unknown"),
+                ):
+                    path = f"{prefix}.{_field_name(key)}"
+                    run[f"{path}.input_tokens"] += usage.input_tokens
+                    run[f"{path}.output_tokens"] += usage.output_tokens
+                    run[f"{path}.cost_usd"] += usage.estimated_cost_usd
+                    run[f"{path}.calls"] += 1
+
+        return {bucket: dict(values) for bucket, values in increments.items()}
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    def _buckets(self, granularity: str, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        self.flush()
+        cursor = self.rollup_collection.find(
+            {"granularity": granularity, "key": {"$gte": keys[0], "$lte": keys[-1]}},
+            {"_id": 0, "key": 1, "cost_usd": 1, "calls": 1},
+        )
+        return {doc["key"]: doc for doc in cursor}
+
+    @staticmethod
+    def _series(field: str, keys: List[str], buckets: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [
+            {
+                field: key,
+                "cost_usd": round(buckets.get(key, {}).get("cost_usd", 0.0), 6),
+                "calls": int(buckets.get(key, {}).get("calls", 0)),
+            }
+            for key in keys
+        ]
+
+    def get_hourly_costs(self, hours: int = 24) -> List[Dict[str, Any]]:
+        """
+        Get persisted costs by hour for the last N hours (zero-filled).
+
+        Returns:
+            List of dicts with 'hour', 'cost_usd', 'calls' keys
+        """
+        if hours <= 0:
+            return []
+        now = datetime.utcnow()
+        keys = [hour_key(now - timedelta(hours=hours - 1 - i)) for i in range(hours)]
+        return self._series("hour", keys, self._buckets("hour", keys))
+
+    def get_daily_costs(self, days: int = 7) -> List[Dict[str, Any]]:
+        """
+        Get persisted costs by day for the last N days (zero-filled).
+
+        Returns:
+            List of dicts with 'date', 'cost_usd', 'calls' keys
+        """
+        if days <= 0:
+            return []
+        now = datetime.utcnow()
+        keys = [day_key(now - timedelta(days=days - 1 - i)) for i in range(days)]
+        return self._series("date", keys, self._buckets("day", keys))
+
+    def get_job_cost(self, job_id: str) -> float:
+        """Get the persisted total cost for a job across all runs and processes."""
+        self.flush()
+        doc = self.rollup_collection.find_one({"granularity": "job", "key": job_id})
+        return float(doc.get("cost_usd", 0.0)) if doc else 0.0
+
+    def get_run_summary(self, run_id: str) -> UsageSummary:
+        """Get the persisted usage summary for a run."""
+        self.flush()
+        doc = self.rollup_collection.find_one({"granularity": "run", "key": run_id})
+        if not doc:
+            return UsageSummary()
+
+        def breakdown(name: str) -> Dict[str, Dict[str, Any]]:
+            return {
+                key: {
+                    "input_tokens": int(values.get("input_tokens", 0)),
+                    "output_tokens": int(values.get("output_tokens", 0)),
+                    "cost_usd": values.get("cost_usd", 0.0),
+                    "calls": int(values.get("calls", 0)),
+                }
+                for key, values in (doc.get(name) or {}).items()
+            }
+
+        input_tokens = int(doc.get("input_tokens", 0))
+        output_tokens = int(doc.get("output_tokens", 0))
+        return UsageSummary(
+            total_input_tokens=input_tokens,
+            total_output_tokens=output_tokens,
+            total_tokens=input_tokens + output_tokens,
+            total_cost_usd=doc.get("cost_usd", 0.0),
+            calls_count=int(doc.get("calls", 0)),
+            cache_hits=int(doc.get("cache_hits", 0)),
+            saved_cost_usd=doc.get("saved_cost_usd", 0.0),
+            by_provider=breakdown("by_provider"),
+            by_layer=breakdown("by_layer"),
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Writer counters for diagnostics."""
+        with self._lock:
+            pending = len(self._pending)
+        return {**self.stats, "pending": pending, "batch_size": self.batch_size}
+
+
+# =============================================================================
+# Global Ledger Instance
+# =============================================================================
+
+_global_ledger: Optional[CostLedger] = None
+_global_ledger_lock = threading.Lock()
+
+
+def is_cost_ledger_enabled() -> bool:
+    """Check whether the persistent cost ledger is switched on via environment."""
+    return os.getenv("COST_LEDGER_ENABLED", "false").lower() == "true"
+
+
+def get_cost_ledger() -> Optional[CostLedger]:
+    """
+    Get the process-wide cost ledger.
+
+    Returns:
+        The installed ledger (see set_cost_ledger), else a ledger built from
+        environment when COST_LEDGER_ENABLED=true, otherwise None. Also
+        returns None if MongoDB cannot be reached.
+    """
+    global _global_ledger
+
+    if _global_ledger is not None:
+        return _global_ledger
+    if not is_cost_ledger_enabled():
+        return None
+
+    with _global_ledger_lock:
+        if _global_ledger is None:
+            try:
+                from pymongo import MongoClient
+
+                mongodb_uri = os.getenv("MONGODB_URI")
+                if not mongodb_uri:
+                    raise ValueError("MONGODB_URI is required for the cost ledger")
+                db = MongoClient(mongodb_uri)["jobs"]
+                ledger = CostLedger(
+                    db["llm_cost_ledger"],
+                    db["llm_cost_rollups"],
+                    batch_size=int(os.getenv("COST_LEDGER_BATCH_SIZE", "50")),
+                    flush_interval_seconds=float(os.getenv("COST_LEDGER_FLUSH_SECONDS", "5")),
+                )
+                ledger.ensure_indexes()
+                atexit.register(ledger.flush)
+                _global_ledger = ledger
+            except Exception as e:
+                logger.warning(f"Cost ledger unavailable, keeping costs in memory only: {e}")
+                return None
+    return _global_ledger
+
+
+def set_cost_ledger(ledger: Optional[CostLedger]) -> None:
+    """Install a ledger instance (or None to fall back to environment)."""
+    global _global_ledger
+    _global_ledger = ledger
+
+
+def reset_cost_ledger() -> None:
+    """Flush and drop the global ledger (for testing)."""
+    global _global_ledger
+    if _global_ledger is not None:
+        try:
+            _global_ledger.flush()
+        except Exception:
+            pass
+    _global_ledger = None
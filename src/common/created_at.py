@@ -0,0 +1,126 @@
+"""
+createdAt normalisation for level-1/level-2 job documents.
+
+Historical rows (mostly n8n ingests) stored `createdAt` as an ISO string
+while every Python writer stores a BSON Date. Listing queries used to wrap
+the field in `$toDate` inside an aggregation, which converts every document
+and cannot use an index. Once every row holds a Date, date filters are plain
+indexed range scans on CREATED_AT_INDEX.
+
+- coerce_created_at(): parse one stored value into a UTC datetime
+- backfill_created_at(): rewrite string createdAt values as Dates in batches
+  (the migration runs it over whole collections; the selector worker runs
+  it with a limit to pick up rows written by other ingest paths)
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from pymongo import DESCENDING, UpdateOne
+from pymongo.collection import Collection
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+CREATED_AT_INDEX = [("createdAt", DESCENDING)]
+CREATED_AT_INDEX_NAME = "createdAt_desc"
+CREATED_AT_BACKFILL_BATCH = 500
+# IndexOptionsConflict: an equivalent index already exists under another name
+_INDEX_OPTIONS_CONFLICT = 85
+
+
+def coerce_created_at(value: Any) -> Optional[datetime]:
+    """
+    Parse a stored createdAt value into a timezone-aware UTC datetime.
+
+    Mirrors MongoDB's $toDate for the shapes seen in the archive: ISO 8601
+    strings with "Z", an offset or no zone (read as UTC, as $toDate does),
+    with or without fractional seconds, and date-only strings.
+
+    Args:
+        value: Stored createdAt (str or datetime)
+
+    Returns:
+        UTC datetime, or None if value is not a parseable date
+    """
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str) and value.strip():
+        text = value.strip()
+        if text.endswith(("Z", "z")):
+            text = text[:-1] + "+00:00"
+        try:
+            parsed = datetime.fromisoformat(text)
+        except ValueError:
+            return None
+    else:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def ensure_created_at_index(collection: Collection) -> None:
+    """Create the createdAt index used by date-filtered listing (keeps an existing equivalent one)."""
+    try:
+        collection.create_index(CREATED_AT_INDEX, name=CREATED_AT_INDEX_NAME)
+    except OperationFailure as exc:
+        if exc.code != _INDEX_OPTIONS_CONFLICT:
+            raise
+        logger.info("createdAt index already exists on %s under another name", collection.name)
+
+
+def backfill_created_at(
+    collection: Collection,
+    *,
+    limit: Optional[int] = None,
+    batch_size: int = CREATED_AT_BACKFILL_BATCH,
+) -> dict[str, int]:
+    """
+    Rewrite string createdAt values as BSON Dates.
+
+    String rows are found through CREATED_AT_INDEX ($type: "string" is an
+    index bound), so once a collection is normalised this is a cheap no-op.
+    Rows are walked in _id order, so strings that do not parse are counted
+    and left in place rather than re-read forever.
+
+    Args:
+        collection: level-1 or level-2
+        limit: Stop after examining this many rows (None = all)
+        batch_size: Rows read and written per round trip
+
+    Returns:
+        {"converted": rows rewritten, "unparseable": rows left as strings}
+    """
+    counts = {"converted": 0, "unparseable": 0}
+    last_id = None
+    while limit is None or sum(counts.values()) < limit:
+        size = batch_size if limit is None else min(batch_size, limit - sum(counts.values()))
+        query: dict[str, Any] = {"createdAt": {"$type": "string"}}
+        if last_id is not None:
+            query["_id"] = {"$gt": last_id}
+        documents = list(collection.find(query, {"createdAt": 1}).sort("_id", 1).limit(size))
+        if not documents:
+            break
+        last_id = documents[-1]["_id"]
+        operations = []
+        for document in documents:
+            created_at = coerce_created_at(document["createdAt"])
+            if created_at is None:
+                counts["unparseable"] += 1
+                logger.warning("Unparseable createdAt %r on %s", document["createdAt"], document["_id"])
+                continue
+            # Guarded on the original string so a concurrent rewrite is not clobbered
+            operations.append(
+                UpdateOne(
+                    {"_id": document["_id"], "createdAt": document["createdAt"]},
+                    {"$set": {"createdAt": created_at}},
+                )
+            )
+        if operations:
+            collection.bulk_write(operations, ordered=False)
+            counts["converted"] += len(operations)
+    return counts
@@ -98,6 +98,35 @@ def generate_dedupe_key(
     return f"{source}|{norm_company}|{norm_title}|{norm_location}"
 
 
+def company_title_key(company: Optional[str], title: Optional[str]) -> str:
+    """
+    Build the persisted company|title fingerprint used for secondary dedupe.
+
+    Stored on level-1/level-2 rows as `company_title_key` and indexed, so the
+    selector can look up candidate pairs with one `$in` query instead of
+    normalising every stored row.
+
+    Args:
+        company: Company name
+        title: Job title
+
+    Returns:
+        "{company}|{title}" normalised, or "" when either part is empty
+        (such rows never match; "" rather than None marks them as keyed)
+
+    Examples:
+        >>> company_title_key("McKinsey & Company", "Senior Consultant")
+        'mckinseycompany|seniorconsultant'
+        >>> company_title_key("Acme", None)
+        ''
+    """
+    norm_company = normalize_for_dedupe(company)
+    norm_title = normalize_for_dedupe(title)
+    if not norm_company or not norm_title:
+        return ""
+    return f"{norm_company}|{norm_title}"
+
+
 def extract_source_id_from_url(url: str, source: str) -> Optional[str]:
     """
     Extract source-specific job ID from URL.
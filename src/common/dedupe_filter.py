@@ -0,0 +1,469 @@
+"""
+Bloom prefilter for dedupeKey lookups.
+
+Discovery and the selectors check every job's dedupeKeys against level-1 and
+level-2 before doing any work. DedupePrefilter keeps a Bloom filter of every
+dedupeKey in those collections so that a definite miss needs no Mongo lookup;
+only keys the filter may contain are confirmed with the usual $in query.
+LinkedIn job IDs are covered through their derived keys
+(linkedin_scout|<id>, linkedin_import|<id>).
+
+The filter must never miss a stored key, so it is kept current three ways:
+
+- catch-up: at most every DEDUPE_BLOOM_CATCH_UP_SECONDS, documents whose
+  ObjectId is newer than the filter's watermark (less a safety margin for
+  client clock skew) are added, so keys written by other processes are seen
+  within that interval. This is an _id range read of recent documents only.
+- insert: this process's level-1/level-2 upserts add their keys immediately
+  via record_dedupe_keys()
+- rebuild: a full scan every DEDUPE_BLOOM_REBUILD_HOURS, and whenever the key
+  count outgrows the capacity the filter was sized for. With no saved filter
+  the first sync builds one before returning; later rebuilds run in a
+  background thread while the old filter keeps serving until the new one is
+  caught up and swapped in. That thread is not a daemon, so a short-lived
+  cron process finishes and saves the rebuild before it exits.
+
+The filter is persisted to DEDUPE_BLOOM_PATH (default
+dedupe_bloom.<database>.bin beside the scout queue) after every rebuild and
+at most every DEDUPE_BLOOM_REFRESH_SECONDS after catch-ups, so a new process
+loads it and only catches up. Documents with non-ObjectId _ids are only
+picked up on rebuild.
+
+Configuration:
+    DEDUPE_BLOOM_ENABLED: "true" (default) or "false"
+    DEDUPE_BLOOM_FP_RATE: Target false-positive rate (default 0.01)
+    DEDUPE_BLOOM_MAX_MB: Memory cap for the bit array (default 64); the
+        false-positive rate rises above target when the cap binds
+    DEDUPE_BLOOM_REBUILD_HOURS: Full rebuild interval (default 24)
+    DEDUPE_BLOOM_REFRESH_SECONDS: Minimum seconds between persisting catch-ups (default 60)
+    DEDUPE_BLOOM_CATCH_UP_SECONDS: Minimum seconds between catch-ups (default 10)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import os
+import struct
+import tempfile
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterable, Optional, Sequence
+
+import numpy as np
+from bson import ObjectId
+
+logger = logging.getLogger(__name__)
+
+DEDUPE_COLLECTIONS = ("level-1", "level-2")
+
+# magic, version, num_bits, num_hashes, count, capacity, built_at, watermark
+_HEADER = struct.Struct("<4sHQHQQdd")
+_MAGIC = b"DDBF"
+_VERSION = 1
+# Catch-up re-reads this far behind the watermark to tolerate client clock skew
+_CATCH_UP_MARGIN = timedelta(minutes=5)
+_MIN_CAPACITY = 100_000
+# Capacity headroom over the current key count when (re)building
+_GROWTH = 2.0
+
+
+def _hash_pairs(keys: Sequence[str]) -> np.ndarray:
+    """Two independent 64-bit hashes per key, shape (len(keys), 2)."""
+    digests = b"".join(hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest() for key in keys)
+    return np.frombuffer(digests, dtype="<u8").reshape(-1, 2)
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings, with k indexes by double hashing.
+
+    Args:
+        num_bits: Bit array size
+        num_hashes: Bits set per key
+        bits: Existing packed bit array (num_bits rounded up to bytes)
+        count: Keys added so far
+        capacity: Keys the filter was sized for
+    """
+
+    def __init__(
+        self,
+        num_bits: int,
+        num_hashes: int,
+        *,
+        bits: Optional[np.ndarray] = None,
+        count: int = 0,
+        capacity: int = 0,
+    ):
+        if num_bits <= 0 or num_hashes <= 0:
+            raise ValueError("BloomFilter needs positive num_bits and num_hashes")
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = bits if bits is not None else np.zeros((num_bits + 7) // 8, dtype=np.uint8)
+        self.count = count
+        self.capacity = capacity
+        self._offsets = np.arange(num_hashes, dtype=np.uint64)
+
+    @classmethod
+    def for_capacity(
+        cls,
+        capacity: int,
+        fp_rate: float = 0.01,
+        *,
+        max_bytes: Optional[int] = None,
+    ) -> "BloomFilter":
+        """
+        Size a filter for capacity keys at fp_rate.
+
+        Args:
+            capacity: Expected number of keys
+            fp_rate: Target false-positive rate at capacity
+            max_bytes: Cap on the bit array; when it binds, the filter keeps
+                the cap and the hash count is re-optimised for it
+
+        Returns:
+            An empty filter
+        """
+        if not 0.0 < fp_rate < 1.0:
+            raise ValueError("fp_rate must be between 0 and 1")
+        capacity = max(1, capacity)
+        num_bits = math.ceil(-capacity * math.log(fp_rate) / (math.log(2) ** 2))
+        if max_bytes is not None and num_bits > max_bytes * 8:
+            num_bits = max_bytes * 8
+            logger.warning(
+                "Dedupe Bloom filter capped at %s bytes; expected false-positive rate %.4f exceeds target %.4f",
+                max_bytes,
+                _expected_fp_rate(num_bits, max(1, round(num_bits / capacity * math.log(2))), capacity),
+                fp_rate,
+            )
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        return cls(num_bits, num_hashes, capacity=capacity)
+
+    @property
+    def memory_bytes(self) -> int:
+        return int(self.bits.nbytes)
+
+    def expected_fp_rate(self) -> float:
+        """False-positive rate implied by the current key count."""
+        return _expected_fp_rate(self.num_bits, self.num_hashes, self.count)
+
+    def _indexes(self, keys: Sequence[str]) -> np.ndarray:
+        pairs = _hash_pairs(keys)
+        # uint64 arithmetic wraps modulo 2**64 before the final modulo, which is fine for hashing
+        with np.errstate(over="ignore"):
+            combined = pairs[:, :1] + self._offsets * pairs[:, 1:]
+        return combined % np.uint64(self.num_bits)
+
+    def add_many(self, keys: Iterable[str]) -> None:
+        """Add keys."""
+        keys = list(keys)
+        if not keys:
+            return
+        indexes = self._indexes(keys).ravel()
+        np.bitwise_or.at(self.bits, indexes >> np.uint64(3), np.left_shift(1, indexes & np.uint64(7)).astype(np.uint8))
+        self.count += len(keys)
+
+    def add(self, key: str) -> None:
+        self.add_many([key])
+
+    def contains_many(self, keys: Sequence[str]) -> list[bool]:
+        """Whether each key may be present (False is definite)."""
+        if not keys:
+            return []
+        indexes = self._indexes(keys)
+        hits = (self.bits[indexes >> np.uint64(3)] >> (indexes & np.uint64(7)).astype(np.uint8)) & 1
+        return hits.all(axis=1).tolist()
+
+    def __contains__(self, key: str) -> bool:
+        return self.contains_many([key])[0]
+
+
+def _expected_fp_rate(num_bits: int, num_hashes: int, count: int) -> float:
+    return (1.0 - math.exp(-num_hashes * count / num_bits)) ** num_hashes
+
+
+@dataclass(frozen=True)
+class DedupeFilterConfig:
+    """Sizing and refresh policy for the dedupe prefilter."""
+
+    fp_rate: float = 0.01
+    max_memory_mb: float = 64.0
+    rebuild_hours: float = 24.0
+    refresh_seconds: float = 60.0
+    catch_up_seconds: float = 10.0
+
+    @classmethod
+    def from_env(cls) -> "DedupeFilterConfig":
+        return cls(
+            fp_rate=_env_float("DEDUPE_BLOOM_FP_RATE", 0.01),
+            max_memory_mb=_env_float("DEDUPE_BLOOM_MAX_MB", 64.0),
+            rebuild_hours=_env_float("DEDUPE_BLOOM_REBUILD_HOURS", 24.0),
+            refresh_seconds=_env_float("DEDUPE_BLOOM_REFRESH_SECONDS", 60.0),
+            catch_up_seconds=_env_float("DEDUPE_BLOOM_CATCH_UP_SECONDS", 10.0),
+        )
+
+    @property
+    def max_bytes(self) -> int:
+        return int(self.max_memory_mb * 1024 * 1024)
+
+
+class DedupePrefilter:
+    """
+    Bloom filter of stored dedupeKeys, kept current against Mongo.
+
+    Args:
+        config: Sizing and refresh policy
+        path: Where the filter is persisted (None keeps it in memory only)
+        collections: Collections whose dedupeKeys are tracked
+    """
+
+    def __init__(
+        self,
+        config: Optional[DedupeFilterConfig] = None,
+        *,
+        path: Optional[Path] = None,
+        collections: Sequence[str] = DEDUPE_COLLECTIONS,
+    ):
+        self.config = config or DedupeFilterConfig()
+        self.path = path
+        self.collections = tuple(collections)
+        self.bloom: Optional[BloomFilter] = None
+        self.built_at: Optional[datetime] = None
+        self.watermark: Optional[datetime] = None
+        self._loaded = False
+        self._saved_at: Optional[datetime] = None
+        self._caught_up_at: Optional[datetime] = None
+        self._rebuild_thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+
+    def sync(self, db: Any, *, now: Optional[datetime] = None) -> None:
+        """
+        Bring the filter up to date with db.
+
+        Loads the persisted filter on first use, building (and saving) it
+        first when there is none. Catches up on documents newer than the
+        watermark at most every catch_up_seconds, and starts a background
+        rebuild when the filter is stale or over capacity.
+        """
+        current_time = now or datetime.now(timezone.utc)
+        with self._lock:
+            if not self._loaded:
+                self.load()
+                self._loaded = True
+        if self.bloom is None:
+            with self._build_lock:
+                if self.bloom is None:
+                    self._rebuild(db, now=current_time)
+            return
+        with self._lock:
+            if self._needs_rebuild(current_time):
+                self._start_rebuild(db, now=current_time)
+            if self._caught_up_at is not None and current_time - self._caught_up_at < timedelta(
+                seconds=self.config.catch_up_seconds
+            ):
+                return
+            self._caught_up_at = current_time
+            if self._catch_up(db, now=current_time):
+                if self._saved_at is None or current_time - self._saved_at >= timedelta(seconds=self.config.refresh_seconds):
+                    self.save()
+                    self._saved_at = current_time
+
+    def wait_for_rebuild(self, timeout: Optional[float] = None) -> bool:
+        """Wait for a running background rebuild; returns whether none is running."""
+        thread = self._rebuild_thread
+        if thread is not None:
+            thread.join(timeout)
+            return not thread.is_alive()
+        return True
+
+    def possible(self, keys: Sequence[str]) -> list[str]:
+        """Keys that may be stored (every stored key is returned); needs sync() first."""
+        with self._lock:
+            if self.bloom is None:
+                return list(keys)
+            return [key for key, maybe in zip(keys, self.bloom.contains_many(keys)) if maybe]
+
+    def add(self, keys: Iterable[str]) -> None:
+        """Record keys this process just stored."""
+        keys = [key for key in keys if key]
+        with self._lock:
+            if self.bloom is not None and keys:
+                self.bloom.add_many(keys)
+
+    def _needs_rebuild(self, now: datetime) -> bool:
+        if now - self.built_at >= timedelta(hours=self.config.rebuild_hours):
+            return True
+        return self.bloom.count > self.bloom.capacity
+
+    def _start_rebuild(self, db: Any, *, now: datetime) -> None:
+        if self._rebuild_thread is not None and self._rebuild_thread.is_alive():
+            return
+        # Not a daemon: a process that exits mid-scan waits for the rebuild to be saved
+        self._rebuild_thread = threading.Thread(
+            target=self._rebuild, args=(db,), kwargs={"now": now}, name="dedupe-bloom-rebuild", daemon=False
+        )
+        self._rebuild_thread.start()
+
+    def _rebuild(self, db: Any, *, now: datetime) -> None:
+        """Scan every dedupeKey into a new filter, then swap it in."""
+        try:
+            counts = [db[name].estimated_document_count() for name in self.collections]
+            capacity = max(_MIN_CAPACITY, int(sum(counts) * _GROWTH))
+            bloom = BloomFilter.for_capacity(capacity, self.config.fp_rate, max_bytes=self.config.max_bytes)
+            for name in self.collections:
+                batch: list[str] = []
+                for document in db[name].find({"dedupeKey": {"$type": "string"}}, {"dedupeKey": 1, "_id": 0}):
+                    batch.append(document["dedupeKey"])
+                    if len(batch) >= 50_000:
+                        bloom.add_many(batch)
+                        batch = []
+                bloom.add_many(batch)
+            with self._lock:
+                # Watermark at the scan start: the catch-up adds whatever was written during the scan
+                self.bloom, self.built_at, self.watermark = bloom, now, now
+                self._catch_up(db, now=max(now, datetime.now(timezone.utc)))
+                self.save()
+                self._saved_at = self._caught_up_at = now
+        except Exception as exc:
+            logger.warning("Dedupe Bloom filter rebuild failed; keeping the previous filter: %s", exc)
+            return
+        logger.info(
+            "Dedupe Bloom filter rebuilt: %s keys, %s bytes, expected false-positive rate %.4f",
+            bloom.count,
+            bloom.memory_bytes,
+            bloom.expected_fp_rate(),
+        )
+
+    def _catch_up(self, db: Any, *, now: datetime) -> int:
+        since = ObjectId.from_datetime(self.watermark - _CATCH_UP_MARGIN)
+        keys = [
+            document["dedupeKey"]
+            for name in self.collections
+            for document in db[name].find({"_id": {"$gte": since}}, {"dedupeKey": 1, "_id": 0})
+            if isinstance(document.get("dedupeKey"), str)
+        ]
+        # The margin re-reads recent documents; only count keys the filter lacks
+        new_keys = [key for key, maybe in zip(keys, self.bloom.contains_many(keys)) if not maybe]
+        self.bloom.add_many(new_keys)
+        self.watermark = max(self.watermark, now)
+        return len(new_keys)
+
+    def load(self) -> None:
+        """Load the persisted filter, if there is a readable one at path."""
+        path = self.path
+        if path is None or not path.exists():
+            return
+        try:
+            payload = path.read_bytes()
+            magic, version, num_bits, num_hashes, count, capacity, built_at, watermark = _HEADER.unpack_from(payload)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(f"unrecognised header {magic!r} v{version}")
+            bits = np.frombuffer(payload, dtype=np.uint8, offset=_HEADER.size).copy()
+            if bits.size != (num_bits + 7) // 8:
+                raise ValueError("truncated bit array")
+        except (OSError, ValueError, struct.error) as exc:
+            logger.warning("Ignoring unreadable dedupe Bloom filter at %s: %s", path, exc)
+            return
+        self.bloom = BloomFilter(num_bits, num_hashes, bits=bits, count=count, capacity=capacity)
+        self.built_at = datetime.fromtimestamp(built_at, tz=timezone.utc)
+        self.watermark = datetime.fromtimestamp(watermark, tz=timezone.utc)
+
+    def save(self) -> None:
+        """Persist the filter to path (no-op without a path or filter)."""
+        path = self.path
+        if path is None or self.bloom is None:
+            return
+        header = _HEADER.pack(
+            _MAGIC,
+            _VERSION,
+            self.bloom.num_bits,
+            self.bloom.num_hashes,
+            self.bloom.count,
+            self.bloom.capacity,
+            self.built_at.timestamp(),
+            self.watermark.timestamp(),
+        )
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so concurrent readers never see a partial file
+            with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name, delete=False) as handle:
+                handle.write(header)
+                handle.write(self.bloom.bits.tobytes())
+            os.replace(handle.name, path)
+        except OSError as exc:
+            logger.warning("Could not persist dedupe Bloom filter to %s: %s", path, exc)
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def dedupe_prefilter_enabled() -> bool:
+    """Whether dedupe lookups go through the Bloom prefilter (DEDUPE_BLOOM_ENABLED, default true)."""
+    return os.getenv("DEDUPE_BLOOM_ENABLED", "true").strip().lower() == "true"
+
+
+def default_dedupe_filter_path(db_name: str) -> Path:
+    """DEDUPE_BLOOM_PATH, else dedupe_bloom.<db_name>.bin beside the scout queue."""
+    configured = os.getenv("DEDUPE_BLOOM_PATH")
+    if configured:
+        return Path(configured)
+    env_dir = os.environ.get("SCOUT_QUEUE_DIR")
+    base = Path(env_dir) if env_dir else Path(__file__).parent.parent.parent / "data" / "scout"
+    return base / f"dedupe_bloom.{db_name}.bin"
+
+
+_prefilter: Optional[DedupePrefilter] = None
+# The database the prefilter tracks; held so a new handle gets its own filter
+_prefilter_db: Any = None
+_prefilter_lock = threading.Lock()
+
+
+def get_dedupe_prefilter(db: Any) -> Optional[DedupePrefilter]:
+    """
+    Get the process-wide prefilter, synced against db.
+
+    Args:
+        db: Database holding level-1 and level-2
+
+    Returns:
+        The shared DedupePrefilter, or None when disabled or unavailable
+        (callers then query Mongo for every key)
+    """
+    global _prefilter, _prefilter_db
+
+    if not dedupe_prefilter_enabled():
+        return None
+    try:
+        with _prefilter_lock:
+            if _prefilter is None or _prefilter_db is not db:
+                _prefilter = DedupePrefilter(DedupeFilterConfig.from_env(), path=default_dedupe_filter_path(db.name))
+                _prefilter_db = db
+            prefilter = _prefilter
+        prefilter.sync(db)
+    except Exception as exc:
+        logger.warning("Dedupe Bloom filter unavailable (%s); checking every key in Mongo", exc)
+        return None
+    return prefilter
+
+
+def record_dedupe_keys(keys: Iterable[str]) -> None:
+    """Add just-stored dedupeKeys to the process-wide prefilter, if loaded."""
+    prefilter = _prefilter
+    if prefilter is not None:
+        prefilter.add(keys)
+
+
+def reset_dedupe_prefilter() -> None:
+    """Drop the process-wide prefilter (tests, forced reload)."""
+    global _prefilter, _prefilter_db
+
+    with _prefilter_lock:
+        _prefilter = _prefilter_db = None
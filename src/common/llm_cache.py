@@ -0,0 +1,462 @@
+"""
+Prompt-Level LLM Response Cache.
+
+Content-addressed cache for LLM responses so that retries and re-runs on an
+unchanged JD don't pay for the same prompt twice. Entries are keyed by a
+SHA-256 over (model, tier, system prompt, user prompt, schema version) and
+stored either in a local SQLite file (default) or a MongoDB collection.
+
+The cache is strictly opt-in:
+    - LLM_RESPONSE_CACHE_ENABLED=true turns it on process-wide
+    - LLM_RESPONSE_CACHE_BACKEND=sqlite|mongo selects the store (default sqlite)
+    - LLM_RESPONSE_CACHE_PATH sets the SQLite file location
+    - LLM_RESPONSE_CACHE_TTL_SECONDS sets freshness (default 7 days)
+    - LLM_RESPONSE_CACHE_MAX_ENTRIES bounds the store size (default 5000)
+
+Individual calls can bypass it with use_cache=False on UnifiedLLM.invoke /
+ClaudeCLI.invoke.
+
+Usage:
+    from src.common.llm_cache import build_cache_key, get_llm_response_cache
+
+    cache = get_llm_response_cache()  # None when disabled
+    if cache:
+        key = build_cache_key(model, tier, system, prompt, schema_version="v2")
+        entry = cache.get(key)
+        if entry is None:
+            ...  # invoke the LLM, then cache.put(key, CachedResponse(...))
+
+    cache.get_stats()  # {"hits": 3, "misses": 7, "hit_rate": 0.3, "saved_cost_usd": 0.12, ...}
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached payload layout changes so old entries are ignored.
+CACHE_FORMAT_VERSION = "1"
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 5000
+
+
+def build_cache_key(
+    model: str,
+    tier: str,
+    system: Optional[str],
+    prompt: str,
+    schema_version: Optional[str] = None,
+    validate_json: bool = True,
+) -> str:
+    """
+    Build a content-addressed cache key for an LLM call.
+
+    Args:
+        model: Model identifier the call will be routed to
+        tier: Tier level ("low", "middle", "high")
+        system: System prompt (None/empty treated identically)
+        prompt: User prompt
+        schema_version: Caller-supplied output schema version; bump it to
+            invalidate entries produced under an older response contract
+        validate_json: Whether the response is parsed as JSON (raw text and
+            parsed responses are cached separately)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    material = json.dumps(
+        [
+            CACHE_FORMAT_VERSION,
+            model,
+            tier,
+            system or "",
+            prompt,
+            schema_version or "",
+            bool(validate_json),
+        ],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedResponse:
+    """A cached LLM response plus the cost it originally incurred."""
+    content: str
+    model: str
+    tier: str
+    backend: str = ""
+    parsed_json: Optional[Dict[str, Any]] = None
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+    cost_usd: Optional[float] = None
+    created_at: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for storage."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CachedResponse":
+        """Rebuild from a stored dictionary, ignoring unknown keys."""
+        return cls(
+            content=data.get("content") or "",
+            model=data.get("model") or "",
+            tier=data.get("tier") or "",
+            backend=data.get("backend") or "",
+            parsed_json=data.get("parsed_json"),
+            input_tokens=data.get("input_tokens"),
+            output_tokens=data.get("output_tokens"),
+            cost_usd=data.get("cost_usd"),
+            created_at=data.get("created_at") or 0.0,
+        )
+
+
+class CacheBackend(ABC):
+    """Storage interface for the response cache."""
+
+    @abstractmethod
+    def get(self, key: str, min_created_at: float) -> Optional[Dict[str, Any]]:
+        """Return the stored payload if present and newer than min_created_at."""
+        pass
+
+    @abstractmethod
+    def put(self, key: str, payload: Dict[str, Any], max_entries: int) -> None:
+        """Store a payload and evict the oldest entries beyond max_entries."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+        pass
+
+    @abstractmethod
+    def count(self) -> int:
+        """Number of stored entries."""
+        pass
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Local SQLite store.
+
+    Eviction is least-recently-used: last_used_at is refreshed on every hit
+    and the oldest rows beyond max_entries are dropped on insert.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_response_cache (
+                key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used "
+            "ON llm_response_cache(last_used_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str, min_created_at: float) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM llm_response_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] < min_created_at:
+                self._conn.execute("DELETE FROM llm_response_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute(
+                "UPDATE llm_response_cache SET last_used_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            self._conn.commit()
+        return json.loads(row[0])
+
+    def put(self, key: str, payload: Dict[str, Any], max_entries: int) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_response_cache "
+                "(key, payload, created_at, last_used_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(payload, ensure_ascii=False), payload.get("created_at", now), now),
+            )
+            self._conn.execute(
+                "DELETE FROM llm_response_cache WHERE key IN ("
+                "SELECT key FROM llm_response_cache ORDER BY last_used_at DESC LIMIT -1 OFFSET ?)",
+                (max_entries,),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_response_cache")
+            self._conn.commit()
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()[0]
+
+
+class MongoCacheBackend(CacheBackend):
+    """
+    MongoDB store (collection ``llm_response_cache``).
+
+    Freshness is enforced on read and by a TTL index on ``expires_at``;
+    size is bounded by trimming the least-recently-used documents on insert.
+    """
+
+    def __init__(self, collection: Any, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        self._collection = collection
+        self._ttl_seconds = ttl_seconds
+
+    def ensure_indexes(self) -> None:
+        """Create the TTL and LRU indexes."""
+        try:
+            self._collection.create_index("expires_at", expireAfterSeconds=0)
+            self._collection.create_index("last_used_at")
+        except Exception as e:
+            logger.warning(f"Error creating llm_response_cache indexes: {e}")
+
+    def get(self, key: str, min_created_at: float) -> Optional[Dict[str, Any]]:
+        doc = self._collection.find_one_and_update(
+            {"_id": key, "payload.created_at": {"$gte": min_created_at}},
+            {"$set": {"last_used_at": time.time()}, "$inc": {"hit_count": 1}},
+        )
+        if not doc:
+            return None
+        return doc.get("payload")
+
+    def put(self, key: str, payload: Dict[str, Any], max_entries: int) -> None:
+        from datetime import datetime, timedelta
+
+        now = time.time()
+        self._collection.update_one(
+            {"_id": key},
+            {
+                "$set": {
+                    "payload": payload,
+                    "last_used_at": now,
+                    "expires_at": datetime.utcnow() + timedelta(seconds=self._ttl_seconds),
+                },
+                "$setOnInsert": {"hit_count": 0},
+            },
+            upsert=True,
+        )
+        overflow = self._collection.estimated_document_count() - max_entries
+        if overflow > 0:
+            stale_ids = [
+                doc["_id"]
+                for doc in self._collection.find({}, {"_id": 1})
+                .sort("last_used_at", 1)
+                .limit(overflow)
+            ]
+            if stale_ids:
+                self._collection.delete_many({"_id": {"$in": stale_ids}})
+
+    def clear(self) -> None:
+        self._collection.delete_many({})
+
+    def count(self) -> int:
+        return self._collection.estimated_document_count()
+
+
+class LLMResponseCache:
+    """
+    Thread-safe response cache with TTL, size bound and hit accounting.
+
+    Storage errors never propagate: a failing backend degrades to a miss so
+    the caller simply invokes the LLM as it would without the cache.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: Storage backend (SQLite or Mongo)
+            ttl_seconds: Entries older than this are treated as misses
+            max_entries: Maximum number of stored entries before LRU eviction
+        """
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._saved_cost_usd = 0.0
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Key from build_cache_key()
+
+        Returns:
+            CachedResponse on hit, None on miss or backend error
+        """
+        try:
+            payload = self.backend.get(key, time.time() - self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"[LLMCache] Lookup failed (treating as miss): {e}")
+            payload = None
+
+        with self._lock:
+            if payload is None:
+                self._misses += 1
+                return None
+            entry = CachedResponse.from_dict(payload)
+            self._hits += 1
+            self._saved_cost_usd += entry.cost_usd or 0.0
+            return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        """
+        Store a response. Failures are logged and swallowed.
+
+        Args:
+            key: Key from build_cache_key()
+            entry: Response to cache
+        """
+        if not entry.created_at:
+            entry.created_at = time.time()
+        try:
+            self.backend.put(key, entry.to_dict(), self.max_entries)
+        except Exception as e:
+            logger.warning(f"[LLMCache] Store failed (ignored): {e}")
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        self.backend.clear()
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._saved_cost_usd = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hit-rate and savings statistics for this process.
+
+        Returns:
+            Dict with hits, misses, hit_rate, saved_cost_usd and entries
+        """
+        try:
+            entries = self.backend.count()
+        except Exception:
+            entries = None
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "saved_cost_usd": round(self._saved_cost_usd, 6),
+                "entries": entries,
+                "ttl_seconds": self.ttl_seconds,
+                "max_entries": self.max_entries,
+            }
+
+
+# =============================================================================
+# Global Cache Instance
+# =============================================================================
+
+_global_cache: Optional[LLMResponseCache] = None
+_global_cache_lock = threading.Lock()
+
+
+def is_llm_cache_enabled() -> bool:
+    """Check whether the response cache is switched on via environment."""
+    return os.getenv("LLM_RESPONSE_CACHE_ENABLED", "false").lower() == "true"
+
+
+def _create_backend(ttl_seconds: int) -> CacheBackend:
+    """Create the backend selected by LLM_RESPONSE_CACHE_BACKEND."""
+    backend_name = os.getenv("LLM_RESPONSE_CACHE_BACKEND", "sqlite").lower()
+    if backend_name == "mongo":
+        from pymongo import MongoClient
+
+        mongodb_uri = os.getenv("MONGODB_URI")
+        if not mongodb_uri:
+            raise ValueError("MONGODB_URI is required for the mongo LLM cache backend")
+        client = MongoClient(mongodb_uri)
+        backend = MongoCacheBackend(client["jobs"]["llm_response_cache"], ttl_seconds)
+        backend.ensure_indexes()
+        return backend
+
+    path = os.getenv(
+        "LLM_RESPONSE_CACHE_PATH",
+        os.path.join(tempfile.gettempdir(), "job-search", "llm_response_cache.sqlite3"),
+    )
+    return SQLiteCacheBackend(path)
+
+
+def get_llm_response_cache() -> Optional[LLMResponseCache]:
+    """
+    Get the process-wide response cache.
+
+    Returns:
+        The installed cache (see set_llm_response_cache), else a cache built
+        from environment when LLM_RESPONSE_CACHE_ENABLED=true, otherwise None.
+        Also returns None if the configured backend cannot be opened.
+    """
+    global _global_cache
+
+    if _global_cache is not None:
+        return _global_cache
+    if not is_llm_cache_enabled():
+        return None
+
+    with _global_cache_lock:
+        if _global_cache is None:
+            ttl_seconds = int(os.getenv("LLM_RESPONSE_CACHE_TTL_SECONDS", str(DEFAULT_TTL_SECONDS)))
+            max_entries = int(os.getenv("LLM_RESPONSE_CACHE_MAX_ENTRIES", str(DEFAULT_MAX_ENTRIES)))
+            try:
+                backend = _create_backend(ttl_seconds)
+            except Exception as e:
+                logger.warning(f"[LLMCache] Cache disabled, backend unavailable: {e}")
+                return None
+            _global_cache = LLMResponseCache(backend, ttl_seconds, max_entries)
+        return _global_cache
+
+
+def set_llm_response_cache(cache: Optional[LLMResponseCache]) -> None:
+    """Install a specific cache instance as the global cache (for tests/wiring)."""
+    global _global_cache
+    with _global_cache_lock:
+        _global_cache = cache
+
+
+def reset_llm_response_cache() -> None:
+    """Drop the global cache instance (for testing)."""
+    set_llm_response_cache(None)
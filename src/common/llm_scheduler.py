@@ -0,0 +1,543 @@
+"""
+Global LLM Scheduler.
+
+Process-wide admission control for LLM calls. Every UnifiedLLM invocation
+(and ClaudeCLI.invoke_batch item) acquires a slot here before it reaches a
+provider, so concurrent batch runs share one budget instead of each service
+throttling on its own.
+
+Per provider the scheduler enforces:
+    - max concurrent in-flight calls
+    - a tokens-per-minute budget (token bucket; estimates are charged up
+      front and corrected with actual usage on release)
+
+Waiting calls are ordered by:
+    1. Priority class: interactive > batch > backfill (strict)
+    2. Fair queuing across jobs within a class (round-robin per job_key),
+       so one 500-job backfill can't push a single job to the back
+
+The scheduler is thread- and event-loop-safe: state is guarded by a
+threading.Lock and waiters are woken via call_soon_threadsafe on their own
+loop, so callers using run_async() in worker threads share the same budget.
+Token-budget refills are re-dispatched from a scheduler-owned timer thread,
+never from a waiter's loop, which may close before the timer fires.
+
+Configuration (environment, per provider name upper-cased):
+    LLM_SCHEDULER_ENABLED=false                  Bypass the scheduler entirely
+    LLM_SCHEDULER_<PROVIDER>_MAX_CONCURRENT=4    Concurrency cap
+    LLM_SCHEDULER_<PROVIDER>_TPM=200000          Tokens-per-minute budget (0 = unlimited)
+
+Usage:
+    scheduler = get_llm_scheduler()
+    async with scheduler.slot("claude_cli", estimated_tokens=3000,
+                              priority="interactive", job_key=job_id) as grant:
+        result = await call_llm()
+        grant.actual_tokens = result.input_tokens + result.output_tokens
+
+    # Runner operations tag all nested UnifiedLLM calls at once
+    with llm_scheduling_context(priority="interactive", job_key=job_id):
+        await operation.execute(...)
+"""
+
+import asyncio
+import contextvars
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Deque, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """Priority classes (lower value is served first)."""
+    INTERACTIVE = 0
+    BATCH = 1
+    BACKFILL = 2
+
+    @classmethod
+    def parse(cls, value: Any) -> "Priority":
+        """Accept a Priority, its name ("interactive") or its int value."""
+        if isinstance(value, Priority):
+            return value
+        if isinstance(value, str):
+            return cls[value.upper()]
+        return cls(int(value))
+
+
+# Defaults per provider: (max_concurrent, tokens_per_minute or None)
+DEFAULT_PROVIDER_BUDGETS = {
+    "claude_cli": (4, None),
+    "anthropic": (4, 400_000),
+    "openai": (8, 800_000),
+    "openrouter": (4, 200_000),
+}
+
+# Rough output allowance added to prompt-size estimates
+DEFAULT_OUTPUT_TOKEN_ESTIMATE = 1500
+
+_current_priority: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "llm_scheduler_priority", default=None
+)
+_current_job_key: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "llm_scheduler_job_key", default=None
+)
+
+
+@contextmanager
+def llm_scheduling_context(
+    priority: Optional[str] = None,
+    job_key: Optional[str] = None,
+) -> Iterator[None]:
+    """
+    Tag all LLM calls made inside this block with a priority/job key.
+
+    Explicit per-call arguments still win over the context.
+    """
+    priority_token = _current_priority.set(priority)
+    job_token = _current_job_key.set(job_key)
+    try:
+        yield
+    finally:
+        _current_priority.reset(priority_token)
+        _current_job_key.reset(job_token)
+
+
+def current_scheduling_context() -> tuple[Optional[str], Optional[str]]:
+    """Return the (priority, job_key) set by llm_scheduling_context, if any."""
+    return _current_priority.get(), _current_job_key.get()
+
+
+def estimate_tokens(text: str, expected_output_tokens: int = DEFAULT_OUTPUT_TOKEN_ESTIMATE) -> int:
+    """Estimate total tokens for a call (~4 chars per token plus output allowance)."""
+    return len(text or "") // 4 + expected_output_tokens
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at capacity-per-minute."""
+
+    def __init__(self, tokens_per_minute: Optional[int]):
+        self.capacity = tokens_per_minute
+        self.level = float(tokens_per_minute or 0)
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if self.capacity:
+            self.level = min(
+                float(self.capacity),
+                self.level + (now - self._updated) * self.capacity / 60.0,
+            )
+        self._updated = now
+
+    def time_until(self, tokens: int) -> float:
+        """Seconds until `tokens` can be charged (0 if now)."""
+        if not self.capacity:
+            return 0.0
+        self._refill()
+        # A single call larger than the whole budget only needs a full bucket
+        needed = min(tokens, self.capacity) - self.level
+        if needed <= 0:
+            return 0.0
+        return needed * 60.0 / self.capacity
+
+    def consume(self, tokens: int) -> None:
+        if self.capacity:
+            self._refill()
+            self.level -= tokens
+
+    def adjust(self, delta: int) -> None:
+        """Refund (positive) or charge (negative) tokens after the fact."""
+        if self.capacity:
+            self._refill()
+            self.level = min(float(self.capacity), self.level + delta)
+
+
+@dataclass
+class _Ticket:
+    provider: str
+    tokens: int
+    priority: Priority
+    job_key: str
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+    granted_at: Optional[float] = None
+
+
+@dataclass
+class SchedulerGrant:
+    """Handle for an admitted call; set actual_tokens before release if known."""
+    provider: str
+    estimated_tokens: int
+    priority: Priority
+    job_key: str
+    wait_seconds: float
+    actual_tokens: Optional[int] = None
+
+
+class _ProviderState:
+    def __init__(self, name: str, max_concurrent: int, tokens_per_minute: Optional[int]):
+        self.name = name
+        self.max_concurrent = max(1, max_concurrent)
+        self.bucket = TokenBucket(tokens_per_minute)
+        self.in_flight = 0
+        self.queues: Dict[Priority, "OrderedDict[str, Deque[_Ticket]]"] = {
+            p: OrderedDict() for p in Priority
+        }
+        self.completed = 0
+        self.timer_pending = False
+        self.timer: Optional[threading.Timer] = None
+
+    def queued(self) -> int:
+        return sum(len(d) for q in self.queues.values() for d in q.values())
+
+    def peek(self) -> Optional[_Ticket]:
+        for priority in Priority:
+            queue = self.queues[priority]
+            if queue:
+                job_key = next(iter(queue))
+                return queue[job_key][0]
+        return None
+
+    def pop(self, ticket: _Ticket) -> None:
+        queue = self.queues[ticket.priority]
+        job_queue = queue[ticket.job_key]
+        job_queue.popleft()
+        if job_queue:
+            queue.move_to_end(ticket.job_key)  # round-robin to the next job
+        else:
+            del queue[ticket.job_key]
+
+    def remove(self, ticket: _Ticket) -> bool:
+        queue = self.queues[ticket.priority]
+        job_queue = queue.get(ticket.job_key)
+        if job_queue is None or ticket not in job_queue:
+            return False
+        job_queue.remove(ticket)
+        if not job_queue:
+            del queue[ticket.job_key]
+        return True
+
+
+class _WaitStats:
+    """Queue-wait samples per priority class (bounded)."""
+
+    def __init__(self, max_samples: int = 2000):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: Deque[float] = deque(maxlen=max_samples)
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.samples.append(seconds)
+
+    def percentile(self, pct: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "avg_wait_seconds": round(self.total / self.count, 4) if self.count else 0.0,
+            "p50_wait_seconds": round(self.percentile(50), 4),
+            "p95_wait_seconds": round(self.percentile(95), 4),
+            "max_wait_seconds": round(self.max, 4),
+        }
+
+
+class LLMScheduler:
+    """Priority- and token-aware admission control shared by all LLM callers."""
+
+    def __init__(self, budgets: Optional[Dict[str, tuple]] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            budgets: Optional {provider: (max_concurrent, tokens_per_minute)}
+                overrides; unknown providers fall back to environment/defaults.
+        """
+        self._budgets = dict(budgets or {})
+        self._providers: Dict[str, _ProviderState] = {}
+        self._lock = threading.Lock()
+        self._wait_stats: Dict[Priority, _WaitStats] = {p: _WaitStats() for p in Priority}
+
+    def _provider_state(self, provider: str) -> _ProviderState:
+        state = self._providers.get(provider)
+        if state is None:
+            if provider in self._budgets:
+                max_concurrent, tpm = self._budgets[provider]
+            else:
+                default_concurrent, default_tpm = DEFAULT_PROVIDER_BUDGETS.get(provider, (4, None))
+                prefix = f"LLM_SCHEDULER_{provider.upper()}"
+                max_concurrent = int(os.getenv(f"{prefix}_MAX_CONCURRENT", str(default_concurrent)))
+                tpm = int(os.getenv(f"{prefix}_TPM", str(default_tpm or 0))) or None
+            state = _ProviderState(provider, max_concurrent, tpm)
+            self._providers[provider] = state
+        return state
+
+    def _dispatch_locked(self, state: _ProviderState) -> Optional[float]:
+        """
+        Grant queued tickets while capacity allows.
+
+        Returns:
+            Seconds until the head ticket's tokens are available, or None if
+            nothing is blocked on the token budget.
+        """
+        while state.in_flight < state.max_concurrent:
+            ticket = state.peek()
+            if ticket is None:
+                return None
+            if ticket.loop.is_closed():
+                # The caller's loop went away without cancelling the wait
+                state.pop(ticket)
+                continue
+            wait = state.bucket.time_until(ticket.tokens)
+            if wait > 0:
+                # Head-of-line: lower classes don't overtake a token-blocked
+                # ticket. Re-dispatch once the bucket has refilled enough.
+                self._schedule_redispatch_locked(state, wait)
+                return wait
+            state.pop(ticket)
+            state.bucket.consume(ticket.tokens)
+            state.in_flight += 1
+            ticket.granted_at = time.monotonic()
+            try:
+                ticket.loop.call_soon_threadsafe(_resolve, ticket.future)
+            except RuntimeError:
+                # Loop closed between the check and the wakeup: take the grant back
+                state.in_flight -= 1
+                state.bucket.adjust(ticket.tokens)
+                ticket.granted_at = None
+        return None
+
+    def _schedule_redispatch_locked(self, state: _ProviderState, delay: float) -> None:
+        """
+        Arm the provider's refill timer (at most one per provider).
+
+        The timer is a scheduler-owned thread rather than a call_later on a
+        waiter's loop, so it still fires if that loop closes first.
+        """
+        if state.timer_pending:
+            return
+        timer = threading.Timer(delay, self._redispatch, args=(state,))
+        timer.daemon = True
+        state.timer_pending = True
+        state.timer = timer
+        try:
+            timer.start()
+        except RuntimeError:
+            state.timer_pending = False
+            state.timer = None
+            logger.exception("LLM scheduler could not arm the %s refill timer", state.name)
+
+    def _cancel_redispatch_locked(self, state: _ProviderState) -> None:
+        if state.timer is not None:
+            state.timer.cancel()
+        state.timer_pending = False
+        state.timer = None
+
+    def _redispatch(self, state: _ProviderState) -> None:
+        with self._lock:
+            state.timer_pending = False
+            state.timer = None
+            self._dispatch_locked(state)
+
+    async def acquire(
+        self,
+        provider: str,
+        estimated_tokens: int = DEFAULT_OUTPUT_TOKEN_ESTIMATE,
+        priority: Any = Priority.BATCH,
+        job_key: Optional[str] = None,
+    ) -> SchedulerGrant:
+        """
+        Wait for an admission slot.
+
+        Args:
+            provider: Provider/budget name ("claude_cli", "openai", ...)
+            estimated_tokens: Tokens to charge against the per-minute budget
+            priority: Priority class (enum, name or int)
+            job_key: Fair-queuing key (job ID); calls without one share a key
+
+        Returns:
+            SchedulerGrant to pass to release()
+        """
+        loop = asyncio.get_running_loop()
+        ticket = _Ticket(
+            provider=provider,
+            tokens=max(0, int(estimated_tokens)),
+            priority=Priority.parse(priority),
+            job_key=job_key or "_default",
+            loop=loop,
+            future=loop.create_future(),
+        )
+        with self._lock:
+            state = self._provider_state(provider)
+            state.queues[ticket.priority].setdefault(ticket.job_key, deque()).append(ticket)
+            self._dispatch_locked(state)
+
+        try:
+            await ticket.future
+        except BaseException:
+            with self._lock:
+                if not state.remove(ticket) and ticket.granted_at is not None:
+                    # Granted just as we were cancelled: hand the slot back
+                    state.in_flight -= 1
+                    state.bucket.adjust(ticket.tokens)
+                if state.peek() is None:
+                    # Abandoned the last waiter: no refill timer is needed
+                    self._cancel_redispatch_locked(state)
+                else:
+                    # The abandoned ticket may have been the token-blocked head
+                    self._dispatch_locked(state)
+            raise
+
+        wait_seconds = ticket.granted_at - ticket.enqueued_at
+        with self._lock:
+            self._wait_stats[ticket.priority].add(wait_seconds)
+        return SchedulerGrant(
+            provider=provider,
+            estimated_tokens=ticket.tokens,
+            priority=ticket.priority,
+            job_key=ticket.job_key,
+            wait_seconds=wait_seconds,
+        )
+
+    def release(self, grant: SchedulerGrant) -> None:
+        """Return a slot and reconcile the token estimate with actual usage."""
+        with self._lock:
+            state = self._provider_state(grant.provider)
+            state.in_flight = max(0, state.in_flight - 1)
+            state.completed += 1
+            if grant.actual_tokens is not None:
+                state.bucket.adjust(grant.estimated_tokens - grant.actual_tokens)
+            self._dispatch_locked(state)
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        provider: str,
+        estimated_tokens: int = DEFAULT_OUTPUT_TOKEN_ESTIMATE,
+        priority: Any = Priority.BATCH,
+        job_key: Optional[str] = None,
+    ):
+        """Async context manager around acquire()/release()."""
+        grant = await self.acquire(provider, estimated_tokens, priority, job_key)
+        try:
+            yield grant
+        finally:
+            self.release(grant)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Queue depth, in-flight counts and wait-time percentiles.
+
+        Returns:
+            Dict with "providers" and "wait_by_priority" sections
+        """
+        with self._lock:
+            providers = {
+                name: {
+                    "in_flight": state.in_flight,
+                    "max_concurrent": state.max_concurrent,
+                    "queued": state.queued(),
+                    "completed": state.completed,
+                    "tokens_per_minute": state.bucket.capacity,
+                    "tokens_available": (
+                        round(state.bucket.level) if state.bucket.capacity else None
+                    ),
+                }
+                for name, state in self._providers.items()
+            }
+            waits = {p.name.lower(): s.to_dict() for p, s in self._wait_stats.items()}
+        return {"providers": providers, "wait_by_priority": waits}
+
+    def reset_stats(self) -> None:
+        """Clear wait-time samples."""
+        with self._lock:
+            self._wait_stats = {p: _WaitStats() for p in Priority}
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(True)
+
+
+# =============================================================================
+# Global Scheduler Instance
+# =============================================================================
+
+_global_scheduler: Optional[LLMScheduler] = None
+_global_scheduler_lock = threading.Lock()
+
+
+def is_llm_scheduler_enabled() -> bool:
+    """The scheduler is on unless LLM_SCHEDULER_ENABLED=false."""
+    return os.getenv("LLM_SCHEDULER_ENABLED", "true").lower() != "false"
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """Get or create the process-wide scheduler."""
+    global _global_scheduler
+    with _global_scheduler_lock:
+        if _global_scheduler is None:
+            _global_scheduler = LLMScheduler()
+        return _global_scheduler
+
+
+def reset_llm_scheduler() -> None:
+    """Drop the global scheduler (for testing)."""
+    global _global_scheduler
+    with _global_scheduler_lock:
+        _global_scheduler = None
+
+
+@asynccontextmanager
+async def scheduled_llm_call(
+    provider: str,
+    prompt_text: str,
+    priority: Optional[str] = None,
+    job_key: Optional[str] = None,
+):
+    """
+    Admit one LLM call through the global scheduler (no-op when disabled).
+
+    Priority/job_key default to the surrounding llm_scheduling_context(),
+    then to "batch" and no job key.
+
+    Yields:
+        SchedulerGrant, or None when the scheduler is disabled
+    """
+    if not is_llm_scheduler_enabled():
+        yield None
+        return
+
+    ctx_priority, ctx_job_key = current_scheduling_context()
+    async with get_llm_scheduler().slot(
+        provider,
+        estimated_tokens=estimate_tokens(prompt_text),
+        priority=priority or ctx_priority or Priority.BATCH,
+        job_key=job_key or ctx_job_key,
+    ) as grant:
+        yield grant
+
+
+def provider_for_model(model: str) -> str:
+    """Map a LangChain model name to its scheduler budget name."""
+    if "/" in model:
+        return "openrouter"
+    if model.startswith("claude"):
+        return "anthropic"
+    return "openai"
+
@@ -5,6 +5,7 @@ Aggregates metrics from all infrastructure components:
 - Token Tracker (BG-1): Usage and cost data
 - Rate Limiter (BG-2): Request counts and wait times
 - Circuit Breaker (CB-1): State and failure counts
+- LLM Scheduler: Queue depth and queue-wait time per priority class
 
 Provides a single point of access for metrics dashboards.
 
@@ -37,6 +38,7 @@ from .circuit_breaker import (
     CircuitState,
     get_circuit_breaker_registry,
 )
+from .cost_ledger import get_cost_ledger
 from .rate_limiter import (
     RateLimiterRegistry,
     get_rate_limiter_registry,
@@ -55,6 +57,9 @@ class TokenMetrics:
     total_input_tokens: int = 0
     total_output_tokens: int = 0
     total_cost_usd: float = 0.0
+    cache_hits: int = 0
+    saved_cost_usd: float = 0.0
+    response_cache: Optional[Dict[str, Any]] = None
     by_provider: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     by_layer: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
@@ -64,6 +69,9 @@ class TokenMetrics:
             "total_input_tokens": self.total_input_tokens,
             "total_output_tokens": self.total_output_tokens,
             "total_cost_usd": round(self.total_cost_usd, 4),
+            "cache_hits": self.cache_hits,
+            "saved_cost_usd": round(self.saved_cost_usd, 4),
+            "response_cache": self.response_cache,
             "by_provider": self.by_provider,
             "by_layer": self.by_layer,
         }
@@ -188,6 +196,7 @@ class MetricsSnapshot:
     circuit_breakers: CircuitBreakerMetrics
     system_health: SystemHealth
     budget: Optional[BudgetMetrics] = None
+    llm_scheduler: Optional[Dict[str, Any]] = None
     uptime_seconds: float = 0.0
 
     def to_dict(self) -> Dict[str, Any]:
@@ -202,6 +211,8 @@ class MetricsSnapshot:
         }
         if self.budget:
             result["budget"] = self.budget.to_dict()
+        if self.llm_scheduler is not None:
+            result["llm_scheduler"] = self.llm_scheduler
         return result
 
 
@@ -277,6 +288,8 @@ class MetricsCollector:
                 metrics.total_input_tokens += provider_input
                 metrics.total_output_tokens += provider_output
                 metrics.total_cost_usd += provider_cost
+                metrics.cache_hits += stats.get("cache_hits", 0)
+                metrics.saved_cost_usd += stats.get("saved_cost_usd", 0.0)
 
                 # Store by provider
                 metrics.by_provider[tracker_name] = {
@@ -302,6 +315,15 @@ class MetricsCollector:
         except Exception as e:
             logger.error(f"Failed to collect token metrics: {e}")
 
+        try:
+            from .llm_cache import get_llm_response_cache
+
+            cache = get_llm_response_cache()
+            if cache is not None:
+                metrics.response_cache = cache.get_stats()
+        except Exception as e:
+            logger.error(f"Failed to collect LLM response cache metrics: {e}")
+
         return metrics
 
     def get_rate_limit_metrics(self) -> RateLimitMetrics:
@@ -529,6 +551,23 @@ class MetricsCollector:
 
         return metrics
 
+    def get_llm_scheduler_metrics(self) -> Optional[Dict[str, Any]]:
+        """
+        Collect queue depth and queue-wait percentiles from the LLM scheduler.
+
+        Returns:
+            Scheduler stats dict, or None if the scheduler is disabled
+        """
+        try:
+            from .llm_scheduler import get_llm_scheduler, is_llm_scheduler_enabled
+
+            if not is_llm_scheduler_enabled():
+                return None
+            return get_llm_scheduler().get_stats()
+        except Exception as e:
+            logger.error(f"Failed to collect LLM scheduler metrics: {e}")
+            return None
+
     def get_snapshot(self) -> MetricsSnapshot:
         """
         Get complete metrics snapshot.
@@ -544,6 +583,7 @@ class MetricsCollector:
                 circuit_breakers=self.get_circuit_breaker_metrics(),
                 system_health=self.get_system_health(),
                 budget=self.get_budget_metrics(),
+                llm_scheduler=self.get_llm_scheduler_metrics(),
                 uptime_seconds=time.time() - self._start_time,
             )
 
@@ -569,16 +609,22 @@ class MetricsCollector:
         from collections import defaultdict
 
         try:
-            # Aggregate costs from all trackers
+            # Aggregate costs from the persistent ledger when configured
+            # (survives restarts, covers all processes), else from all trackers
             aggregated = defaultdict(lambda: {"cost_usd": 0.0, "calls": 0})
+            key_field = "hour" if period == "hourly" else "date"
+
+            ledger = get_cost_ledger()
+            if ledger is not None:
+                sources = [ledger]
+            else:
+                sources = list(self.token_registry._trackers.values())
 
-            for name, tracker in self.token_registry._trackers.items():
+            for source in sources:
                 if period == "hourly":
-                    data = tracker.get_hourly_costs(count)
-                    key_field = "hour"
+                    data = source.get_hourly_costs(count)
                 else:
-                    data = tracker.get_daily_costs(count)
-                    key_field = "date"
+                    data = source.get_daily_costs(count)
 
                 for item in data:
                     key = item[key_field]
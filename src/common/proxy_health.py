@@ -0,0 +1,443 @@
+"""
+Health-scored proxy selection.
+
+Free proxies vary wildly: some are dead (every request burns a full
+timeout), some are slow, some are fine until LinkedIn rate-limits them for a
+few minutes. Round robin and uniform random picks treat them all alike.
+ProxySelector instead keeps per-proxy health and picks by weighted score:
+
+- success rate and latency are exponentially weighted moving averages
+  (PROXY_HEALTH_EWMA_ALPHA); weight = success_rate^2 / (latency + 250ms)
+- a 429 puts the proxy in cooldown for PROXY_HEALTH_COOLDOWN_SECONDS
+- PROXY_HEALTH_FAILURE_THRESHOLD consecutive failures open the circuit:
+  the proxy is quarantined for PROXY_HEALTH_QUARANTINE_SECONDS, doubling per
+  repeat quarantine up to an hour
+- once the quarantine expires the proxy is re-admitted half-open: one
+  success closes the circuit, one failure quarantines it again
+
+Health is shared across worker processes through a small SQLite file
+(PROXY_HEALTH_DB_PATH, next to the proxy cache by default). Updates are
+read-modify-write inside an IMMEDIATE transaction, so concurrent workers
+never lose each other's outcomes; picks use an in-process snapshot
+refreshed every PROXY_HEALTH_REFRESH_SECONDS. Store errors are logged and
+never fail a request.
+
+Usage:
+    selector = get_proxy_selector()
+    for proxy in selector.choose(2):
+        ...
+        selector.record(proxy, "success", latency_ms=420)
+"""
+
+import logging
+import math
+import os
+import random
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+OUTCOMES = ("success", "rate_limited", "failure")
+
+# Priors for proxies with no history: optimistic enough that new proxies
+# get explored, below a proven fast proxy.
+PRIOR_SUCCESS = 0.7
+PRIOR_LATENCY_MS = 2000.0
+LATENCY_FLOOR_MS = 250.0
+MAX_QUARANTINE_SECONDS = 3600.0
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+@dataclass(frozen=True)
+class HealthPolicy:
+    """Tuning for health scoring, cooldowns and quarantine."""
+
+    alpha: float = 0.3
+    cooldown_seconds: float = 120.0
+    failure_threshold: int = 3
+    quarantine_seconds: float = 300.0
+
+    @classmethod
+    def from_env(cls) -> "HealthPolicy":
+        return cls(
+            alpha=min(1.0, max(0.01, _env_float("PROXY_HEALTH_EWMA_ALPHA", 0.3))),
+            cooldown_seconds=max(0.0, _env_float("PROXY_HEALTH_COOLDOWN_SECONDS", 120.0)),
+            failure_threshold=max(1, int(_env_float("PROXY_HEALTH_FAILURE_THRESHOLD", 3))),
+            quarantine_seconds=max(1.0, _env_float("PROXY_HEALTH_QUARANTINE_SECONDS", 300.0)),
+        )
+
+
+@dataclass(frozen=True)
+class ProxyHealth:
+    """Health of one proxy. Times are epoch seconds."""
+
+    proxy: str
+    success_rate: float = PRIOR_SUCCESS
+    latency_ms: float = PRIOR_LATENCY_MS
+    consecutive_failures: int = 0
+    cooldown_until: float = 0.0
+    quarantined_until: float = 0.0
+    quarantines: int = 0
+
+    def available(self, now: float) -> bool:
+        """Whether the proxy may be picked (not cooling down or quarantined)."""
+        return now >= self.cooldown_until and now >= self.quarantined_until
+
+    def half_open(self, now: float) -> bool:
+        """Re-admitted after a quarantine but not yet proven healthy."""
+        return self.quarantines > 0 and now >= self.quarantined_until
+
+    @property
+    def weight(self) -> float:
+        """Selection weight: favours reliable, then fast, proxies."""
+        return max(1e-6, self.success_rate**2 * 1000.0 / (self.latency_ms + LATENCY_FLOOR_MS))
+
+
+def apply_outcome(
+    health: ProxyHealth,
+    outcome: str,
+    *,
+    latency_ms: Optional[float],
+    now: float,
+    policy: HealthPolicy,
+) -> ProxyHealth:
+    """
+    Fold one request outcome into a proxy's health.
+
+    Args:
+        health: Current health
+        outcome: "success", "rate_limited" (429) or "failure" (connect
+            error, timeout, proxy error)
+        latency_ms: Request duration, used for successes
+        now: Epoch seconds
+        policy: Scoring and quarantine tuning
+
+    Returns:
+        The updated health
+    """
+    if outcome not in OUTCOMES:
+        raise ValueError(f"Unknown proxy outcome '{outcome}'; expected one of {OUTCOMES}")
+    alpha = policy.alpha
+    if outcome == "success":
+        latency = health.latency_ms if latency_ms is None else (1 - alpha) * health.latency_ms + alpha * latency_ms
+        return replace(
+            health,
+            success_rate=(1 - alpha) * health.success_rate + alpha,
+            latency_ms=latency,
+            consecutive_failures=0,
+            quarantines=0 if health.half_open(now) else health.quarantines,
+        )
+    if outcome == "rate_limited":
+        # The proxy works; its IP is just throttled for a while.
+        return replace(health, cooldown_until=now + policy.cooldown_seconds)
+
+    failed = replace(
+        health,
+        success_rate=(1 - alpha) * health.success_rate,
+        consecutive_failures=health.consecutive_failures + 1,
+    )
+    if failed.consecutive_failures >= policy.failure_threshold or health.half_open(now):
+        return quarantine(failed, now=now, policy=policy)
+    return failed
+
+
+def quarantine(health: ProxyHealth, *, now: float, policy: HealthPolicy) -> ProxyHealth:
+    """Open the circuit: bench the proxy with exponential backoff."""
+    duration = min(MAX_QUARANTINE_SECONDS, policy.quarantine_seconds * (2**health.quarantines))
+    return replace(
+        health,
+        consecutive_failures=0,
+        quarantined_until=now + duration,
+        quarantines=health.quarantines + 1,
+    )
+
+
+class ProxyHealthStore:
+    """SQLite-backed health shared by every process that opens the same file."""
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5.0, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS proxy_health (
+                proxy TEXT PRIMARY KEY,
+                success_rate REAL NOT NULL,
+                latency_ms REAL NOT NULL,
+                consecutive_failures INTEGER NOT NULL,
+                cooldown_until REAL NOT NULL,
+                quarantined_until REAL NOT NULL,
+                quarantines INTEGER NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+
+    @staticmethod
+    def _from_row(row: Sequence) -> ProxyHealth:
+        return ProxyHealth(*row[:7])
+
+    def load_all(self) -> Dict[str, ProxyHealth]:
+        """Every stored proxy's health."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT proxy, success_rate, latency_ms, consecutive_failures, cooldown_until, "
+                "quarantined_until, quarantines FROM proxy_health"
+            ).fetchall()
+        return {row[0]: self._from_row(row) for row in rows}
+
+    def update(self, proxy: str, fn, *, now: float) -> ProxyHealth:
+        """
+        Atomically read a proxy's health, transform it and write it back.
+
+        Args:
+            proxy: Proxy URL
+            fn: ProxyHealth -> ProxyHealth
+            now: Epoch seconds, stored as updated_at
+
+        Returns:
+            The written health
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT proxy, success_rate, latency_ms, consecutive_failures, cooldown_until, "
+                    "quarantined_until, quarantines FROM proxy_health WHERE proxy = ?",
+                    (proxy,),
+                ).fetchone()
+                updated = fn(self._from_row(row) if row else ProxyHealth(proxy))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO proxy_health VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        proxy,
+                        updated.success_rate,
+                        updated.latency_ms,
+                        updated.consecutive_failures,
+                        updated.cooldown_until,
+                        updated.quarantined_until,
+                        updated.quarantines,
+                        now,
+                    ),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return updated
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class ProxySelector:
+    """
+    Weighted, health-aware proxy picker. Thread-safe.
+
+    Args:
+        proxies: Candidate proxy URLs
+        store: Shared health store; None keeps health in this process only
+        policy: Scoring and quarantine tuning (defaults from environment)
+        refresh_seconds: How stale the shared-health snapshot may get
+    """
+
+    def __init__(
+        self,
+        proxies: Iterable[str] = (),
+        *,
+        store: Optional[ProxyHealthStore] = None,
+        policy: Optional[HealthPolicy] = None,
+        refresh_seconds: Optional[float] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        self.store = store
+        self.policy = policy or HealthPolicy.from_env()
+        self.refresh_seconds = (
+            refresh_seconds if refresh_seconds is not None else _env_float("PROXY_HEALTH_REFRESH_SECONDS", 5.0)
+        )
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._proxies: List[str] = []
+        self._source: Optional[Sequence[str]] = None
+        self._health: Dict[str, ProxyHealth] = {}
+        self._refreshed_at = -math.inf
+        self.set_proxies(proxies)
+
+    @property
+    def proxies(self) -> List[str]:
+        return list(self._proxies)
+
+    def set_proxies(self, proxies: Iterable[str]) -> None:
+        """Replace the candidate set; health for known proxies is kept."""
+        source = proxies if isinstance(proxies, (list, tuple)) else list(proxies)
+        with self._lock:
+            self._source = source
+            self._proxies = list(dict.fromkeys(source))
+
+    def sync_proxies(self, proxies: Sequence[str]) -> None:
+        """set_proxies, skipped when handed the same list object again."""
+        if proxies is not self._source:
+            self.set_proxies(proxies)
+
+    def health(self, proxy: str) -> ProxyHealth:
+        """Current (possibly snapshot-stale) health of a proxy."""
+        return self._health.get(proxy) or ProxyHealth(proxy)
+
+    def _refresh(self, now: float) -> None:
+        if self.store is None or time.monotonic() - self._refreshed_at < self.refresh_seconds:
+            return
+        try:
+            shared = self.store.load_all()
+        except Exception as exc:
+            logger.debug("ProxySelector: health store read failed: %s", exc)
+            shared = None
+        with self._lock:
+            if shared is not None:
+                self._health.update(shared)
+            self._refreshed_at = time.monotonic()
+
+    def available(self, now: Optional[float] = None) -> List[str]:
+        """Proxies not in cooldown or quarantine."""
+        current = time.time() if now is None else now
+        self._refresh(current)
+        return [proxy for proxy in self._proxies if self.health(proxy).available(current)]
+
+    def choose(self, k: int = 1, *, now: Optional[float] = None) -> List[str]:
+        """
+        Pick up to k distinct available proxies, weighted by health.
+
+        Uses weighted sampling without replacement (Efraimidis-Spirakis), so
+        healthy proxies are preferred but every available proxy keeps some
+        chance of being probed.
+
+        Args:
+            k: Proxies wanted (e.g. 2 for a proxy attempt plus one fallback)
+            now: Epoch seconds
+
+        Returns:
+            Proxy URLs, best draw first; empty when none are available
+        """
+        candidates = self.available(now)
+        if not candidates or k <= 0:
+            return []
+        keyed = [(self._rng.random() ** (1.0 / self.health(proxy).weight), proxy) for proxy in candidates]
+        keyed.sort(reverse=True)
+        return [proxy for _, proxy in keyed[:k]]
+
+    def _apply(self, proxy: str, fn, now: float) -> ProxyHealth:
+        updated: Optional[ProxyHealth] = None
+        if self.store is not None:
+            try:
+                updated = self.store.update(proxy, fn, now=now)
+            except Exception as exc:
+                logger.debug("ProxySelector: health store write failed: %s", exc)
+        with self._lock:
+            if updated is None:
+                updated = fn(self.health(proxy))
+            self._health[proxy] = updated
+        return updated
+
+    def record(self, proxy: str, outcome: str, *, latency_ms: Optional[float] = None, now: Optional[float] = None) -> ProxyHealth:
+        """
+        Record a request outcome for a proxy.
+
+        Args:
+            proxy: Proxy URL
+            outcome: "success", "rate_limited" or "failure"
+            latency_ms: Request duration (successes)
+            now: Epoch seconds
+
+        Returns:
+            The proxy's updated health
+        """
+        if outcome not in OUTCOMES:
+            raise ValueError(f"Unknown proxy outcome '{outcome}'; expected one of {OUTCOMES}")
+        current = time.time() if now is None else now
+        return self._apply(
+            proxy,
+            lambda health: apply_outcome(health, outcome, latency_ms=latency_ms, now=current, policy=self.policy),
+            current,
+        )
+
+    def quarantine(self, proxy: str, *, now: Optional[float] = None) -> ProxyHealth:
+        """Bench a proxy immediately, regardless of its failure count."""
+        current = time.time() if now is None else now
+        return self._apply(proxy, lambda health: quarantine(health, now=current, policy=self.policy), current)
+
+
+def default_health_db_path() -> Path:
+    """PROXY_HEALTH_DB_PATH, else proxy_health.sqlite3 beside the proxy cache."""
+    configured = os.getenv("PROXY_HEALTH_DB_PATH")
+    if configured:
+        return Path(configured)
+    env_dir = os.environ.get("SCOUT_QUEUE_DIR")
+    base = Path(env_dir) if env_dir else Path(__file__).parent.parent.parent / "data" / "scout"
+    return base / "proxy_health.sqlite3"
+
+
+_selector: Optional[ProxySelector] = None
+_selector_lock = threading.Lock()
+
+
+def open_shared_health_store() -> Optional[ProxyHealthStore]:
+    """The shared health file, or None when PROXY_HEALTH_SHARED=false or it cannot be opened."""
+    if os.getenv("PROXY_HEALTH_SHARED", "true").strip().lower() != "true":
+        return None
+    try:
+        return ProxyHealthStore(str(default_health_db_path()))
+    except Exception as exc:
+        logger.warning("ProxySelector: shared health store unavailable (%s); using in-process health", exc)
+        return None
+
+
+def get_proxy_selector(proxies: Optional[Sequence[str]] = None) -> ProxySelector:
+    """
+    Get the process-wide selector.
+
+    Args:
+        proxies: Candidate proxies. When omitted, the first call loads the
+            validated proxy cache once; later calls reuse the loaded set.
+
+    Returns:
+        The shared ProxySelector
+    """
+    global _selector
+
+    with _selector_lock:
+        if _selector is None:
+            if proxies is None:
+                from src.common.proxy_pool import load_proxy_pool
+
+                proxies = load_proxy_pool()
+            _selector = ProxySelector(proxies, store=open_shared_health_store())
+            return _selector
+    if proxies is not None:
+        _selector.sync_proxies(proxies)
+    return _selector
+
+
+def reset_proxy_selector() -> None:
+    """Drop the process-wide selector (tests, proxy cache refresh)."""
+    global _selector
+
+    with _selector_lock:
+        if _selector is not None and _selector.store is not None:
+            _selector.store.close()
+        _selector = None
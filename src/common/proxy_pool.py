@@ -5,7 +5,8 @@ Architecture:
   - Validation is decoupled from usage via a separate cron job
   - scout_proxy_refresh_cron.py runs every 20 min: fetches, validates, saves cache
   - Scout cron just loads the pre-validated cache file — instant startup
-  - ProxyPool provides round-robin get_proxy() and mark_failed() for removal
+  - ProxyPool provides health-weighted get_proxy(), mark_success(), mark_rate_limited()
+    and mark_failed() (quarantine with backoff) via src.common.proxy_health
 
 Sources (fetched by refresh cron):
   - proxifly/free-proxy-list (every ~5 min)
@@ -20,12 +21,15 @@ import json
 import logging
 import os
 import random
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional
 
 import requests
 
+from src.common.proxy_health import ProxySelector, get_proxy_selector, open_shared_health_store
+
 logger = logging.getLogger(__name__)
 
 # CDN sources — raw text, one "ip:port" per line
@@ -140,19 +144,25 @@ def save_cache(proxies: List[str], cache_path: Optional[Path] = None) -> None:
 
 
 class ProxyPool:
-    """Round-robin rotating proxy pool — loads pre-validated proxies from cache.
+    """Health-scored rotating proxy pool — loads pre-validated proxies from cache.
+
+    Picks are weighted by each proxy's success rate and latency (see
+    src.common.proxy_health); failed proxies are quarantined and re-admitted
+    later instead of being dropped for the life of the process.
 
     Usage:
         pool = ProxyPool()
-        count = pool.initialize()          # loads from cache (written by refresh cron)
-        proxy = pool.get_proxy()           # {"http": "...", "https": "..."}
-        pool.mark_failed("http://ip:port") # removes from pool
+        count = pool.initialize()              # loads from cache (written by refresh cron)
+        proxy = pool.get_proxy()               # {"http": "...", "https": "..."}
+        pool.mark_success(proxy["http"], 420)  # feeds the latency/success score
+        pool.mark_rate_limited("http://ip:port")  # 429: cool down, keep
+        pool.mark_failed("http://ip:port")     # dead: quarantine
     """
 
-    def __init__(self, cache_path: Optional[str] = None) -> None:
+    def __init__(self, cache_path: Optional[str] = None, selector: Optional[ProxySelector] = None) -> None:
         self._cache_path = Path(cache_path) if cache_path else _default_cache_path()
         self._pool: List[str] = []
-        self._index: int = 0
+        self._selector = selector
 
     # ------------------------------------------------------------------
     # Public API
@@ -169,45 +179,57 @@ class ProxyPool:
         if cached:
             self._pool = cached
             logger.info(f"ProxyPool: loaded {len(self._pool)} proxies from cache")
-            return len(self._pool)
+        else:
+            logger.warning("ProxyPool: no cached proxies found — will use direct requests")
+            self._pool = []
+        if self._selector is not None:
+            self._selector.set_proxies(self._pool)
+        return len(self._pool)
 
-        logger.warning("ProxyPool: no cached proxies found — will use direct requests")
-        self._pool = []
-        return 0
+    @property
+    def selector(self) -> ProxySelector:
+        """Health-scored selector over the loaded proxies (shared health store)."""
+        if self._selector is None:
+            self._selector = ProxySelector(self._pool, store=open_shared_health_store())
+        return self._selector
+
+    @property
+    def proxies(self) -> List[str]:
+        """All loaded proxies, including ones currently benched."""
+        return list(self._pool)
 
     def get_proxy(self) -> Optional[Dict[str, str]]:
-        """Return the next proxy in round-robin order.
+        """Return the next proxy, weighted by health.
 
         Returns a requests-compatible dict:
             {"http": "http://ip:port", "https": "http://ip:port"}
 
-        Returns None (fall back to direct) if pool is exhausted.
+        Returns None (fall back to direct) if every proxy is benched.
         """
-        if not self._pool:
-            logger.debug("ProxyPool: pool empty, using direct connection")
+        chosen = self.selector.choose(1) if self._pool else []
+        if not chosen:
+            logger.debug("ProxyPool: no available proxy, using direct connection")
             return None
+        return {"http": chosen[0], "https": chosen[0]}
 
-        # Wrap index around pool size
-        self._index = self._index % len(self._pool)
-        url = self._pool[self._index]
-        self._index += 1
-        return {"http": url, "https": url}
+    def mark_success(self, proxy_url: str, latency_ms: Optional[float] = None) -> None:
+        """Record a successful request through a proxy."""
+        self.selector.record(proxy_url, "success", latency_ms=latency_ms)
+
+    def mark_rate_limited(self, proxy_url: str) -> None:
+        """Cool down a proxy that returned 429."""
+        self.selector.record(proxy_url, "rate_limited")
+        logger.debug(f"ProxyPool: cooling down rate-limited proxy {proxy_url}")
 
     def mark_failed(self, proxy_url: str) -> None:
-        """Remove a proxy that returned 429 or failed from the pool."""
-        before = len(self._pool)
-        self._pool = [p for p in self._pool if p != proxy_url]
-        after = len(self._pool)
-        if before != after:
-            logger.debug(f"ProxyPool: removed failed proxy {proxy_url} ({after} remaining)")
-            # Reset index so it doesn't go out of bounds
-            if self._index >= len(self._pool):
-                self._index = 0
+        """Quarantine a proxy that failed; it is re-admitted after backoff."""
+        self.selector.quarantine(proxy_url)
+        logger.debug(f"ProxyPool: quarantined failed proxy {proxy_url} ({self.size} available)")
 
     @property
     def size(self) -> int:
-        """Number of proxies currently in the pool."""
-        return len(self._pool)
+        """Number of proxies currently available (not cooling down or quarantined)."""
+        return len(self.selector.available()) if self._pool else 0
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -240,7 +262,7 @@ def load_proxy_pool() -> List[str]:
     """Load pre-validated proxies from cache. Returns list of proxy URLs."""
     pool = ProxyPool()
     pool.initialize()
-    return pool._pool
+    return pool.proxies
 
 
 def fetch_with_proxy(
@@ -250,12 +272,14 @@ def fetch_with_proxy(
     pool: Optional[List[str]] = None,
     **kwargs,
 ) -> requests.Response:
-    """Fetch URL with proxy rotation and direct fallback.
+    """Fetch URL with health-scored proxy selection and direct fallback.
 
-    Tries up to 2 random proxies, then falls back to direct.
+    Tries up to 2 proxies picked by the process-wide ProxySelector (loading
+    the proxy cache once per process when no pool is passed), feeding each
+    outcome back into proxy health, then falls back to direct. A 429 through
+    a proxy cools that proxy down and moves on to the next one.
     """
-    if pool is None:
-        pool = load_proxy_pool()
+    selector = get_proxy_selector(pool)
 
     proxy_errors = (
         requests.exceptions.ProxyError,
@@ -263,17 +287,10 @@ def fetch_with_proxy(
         requests.exceptions.ConnectionError,
     )
 
-    used = set()
-
-    # Try 2 proxies
-    for attempt in range(min(2, len(pool))):
-        remaining = [p for p in pool if p not in used]
-        if not remaining:
-            break
-        proxy = random.choice(remaining)
-        used.add(proxy)
+    for attempt, proxy in enumerate(selector.choose(2)):
+        started = time.monotonic()
         try:
-            return requests.get(
+            response = requests.get(
                 url,
                 headers=headers,
                 timeout=timeout,
@@ -281,7 +298,15 @@ def fetch_with_proxy(
                 **kwargs,
             )
         except proxy_errors as e:
+            selector.record(proxy, "failure")
             logger.debug(f"Proxy attempt {attempt + 1} failed ({proxy}): {e}")
+            continue
+        if response.status_code == 429:
+            selector.record(proxy, "rate_limited")
+            logger.debug(f"Proxy attempt {attempt + 1} rate limited ({proxy})")
+            continue
+        selector.record(proxy, "success", latency_ms=(time.monotonic() - started) * 1000.0)
+        return response
 
     # Direct fallback
     logger.debug(f"Falling back to direct request for {url}")
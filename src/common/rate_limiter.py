@@ -4,13 +4,21 @@ Rate Limiting Module (Gap BG-2).
 Provides rate limiting for external API calls to prevent hitting provider limits.
 Supports FireCrawl (daily limits) and LLM providers (per-minute limits).
 
-Uses token bucket algorithm with configurable refill rates.
+Uses GCRA (the generic cell rate algorithm, a token bucket expressed as a
+single "theoretical arrival time"), so acquire/check are O(1) regardless of
+the limit and bursts of up to ``requests_per_minute`` are allowed. Waiters
+reserve their slot up front and sleep exactly until it, instead of polling.
+
+By default state is process-local. Passing a Redis client (or setting
+RATE_LIMITER_REDIS_URL) makes every limiter for the same provider share one
+budget across processes and hosts; each decision is a single atomic Lua
+script evaluated against the Redis server clock.
 
 Usage:
     # Per-minute rate limiting for LLM
     limiter = RateLimiter(requests_per_minute=60)
 
-    await limiter.acquire()  # Waits if rate limit exceeded
+    await limiter.acquire_async()  # Waits if rate limit exceeded
     response = await llm.invoke(...)
 
     # Daily rate limiting for FireCrawl
@@ -18,17 +26,23 @@ Usage:
         requests_per_minute=10,  # Spread requests
         daily_limit=600,         # Hard daily cap
     )
+
+    # Shared budget across runners/workers
+    limiter = RateLimiter("openai", requests_per_minute=500, redis=redis_client)
 """
 
 import asyncio
+import logging
+import math
 import os
 import threading
 import time
-from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
 
 
 class Provider(str, Enum):
@@ -47,6 +61,60 @@ DEFAULT_RATE_LIMITS = {
     Provider.FIRECRAWL: {"requests_per_minute": 10, "daily_limit": 600},
 }
 
+# Window the per-minute limit applies to (also the GCRA burst tolerance)
+WINDOW_SECONDS = 60.0
+
+# Daily counters in Redis outlive the UTC day they belong to by a day
+DAILY_KEY_TTL_SECONDS = 2 * 86400
+
+# Absorbs float rounding when summing emission intervals
+_EPSILON = 1e-6
+
+# Reservation outcomes
+_ALLOWED = 0
+_RATE_LIMITED = 1
+_DAILY_EXHAUSTED = 2
+
+# Atomic GCRA reservation against the Redis server clock (microseconds).
+# KEYS: [tat_key, daily_key]
+# ARGV: [interval_us, window_us, max_wait_us, daily_limit (0 = none), commit (0/1), daily_ttl_s]
+# Returns: [status, wait_us, daily_count, backlog_us]
+_GCRA_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000000 + tonumber(t[2])
+local interval = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local max_wait = tonumber(ARGV[3])
+local daily_limit = tonumber(ARGV[4])
+local commit = tonumber(ARGV[5])
+
+local daily = tonumber(redis.call('GET', KEYS[2]) or '0')
+local tat = tonumber(redis.call('GET', KEYS[1]) or '0')
+if tat < now then tat = now end
+
+if daily_limit > 0 and daily >= daily_limit then
+    return {2, 0, daily, math.floor(tat - now)}
+end
+
+local new_tat = tat + interval
+local wait = new_tat - now - window
+if wait > max_wait + 1 then
+    return {1, math.floor(wait), daily, math.floor(tat - now)}
+end
+
+if commit == 1 then
+    redis.call('SET', KEYS[1], string.format('%.0f', new_tat), 'PX', math.ceil((new_tat - now) / 1000))
+    daily = redis.call('INCR', KEYS[2])
+    if daily == 1 then
+        redis.call('EXPIRE', KEYS[2], tonumber(ARGV[6]))
+    end
+    tat = new_tat
+end
+
+if wait < 0 then wait = 0 end
+return {0, math.floor(wait), daily, math.floor(tat - now)}
+"""
+
 
 @dataclass
 class RateLimitStats:
@@ -75,10 +143,17 @@ class RateLimitExceededError(Exception):
 
 class RateLimiter:
     """
-    Thread-safe rate limiter using sliding window algorithm.
+    Thread-safe rate limiter using GCRA (token bucket).
+
+    Tracks requests per minute and optionally per day. State is a single
+    theoretical arrival time (TAT): each request pushes it forward by
+    60 / requests_per_minute seconds, and a request is allowed while the
+    TAT stays within one minute of now. That gives O(1) decisions, bursts
+    of up to requests_per_minute, and an exact wait time when limited.
 
-    Tracks requests per minute and optionally per day.
-    Provides both blocking (wait) and non-blocking (check) modes.
+    Provides both blocking (wait) and non-blocking (check) modes. With a
+    Redis client the TAT and daily counter live in Redis and are shared by
+    every process using the same provider and key prefix.
     """
 
     def __init__(
@@ -88,6 +163,8 @@ class RateLimiter:
         daily_limit: Optional[int] = None,
         allow_wait: bool = True,
         max_wait_seconds: float = 60.0,
+        redis: Optional[Any] = None,
+        key_prefix: str = "ratelimit",
     ):
         """
         Initialize rate limiter.
@@ -98,6 +175,8 @@ class RateLimiter:
             daily_limit: Maximum requests per day (None for unlimited)
             allow_wait: If True, wait when limit hit; if False, raise error
             max_wait_seconds: Maximum time to wait before giving up
+            redis: Optional Redis client; enables a budget shared across processes
+            key_prefix: Redis key prefix (keys are "<prefix>:<provider>:...")
         """
         self.provider = provider
         self.requests_per_minute = requests_per_minute
@@ -105,22 +184,31 @@ class RateLimiter:
         self.allow_wait = allow_wait
         self.max_wait_seconds = max_wait_seconds
 
-        # Sliding window for per-minute tracking
-        self._minute_window: deque = deque()
+        # GCRA state: theoretical arrival time of the next request (epoch seconds)
+        self._tat = 0.0
         self._lock = threading.Lock()
 
-        # Daily tracking
+        # Daily tracking (mirrors the shared counter in Redis mode)
         self._daily_count = 0
         self._daily_reset_date: Optional[datetime] = None
 
+        # Optional shared backend
+        self._redis = redis
+        self._key_base = f"{key_prefix}:{provider}"
+        self._script = redis.register_script(_GCRA_LUA) if redis is not None else None
+
         # Stats
         self._stats = RateLimitStats()
 
-    def _clean_minute_window(self) -> None:
-        """Remove entries older than 1 minute from the sliding window."""
-        cutoff = time.time() - 60.0
-        while self._minute_window and self._minute_window[0] < cutoff:
-            self._minute_window.popleft()
+    @property
+    def backend(self) -> str:
+        """Where limiter state lives: "redis" (shared) or "local"."""
+        return "redis" if self._redis is not None else "local"
+
+    @property
+    def _interval(self) -> float:
+        """Emission interval: seconds of budget one request consumes."""
+        return WINDOW_SECONDS / self.requests_per_minute
 
     def _reset_daily_if_needed(self) -> None:
         """Reset daily counter if we're on a new day."""
@@ -130,24 +218,125 @@ class RateLimiter:
             self._daily_reset_date = today
             self._stats.daily_reset_at = datetime.utcnow()
 
-    def _get_wait_time(self) -> float:
+    def _backlog_count(self, backlog_seconds: float) -> int:
+        """Convert TAT backlog into the number of requests counted in the window."""
+        if self.requests_per_minute <= 0 or backlog_seconds <= 0:
+            return 0
+        return math.ceil(backlog_seconds / self._interval - _EPSILON)
+
+    def _daily_key(self) -> str:
+        return f"{self._key_base}:daily:{datetime.utcnow().date().isoformat()}"
+
+    def _reserve(self, max_wait: float, commit: bool = True) -> Tuple[int, float]:
         """
-        Calculate how long to wait before next request is allowed.
+        Reserve the next request slot if it is at most max_wait seconds away.
+
+        Args:
+            max_wait: Longest acceptable wait for the slot
+            commit: False to only test (check()), True to consume the slot
 
         Returns:
-            Wait time in seconds (0.0 if no wait needed)
+            (outcome, seconds until the slot) - outcome is _ALLOWED,
+            _RATE_LIMITED or _DAILY_EXHAUSTED
         """
-        self._clean_minute_window()
+        if self._script is not None:
+            try:
+                return self._reserve_redis(max_wait, commit)
+            except Exception as e:
+                logger.warning(
+                    f"[RateLimiter] Redis unavailable for {self.provider}, "
+                    f"falling back to local limiting: {e}"
+                )
+        return self._reserve_local(max_wait, commit)
+
+    def _reserve_local(self, max_wait: float, commit: bool) -> Tuple[int, float]:
+        with self._lock:
+            self._reset_daily_if_needed()
 
-        if len(self._minute_window) < self.requests_per_minute:
-            return 0.0
+            # Daily limit is a hard cap, no waiting helps
+            if self.daily_limit and self._daily_count >= self.daily_limit:
+                return _DAILY_EXHAUSTED, 0.0
+            if self.requests_per_minute <= 0:
+                return _RATE_LIMITED, math.inf
+
+            now = time.time()
+            new_tat = max(self._tat, now) + self._interval
+            wait = new_tat - now - WINDOW_SECONDS
+            if wait > max_wait + _EPSILON:
+                return _RATE_LIMITED, wait
+
+            if commit:
+                self._tat = new_tat
+                self._daily_count += 1
+                self._record_request(self._backlog_count(new_tat - now))
+            return _ALLOWED, max(0.0, wait)
+
+    def _reserve_redis(self, max_wait: float, commit: bool) -> Tuple[int, float]:
+        if self.requests_per_minute <= 0:
+            return _RATE_LIMITED, math.inf
+
+        outcome, wait_us, daily, backlog_us = self._script(
+            keys=[self._key_base, self._daily_key()],
+            args=[
+                self._interval * 1e6,
+                WINDOW_SECONDS * 1e6,
+                max_wait * 1e6,
+                self.daily_limit or 0,
+                1 if commit else 0,
+                DAILY_KEY_TTL_SECONDS,
+            ],
+        )
+        with self._lock:
+            self._reset_daily_if_needed()
+            self._daily_count = int(daily)
+            backlog = self._backlog_count(int(backlog_us) / 1e6)
+            if commit and outcome == _ALLOWED:
+                self._record_request(backlog)
+            else:
+                self._stats.requests_this_minute = backlog
+        return int(outcome), int(wait_us) / 1e6
+
+    def _record_request(self, requests_this_minute: int) -> None:
+        """Update stats for a granted request (caller holds the lock)."""
+        self._stats.total_requests += 1
+        self._stats.requests_today = self._daily_count
+        self._stats.requests_this_minute = requests_this_minute
+        self._stats.last_request_at = datetime.utcnow()
+
+    def _record_wait(self, wait: float) -> None:
+        with self._lock:
+            self._stats.waits_count += 1
+            self._stats.total_wait_time_seconds += wait
 
-        # Need to wait until oldest request expires from window
-        oldest = self._minute_window[0]
-        wait_until = oldest + 60.0
-        wait_time = wait_until - time.time()
+    def _release_unused(self) -> None:
+        """
+        Give back a reserved slot whose waiter was cancelled.
 
-        return max(0.0, wait_time)
+        Only local state can be refunded; in Redis mode the slot is forfeited
+        (it costs one emission interval of shared budget at most).
+        """
+        if self._redis is not None:
+            return
+        with self._lock:
+            self._tat -= self._interval
+            self._daily_count = max(0, self._daily_count - 1)
+            self._stats.total_requests = max(0, self._stats.total_requests - 1)
+            self._stats.requests_today = self._daily_count
+
+    def _limit_exceeded(self, outcome: int) -> bool:
+        """Handle a refused reservation: raise if waiting is disallowed, else False."""
+        if not self.allow_wait:
+            if outcome == _DAILY_EXHAUSTED:
+                raise RateLimitExceededError(
+                    self.provider, "daily", self._daily_count, self.daily_limit
+                )
+            raise RateLimitExceededError(
+                self.provider,
+                "per_minute",
+                self._stats.requests_this_minute,
+                self.requests_per_minute,
+            )
+        return False
 
     def check(self) -> bool:
         """
@@ -156,25 +345,15 @@ class RateLimiter:
         Returns:
             True if request allowed, False if rate limited
         """
-        with self._lock:
-            self._reset_daily_if_needed()
-            self._clean_minute_window()
-
-            # Check daily limit
-            if self.daily_limit and self._daily_count >= self.daily_limit:
-                return False
-
-            # Check per-minute limit
-            if len(self._minute_window) >= self.requests_per_minute:
-                return False
-
-            return True
+        outcome, _ = self._reserve(max_wait=0.0, commit=False)
+        return outcome == _ALLOWED
 
     def acquire(self) -> bool:
         """
         Acquire permission for a request (blocking).
 
-        Waits if rate limit is exceeded, up to max_wait_seconds.
+        Reserves the next free slot and sleeps exactly until it, provided it
+        is no more than max_wait_seconds away.
 
         Returns:
             True if acquired, False if timed out
@@ -182,114 +361,52 @@ class RateLimiter:
         Raises:
             RateLimitExceededError: If allow_wait is False and limit exceeded
         """
-        start_time = time.time()
-
-        while True:
-            with self._lock:
-                self._reset_daily_if_needed()
-                self._clean_minute_window()
-
-                # Check daily limit (hard cap, no waiting helps)
-                if self.daily_limit and self._daily_count >= self.daily_limit:
-                    if not self.allow_wait:
-                        raise RateLimitExceededError(
-                            self.provider, "daily", self._daily_count, self.daily_limit
-                        )
-                    # For daily limits, we can't wait - must fail
-                    return False
-
-                # Check per-minute limit
-                if len(self._minute_window) < self.requests_per_minute:
-                    # Can proceed - record the request
-                    now = time.time()
-                    self._minute_window.append(now)
-                    self._daily_count += 1
-
-                    # Update stats
-                    self._stats.total_requests += 1
-                    self._stats.requests_today = self._daily_count
-                    self._stats.requests_this_minute = len(self._minute_window)
-                    self._stats.last_request_at = datetime.utcnow()
-
-                    return True
-
-                # Rate limited - need to wait
-                wait_time = self._get_wait_time()
-
-            # Check if we've exceeded max wait time
-            elapsed = time.time() - start_time
-            if elapsed + wait_time > self.max_wait_seconds:
-                if not self.allow_wait:
-                    raise RateLimitExceededError(
-                        self.provider,
-                        "per_minute",
-                        len(self._minute_window),
-                        self.requests_per_minute,
-                    )
-                return False
-
-            # Wait and retry
-            self._stats.waits_count += 1
-            self._stats.total_wait_time_seconds += min(wait_time, 1.0)
-            time.sleep(min(wait_time, 1.0))  # Sleep in small increments
+        max_wait = self.max_wait_seconds if self.allow_wait else 0.0
+        outcome, wait = self._reserve(max_wait)
+        if outcome != _ALLOWED:
+            return self._limit_exceeded(outcome)
+
+        if wait > 0:
+            self._record_wait(wait)
+            time.sleep(wait)
+        return True
 
     async def acquire_async(self) -> bool:
         """
         Async version of acquire().
 
+        Concurrent waiters each hold their own reserved slot, so they wake in
+        order at their slot time without polling, and never before it. A
+        cancelled waiter returns its slot (local mode).
+
         Returns:
             True if acquired, False if timed out
         """
-        start_time = time.time()
-
-        while True:
-            with self._lock:
-                self._reset_daily_if_needed()
-                self._clean_minute_window()
-
-                # Check daily limit
-                if self.daily_limit and self._daily_count >= self.daily_limit:
-                    if not self.allow_wait:
-                        raise RateLimitExceededError(
-                            self.provider, "daily", self._daily_count, self.daily_limit
-                        )
-                    return False
-
-                # Check per-minute limit
-                if len(self._minute_window) < self.requests_per_minute:
-                    now = time.time()
-                    self._minute_window.append(now)
-                    self._daily_count += 1
-
-                    self._stats.total_requests += 1
-                    self._stats.requests_today = self._daily_count
-                    self._stats.requests_this_minute = len(self._minute_window)
-                    self._stats.last_request_at = datetime.utcnow()
-
-                    return True
-
-                wait_time = self._get_wait_time()
-
-            elapsed = time.time() - start_time
-            if elapsed + wait_time > self.max_wait_seconds:
-                if not self.allow_wait:
-                    raise RateLimitExceededError(
-                        self.provider,
-                        "per_minute",
-                        len(self._minute_window),
-                        self.requests_per_minute,
-                    )
-                return False
-
-            self._stats.waits_count += 1
-            self._stats.total_wait_time_seconds += min(wait_time, 0.5)
-            await asyncio.sleep(min(wait_time, 0.5))
+        max_wait = self.max_wait_seconds if self.allow_wait else 0.0
+        outcome, wait = self._reserve(max_wait)
+        if outcome != _ALLOWED:
+            return self._limit_exceeded(outcome)
+
+        if wait > 0:
+            self._record_wait(wait)
+            # The event loop sleeps on its monotonic clock and may fire a timer
+            # up to its clock resolution early, while slots are wall-clock
+            # times: sleep again for any remainder so no slot is granted early
+            deadline = time.time() + wait
+            try:
+                while wait > 0:
+                    await asyncio.sleep(wait)
+                    wait = deadline - time.time()
+            except asyncio.CancelledError:
+                self._release_unused()
+                raise
+        return True
 
     def get_stats(self) -> RateLimitStats:
         """Get rate limiting statistics."""
         with self._lock:
-            self._clean_minute_window()
-            self._stats.requests_this_minute = len(self._minute_window)
+            if self._redis is None:
+                self._stats.requests_this_minute = self._backlog_count(self._tat - time.time())
             return RateLimitStats(
                 total_requests=self._stats.total_requests,
                 requests_today=self._stats.requests_today,
@@ -304,14 +421,28 @@ class RateLimiter:
         """Get remaining daily requests (None if no daily limit)."""
         if self.daily_limit is None:
             return None
+        if self._redis is not None:
+            try:
+                used = int(self._redis.get(self._daily_key()) or 0)
+                with self._lock:
+                    self._reset_daily_if_needed()
+                    self._daily_count = used
+                return max(0, self.daily_limit - used)
+            except Exception as e:
+                logger.warning(f"[RateLimiter] Redis unavailable for {self.provider}: {e}")
         with self._lock:
             self._reset_daily_if_needed()
             return max(0, self.daily_limit - self._daily_count)
 
     def reset(self) -> None:
-        """Reset all rate limit tracking."""
+        """
+        Reset all rate limit tracking.
+
+        In Redis mode this clears this process's view only; the shared budget
+        is left to expire on its own.
+        """
         with self._lock:
-            self._minute_window.clear()
+            self._tat = 0.0
             self._daily_count = 0
             self._daily_reset_date = None
             self._stats = RateLimitStats()
@@ -321,6 +452,7 @@ class RateLimiter:
         stats = self.get_stats()
         return {
             "provider": self.provider,
+            "backend": self.backend,
             "requests_per_minute": self.requests_per_minute,
             "daily_limit": self.daily_limit,
             "stats": {
@@ -406,6 +538,9 @@ class RateLimiterRegistry:
 # Global registry instance
 _global_registry: Optional[RateLimiterRegistry] = None
 
+# Shared Redis client for cross-process limits (False = not configured/unavailable)
+_shared_redis: Any = None
+
 
 def get_rate_limiter_registry() -> RateLimiterRegistry:
     """Get or create the global rate limiter registry."""
@@ -415,6 +550,31 @@ def get_rate_limiter_registry() -> RateLimiterRegistry:
     return _global_registry
 
 
+def _get_shared_redis() -> Optional[Any]:
+    """
+    Get the Redis client used for shared limits.
+
+    Configured via RATE_LIMITER_REDIS_URL; returns None (process-local
+    limiting) when unset or when Redis cannot be reached.
+    """
+    global _shared_redis
+    if _shared_redis is None:
+        _shared_redis = False
+        redis_url = os.getenv("RATE_LIMITER_REDIS_URL")
+        if redis_url:
+            try:
+                import redis
+
+                client = redis.from_url(redis_url)
+                client.ping()
+                _shared_redis = client
+            except ImportError:
+                logger.warning("redis package not installed, using process-local rate limits")
+            except Exception as e:
+                logger.warning(f"Failed to connect to Redis, using process-local rate limits: {e}")
+    return _shared_redis or None
+
+
 def get_rate_limiter(provider: str) -> RateLimiter:
     """
     Get rate limiter for a provider using global registry.
@@ -422,6 +582,7 @@ def get_rate_limiter(provider: str) -> RateLimiter:
     Reads configuration from environment variables:
     - {PROVIDER}_RATE_LIMIT_PER_MIN: Per-minute limit
     - {PROVIDER}_DAILY_LIMIT: Daily limit (optional)
+    - RATE_LIMITER_REDIS_URL: Share budgets across processes via Redis (optional)
 
     Args:
         provider: Provider name (openai, anthropic, openrouter, firecrawl)
@@ -448,12 +609,14 @@ def get_rate_limiter(provider: str) -> RateLimiter:
         provider=provider,
         requests_per_minute=rpm,
         daily_limit=daily_limit,
+        redis=_get_shared_redis(),
     )
 
 
 def reset_global_registry() -> None:
     """Reset the global registry (useful for testing)."""
-    global _global_registry
+    global _global_registry, _shared_redis
     if _global_registry:
         _global_registry.reset_all()
     _global_registry = None
+    _shared_redis = None
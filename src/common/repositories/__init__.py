@@ -43,6 +43,11 @@ from .company_cache_repository import (
     get_company_cache_repository,
     reset_company_cache_repository,
 )
+from .company_research_artifact_repository import (
+    CompanyResearchArtifactRepositoryInterface,
+    get_company_research_artifact_repository,
+    reset_company_research_artifact_repository,
+)
 from .config import (
     RepositoryConfig,
     SyncMode,
@@ -107,6 +112,10 @@ __all__ = [
     "get_company_cache_repository",
     "reset_company_cache_repository",
     "CompanyCacheRepositoryInterface",
+    # Company research artifact repository
+    "get_company_research_artifact_repository",
+    "reset_company_research_artifact_repository",
+    "CompanyResearchArtifactRepositoryInterface",
     # Form cache repository
     "get_form_cache_repository",
     "reset_form_cache_repository",
@@ -0,0 +1,268 @@
+"""
+Company Research Artifact Repository
+
+Repository interface for the research_company_artifacts collection.
+Stores one versioned company-research artifact per (company_checksum,
+prompt_version) so research for a company is computed once and reused by
+every job posted by that company. Each document also carries a short-lived
+compute lock so concurrent workers single-flight the live research call.
+"""
+
+import logging
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from pymongo import ASCENDING, MongoClient
+from pymongo.errors import DuplicateKeyError
+
+logger = logging.getLogger(__name__)
+
+
+class CompanyResearchArtifactRepositoryInterface(ABC):
+    """
+    Abstract interface for the company research artifact store.
+
+    The research_company_artifacts collection stores:
+    - The latest company research payload per (company_checksum, prompt_version)
+    - computed_at and a monotonically increasing artifact_version
+    - lock_owner / lock_expires_at for single-flight recomputation
+    """
+
+    @abstractmethod
+    def find_artifact(self, company_checksum: str, prompt_version: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the stored artifact for a company.
+
+        Args:
+            company_checksum: Company identity checksum ("sha256:<hex>")
+            prompt_version: Prompt version the artifact was produced with
+
+        Returns:
+            Artifact document (may be stale or lock-only) or None
+        """
+        pass
+
+    @abstractmethod
+    def try_acquire_lock(
+        self,
+        company_checksum: str,
+        prompt_version: str,
+        owner: str,
+        lease_seconds: float,
+    ) -> bool:
+        """
+        Take the compute lock for a company if it is free or expired.
+
+        Args:
+            company_checksum: Company identity checksum
+            prompt_version: Prompt version being computed
+            owner: Lock owner identity (worker/job)
+            lease_seconds: How long the lock is held before others may take it
+
+        Returns:
+            True if this owner now holds the lock
+        """
+        pass
+
+    @abstractmethod
+    def save_artifact(
+        self,
+        company_checksum: str,
+        prompt_version: str,
+        owner: str,
+        artifact: Dict[str, Any],
+    ) -> bool:
+        """
+        Store a freshly computed artifact and release the owner's lock.
+
+        Args:
+            company_checksum: Company identity checksum
+            prompt_version: Prompt version the artifact was produced with
+            owner: Lock owner identity
+            artifact: Fields to store (e.g. company_profile, notes)
+
+        Returns:
+            True if successful
+        """
+        pass
+
+    @abstractmethod
+    def release_lock(self, company_checksum: str, prompt_version: str, owner: str) -> None:
+        """Release the compute lock without storing an artifact (compute failed)."""
+        pass
+
+    @abstractmethod
+    def ensure_indexes(self) -> None:
+        """Ensure required indexes exist."""
+        pass
+
+
+class AtlasCompanyResearchArtifactRepository(CompanyResearchArtifactRepositoryInterface):
+    """
+    Atlas MongoDB implementation of CompanyResearchArtifactRepository.
+
+    Freshness is decided by callers from computed_at, so stale artifacts stay
+    readable while a refresh is in flight.
+    """
+
+    _client: Optional[MongoClient] = None
+
+    def __init__(
+        self,
+        mongodb_uri: Optional[str] = None,
+        database: str = "jobs",
+        collection: str = "research_company_artifacts",
+    ):
+        """
+        Initialize the repository.
+
+        Args:
+            mongodb_uri: MongoDB connection string (defaults to MONGODB_URI env var)
+            database: Database name
+            collection: Collection name
+        """
+        self._mongodb_uri = mongodb_uri or os.getenv("MONGODB_URI")
+        self._database = database
+        self._collection_name = collection
+
+        if not self._mongodb_uri:
+            raise ValueError("MongoDB URI is required")
+
+    def _get_client(self) -> MongoClient:
+        """Get or create the MongoDB client (singleton)."""
+        if AtlasCompanyResearchArtifactRepository._client is None:
+            AtlasCompanyResearchArtifactRepository._client = MongoClient(self._mongodb_uri)
+            logger.info("Created new MongoDB client for company research artifact repository")
+        return AtlasCompanyResearchArtifactRepository._client
+
+    def _get_collection(self):
+        """Get the research_company_artifacts collection."""
+        client = self._get_client()
+        return client[self._database][self._collection_name]
+
+    @classmethod
+    def reset_connection(cls) -> None:
+        """Reset the MongoDB client connection."""
+        if cls._client is not None:
+            cls._client.close()
+            cls._client = None
+            logger.info("Company research artifact repository connection reset")
+
+    def find_artifact(self, company_checksum: str, prompt_version: str) -> Optional[Dict[str, Any]]:
+        """Find the stored artifact for a company."""
+        collection = self._get_collection()
+        return collection.find_one({"company_checksum": company_checksum, "prompt_version": prompt_version})
+
+    def try_acquire_lock(
+        self,
+        company_checksum: str,
+        prompt_version: str,
+        owner: str,
+        lease_seconds: float,
+    ) -> bool:
+        """Take the compute lock if it is free or expired."""
+        now = datetime.now(timezone.utc)
+        collection = self._get_collection()
+        try:
+            # Matches only when unlocked/expired; when another owner holds the
+            # lock the upsert collides with the unique index instead.
+            collection.update_one(
+                {
+                    "company_checksum": company_checksum,
+                    "prompt_version": prompt_version,
+                    "$or": [{"lock_owner": None}, {"lock_expires_at": {"$lte": now}}],
+                },
+                {
+                    "$set": {
+                        "lock_owner": owner,
+                        "lock_expires_at": now + timedelta(seconds=lease_seconds),
+                    }
+                },
+                upsert=True,
+            )
+            return True
+        except DuplicateKeyError:
+            return False
+
+    def save_artifact(
+        self,
+        company_checksum: str,
+        prompt_version: str,
+        owner: str,
+        artifact: Dict[str, Any],
+    ) -> bool:
+        """Store a freshly computed artifact and release the owner's lock."""
+        try:
+            collection = self._get_collection()
+            payload = dict(artifact)
+            payload["computed_at"] = datetime.now(timezone.utc)
+            payload["computed_by"] = owner
+            collection.update_one(
+                {"company_checksum": company_checksum, "prompt_version": prompt_version},
+                {"$set": payload, "$inc": {"artifact_version": 1}},
+                upsert=True,
+            )
+            self.release_lock(company_checksum, prompt_version, owner)
+            return True
+        except Exception as e:
+            logger.error(f"Error saving company research artifact for {company_checksum}: {e}")
+            return False
+
+    def release_lock(self, company_checksum: str, prompt_version: str, owner: str) -> None:
+        """Release the compute lock if this owner still holds it."""
+        collection = self._get_collection()
+        collection.update_one(
+            {"company_checksum": company_checksum, "prompt_version": prompt_version, "lock_owner": owner},
+            {"$set": {"lock_owner": None, "lock_expires_at": None}},
+        )
+
+    def ensure_indexes(self) -> None:
+        """Ensure the unique (company_checksum, prompt_version) index exists."""
+        try:
+            collection = self._get_collection()
+            collection.create_index(
+                [("company_checksum", ASCENDING), ("prompt_version", ASCENDING)],
+                name="research_company_artifact_key",
+                unique=True,
+            )
+            logger.info("Company research artifact indexes ensured")
+        except Exception as e:
+            logger.warning(f"Error creating company research artifact indexes: {e}")
+
+
+# Singleton instance
+_company_research_artifact_repository_instance: Optional[CompanyResearchArtifactRepositoryInterface] = None
+
+
+def get_company_research_artifact_repository() -> CompanyResearchArtifactRepositoryInterface:
+    """
+    Get the company research artifact repository instance (singleton).
+
+    Ensures the unique key index on first use; the lock protocol relies on it.
+
+    Returns:
+        CompanyResearchArtifactRepositoryInterface implementation
+    """
+    global _company_research_artifact_repository_instance
+
+    if _company_research_artifact_repository_instance is None:
+        repository = AtlasCompanyResearchArtifactRepository()
+        repository.ensure_indexes()
+        _company_research_artifact_repository_instance = repository
+        logger.info("Initialized company research artifact repository")
+
+    return _company_research_artifact_repository_instance
+
+
+def reset_company_research_artifact_repository() -> None:
+    """Reset the repository singleton."""
+    global _company_research_artifact_repository_instance
+
+    if _company_research_artifact_repository_instance is not None:
+        if isinstance(_company_research_artifact_repository_instance, AtlasCompanyResearchArtifactRepository):
+            AtlasCompanyResearchArtifactRepository.reset_connection()
+
+    _company_research_artifact_repository_instance = None
+    logger.info("Company research artifact repository singleton reset")
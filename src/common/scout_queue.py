@@ -12,21 +12,32 @@ Queue directory:
 File locks use a cross-platform abstraction: `fcntl.flock` on POSIX and
 `msvcrt.locking` on Windows. Both paths honour a `LOCK_TIMEOUT` budget so the
 contract is identical from the caller's perspective.
+
+Files are streamed rather than loaded whole, so memory stays bounded however
+large an overnight backlog grows:
+  - reads are lazy (`_iter_jsonl`) and consumers take entries in chunks
+    (`iter_scored_chunks`, `iter_pool_chunks`)
+  - writers only append; rewrites (dequeue, purge) stream the kept entries
+    into a sibling temp file and atomically rename it over the original
 """
 
 import json
 import logging
 import os
 import sys
+import tempfile
 import time
+from collections import deque
 from contextlib import contextmanager
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 LOCK_TIMEOUT = 5  # seconds
+STREAM_CHUNK_SIZE = 500  # entries per chunk for streaming consumers
 
 _IS_WINDOWS = sys.platform.startswith("win")
 
@@ -145,30 +156,113 @@ def _file_lock(path: Path, exclusive: bool = True):
         fd.close()
 
 
+def _parse_jsonl_lines(handle, path: Path, limit: Optional[int] = None) -> Iterator[Dict]:
+    """Yield entries from a binary JSONL handle, stopping after `limit` bytes."""
+    consumed = 0
+    for raw in handle:
+        consumed += len(raw)
+        if limit is not None and consumed > limit:
+            # Bytes appended after the snapshot (possibly a partial line)
+            return
+        line = raw.strip()
+        if line:
+            try:
+                yield json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                logger.warning(f"Skipping malformed JSONL line in {path}")
+
+
+def _iter_jsonl(path: Path) -> Iterator[Dict]:
+    """Lazily yield entries from a JSONL file (nothing if it doesn't exist)."""
+    try:
+        handle = open(path, "rb")
+    except FileNotFoundError:
+        return
+    with handle:
+        yield from _parse_jsonl_lines(handle, path)
+
+
+def _iter_jsonl_snapshot(path: Path) -> Iterator[Dict]:
+    """Lazily yield the entries present when iteration starts.
+
+    The shared lock is held only to open the file and record its size, so a
+    slow consumer never blocks writers: appends land beyond the recorded size
+    and rewrites replace the file rather than changing the open one.
+    """
+    with _file_lock(path, exclusive=False):
+        try:
+            handle = open(path, "rb")
+        except FileNotFoundError:
+            return
+        size = os.fstat(handle.fileno()).st_size
+    with handle:
+        yield from _parse_jsonl_lines(handle, path, limit=size)
+
+
+def _chunked(entries: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    """Group entries into lists of at most `size`."""
+    iterator = iter(entries)
+    while chunk := list(islice(iterator, max(1, size))):
+        yield chunk
+
+
 def _read_jsonl(path: Path) -> List[Dict]:
     """Read all entries from a JSONL file."""
-    if not path.exists():
-        return []
-    entries = []
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    entries.append(json.loads(line))
-                except json.JSONDecodeError:
-                    logger.warning(f"Skipping malformed JSONL line in {path}")
-    return entries
-
-
-def _write_jsonl(path: Path, entries: List[Dict]):
-    """Overwrite a JSONL file with entries."""
-    with open(path, "w", encoding="utf-8") as f:
-        for entry in entries:
-            f.write(json.dumps(entry, default=str) + "\n")
+    return list(_iter_jsonl(path))
 
 
-def _append_jsonl(path: Path, entries: List[Dict]):
+def _write_jsonl(path: Path, entries: Iterable[Dict]) -> int:
+    """Atomically replace a JSONL file with entries.
+
+    Entries are streamed into a sibling temp file which is then renamed over
+    `path`, so readers see either the old or the new file, never a partial
+    one, and `entries` may lazily read the file being replaced.
+
+    Returns:
+        Number of entries written
+    """
+    handle = tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    )
+    written = 0
+    try:
+        with handle:
+            for entry in entries:
+                handle.write(json.dumps(entry, default=str) + "\n")
+                written += 1
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(handle.name, path)
+    except BaseException:
+        Path(handle.name).unlink(missing_ok=True)
+        raise
+    return written
+
+
+def _compact_jsonl(path: Path, keep: Callable[[Dict], bool]) -> Tuple[int, int]:
+    """Stream a JSONL file through `keep`, rewriting it only if entries were dropped.
+
+    Returns:
+        (kept, dropped) counts
+    """
+    dropped = 0
+
+    def _kept() -> Iterator[Dict]:
+        nonlocal dropped
+        for entry in _iter_jsonl(path):
+            if keep(entry):
+                yield entry
+            else:
+                dropped += 1
+
+    kept = sum(1 for _ in _kept())
+    if dropped:
+        dropped = 0
+        kept = _write_jsonl(path, _kept())
+    return kept, dropped
+
+
+def _append_jsonl(path: Path, entries: Iterable[Dict]):
     """Append entries to a JSONL file."""
     with open(path, "a", encoding="utf-8") as f:
         for entry in entries:
@@ -198,16 +292,13 @@ def enqueue_jobs(
     dead_file = queue_dir / "queue_dead.jsonl"
 
     with _file_lock(queue_file, exclusive=True):
-        existing = _read_jsonl(queue_file)
-        existing_ids = {e["job_id"] for e in existing}
+        existing_ids = {e["job_id"] for e in _iter_jsonl(queue_file)}
 
         # Also check scored.jsonl (already scraped, awaiting selection)
-        scored_entries = _read_jsonl(scored_file)
-        existing_ids.update(e["job_id"] for e in scored_entries if "job_id" in e)
+        existing_ids.update(e["job_id"] for e in _iter_jsonl(scored_file) if "job_id" in e)
 
         # Also check dead letter (permanently failed — no point re-enqueuing)
-        dead_entries = _read_jsonl(dead_file)
-        existing_ids.update(e["job_id"] for e in dead_entries if "job_id" in e)
+        existing_ids.update(e["job_id"] for e in _iter_jsonl(dead_file) if "job_id" in e)
 
         new_entries = []
         for job in jobs:
@@ -251,16 +342,24 @@ def dequeue_batch(batch_size: int = 5) -> List[Dict]:
     queue_file = queue_dir / "queue.jsonl"
 
     with _file_lock(queue_file, exclusive=True):
-        entries = _read_jsonl(queue_file)
-        if not entries:
+        if not any(True for _ in _iter_jsonl(queue_file)):
             return []
 
-        # LIFO: take from the end (newest enqueued first)
-        batch = entries[-batch_size:]
-        remaining = entries[:-batch_size] if len(entries) > batch_size else []
-        _write_jsonl(queue_file, remaining)
+        # LIFO: take from the end (newest enqueued first). Only the last
+        # batch_size entries are held; everything older streams straight
+        # into the rewritten file.
+        tail: deque = deque(maxlen=batch_size if batch_size > 0 else None)
+
+        def _older() -> Iterator[Dict]:
+            for entry in _iter_jsonl(queue_file):
+                if len(tail) == tail.maxlen:
+                    yield tail[0]
+                tail.append(entry)
 
-    logger.info(f"Dequeued {len(batch)} jobs, newest first ({len(remaining)} remaining)")
+        remaining = _write_jsonl(queue_file, _older())
+        batch = list(tail)
+
+    logger.info(f"Dequeued {len(batch)} jobs, newest first ({remaining} remaining)")
     return batch
 
 
@@ -291,10 +390,7 @@ def scored_contains_job(job_id: str) -> bool:
     queue_dir = get_queue_dir()
     scored_file = queue_dir / "scored.jsonl"
     with _file_lock(scored_file, exclusive=False):
-        for entry in _read_jsonl(scored_file):
-            if entry.get("job_id") == job_id:
-                return True
-    return False
+        return any(entry.get("job_id") == job_id for entry in _iter_jsonl(scored_file))
 
 
 def append_scored_unique(jobs: List[Dict]) -> int:
@@ -308,7 +404,7 @@ def append_scored_unique(jobs: List[Dict]) -> int:
     with _file_lock(scored_file, exclusive=True):
         existing_ids = {
             entry.get("job_id")
-            for entry in _read_jsonl(scored_file)
+            for entry in _iter_jsonl(scored_file)
             if entry.get("job_id")
         }
         new_jobs = [job for job in jobs if job.get("job_id") and job.get("job_id") not in existing_ids]
@@ -320,24 +416,54 @@ def append_scored_unique(jobs: List[Dict]) -> int:
     return len(new_jobs)
 
 
-def read_and_clear_scored() -> List[Dict]:
-    """Atomically read all scored entries and truncate the file.
+def iter_scored_chunks(chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[List[Dict]]:
+    """Drain scored.jsonl in chunks without loading it whole.
 
-    Returns:
-        All scored entries
+    The file is claimed by renaming it to scored.jsonl.draining under the
+    lock (new scored jobs then start a fresh file), streamed from there, and
+    removed once every chunk has been consumed. If the consumer stops early
+    or crashes, the claimed entries are delivered again on the next drain,
+    ahead of anything scored since. Assumes a single consumer at a time
+    (the selector cron).
+
+    Args:
+        chunk_size: Maximum entries per chunk
+
+    Yields:
+        Lists of scored entries, in file order
     """
     queue_dir = get_queue_dir()
     scored_file = queue_dir / "scored.jsonl"
+    draining_file = queue_dir / "scored.jsonl.draining"
 
     with _file_lock(scored_file, exclusive=True):
-        entries = _read_jsonl(scored_file)
-        if entries:
-            # Truncate
-            scored_file.write_text("")
+        if scored_file.exists():
+            if draining_file.exists():
+                # Leftover claim from an interrupted drain: fold new entries in
+                _append_jsonl(draining_file, _iter_jsonl(scored_file))
+                scored_file.unlink()
+            else:
+                os.replace(scored_file, draining_file)
 
-    if entries:
-        logger.info(f"Read and cleared {len(entries)} scored jobs")
-    return entries
+    total = 0
+    for chunk in _chunked(_iter_jsonl(draining_file), chunk_size):
+        total += len(chunk)
+        yield chunk
+    draining_file.unlink(missing_ok=True)
+
+    if total:
+        logger.info(f"Drained {total} scored jobs")
+
+
+def read_and_clear_scored() -> List[Dict]:
+    """Read all scored entries and clear the file.
+
+    Prefer iter_scored_chunks() for large backlogs.
+
+    Returns:
+        All scored entries
+    """
+    return [entry for chunk in iter_scored_chunks() for entry in chunk]
 
 
 def purge_stale(max_age_hours: int = 48) -> int:
@@ -353,31 +479,21 @@ def purge_stale(max_age_hours: int = 48) -> int:
     queue_file = queue_dir / "queue.jsonl"
     now = datetime.now(timezone.utc)
 
-    with _file_lock(queue_file, exclusive=True):
-        entries = _read_jsonl(queue_file)
-        if not entries:
-            return 0
-
-        fresh = []
-        stale = []
-        for entry in entries:
-            enqueued_str = entry.get("enqueued_at", "")
-            try:
-                enqueued_at = datetime.fromisoformat(enqueued_str.replace("Z", "+00:00"))
-                age_hours = (now - enqueued_at).total_seconds() / 3600
-                if age_hours > max_age_hours:
-                    stale.append(entry)
-                else:
-                    fresh.append(entry)
-            except (ValueError, TypeError):
-                # Can't parse date — keep it
-                fresh.append(entry)
+    def _fresh(entry: Dict) -> bool:
+        enqueued_str = entry.get("enqueued_at", "")
+        try:
+            enqueued_at = datetime.fromisoformat(enqueued_str.replace("Z", "+00:00"))
+            return (now - enqueued_at).total_seconds() / 3600 <= max_age_hours
+        except (ValueError, TypeError, AttributeError):
+            # Can't parse date — keep it
+            return True
 
-        if stale:
-            _write_jsonl(queue_file, fresh)
-            logger.info(f"Purged {len(stale)} stale entries (>{max_age_hours}h old)")
+    with _file_lock(queue_file, exclusive=True):
+        _, stale = _compact_jsonl(queue_file, _fresh)
 
-    return len(stale)
+    if stale:
+        logger.info(f"Purged {stale} stale entries (>{max_age_hours}h old)")
+    return stale
 
 
 def move_to_dead_letter(entries: List[Dict], reason: str):
@@ -455,13 +571,28 @@ def append_to_pool(jobs: List[Dict]) -> int:
     return len(jobs)
 
 
+def iter_pool_chunks(chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[List[Dict]]:
+    """Stream scored_pool.jsonl in chunks (non-destructive).
+
+    Yields the entries present when iteration starts; jobs pooled meanwhile
+    are left for the next read.
+
+    Args:
+        chunk_size: Maximum entries per chunk
+
+    Yields:
+        Lists of pool entries, in file order
+    """
+    pool_file = get_queue_dir() / "scored_pool.jsonl"
+    yield from _chunked(_iter_jsonl_snapshot(pool_file), chunk_size)
+
+
 def read_pool() -> List[Dict]:
-    """Read all entries from scored_pool.jsonl (non-destructive)."""
-    queue_dir = get_queue_dir()
-    pool_file = queue_dir / "scored_pool.jsonl"
+    """Read all entries from scored_pool.jsonl (non-destructive).
 
-    with _file_lock(pool_file, exclusive=False):
-        return _read_jsonl(pool_file)
+    Prefer iter_pool_chunks() for large pools.
+    """
+    return [entry for chunk in iter_pool_chunks() for entry in chunk]
 
 
 def purge_pool(max_age_hours: int = POOL_MAX_AGE_HOURS) -> int:
@@ -474,28 +605,15 @@ def purge_pool(max_age_hours: int = POOL_MAX_AGE_HOURS) -> int:
 
     cutoff = time.time() - (max_age_hours * 3600)
 
-    with _file_lock(pool_file, exclusive=True):
-        entries = _read_jsonl(pool_file)
-        if not entries:
-            return 0
+    def _fresh(entry: Dict) -> bool:
+        try:
+            return datetime.fromisoformat(entry.get("pooled_at", "2000-01-01")).timestamp() >= cutoff
+        except (ValueError, TypeError):
+            return False
 
-        kept = []
-        purged = 0
-        for entry in entries:
-            try:
-                ts = datetime.fromisoformat(entry.get("pooled_at", "2000-01-01"))
-                if ts.timestamp() >= cutoff:
-                    kept.append(entry)
-                else:
-                    purged += 1
-            except (ValueError, TypeError):
-                purged += 1
-
-        if purged:
-            with open(pool_file, "w", encoding="utf-8") as f:
-                for entry in kept:
-                    f.write(json.dumps(entry) + "\n")
+    with _file_lock(pool_file, exclusive=True):
+        kept, purged = _compact_jsonl(pool_file, _fresh)
 
     if purged:
-        logger.info(f"Purged {purged} stale entries from scored_pool.jsonl ({len(kept)} remaining)")
+        logger.info(f"Purged {purged} stale entries from scored_pool.jsonl ({kept} remaining)")
     return purged
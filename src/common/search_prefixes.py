@@ -0,0 +1,133 @@
+"""
+Edge n-gram search prefixes for typeahead job search.
+
+Free-text job search used to run case-insensitive, unanchored $regex over
+title/company/location/jobId, which scans the whole collection on every
+keystroke. Instead each document carries `search_prefixes`: every prefix
+(MIN_PREFIX_LENGTH..MAX_PREFIX_LENGTH characters) of every word in its
+searchable fields, behind a multikey index. A query matches when each of
+its words is a prefix of some word in the document:
+
+    {"search_prefixes": {"$all": query_prefixes("senior eng")}}
+
+which is an index lookup of the rarest prefix plus a short fetch.
+
+Words are casefolded with accents stripped, so "Zürich" matches "zur".
+Query words longer than MAX_PREFIX_LENGTH are truncated (a slight superset)
+and words shorter than MIN_PREFIX_LENGTH are ignored; a query with no usable
+word gets no prefixes, and callers fall back to their regex search.
+
+Writers set the field with search_prefixes(document) when they build a job;
+backfill_search_prefixes() fills rows written without it (migration, plus a
+bounded catch-up per selector run for other ingest paths).
+
+SYNC NOTE: This file is copied to frontend/repositories/search_prefixes.py for Vercel deployment.
+When modifying this file, also update the frontend copy to stay in sync.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import Any, Iterable, Mapping, Optional
+
+from pymongo import ASCENDING, UpdateOne
+
+SEARCH_PREFIX_FIELD = "search_prefixes"
+SEARCH_PREFIX_INDEX_NAME = "search_prefixes"
+# Fields searched on level-2 jobs (/api/jobs)
+JOB_SEARCH_FIELDS = ("title", "company", "location", "jobId")
+MIN_PREFIX_LENGTH = 2
+MAX_PREFIX_LENGTH = 15
+SEARCH_PREFIX_BACKFILL_BATCH = 500
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def search_words(text: Any) -> list[str]:
+    """Casefolded, accent-stripped words of text (non-strings are stringified)."""
+    if text is None:
+        return []
+    decomposed = unicodedata.normalize("NFKD", str(text))
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _WORD.findall(stripped.casefold())
+
+
+def search_prefixes(document: Mapping[str, Any], fields: Iterable[str] = JOB_SEARCH_FIELDS) -> list[str]:
+    """
+    Every indexed prefix of every word in document's search fields.
+
+    Args:
+        document: Job document (or the fields being written)
+        fields: Fields to index
+
+    Returns:
+        Sorted, de-duplicated prefixes
+    """
+    prefixes: set[str] = set()
+    for field in fields:
+        for word in search_words(document.get(field)):
+            for length in range(MIN_PREFIX_LENGTH, min(len(word), MAX_PREFIX_LENGTH) + 1):
+                prefixes.add(word[:length])
+    return sorted(prefixes)
+
+
+def query_prefixes(query_text: str) -> list[str]:
+    """
+    The prefixes a document must all contain to match query_text.
+
+    Returns:
+        One prefix per usable query word, or [] if there is none
+    """
+    prefixes = {word[:MAX_PREFIX_LENGTH] for word in search_words(query_text) if len(word) >= MIN_PREFIX_LENGTH}
+    return sorted(prefixes)
+
+
+def ensure_search_prefix_index(collection) -> None:
+    """Create the multikey index prefix queries use."""
+    collection.create_index([(SEARCH_PREFIX_FIELD, ASCENDING)], name=SEARCH_PREFIX_INDEX_NAME)
+
+
+def backfill_search_prefixes(
+    collection,
+    *,
+    fields: Iterable[str] = JOB_SEARCH_FIELDS,
+    limit: Optional[int] = None,
+    batch_size: int = SEARCH_PREFIX_BACKFILL_BATCH,
+) -> int:
+    """
+    Write search_prefixes on rows that do not have them yet.
+
+    Rows without the field are found through the search_prefixes index (a
+    missing field indexes as null), so once a collection is backfilled this
+    is a cheap no-op. Rows with nothing searchable get an empty list.
+
+    Args:
+        collection: level-2 or level-1
+        fields: Fields to index
+        limit: Stop after writing this many rows (None = all)
+        batch_size: Rows read and written per round trip
+
+    Returns:
+        Number of rows written
+    """
+    fields = tuple(fields)
+    projection = {field: 1 for field in fields}
+    written = 0
+    while limit is None or written < limit:
+        size = batch_size if limit is None else min(batch_size, limit - written)
+        documents = list(collection.find({SEARCH_PREFIX_FIELD: None}, projection).limit(size))
+        if not documents:
+            break
+        collection.bulk_write(
+            [
+                UpdateOne(
+                    {"_id": document["_id"], SEARCH_PREFIX_FIELD: None},
+                    {"$set": {SEARCH_PREFIX_FIELD: search_prefixes(document, fields)}},
+                )
+                for document in documents
+            ],
+            ordered=False,
+        )
+        written += len(documents)
+    return written
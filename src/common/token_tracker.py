@@ -13,18 +13,30 @@ Usage:
     # Check if budget exceeded
     if tracker.is_budget_exceeded():
         raise BudgetExceededError(tracker.get_usage_summary())
+
+Aggregates (totals, hourly/daily buckets, per-run and per-job) are maintained
+incrementally as usages are tracked, so summaries and cost histories cost
+O(buckets) rather than a scan of every call. Raw usages are kept in a bounded
+ring buffer (TOKEN_TRACKER_MAX_USAGES). With COST_LEDGER_ENABLED=true usages
+are also persisted to MongoDB (see cost_ledger.py) so history survives
+restarts and is shared across processes.
 """
 
+import copy
 import os
 import threading
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional
 
 from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.outputs import LLMResult
 
+if TYPE_CHECKING:
+    from .cost_ledger import CostLedger
+
 
 class Provider(str, Enum):
     """Supported LLM providers."""
@@ -55,6 +67,27 @@ TOKEN_COSTS_PER_MILLION = {
     "default": {"input": 2.00, "output": 8.00},
 }
 
+# Raw usages kept in memory per tracker (older ones live only in aggregates/ledger)
+DEFAULT_MAX_USAGES = 10_000
+
+# Retention of in-memory time buckets
+HOURLY_BUCKET_RETENTION_HOURS = 7 * 24
+DAILY_BUCKET_RETENTION_DAYS = 366
+
+# Per-run / per-job aggregates kept in memory (least recently updated evicted first)
+MAX_TRACKED_RUNS = 1_000
+MAX_TRACKED_JOBS = 10_000
+
+
+def hour_key(timestamp: datetime) -> str:
+    """Bucket key for the hour containing timestamp (sorts chronologically)."""
+    return timestamp.strftime("%Y-%m-%d %H:00")
+
+
+def day_key(timestamp: datetime) -> str:
+    """Bucket key for the day containing timestamp (sorts chronologically)."""
+    return timestamp.strftime("%Y-%m-%d")
+
 
 @dataclass
 class TokenUsage:
@@ -68,6 +101,8 @@ class TokenUsage:
     run_id: Optional[str] = None
     job_id: Optional[str] = None
     timestamp: datetime = field(default_factory=datetime.utcnow)
+    cache_hit: bool = False
+    saved_cost_usd: float = 0.0
 
     @property
     def total_tokens(self) -> int:
@@ -83,9 +118,38 @@ class UsageSummary:
     total_tokens: int = 0
     total_cost_usd: float = 0.0
     calls_count: int = 0
+    cache_hits: int = 0
+    saved_cost_usd: float = 0.0
     by_provider: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     by_layer: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
+    def add(self, usage: "TokenUsage") -> None:
+        """Fold one usage record into the running totals."""
+        self.total_input_tokens += usage.input_tokens
+        self.total_output_tokens += usage.output_tokens
+        self.total_tokens += usage.total_tokens
+        self.total_cost_usd += usage.estimated_cost_usd
+        self.calls_count += 1
+        if usage.cache_hit:
+            self.cache_hits += 1
+            self.saved_cost_usd += usage.saved_cost_usd
+
+        for breakdown, key in (
+            (self.by_provider, usage.provider),
+            (self.by_layer, usage.layer or "unknown"),
+        ):
+            if key not in breakdown:
+                breakdown[key] = {
+                    "input_tokens": 0,
+                    "output_tokens": 0,
+                    "cost_usd": 0.0,
+                    "calls": 0,
+                }
+            breakdown[key]["input_tokens"] += usage.input_tokens
+            breakdown[key]["output_tokens"] += usage.output_tokens
+            breakdown[key]["cost_usd"] += usage.estimated_cost_usd
+            breakdown[key]["calls"] += 1
+
 
 class BudgetExceededError(Exception):
     """Raised when token budget is exceeded."""
@@ -112,6 +176,8 @@ class TokenTracker:
         budget_usd: Optional[float] = None,
         enforce_budget: bool = True,
         job_id: Optional[str] = None,
+        ledger: Optional["CostLedger"] = None,
+        max_usages: Optional[int] = None,
     ):
         """
         Initialize token tracker.
@@ -120,12 +186,57 @@ class TokenTracker:
             budget_usd: Maximum budget in USD (None for unlimited)
             enforce_budget: Whether to raise BudgetExceededError when exceeded
             job_id: Optional job ID for per-job tracking
+            ledger: Optional persistent CostLedger that every usage is appended to
+            max_usages: Raw usages kept in memory (default TOKEN_TRACKER_MAX_USAGES
+                or 10,000); aggregates always cover every tracked usage
         """
         self.budget_usd = budget_usd
         self.enforce_budget = enforce_budget
         self.job_id = job_id
-        self._usages: List[TokenUsage] = []
+        self.ledger = ledger
+        if max_usages is None:
+            max_usages = int(os.getenv("TOKEN_TRACKER_MAX_USAGES", str(DEFAULT_MAX_USAGES)))
+        self._usages: Deque[TokenUsage] = deque(maxlen=max_usages)
         self._lock = threading.Lock()
+        self._init_aggregates()
+
+    def _init_aggregates(self) -> None:
+        """Create empty incremental aggregates (caller holds the lock or owns self)."""
+        self._summary = UsageSummary()
+        self._hourly: Dict[str, Dict[str, Any]] = {}
+        self._daily: Dict[str, Dict[str, Any]] = {}
+        self._run_summaries: "OrderedDict[str, UsageSummary]" = OrderedDict()
+        self._job_costs: "OrderedDict[str, float]" = OrderedDict()
+
+    def _aggregate(self, usage: TokenUsage) -> None:
+        """Fold a usage into every aggregate (caller holds the lock)."""
+        self._summary.add(usage)
+
+        for buckets, key, retention_key in (
+            (self._hourly, hour_key(usage.timestamp),
+             hour_key(usage.timestamp - timedelta(hours=HOURLY_BUCKET_RETENTION_HOURS))),
+            (self._daily, day_key(usage.timestamp),
+             day_key(usage.timestamp - timedelta(days=DAILY_BUCKET_RETENTION_DAYS))),
+        ):
+            if key not in buckets:
+                for old in [k for k in buckets if k < retention_key]:
+                    del buckets[old]
+                buckets[key] = {"cost_usd": 0.0, "calls": 0}
+            buckets[key]["cost_usd"] += usage.estimated_cost_usd
+            buckets[key]["calls"] += 1
+
+        if usage.run_id:
+            run_summary = self._run_summaries.pop(usage.run_id, None) or UsageSummary()
+            run_summary.add(usage)
+            self._run_summaries[usage.run_id] = run_summary
+            if len(self._run_summaries) > MAX_TRACKED_RUNS:
+                self._run_summaries.popitem(last=False)
+
+        if usage.job_id:
+            job_cost = self._job_costs.pop(usage.job_id, 0.0)
+            self._job_costs[usage.job_id] = job_cost + usage.estimated_cost_usd
+            if len(self._job_costs) > MAX_TRACKED_JOBS:
+                self._job_costs.popitem(last=False)
 
     def estimate_cost(self, model: str, input_tokens: int, output_tokens: int) -> float:
         """
@@ -159,6 +270,8 @@ class TokenTracker:
         layer: Optional[str] = None,
         run_id: Optional[str] = None,
         job_id: Optional[str] = None,
+        cache_hit: bool = False,
+        saved_cost_usd: Optional[float] = None,
     ) -> TokenUsage:
         """
         Track token usage from an LLM call.
@@ -171,6 +284,11 @@ class TokenTracker:
             layer: Pipeline layer name (e.g., "layer2", "layer6_v2")
             run_id: Pipeline run identifier for per-run cost tracking
             job_id: Job identifier for per-job cost tracking
+            cache_hit: True if the response was served from the LLM response
+                cache. Recorded as zero-cost; the avoided cost goes to
+                saved_cost_usd instead.
+            saved_cost_usd: Original cost of the cached response (estimated
+                from tokens if not provided). Only used when cache_hit is True.
 
         Returns:
             TokenUsage record
@@ -179,6 +297,10 @@ class TokenTracker:
             BudgetExceededError: If budget is exceeded and enforcement is enabled
         """
         cost = self.estimate_cost(model, input_tokens, output_tokens)
+        saved = 0.0
+        if cache_hit:
+            saved = cost if saved_cost_usd is None else saved_cost_usd
+            cost = 0.0
 
         # Use instance-level job_id if not provided
         effective_job_id = job_id or self.job_id
@@ -192,10 +314,16 @@ class TokenTracker:
             layer=layer,
             run_id=run_id,
             job_id=effective_job_id,
+            cache_hit=cache_hit,
+            saved_cost_usd=saved,
         )
 
         with self._lock:
             self._usages.append(usage)
+            self._aggregate(usage)
+
+        if self.ledger is not None:
+            self.ledger.record(usage)
 
         # Check budget after tracking
         if self.enforce_budget and self.is_budget_exceeded():
@@ -281,43 +409,7 @@ class TokenTracker:
             UsageSummary with totals and breakdowns
         """
         with self._lock:
-            summary = UsageSummary()
-
-            for usage in self._usages:
-                summary.total_input_tokens += usage.input_tokens
-                summary.total_output_tokens += usage.output_tokens
-                summary.total_tokens += usage.total_tokens
-                summary.total_cost_usd += usage.estimated_cost_usd
-                summary.calls_count += 1
-
-                # By provider
-                if usage.provider not in summary.by_provider:
-                    summary.by_provider[usage.provider] = {
-                        "input_tokens": 0,
-                        "output_tokens": 0,
-                        "cost_usd": 0.0,
-                        "calls": 0,
-                    }
-                summary.by_provider[usage.provider]["input_tokens"] += usage.input_tokens
-                summary.by_provider[usage.provider]["output_tokens"] += usage.output_tokens
-                summary.by_provider[usage.provider]["cost_usd"] += usage.estimated_cost_usd
-                summary.by_provider[usage.provider]["calls"] += 1
-
-                # By layer
-                layer_key = usage.layer or "unknown"
-                if layer_key not in summary.by_layer:
-                    summary.by_layer[layer_key] = {
-                        "input_tokens": 0,
-                        "output_tokens": 0,
-                        "cost_usd": 0.0,
-                        "calls": 0,
-                    }
-                summary.by_layer[layer_key]["input_tokens"] += usage.input_tokens
-                summary.by_layer[layer_key]["output_tokens"] += usage.output_tokens
-                summary.by_layer[layer_key]["cost_usd"] += usage.estimated_cost_usd
-                summary.by_layer[layer_key]["calls"] += 1
-
-            return summary
+            return copy.deepcopy(self._summary)
 
     def is_budget_exceeded(self) -> bool:
         """
@@ -329,8 +421,8 @@ class TokenTracker:
         if self.budget_usd is None:
             return False
 
-        summary = self.get_summary()
-        return summary.total_cost_usd > self.budget_usd
+        with self._lock:
+            return self._summary.total_cost_usd > self.budget_usd
 
     def get_remaining_budget(self) -> Optional[float]:
         """
@@ -342,18 +434,19 @@ class TokenTracker:
         if self.budget_usd is None:
             return None
 
-        summary = self.get_summary()
-        return max(0.0, self.budget_usd - summary.total_cost_usd)
+        with self._lock:
+            return max(0.0, self.budget_usd - self._summary.total_cost_usd)
 
     def get_usages(self) -> List[TokenUsage]:
-        """Get all tracked usages."""
+        """Get tracked usages still held in the in-memory ring buffer."""
         with self._lock:
             return list(self._usages)
 
     def reset(self) -> None:
-        """Reset all tracked usage."""
+        """Reset all tracked usage (in memory; the persistent ledger is untouched)."""
         with self._lock:
             self._usages.clear()
+            self._init_aggregates()
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -363,6 +456,7 @@ class TokenTracker:
             Dictionary with usage data
         """
         summary = self.get_summary()
+        usages = self.get_usages()
         return {
             "job_id": self.job_id,
             "budget_usd": self.budget_usd,
@@ -371,6 +465,8 @@ class TokenTracker:
             "total_tokens": summary.total_tokens,
             "total_cost_usd": summary.total_cost_usd,
             "calls_count": summary.calls_count,
+            "cache_hits": summary.cache_hits,
+            "saved_cost_usd": summary.saved_cost_usd,
             "by_provider": summary.by_provider,
             "by_layer": summary.by_layer,
             "usages": [
@@ -384,8 +480,9 @@ class TokenTracker:
                     "run_id": u.run_id,
                     "job_id": u.job_id,
                     "timestamp": u.timestamp.isoformat(),
+                    "cache_hit": u.cache_hit,
                 }
-                for u in self._usages
+                for u in usages
             ],
         }
 
@@ -393,77 +490,43 @@ class TokenTracker:
         """
         Get costs aggregated by hour for the last N hours.
 
+        Reads the incremental hourly buckets (kept for 7 days in memory).
+
         Args:
             hours: Number of hours to look back (default 24)
 
         Returns:
             List of dicts with 'hour', 'cost_usd', 'calls' keys
         """
-        from collections import defaultdict
-
         now = datetime.utcnow()
-        cutoff = now - timedelta(hours=hours)
-
+        keys = [hour_key(now - timedelta(hours=hours - 1 - i)) for i in range(hours)]
         with self._lock:
-            hourly = defaultdict(lambda: {"cost_usd": 0.0, "calls": 0})
-
-            for usage in self._usages:
-                if usage.timestamp >= cutoff:
-                    hour_key = usage.timestamp.strftime("%Y-%m-%d %H:00")
-                    hourly[hour_key]["cost_usd"] += usage.estimated_cost_usd
-                    hourly[hour_key]["calls"] += 1
-
-        # Generate all hours in range (including zeros)
-        result = []
-        for i in range(hours):
-            hour = now - timedelta(hours=hours - 1 - i)
-            hour_key = hour.strftime("%Y-%m-%d %H:00")
-            data = hourly.get(hour_key, {"cost_usd": 0.0, "calls": 0})
-            result.append({
-                "hour": hour_key,
-                "cost_usd": round(data["cost_usd"], 6),
-                "calls": data["calls"],
-            })
-
-        return result
+            buckets = {k: dict(self._hourly[k]) for k in keys if k in self._hourly}
+        return [
+            {"hour": key, **_rounded_bucket(buckets.get(key))}
+            for key in keys
+        ]
 
     def get_daily_costs(self, days: int = 7) -> List[Dict[str, Any]]:
         """
         Get costs aggregated by day for the last N days.
 
+        Reads the incremental daily buckets (kept for a year in memory).
+
         Args:
             days: Number of days to look back (default 7)
 
         Returns:
             List of dicts with 'date', 'cost_usd', 'calls' keys
         """
-        from collections import defaultdict
-
         now = datetime.utcnow()
-        cutoff = now - timedelta(days=days)
-
+        keys = [day_key(now - timedelta(days=days - 1 - i)) for i in range(days)]
         with self._lock:
-            daily = defaultdict(lambda: {"cost_usd": 0.0, "calls": 0})
-
-            for usage in self._usages:
-                if usage.timestamp >= cutoff:
-                    day_key = usage.timestamp.strftime("%Y-%m-%d")
-                    daily[day_key]["cost_usd"] += usage.estimated_cost_usd
-                    daily[day_key]["calls"] += 1
-
-        # Generate all days in range (including zeros)
-        result = []
-        for i in range(days):
-            day = now - timedelta(days=days - 1 - i)
-            day_key = day.strftime("%Y-%m-%d")
-            data = daily.get(day_key, {"cost_usd": 0.0, "calls": 0})
-            result.append({
-                "date": day_key,
-                "cost_usd": round(data["cost_usd"], 6),
-                "calls": data["calls"],
-            })
-
-        return result
+            buckets = {k: dict(self._daily[k]) for k in keys if k in self._daily}
+        return [
+            {"date": key, **_rounded_bucket(buckets.get(key))}
+            for key in keys
+        ]
 
     # =========================================================================
     # Per-Run Cost Tracking (BG-3)
@@ -477,11 +540,11 @@ class TokenTracker:
             List of run_id strings (excludes None)
         """
         with self._lock:
-            return list(set(u.run_id for u in self._usages if u.run_id))
+            return list(self._run_summaries.keys())
 
     def get_run_usages(self, run_id: str) -> List[TokenUsage]:
         """
-        Get all usages for a specific run.
+        Get usages for a specific run still held in the in-memory ring buffer.
 
         Args:
             run_id: Pipeline run identifier
@@ -496,6 +559,9 @@ class TokenTracker:
         """
         Get aggregated usage summary for a specific run.
 
+        Falls back to the persistent ledger for runs this tracker has not seen
+        (e.g. after a restart).
+
         Args:
             run_id: Pipeline run identifier
 
@@ -503,46 +569,12 @@ class TokenTracker:
             UsageSummary with totals and breakdowns for the run
         """
         with self._lock:
-            summary = UsageSummary()
-
-            for usage in self._usages:
-                if usage.run_id != run_id:
-                    continue
-
-                summary.total_input_tokens += usage.input_tokens
-                summary.total_output_tokens += usage.output_tokens
-                summary.total_tokens += usage.total_tokens
-                summary.total_cost_usd += usage.estimated_cost_usd
-                summary.calls_count += 1
-
-                # By provider
-                if usage.provider not in summary.by_provider:
-                    summary.by_provider[usage.provider] = {
-                        "input_tokens": 0,
-                        "output_tokens": 0,
-                        "cost_usd": 0.0,
-                        "calls": 0,
-                    }
-                summary.by_provider[usage.provider]["input_tokens"] += usage.input_tokens
-                summary.by_provider[usage.provider]["output_tokens"] += usage.output_tokens
-                summary.by_provider[usage.provider]["cost_usd"] += usage.estimated_cost_usd
-                summary.by_provider[usage.provider]["calls"] += 1
-
-                # By layer
-                layer_key = usage.layer or "unknown"
-                if layer_key not in summary.by_layer:
-                    summary.by_layer[layer_key] = {
-                        "input_tokens": 0,
-                        "output_tokens": 0,
-                        "cost_usd": 0.0,
-                        "calls": 0,
-                    }
-                summary.by_layer[layer_key]["input_tokens"] += usage.input_tokens
-                summary.by_layer[layer_key]["output_tokens"] += usage.output_tokens
-                summary.by_layer[layer_key]["cost_usd"] += usage.estimated_cost_usd
-                summary.by_layer[layer_key]["calls"] += 1
-
-            return summary
+            summary = self._run_summaries.get(run_id)
+            if summary is not None:
+                return copy.deepcopy(summary)
+        if self.ledger is not None:
+            return self.ledger.get_run_summary(run_id)
+        return UsageSummary()
 
     def get_run_cost(self, run_id: str) -> float:
         """
@@ -605,6 +637,8 @@ class TokenTracker:
         """
         Get total cost for a specific job across all runs.
 
+        Falls back to the persistent ledger for jobs this tracker has not seen.
+
         Args:
             job_id: Job identifier
 
@@ -612,10 +646,17 @@ class TokenTracker:
             Total cost in USD for the job
         """
         with self._lock:
-            return sum(
-                u.estimated_cost_usd for u in self._usages
-                if u.job_id == job_id
-            )
+            cost = self._job_costs.get(job_id)
+        if cost is None and self.ledger is not None:
+            return self.ledger.get_job_cost(job_id)
+        return cost or 0.0
+
+
+def _rounded_bucket(bucket: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Format a cost bucket for history output (missing buckets are zero)."""
+    if not bucket:
+        return {"cost_usd": 0.0, "calls": 0}
+    return {"cost_usd": round(bucket["cost_usd"], 6), "calls": bucket["calls"]}
 
 
 class TokenTrackingCallback(BaseCallbackHandler):
@@ -695,13 +736,20 @@ def get_global_tracker() -> TokenTracker:
     Uses environment variables for configuration:
     - TOKEN_BUDGET_USD: Budget limit (default: 100.0)
     - ENFORCE_TOKEN_BUDGET: Whether to enforce (default: false in dev)
+    - COST_LEDGER_ENABLED: Persist usages to the MongoDB cost ledger
     """
     global _global_tracker
 
     if _global_tracker is None:
+        from .cost_ledger import get_cost_ledger
+
         budget = float(os.getenv("TOKEN_BUDGET_USD", "100.0"))
         enforce = os.getenv("ENFORCE_TOKEN_BUDGET", "false").lower() == "true"
-        _global_tracker = TokenTracker(budget_usd=budget, enforce_budget=enforce)
+        _global_tracker = TokenTracker(
+            budget_usd=budget,
+            enforce_budget=enforce,
+            ledger=get_cost_ledger(),
+        )
 
     return _global_tracker
 
@@ -748,6 +796,10 @@ class TokenTrackerRegistry:
         """
         with self._lock:
             if name not in self._trackers:
+                if "ledger" not in kwargs:
+                    from .cost_ledger import get_cost_ledger
+
+                    kwargs["ledger"] = get_cost_ledger()
                 self._trackers[name] = TokenTracker(
                     budget_usd=budget_usd,
                     **kwargs,
@@ -787,6 +839,8 @@ class TokenTrackerRegistry:
                     "total_output_tokens": summary.total_output_tokens,
                     "total_cost_usd": summary.total_cost_usd,
                     "call_count": summary.calls_count,
+                    "cache_hits": summary.cache_hits,
+                    "saved_cost_usd": summary.saved_cost_usd,
                     "budget_usd": budget_usd,
                     "budget_remaining_usd": remaining,
                     "budget_used_percent": round(used_percent, 1),
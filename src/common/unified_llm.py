@@ -49,13 +49,17 @@ ProgressCallback = Callable[[str, str, Dict[str, Any]], None]
 from typing import TYPE_CHECKING
 
 from src.common.claude_cli import ClaudeCLI, CLIResult
+from src.common.claude_cli_pool import is_cli_pool_enabled
 from src.common.json_utils import parse_llm_json
+from src.common.llm_cache import CachedResponse, build_cache_key, get_llm_response_cache
 from src.common.llm_config import (
     TIER_TO_CLAUDE_MODEL,
     StepConfig,
     TierType,
     get_step_config,
 )
+from src.common.llm_scheduler import provider_for_model, scheduled_llm_call
+from src.common.token_tracker import get_global_tracker
 from src.common.utils import run_async
 
 if TYPE_CHECKING:
@@ -84,6 +88,7 @@ class LLMResult:
         input_tokens: Number of input tokens (if available)
         output_tokens: Number of output tokens (if available)
         cost_usd: Estimated cost in USD (if available)
+        cached: True when served from the LLM response cache (cost_usd is 0)
     """
 
     content: str
@@ -97,6 +102,7 @@ class LLMResult:
     input_tokens: Optional[int] = None
     output_tokens: Optional[int] = None
     cost_usd: Optional[float] = None
+    cached: bool = False
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -128,6 +134,7 @@ class UnifiedLLM:
         job_id: Optional[str] = None,
         struct_logger: Optional["StructuredLogger"] = None,
         progress_callback: Optional[ProgressCallback] = None,
+        priority: Optional[str] = None,
     ):
         """
         Initialize the UnifiedLLM wrapper.
@@ -143,6 +150,8 @@ class UnifiedLLM:
             progress_callback: Optional callback for granular progress events to Redis.
                 Signature: (event_type: str, message: str, data: Dict) -> None
                 This forwards LLM call events directly to Redis for frontend streaming.
+            priority: Scheduler priority class ("interactive", "batch", "backfill").
+                Defaults to the surrounding llm_scheduling_context(), then "batch".
 
         Note:
             If step_name is provided, config is loaded from STEP_CONFIGS.
@@ -165,6 +174,7 @@ class UnifiedLLM:
             self.config.tier = tier
 
         self.job_id = job_id or "unknown"
+        self.priority = priority
         self._cli: Optional[ClaudeCLI] = None
         self._langchain_llm = None
         self._progress_callback = progress_callback
@@ -219,6 +229,8 @@ class UnifiedLLM:
         system: Optional[str] = None,
         job_id: Optional[str] = None,
         validate_json: bool = True,
+        use_cache: bool = True,
+        schema_version: Optional[str] = None,
     ) -> LLMResult:
         """
         Invoke LLM with Claude CLI primary, LangChain fallback.
@@ -227,6 +239,11 @@ class UnifiedLLM:
         error, etc.) and fallback is enabled, it automatically tries the
         LangChain backend.
 
+        When the LLM response cache is enabled (LLM_RESPONSE_CACHE_ENABLED=true),
+        a previously successful response for the same (model, tier, system,
+        prompt, schema_version) is returned without invoking any backend.
+        Research steps are never cached since they depend on live web search.
+
         The backend used is always reported in the result for transparency.
 
         Args:
@@ -234,6 +251,9 @@ class UnifiedLLM:
             system: Optional system prompt (combined with user prompt for CLI)
             job_id: Job ID for tracking (overrides default)
             validate_json: Whether to parse response as JSON (default True)
+            use_cache: Set False to bypass the response cache for this call
+            schema_version: Output schema version folded into the cache key;
+                bump it when the expected response shape changes
 
         Returns:
             LLMResult with response and backend attribution
@@ -244,6 +264,99 @@ class UnifiedLLM:
             >>> print(f"Grade: {result.content}, via {result.backend}")
         """
         job_id = job_id or self.job_id
+
+        cache = None
+        if use_cache and not self.step_name.startswith("research_"):
+            cache = get_llm_response_cache()
+        if cache is None:
+            return await self._invoke_backends(prompt, system, job_id, validate_json)
+
+        cache_key = build_cache_key(
+            self.config.get_claude_model(), self.config.tier, system, prompt,
+            schema_version=schema_version, validate_json=validate_json,
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return self._result_from_cache(cached, job_id)
+
+        result = await self._invoke_backends(prompt, system, job_id, validate_json)
+        if result.success:
+            cost_usd = result.cost_usd
+            if cost_usd is None:
+                combined_len = len(system or "") + len(prompt)
+                cost_usd = ClaudeCLI.get_tier_cost_estimate(
+                    self.config.tier, combined_len // 4, len(result.content) // 4
+                )
+            cache.put(cache_key, CachedResponse(
+                content=result.content,
+                parsed_json=result.parsed_json,
+                model=result.model,
+                tier=result.tier,
+                backend=result.backend,
+                input_tokens=result.input_tokens,
+                output_tokens=result.output_tokens,
+                cost_usd=cost_usd,
+            ))
+        return result
+
+    def _result_from_cache(self, cached: CachedResponse, job_id: str) -> LLMResult:
+        """
+        Build an LLMResult for a cache hit and record it as a zero-cost call.
+
+        Args:
+            cached: Cached response entry
+            job_id: Job ID for tracking
+
+        Returns:
+            LLMResult with cached=True and cost_usd=0.0
+        """
+        logger.info(
+            f"[UnifiedLLM:{self.step_name}] Cache hit: model={cached.model}, "
+            f"saved=${cached.cost_usd or 0:.4f}, Job={job_id}"
+        )
+        try:
+            get_global_tracker().track_usage(
+                provider="anthropic" if cached.model.startswith("claude") else "openai",
+                model=cached.model,
+                input_tokens=cached.input_tokens or 0,
+                output_tokens=cached.output_tokens or 0,
+                layer=self.step_name,
+                job_id=job_id,
+                cache_hit=True,
+                saved_cost_usd=cached.cost_usd or 0.0,
+            )
+        except Exception as e:
+            logger.debug(f"[UnifiedLLM] Cache-hit tracking failed (ignored): {e}")
+
+        self._emit_progress(
+            "llm_cache_hit",
+            f"Served from LLM response cache ({len(cached.content)} chars, saved ${cached.cost_usd or 0:.4f})",
+            backend=cached.backend or "cache",
+            model=cached.model,
+            saved_cost_usd=cached.cost_usd,
+        )
+        return LLMResult(
+            content=cached.content,
+            parsed_json=cached.parsed_json,
+            backend=cached.backend or "cache",
+            model=cached.model,
+            tier=cached.tier or self.config.tier,
+            duration_ms=0,
+            success=True,
+            input_tokens=cached.input_tokens,
+            output_tokens=cached.output_tokens,
+            cost_usd=0.0,
+            cached=True,
+        )
+
+    async def _invoke_backends(
+        self,
+        prompt: str,
+        system: Optional[str],
+        job_id: str,
+        validate_json: bool,
+    ) -> LLMResult:
+        """Run the CLI-primary / LangChain-fallback chain for invoke()."""
         combined_prompt = f"{system}\n\n{prompt}" if system else prompt
 
         # Track specific CLI error reason for fallback logging
@@ -397,7 +510,8 @@ class UnifiedLLM:
         """
         Invoke Claude CLI backend.
 
-        Runs the CLI in a thread pool to avoid blocking the event loop.
+        Uses the warm CLI worker pool when CLAUDE_CLI_POOL_ENABLED=true,
+        otherwise runs the CLI in a thread pool to avoid blocking the event loop.
 
         Args:
             prompt: Combined system + user prompt
@@ -415,19 +529,35 @@ class UnifiedLLM:
         if allow_tools:
             logger.debug(f"[UnifiedLLM:{self.step_name}] Enabling CLI tools (WebSearch) for research step")
 
-        # Run sync CLI in thread pool
-        # Pass struct_logger for Redis live-tail logging of prompts/results
-        loop = asyncio.get_event_loop()
-        cli_result: CLIResult = await loop.run_in_executor(
-            None,
-            lambda: self.cli.invoke(
-                prompt,
-                job_id,
-                validate_json=validate_json,
-                allow_tools=allow_tools,
-                struct_logger=self._struct_logger,
-            ),
-        )
+        # Admission through the process-wide scheduler (per-provider
+        # concurrency/TPM budgets, priority classes, per-job fair queuing)
+        async with scheduled_llm_call("claude_cli", prompt, self.priority, job_id) as grant:
+            if is_cli_pool_enabled():
+                # Warm stream-json worker over an asyncio subprocess
+                cli_result: CLIResult = await self.cli.invoke_async(
+                    prompt,
+                    job_id,
+                    validate_json=validate_json,
+                    allow_tools=allow_tools,
+                    use_cache=False,  # caching is handled one level up in invoke()
+                )
+            else:
+                # Run sync CLI in thread pool
+                # Pass struct_logger for Redis live-tail logging of prompts/results
+                loop = asyncio.get_event_loop()
+                cli_result = await loop.run_in_executor(
+                    None,
+                    lambda: self.cli.invoke(
+                        prompt,
+                        job_id,
+                        validate_json=validate_json,
+                        allow_tools=allow_tools,
+                        struct_logger=self._struct_logger,
+                        use_cache=False,  # caching is handled one level up in invoke()
+                    ),
+                )
+            if grant is not None and cli_result.input_tokens is not None:
+                grant.actual_tokens = cli_result.input_tokens + (cli_result.output_tokens or 0)
 
         duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
 
@@ -517,7 +647,14 @@ class UnifiedLLM:
             messages.append(HumanMessage(content=prompt))
 
             # Invoke LLM
-            response = await llm.ainvoke(messages)
+            prompt_text = f"{system or ''}{prompt}"
+            async with scheduled_llm_call(
+                provider_for_model(fallback_model), prompt_text, self.priority, job_id
+            ) as grant:
+                response = await llm.ainvoke(messages)
+                usage = getattr(response, "usage_metadata", None)
+                if grant is not None and isinstance(usage, dict) and usage.get("total_tokens"):
+                    grant.actual_tokens = usage["total_tokens"]
             content = response.content if hasattr(response, 'content') else str(response)
 
             duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
@@ -851,6 +988,7 @@ async def invoke_unified(
     validate_json: bool = True,
     struct_logger: Optional["StructuredLogger"] = None,
     progress_callback: Optional[ProgressCallback] = None,
+    use_cache: bool = True,
 ) -> LLMResult:
     """
     Convenience function for single UnifiedLLM invocation.
@@ -866,6 +1004,7 @@ async def invoke_unified(
         validate_json: Whether to parse response as JSON
         struct_logger: Optional StructuredLogger for frontend visibility
         progress_callback: Optional callback for granular progress events to Redis
+        use_cache: Set False to bypass the LLM response cache
 
     Returns:
         LLMResult with response and backend attribution
@@ -885,7 +1024,7 @@ async def invoke_unified(
         struct_logger=struct_logger,
         progress_callback=progress_callback,
     )
-    return await llm.invoke(prompt, system=system, validate_json=validate_json)
+    return await llm.invoke(prompt, system=system, validate_json=validate_json, use_cache=use_cache)
 
 
 def invoke_unified_sync(
@@ -12,6 +12,7 @@ Includes:
 
 import asyncio
 import concurrent.futures
+import contextvars
 from typing import Any, Coroutine, Dict, List, Optional, TypeVar
 
 T = TypeVar('T')
@@ -48,9 +49,10 @@ def run_async(coro: Coroutine[None, None, T]) -> T:
         # No running loop - we can use asyncio.run() directly
         return asyncio.run(coro)
 
-    # There's already a running loop - use thread pool to avoid nesting
+    # There's already a running loop - use thread pool to avoid nesting.
+    # Carry the caller's context vars (e.g. llm_scheduling_context) into the thread.
     with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-        future = executor.submit(asyncio.run, coro)
+        future = executor.submit(contextvars.copy_context().run, asyncio.run, coro)
         return future.result()
 
 
@@ -0,0 +1,340 @@
+"""
+Concurrent scrape mode for the native scrape worker.
+
+NativeScrapeWorker fetches, parses and writes one work item at a time, so a
+worker's throughput is bounded by page latency. AsyncNativeScrapeWorker keeps
+up to SCOUT_SCRAPE_ASYNC_CONCURRENCY fetches in flight instead:
+
+- claims are refilled as fetches complete, SCOUT_SCRAPE_CLAIM_BATCH_SIZE
+  items (and their search hits) per round trip, so the claim loop, network
+  and parsing overlap
+- each proxy (and the direct route) gets its own keep-alive httpx pool of
+  SCOUT_SCRAPE_ASYNC_POOL_SIZE connections
+- a global semaphore and a per-host semaphore (SCOUT_SCRAPE_ASYNC_PER_HOST)
+  bound load on LinkedIn regardless of how many proxies are in use
+- HTML parsing and scoring run in a process pool of
+  SCOUT_SCRAPE_PARSE_PROCESSES workers (0 = the loop's default thread pool)
+
+Claim, lease and result bookkeeping reuse NativeScrapeWorker's steps and run
+on the event-loop thread, so Mongo writes and tracing stay single-threaded
+and the per-item outcomes are identical to the serial worker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Optional, Sequence, TypeVar
+from urllib.parse import urlsplit
+
+import httpx
+
+from src.common.proxy_health import ProxySelector, get_proxy_selector
+from src.pipeline.scrape_common import (
+    LINKEDIN_JOB_URL,
+    ScrapeSuccessResult,
+    build_scored_job,
+    raise_for_scrape_status,
+    screen_scrape_candidate,
+)
+from src.pipeline.scrape_worker import NativeScrapeWorker, PreparedScrape, ScrapeFeatureFlags, ScrapeRun
+from src.services.linkedin_scraper import HEADERS
+
+logger = logging.getLogger("scout_native_scrape")
+T = TypeVar("T")
+
+# Errors after which the next proxy (or the direct route) is tried, matching
+# fetch_with_proxy's proxy fallback; they count against the proxy's health.
+_PROXY_ERRORS = (httpx.ProxyError, httpx.ConnectTimeout, httpx.ConnectError)
+_PROXY_ATTEMPTS = 2
+
+
+def _env_int(name: str, default: int, *, minimum: int = 1) -> int:
+    try:
+        return max(minimum, int(os.getenv(name, str(default))))
+    except ValueError:
+        return default
+
+
+@dataclass(frozen=True)
+class AsyncScrapeConfig:
+    """Concurrency limits for the async scrape mode."""
+
+    concurrency: int = 32
+    per_host: int = 8
+    pool_size: int = 4
+    parse_processes: int = 2
+    timeout_seconds: float = 15.0
+    url_template: str = LINKEDIN_JOB_URL
+
+    @classmethod
+    def from_env(cls) -> "AsyncScrapeConfig":
+        try:
+            timeout_seconds = max(1.0, float(os.getenv("SCOUT_SCRAPE_ASYNC_TIMEOUT_SECONDS", "15")))
+        except ValueError:
+            timeout_seconds = 15.0
+        return cls(
+            concurrency=_env_int("SCOUT_SCRAPE_ASYNC_CONCURRENCY", 32),
+            per_host=_env_int("SCOUT_SCRAPE_ASYNC_PER_HOST", 8),
+            pool_size=_env_int("SCOUT_SCRAPE_ASYNC_POOL_SIZE", 4),
+            parse_processes=_env_int("SCOUT_SCRAPE_PARSE_PROCESSES", min(4, os.cpu_count() or 1), minimum=0),
+            timeout_seconds=timeout_seconds,
+        )
+
+
+@dataclass(frozen=True)
+class FetchedPage:
+    """A job page response."""
+
+    status_code: int
+    text: str
+    used_proxy: bool
+
+
+class AsyncFetcher:
+    """
+    Bounded concurrent page fetcher with one keep-alive pool per proxy.
+
+    Args:
+        config: Concurrency limits
+        proxies: Proxy URLs; ignored when a selector is passed
+        selector: Health-scored selector to pick proxies and record outcomes
+            (defaults to an in-process selector over proxies)
+    """
+
+    def __init__(
+        self,
+        config: AsyncScrapeConfig,
+        *,
+        proxies: Sequence[str] = (),
+        selector: Optional[ProxySelector] = None,
+    ):
+        self.config = config
+        self.selector = selector if selector is not None else ProxySelector(proxies)
+        self._clients: dict[Optional[str], httpx.AsyncClient] = {}
+        self._global = asyncio.Semaphore(config.concurrency)
+        self._hosts: dict[str, asyncio.Semaphore] = {}
+
+    def _client(self, proxy: Optional[str]) -> httpx.AsyncClient:
+        client = self._clients.get(proxy)
+        if client is None:
+            client = httpx.AsyncClient(
+                proxy=proxy,
+                headers=HEADERS,
+                timeout=self.config.timeout_seconds,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.config.pool_size,
+                    max_keepalive_connections=self.config.pool_size,
+                ),
+            )
+            self._clients[proxy] = client
+        return client
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).hostname or ""
+        semaphore = self._hosts.get(host)
+        if semaphore is None:
+            semaphore = self._hosts[host] = asyncio.Semaphore(self.config.per_host)
+        return semaphore
+
+    async def fetch(self, url: str) -> FetchedPage:
+        """
+        GET a page through up to two health-picked proxies, then direct.
+
+        A 429 through a proxy cools that proxy down and moves on; every
+        proxy outcome is recorded on the selector.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Status, body and whether a proxy served it
+
+        Raises:
+            httpx.HTTPError: When the direct request fails too
+        """
+        async with self._global, self._host_limit(url):
+            for proxy in await self._health(self.selector.choose, _PROXY_ATTEMPTS):
+                started = time.monotonic()
+                try:
+                    response = await self._client(proxy).get(url)
+                except _PROXY_ERRORS as exc:
+                    await self._health(self.selector.record, proxy, "failure")
+                    logger.debug("Proxy %s failed for %s: %s", proxy, url, exc)
+                    continue
+                if response.status_code == 429:
+                    await self._health(self.selector.record, proxy, "rate_limited")
+                    continue
+                await self._health(
+                    self.selector.record, proxy, "success", latency_ms=(time.monotonic() - started) * 1000.0
+                )
+                return FetchedPage(response.status_code, response.text, used_proxy=True)
+            response = await self._client(None).get(url)
+            return FetchedPage(response.status_code, response.text, used_proxy=False)
+
+    async def _health(self, call: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a selector call, in a worker thread when it reads or writes the shared SQLite store."""
+        if self.selector.store is None:
+            return call(*args, **kwargs)
+        # Store writes can wait up to the SQLite busy timeout; keep that off the event loop
+        return await asyncio.to_thread(call, *args, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close every connection pool."""
+        clients, self._clients = list(self._clients.values()), {}
+        await asyncio.gather(*(client.aclose() for client in clients), return_exceptions=True)
+
+
+def build_parse_executor(config: AsyncScrapeConfig) -> Optional[Executor]:
+    """Process pool for parsing, or None to use the loop's default thread pool."""
+    if config.parse_processes <= 0:
+        return None
+    return ProcessPoolExecutor(max_workers=config.parse_processes)
+
+
+async def fetch_and_score(
+    job: dict[str, Any],
+    *,
+    fetcher: AsyncFetcher,
+    executor: Optional[Executor],
+) -> ScrapeSuccessResult:
+    """Fetch one job page and parse/score it off the event loop."""
+    job_id = job["job_id"]
+    page = await fetcher.fetch(fetcher.config.url_template.format(job_id=job_id))
+    raise_for_scrape_status(job_id, page.status_code)
+    parse = functools.partial(build_scored_job, job, page.text, http_status=page.status_code, used_proxy=page.used_proxy)
+    return await asyncio.get_running_loop().run_in_executor(executor, parse)
+
+
+async def scrape_jobs(
+    jobs: Sequence[dict[str, Any]],
+    *,
+    config: AsyncScrapeConfig,
+    proxies: Sequence[str] = (),
+) -> list[ScrapeSuccessResult | Exception]:
+    """
+    Fetch and score jobs concurrently, without any Mongo bookkeeping.
+
+    Args:
+        jobs: Payloads with at least job_id
+        config: Concurrency limits and URL template
+        proxies: Proxy URLs to rotate through
+
+    Returns:
+        One result or exception per job, in input order
+    """
+    fetcher = AsyncFetcher(config, proxies=proxies)
+    executor = build_parse_executor(config)
+    try:
+        return await asyncio.gather(
+            *(fetch_and_score(job, fetcher=fetcher, executor=executor) for job in jobs),
+            return_exceptions=True,
+        )
+    finally:
+        await fetcher.aclose()
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+class AsyncNativeScrapeWorker(NativeScrapeWorker):
+    """NativeScrapeWorker that keeps many fetches in flight."""
+
+    def __init__(
+        self,
+        db,
+        *,
+        flags: ScrapeFeatureFlags,
+        worker_id: str,
+        use_proxy: bool,
+        config: Optional[AsyncScrapeConfig] = None,
+        claim_batch_size: Optional[int] = None,
+    ) -> None:
+        super().__init__(db, flags=flags, worker_id=worker_id, use_proxy=use_proxy, claim_batch_size=claim_batch_size)
+        self.config = config or AsyncScrapeConfig.from_env()
+
+    def run_once(
+        self,
+        *,
+        max_items: int,
+        lease_seconds: int,
+        trigger_mode: str,
+        now: Optional[datetime] = None,
+    ) -> dict[str, int]:
+        """Process up to max_items native scrape work-items concurrently."""
+        run = self._start_run(trigger_mode=trigger_mode, now=now)
+        try:
+            asyncio.run(self._drain(run, max_items=max_items, lease_seconds=lease_seconds))
+            return self._complete_run(run)
+        except Exception as exc:
+            self._fail_run(run, exc)
+            raise
+
+    async def _drain(self, run: ScrapeRun, *, max_items: int, lease_seconds: int) -> None:
+        selector = get_proxy_selector(self._proxy_pool) if self.use_proxy and self._proxy_pool else ProxySelector()
+        fetcher = AsyncFetcher(self.config, selector=selector)
+        executor = build_parse_executor(self.config)
+        # Claim ahead of the fetch limit so parsing and the next fetches overlap.
+        max_in_flight = self.config.concurrency * 2
+        in_flight: dict[asyncio.Future, PreparedScrape] = {}
+        claimed = 0
+        exhausted = False
+        renew_at = time.monotonic() + lease_seconds / 2
+        try:
+            while True:
+                # Refill a whole claim batch at a time rather than one item per completion.
+                while not exhausted and claimed < max_items:
+                    size = min(self.claim_batch_size, max_items - claimed)
+                    if in_flight and max_in_flight - len(in_flight) < size:
+                        break
+                    batch = self._claim_batch(size, lease_seconds=lease_seconds, now=run.now)
+                    if not batch:
+                        exhausted = True
+                        break
+                    claimed += len(batch)
+                    for item, hit in batch:
+                        prepared = self._prepare_item(item, hit, run)
+                        if prepared is None:
+                            continue
+                        skipped = screen_scrape_candidate(prepared.payload)
+                        if skipped is not None:
+                            self._finish_item(prepared, skipped, run)
+                            continue
+                        task = asyncio.ensure_future(self._scrape(prepared, fetcher=fetcher, executor=executor))
+                        in_flight[task] = prepared
+                if not in_flight:
+                    return
+                done, _pending = await asyncio.wait(in_flight, timeout=lease_seconds / 2, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    del in_flight[task]
+                    prepared, outcome = task.result()
+                    self._finish_item(prepared, outcome, run)
+                if in_flight and time.monotonic() >= renew_at:
+                    self._renew_leases([prepared.item for prepared in in_flight.values()], lease_seconds=lease_seconds, now=run.now)
+                    renew_at = time.monotonic() + lease_seconds / 2
+        finally:
+            # Only reached with work in flight on a run failure; those items
+            # keep their leases and are reclaimed when the leases expire.
+            for task in in_flight:
+                task.cancel()
+            await fetcher.aclose()
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _scrape(
+        self,
+        prepared: PreparedScrape,
+        *,
+        fetcher: AsyncFetcher,
+        executor: Optional[Executor],
+    ) -> tuple[PreparedScrape, ScrapeSuccessResult | Exception]:
+        try:
+            return prepared, await fetch_and_score(prepared.payload, fetcher=fetcher, executor=executor)
+        except Exception as exc:
+            return prepared, exc
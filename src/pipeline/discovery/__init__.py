@@ -4,6 +4,7 @@ from .store import (
     ScrapeRunContext,
     SearchDiscoveryStore,
     SearchHitUpsertResult,
+    SearchHitWrite,
     SearchRunContext,
     build_correlation_id,
     build_run_id,
@@ -16,6 +17,7 @@ from .store import (
 __all__ = [
     "SearchDiscoveryStore",
     "SearchHitUpsertResult",
+    "SearchHitWrite",
     "SearchRunContext",
     "ScrapeRunContext",
     "build_correlation_id",
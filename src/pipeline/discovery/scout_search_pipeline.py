@@ -20,9 +20,10 @@ if str(SKILL_ROOT) not in sys.path:
 from scripts.scout_linkedin_jobs import REGION_CONFIGS, SEARCH_PROFILES, search_jobs  # noqa: E402
 from src.common.blacklist import filter_blacklisted  # noqa: E402
 from src.common.dedupe import generate_dedupe_key  # noqa: E402
+from src.common.dedupe_filter import get_dedupe_prefilter  # noqa: E402
 from src.common.proxy_pool import ProxyPool  # noqa: E402
 from src.common.scout_queue import enqueue_jobs  # noqa: E402
-from src.pipeline.discovery import SearchDiscoveryStore, build_correlation_id  # noqa: E402
+from src.pipeline.discovery import SearchDiscoveryStore, SearchHitWrite, build_correlation_id  # noqa: E402
 from src.pipeline.legacy_scrape_handoff import LegacyScrapeHandoffBridge  # noqa: E402
 from src.pipeline.queue import WorkItemQueue  # noqa: E402
 from src.pipeline.tracing import SearchTracingSession  # noqa: E402
@@ -220,33 +221,38 @@ def main(argv: Optional[list[str]] = None) -> int:
             if flags.direct_jsonl_enqueue:
                 direct_jsonl_enqueued += enqueue_jobs(new_jobs, source_cron=request_ctx.source_cron)
 
-            if flags.write_search_hits_to_mongo:
-                for job in new_jobs:
-                    scout_metadata = {
-                        "command_mode": command_mode,
-                        "few_applicants": request_ctx.few_applicants,
-                        "remote_only": request_ctx.remote_only,
-                        "location_override": args.location,
-                        "keywords": request_ctx.keywords,
-                    }
-                    correlation_id = build_correlation_id("linkedin", job.get("job_id"))
-                    hit_result = discovery.upsert_search_hit(
-                        source="linkedin",
-                        external_job_id=job.get("job_id"),
-                        job_url=job.get("job_url"),
-                        title=job.get("title"),
-                        company=job.get("company"),
-                        location=job.get("location"),
-                        search_profile=request_ctx.profile_name,
-                        search_region=request_ctx.region_label,
-                        source_cron=request_ctx.source_cron,
-                        run_id=run_context.run_id,
-                        correlation_id=correlation_id,
-                        langfuse_session_id=run_context.langfuse_session_id,
-                        scout_metadata=scout_metadata,
-                        raw_search_payload=job,
-                    )
-                    stats["hits_upserted"] += 1
+            if flags.write_search_hits_to_mongo and new_jobs:
+                scout_metadata = {
+                    "command_mode": command_mode,
+                    "few_applicants": request_ctx.few_applicants,
+                    "remote_only": request_ctx.remote_only,
+                    "location_override": args.location,
+                    "keywords": request_ctx.keywords,
+                }
+                correlation_ids = [build_correlation_id("linkedin", job.get("job_id")) for job in new_jobs]
+                hit_results = discovery.upsert_search_hits_bulk(
+                    [
+                        SearchHitWrite(
+                            source="linkedin",
+                            external_job_id=job.get("job_id"),
+                            job_url=job.get("job_url"),
+                            title=job.get("title"),
+                            company=job.get("company"),
+                            location=job.get("location"),
+                            search_profile=request_ctx.profile_name,
+                            search_region=request_ctx.region_label,
+                            source_cron=request_ctx.source_cron,
+                            run_id=run_context.run_id,
+                            correlation_id=correlation_id,
+                            langfuse_session_id=run_context.langfuse_session_id,
+                            scout_metadata=scout_metadata,
+                            raw_search_payload=job,
+                        )
+                        for job, correlation_id in zip(new_jobs, correlation_ids)
+                    ]
+                )
+                stats["hits_upserted"] += len(hit_results)
+                for job, correlation_id, hit_result in zip(new_jobs, correlation_ids, hit_results):
                     tracer.record_hit_event(
                         "new" if hit_result.inserted else "updated",
                         {
@@ -259,36 +265,39 @@ def main(argv: Optional[list[str]] = None) -> int:
                         },
                     )
 
-                    if flags.enqueue_work_items:
-                        enqueue_result = queue.enqueue(
-                            task_type="scrape.hit",
-                            lane="scrape",
-                            consumer_mode=flags.search_scrape_consumer_mode,
-                            subject_type="search_hit",
-                            subject_id=hit_result.hit_id,
-                            priority=100,
-                            available_at=None,
-                            max_attempts=5,
-                            idempotency_key=f"scrape.hit:linkedin:{job.get('job_id')}",
-                            correlation_id=correlation_id,
-                            payload={
-                                "job_id": job.get("job_id"),
-                                "title": job.get("title", ""),
-                                "company": job.get("company", ""),
-                                "location": job.get("location", ""),
-                                "job_url": job.get("job_url", ""),
-                                "search_profile": request_ctx.profile_name,
-                                "source_cron": request_ctx.source_cron,
-                            },
-                        )
+                if flags.enqueue_work_items:
+                    enqueue_results = queue.enqueue_many(
+                        [
+                            {
+                                "task_type": "scrape.hit",
+                                "lane": "scrape",
+                                "consumer_mode": flags.search_scrape_consumer_mode,
+                                "subject_type": "search_hit",
+                                "subject_id": hit_result.hit_id,
+                                "priority": 100,
+                                "available_at": None,
+                                "max_attempts": 5,
+                                "idempotency_key": f"scrape.hit:linkedin:{job.get('job_id')}",
+                                "correlation_id": correlation_id,
+                                "payload": {
+                                    "job_id": job.get("job_id"),
+                                    "title": job.get("title", ""),
+                                    "company": job.get("company", ""),
+                                    "location": job.get("location", ""),
+                                    "job_url": job.get("job_url", ""),
+                                    "search_profile": request_ctx.profile_name,
+                                    "source_cron": request_ctx.source_cron,
+                                },
+                            }
+                            for job, correlation_id, hit_result in zip(new_jobs, correlation_ids, hit_results)
+                        ]
+                    )
+                    queued: list[tuple[Any, Any]] = []
+                    for correlation_id, hit_result, enqueue_result in zip(correlation_ids, hit_results, enqueue_results):
                         if enqueue_result.created:
                             stats["work_items_created"] += 1
                         if enqueue_result.created or enqueue_result.document.get("status") in {"pending", "failed", "leased"}:
-                            discovery.mark_hit_queued(
-                                hit_result.hit_id,
-                                consumer_mode=flags.search_scrape_consumer_mode,
-                                work_item_id=enqueue_result.document.get("_id"),
-                            )
+                            queued.append((hit_result.hit_id, enqueue_result.document.get("_id")))
                         tracer.record_enqueue_event(
                             {
                                 "work_item_id": str(enqueue_result.document.get("_id")),
@@ -298,6 +307,7 @@ def main(argv: Optional[list[str]] = None) -> int:
                                 "consumer_mode": flags.search_scrape_consumer_mode,
                             }
                         )
+                    discovery.mark_hits_queued(queued, consumer_mode=flags.search_scrape_consumer_mode)
 
             tracer.end_span(
                 combo_span,
@@ -371,9 +381,13 @@ def dedupe_against_db(jobs: list[dict[str, Any]], db) -> list[dict[str, Any]]:
         dedupe_keys.append(generate_dedupe_key("linkedin_scout", source_id=job["job_id"]))
         dedupe_keys.append(generate_dedupe_key("linkedin_import", source_id=job["job_id"]))
 
+    # Definite Bloom misses are new; only possible hits are confirmed in Mongo
+    prefilter = get_dedupe_prefilter(db)
+    lookup_keys = prefilter.possible(dedupe_keys) if prefilter is not None else dedupe_keys
+
     existing = set()
-    for coll_name in ("level-2", "level-1"):
-        cursor = db[coll_name].find({"dedupeKey": {"$in": dedupe_keys}}, {"dedupeKey": 1})
+    for coll_name in ("level-2", "level-1") if lookup_keys else ():
+        cursor = db[coll_name].find({"dedupeKey": {"$in": lookup_keys}}, {"dedupeKey": 1})
         for doc in cursor:
             existing.add(doc["dedupeKey"])
 
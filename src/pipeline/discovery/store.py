@@ -6,19 +6,21 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from hashlib import sha256
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 from uuid import uuid4
 
 from bson import ObjectId
-from pymongo import ASCENDING, DESCENDING, TEXT
+from pymongo import ASCENDING, DESCENDING, TEXT, UpdateOne
 from pymongo.collection import Collection
 from pymongo.database import Database
-from pymongo.errors import DuplicateKeyError
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 from src.pipeline.selector_store import build_default_selection_state
 
 logger = logging.getLogger(__name__)
 
+DUPLICATE_KEY_ERROR_CODE = 11000
+
 
 def utc_now() -> datetime:
     """Return a timezone-aware UTC timestamp."""
@@ -112,6 +114,26 @@ class ScrapeRunContext:
     worker_id: str
 
 
+@dataclass(frozen=True)
+class SearchHitWrite:
+    """Fields written for one scout discovery hit."""
+
+    source: str
+    external_job_id: Optional[str]
+    job_url: Optional[str]
+    title: Optional[str]
+    company: Optional[str]
+    location: Optional[str]
+    search_profile: Optional[str]
+    search_region: Optional[str]
+    source_cron: str
+    run_id: str
+    correlation_id: Optional[str] = None
+    langfuse_session_id: Optional[str] = None
+    scout_metadata: Optional[dict[str, Any]] = None
+    raw_search_payload: Optional[dict[str, Any]] = None
+
+
 @dataclass(frozen=True)
 class SearchHitUpsertResult:
     """Result of upserting one scout discovery hit."""
@@ -399,57 +421,25 @@ class SearchDiscoveryStore:
         now: Optional[datetime] = None,
     ) -> SearchHitUpsertResult:
         """Upsert one search hit and increment its times_seen counter."""
-        current_time = now or utc_now()
-        canonical_url = canonicalize_job_url(job_url, external_job_id)
-        canonical_url_hash = hash_canonical_url(canonical_url)
-        correlation = correlation_id or build_correlation_id(source, external_job_id)
-        session_id = langfuse_session_id or correlation
-
-        if external_job_id:
-            identity_filter: dict[str, Any] = {"source": source, "external_job_id": external_job_id}
-        elif canonical_url_hash:
-            identity_filter = {"canonical_url_hash": canonical_url_hash}
-        else:
-            raise ValueError("Search hit requires external_job_id or canonical_url_hash")
+        hit = SearchHitWrite(
+            source=source,
+            external_job_id=external_job_id,
+            job_url=job_url,
+            title=title,
+            company=company,
+            location=location,
+            search_profile=search_profile,
+            search_region=search_region,
+            source_cron=source_cron,
+            run_id=run_id,
+            correlation_id=correlation_id,
+            langfuse_session_id=langfuse_session_id,
+            scout_metadata=scout_metadata,
+            raw_search_payload=raw_search_payload,
+        )
+        identity_filter, canonical_url_hash, update = _build_search_hit_upsert(hit, now or utc_now())
 
         inserted = self.search_hits.find_one(identity_filter, {"_id": 1}) is None
-        update = {
-            "$set": {
-                "source": source,
-                "external_job_id": external_job_id,
-                "canonical_url": canonical_url,
-                "canonical_url_hash": canonical_url_hash,
-                "job_url": canonical_url,
-                "title": title,
-                "company": company,
-                "location": location,
-                "search_profile": search_profile,
-                "search_region": search_region,
-                "source_cron": source_cron,
-                "run_id": run_id,
-                "correlation_id": correlation,
-                "langfuse_session_id": session_id,
-                "trace.job_correlation_id": correlation,
-                "trace.search_run_id": run_id,
-                "scout_metadata": scout_metadata or {},
-                "raw_search_payload": raw_search_payload or {},
-                "updated_at": current_time,
-                "last_seen_at": current_time,
-            },
-            "$setOnInsert": {
-                "hit_status": "discovered",
-                "first_seen_at": current_time,
-                "last_queued_at": None,
-                "last_legacy_handoff_at": None,
-                "scrape": build_default_scrape_state(),
-                "selection": build_default_selection_state(),
-                "created_at": current_time,
-            },
-            "$inc": {
-                "times_seen": 1,
-            },
-        }
-
         try:
             self.search_hits.update_one(identity_filter, update, upsert=True)
         except DuplicateKeyError:
@@ -465,10 +455,81 @@ class SearchDiscoveryStore:
 
         return SearchHitUpsertResult(hit_id=document["_id"], inserted=inserted, document=document)
 
+    def upsert_search_hits_bulk(
+        self,
+        hits: Sequence[SearchHitWrite],
+        *,
+        now: Optional[datetime] = None,
+    ) -> list[SearchHitUpsertResult]:
+        """
+        Upsert many search hits with one unordered bulk write.
+
+        Same document shape as upsert_search_hit. Whether a hit was new is
+        derived from the bulk result's upserted ids rather than a find_one per
+        hit, and the resulting documents are read back with one $in query on
+        canonical_url_hash (every upsert sets it). A hit whose canonical URL
+        already belongs to another document is retried on that document and
+        reported as updated, as in upsert_search_hit.
+
+        Args:
+            hits: Hits to upsert
+            now: Timestamp applied to every hit
+
+        Returns:
+            One result per hit, in input order
+
+        Raises:
+            BulkWriteError: When a write fails for a reason other than a
+                duplicate canonical URL
+        """
+        if not hits:
+            return []
+        current_time = now or utc_now()
+        writes = [_build_search_hit_upsert(hit, current_time) for hit in hits]
+        # Identity filters are backed by unique indexes
+        operations = [UpdateOne(identity_filter, update, upsert=True) for identity_filter, _hash, update in writes]
+
+        duplicates: list[int] = []
+        try:
+            result = self.search_hits.bulk_write(operations, ordered=False)
+            upserted_ids = set(result.upserted_ids.values())
+        except BulkWriteError as exc:
+            errors = exc.details.get("writeErrors", [])
+            if any(error.get("code") != DUPLICATE_KEY_ERROR_CODE for error in errors):
+                raise
+            duplicates = [error["index"] for error in errors]
+            upserted_ids = {upserted["_id"] for upserted in exc.details.get("upserted", [])}
+        for index in duplicates:
+            _identity_filter, canonical_url_hash, update = writes[index]
+            self.search_hits.update_one({"canonical_url_hash": canonical_url_hash}, update, upsert=True)
+
+        hashes = [canonical_url_hash for _filter, canonical_url_hash, _update in writes]
+        documents = {
+            document["canonical_url_hash"]: document
+            for document in self.search_hits.find({"canonical_url_hash": {"$in": list(set(hashes))}})
+        }
+        results: list[SearchHitUpsertResult] = []
+        for canonical_url_hash in hashes:
+            document = documents.get(canonical_url_hash)
+            if document is None:
+                raise RuntimeError("Failed to fetch scout_search_hits document after bulk upsert")
+            # A hit repeated in the batch is only new the first time.
+            inserted = document["_id"] in upserted_ids
+            upserted_ids.discard(document["_id"])
+            results.append(SearchHitUpsertResult(hit_id=document["_id"], inserted=inserted, document=document))
+        return results
+
     def get_hit(self, hit_id: ObjectId | str) -> Optional[dict[str, Any]]:
         """Return one hit by id."""
         return self.search_hits.find_one({"_id": _coerce_object_id(hit_id)})
 
+    def get_hits(self, hit_ids: Sequence[ObjectId | str]) -> dict[str, dict[str, Any]]:
+        """Return hits by id with one $in query, keyed by str(_id); missing ids are absent."""
+        if not hit_ids:
+            return {}
+        ids = list({_coerce_object_id(hit_id) for hit_id in hit_ids})
+        return {str(document["_id"]): document for document in self.search_hits.find({"_id": {"$in": ids}})}
+
     def mark_hit_queued(
         self,
         hit_id: ObjectId | str,
@@ -478,18 +539,32 @@ class SearchDiscoveryStore:
         now: Optional[datetime] = None,
     ) -> None:
         """Mark a hit as queued for downstream scrape consumption."""
+        self.search_hits.update_one(
+            {"_id": _coerce_object_id(hit_id)},
+            {"$set": _queued_hit_update(consumer_mode, work_item_id, now or utc_now())},
+        )
+
+    def mark_hits_queued(
+        self,
+        queued: Sequence[tuple[ObjectId | str, Optional[ObjectId | str]]],
+        *,
+        consumer_mode: str = "legacy_jsonl",
+        now: Optional[datetime] = None,
+    ) -> None:
+        """Mark many (hit id, work item id) pairs queued with one bulk write."""
+        if not queued:
+            return
         current_time = now or utc_now()
-        update: dict[str, Any] = {
-            "hit_status": "queued_for_scrape",
-            "last_queued_at": current_time,
-            "updated_at": current_time,
-            "scrape.status": "pending",
-            "scrape.consumer_mode": consumer_mode,
-            "scrape.last_error": None,
-        }
-        if work_item_id is not None:
-            update["scrape.work_item_id"] = str(work_item_id)
-        self.search_hits.update_one({"_id": _coerce_object_id(hit_id)}, {"$set": update})
+        self.search_hits.bulk_write(
+            [
+                UpdateOne(
+                    {"_id": _coerce_object_id(hit_id)},
+                    {"$set": _queued_hit_update(consumer_mode, work_item_id, current_time)},
+                )
+                for hit_id, work_item_id in queued
+            ],
+            ordered=False,
+        )
 
     def mark_hit_handed_off(
         self,
@@ -843,6 +918,81 @@ class SearchDiscoveryStore:
         )
 
 
+def _build_search_hit_upsert(
+    hit: SearchHitWrite,
+    current_time: datetime,
+) -> tuple[dict[str, Any], Optional[str], dict[str, Any]]:
+    """Return (identity filter, canonical URL hash, update) for one hit upsert."""
+    canonical_url = canonicalize_job_url(hit.job_url, hit.external_job_id)
+    canonical_url_hash = hash_canonical_url(canonical_url)
+    correlation = hit.correlation_id or build_correlation_id(hit.source, hit.external_job_id)
+    session_id = hit.langfuse_session_id or correlation
+
+    if hit.external_job_id:
+        identity_filter: dict[str, Any] = {"source": hit.source, "external_job_id": hit.external_job_id}
+    elif canonical_url_hash:
+        identity_filter = {"canonical_url_hash": canonical_url_hash}
+    else:
+        raise ValueError("Search hit requires external_job_id or canonical_url_hash")
+
+    update = {
+        "$set": {
+            "source": hit.source,
+            "external_job_id": hit.external_job_id,
+            "canonical_url": canonical_url,
+            "canonical_url_hash": canonical_url_hash,
+            "job_url": canonical_url,
+            "title": hit.title,
+            "company": hit.company,
+            "location": hit.location,
+            "search_profile": hit.search_profile,
+            "search_region": hit.search_region,
+            "source_cron": hit.source_cron,
+            "run_id": hit.run_id,
+            "correlation_id": correlation,
+            "langfuse_session_id": session_id,
+            "trace.job_correlation_id": correlation,
+            "trace.search_run_id": hit.run_id,
+            "scout_metadata": hit.scout_metadata or {},
+            "raw_search_payload": hit.raw_search_payload or {},
+            "updated_at": current_time,
+            "last_seen_at": current_time,
+        },
+        "$setOnInsert": {
+            "hit_status": "discovered",
+            "first_seen_at": current_time,
+            "last_queued_at": None,
+            "last_legacy_handoff_at": None,
+            "scrape": build_default_scrape_state(),
+            "selection": build_default_selection_state(),
+            "created_at": current_time,
+        },
+        "$inc": {
+            "times_seen": 1,
+        },
+    }
+    return identity_filter, canonical_url_hash, update
+
+
+def _queued_hit_update(
+    consumer_mode: str,
+    work_item_id: Optional[ObjectId | str],
+    current_time: datetime,
+) -> dict[str, Any]:
+    """Return the $set that marks a hit queued for scrape."""
+    update: dict[str, Any] = {
+        "hit_status": "queued_for_scrape",
+        "last_queued_at": current_time,
+        "updated_at": current_time,
+        "scrape.status": "pending",
+        "scrape.consumer_mode": consumer_mode,
+        "scrape.last_error": None,
+    }
+    if work_item_id is not None:
+        update["scrape.work_item_id"] = str(work_item_id)
+    return update
+
+
 def _coerce_object_id(value: ObjectId | str) -> ObjectId:
     """Convert string ids back to ObjectId where possible."""
     if isinstance(value, ObjectId):
@@ -0,0 +1,158 @@
+"""
+Fair-share claim ordering for work items.
+
+Sorting purely by priority lets one large backfill monopolise a stage while
+an interactive job waits behind it. Work items therefore carry an origin
+(interactive, cron, backfill) and claims pick the origin to serve next with
+smooth weighted round-robin: over any window each origin with eligible work
+is served in proportion to its weight, and none is skipped entirely.
+
+Aging keeps a low-weight origin from starving under sustained load: an
+origin's weight grows with how long its oldest eligible item has waited,
+by one full weight per WORK_ITEM_FAIR_SHARE_AGING_SECONDS.
+
+Within an origin the caller's sort (priority, available_at, ...) applies
+unchanged, and every per-origin query is served by an index whose equality
+prefix ends in origin, status, so each claim stays O(log n).
+
+Which origins have work is read from Mongo on every claim (one indexed,
+limited query per origin), so work enqueued by any process is seen by the
+next claim. The round-robin credit itself lives in each WorkItemQueue, so
+weights are honoured per worker process; several workers each interleave
+independently. A batch claim picks the origin item by item, so one batch
+cannot be filled from a single origin while others wait.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Iterable, Mapping, Optional, Sequence
+
+ORIGINS = ("interactive", "cron", "backfill")
+DEFAULT_ORIGIN = "cron"
+DEFAULT_WEIGHTS = {"interactive": 8, "cron": 3, "backfill": 1}
+
+
+def fair_share_enabled() -> bool:
+    """Whether claims interleave origins (WORK_ITEM_FAIR_SHARE_ENABLED, default true)."""
+    return os.getenv("WORK_ITEM_FAIR_SHARE_ENABLED", "true").strip().lower() == "true"
+
+
+def origin_weight(origin: str) -> int:
+    """Round-robin weight of an origin (WORK_ITEM_FAIR_SHARE_WEIGHT_<ORIGIN>)."""
+    raw = os.getenv(f"WORK_ITEM_FAIR_SHARE_WEIGHT_{origin.upper()}")
+    try:
+        value = int(raw) if raw not in (None, "") else DEFAULT_WEIGHTS.get(origin, 1)
+    except ValueError:
+        value = DEFAULT_WEIGHTS.get(origin, 1)
+    return max(1, value)
+
+
+def aging_seconds() -> float:
+    """Wait after which an origin's weight doubles (WORK_ITEM_FAIR_SHARE_AGING_SECONDS)."""
+    try:
+        return max(1.0, float(os.getenv("WORK_ITEM_FAIR_SHARE_AGING_SECONDS", "300")))
+    except ValueError:
+        return 300.0
+
+
+def normalize_origin(value: Optional[str]) -> str:
+    """Map a free-form origin onto ORIGINS, defaulting to cron."""
+    origin = str(value or "").strip().lower()
+    return origin if origin in ORIGINS else DEFAULT_ORIGIN
+
+
+def origin_filter(origin: str) -> dict[str, Any]:
+    """Query clause selecting one origin; items written before origins existed count as cron."""
+    if origin == DEFAULT_ORIGIN:
+        return {"origin": {"$in": [DEFAULT_ORIGIN, None]}}
+    return {"origin": origin}
+
+
+def _ensure_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+class FairShareScheduler:
+    """Smooth weighted round-robin over origins, with aging. Thread-safe."""
+
+    def __init__(self, weights: Optional[Mapping[str, int]] = None, *, aging: Optional[float] = None):
+        self.weights = dict(weights) if weights is not None else {origin: origin_weight(origin) for origin in ORIGINS}
+        self.aging = aging if aging is not None else aging_seconds()
+        self._current: dict[str, float] = {origin: 0.0 for origin in self.weights}
+        self._lock = threading.Lock()
+
+    def effective_weight(self, origin: str, oldest: Optional[datetime], now: datetime) -> float:
+        """Configured weight scaled up by how long the origin's oldest item has waited."""
+        weight = float(self.weights.get(origin, 1))
+        if oldest is None:
+            return weight
+        waited = max(0.0, (_ensure_utc(now) - _ensure_utc(oldest)).total_seconds())
+        return weight * (1.0 + waited / self.aging)
+
+    def order(self, oldest_by_origin: Mapping[str, Optional[datetime]], *, now: datetime) -> list[str]:
+        """
+        Pick the origin to serve next.
+
+        Args:
+            oldest_by_origin: Origins that have eligible work, mapped to the
+                available_at of their oldest eligible item
+            now: Current time, for aging
+
+        Returns:
+            Origins in the order to try: the round-robin pick first, then the
+            rest by remaining credit (fallbacks when the pick's claims race)
+        """
+        if not oldest_by_origin:
+            return []
+        effective = {
+            origin: self.effective_weight(origin, oldest, now) for origin, oldest in oldest_by_origin.items()
+        }
+        total = sum(effective.values())
+        with self._lock:
+            for origin, weight in effective.items():
+                self._current[origin] = self._current.get(origin, 0.0) + weight
+            ranked = sorted(effective, key=lambda origin: (-self._current[origin], ORIGINS.index(origin) if origin in ORIGINS else len(ORIGINS)))
+            self._current[ranked[0]] -= total
+        return ranked
+
+    def interleave(
+        self,
+        candidates_by_origin: Mapping[str, Sequence[Mapping[str, Any]]],
+        *,
+        picks: int,
+        now: datetime,
+    ) -> list[Mapping[str, Any]]:
+        """
+        Order candidates so each of the first `picks` is its own round-robin pick.
+
+        Args:
+            candidates_by_origin: Each origin's candidates, best first
+            picks: How many items the caller intends to claim
+            now: Current time, for aging
+
+        Returns:
+            The picked candidates, then the rest as fallbacks for lost races,
+            origin by origin in the last pick's ranking
+        """
+        queues = {origin: deque(items) for origin, items in candidates_by_origin.items() if items}
+        ordered: list[Mapping[str, Any]] = []
+        ranked = list(queues)
+        for _ in range(picks):
+            oldest = {origin: _oldest(items) for origin, items in queues.items() if items}
+            if not oldest:
+                break
+            ranked = self.order(oldest, now=now)
+            ordered.append(queues[ranked[0]].popleft())
+        for origin in ranked + [origin for origin in queues if origin not in ranked]:
+            ordered.extend(queues[origin])
+        return ordered
+
+
+def _oldest(items: Iterable[Mapping[str, Any]]) -> Optional[datetime]:
+    return min((item["available_at"] for item in items if item.get("available_at") is not None), default=None)
@@ -6,14 +6,25 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, Iterable, Optional
+from uuid import uuid4
 
 from bson import ObjectId
-from pymongo import ASCENDING, ReturnDocument
+from pymongo import ASCENDING, DESCENDING, InsertOne, ReturnDocument
 from pymongo.collection import Collection
 from pymongo.database import Database
-from pymongo.errors import DuplicateKeyError
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from src.pipeline.fair_share import (
+    ORIGINS,
+    FairShareScheduler,
+    fair_share_enabled,
+    normalize_origin,
+    origin_filter,
+)
+from src.pipeline.queue_metrics import QueueMetrics, Transition, ms_between
 
 logger = logging.getLogger(__name__)
+DUPLICATE_KEY_ERROR_CODE = 11000
 
 
 def utc_now() -> datetime:
@@ -35,6 +46,8 @@ class WorkItemQueue:
     def __init__(self, db: Database):
         self.db = db
         self.collection: Collection = db["work_items"]
+        self.metrics = QueueMetrics(db)
+        self.fair_share = FairShareScheduler()
 
     def ensure_indexes(self) -> None:
         """Create the indexes used by the discovery and scrape workers."""
@@ -79,6 +92,32 @@ class WorkItemQueue:
             ],
             name="lane_consumer_status_available_priority_created",
         )
+        # Fair-share claims run one query per origin; equality on
+        # lane/task_type/consumer_mode/origin/status keeps each one an index seek.
+        self.collection.create_index(
+            [
+                ("lane", ASCENDING),
+                ("task_type", ASCENDING),
+                ("consumer_mode", ASCENDING),
+                ("origin", ASCENDING),
+                ("status", ASCENDING),
+                ("priority", DESCENDING),
+                ("available_at", ASCENDING),
+                ("created_at", ASCENDING),
+            ],
+            name="lane_task_consumer_origin_status_priority_available",
+        )
+        self.collection.create_index(
+            [
+                ("lane", ASCENDING),
+                ("origin", ASCENDING),
+                ("status", ASCENDING),
+                ("priority", ASCENDING),
+                ("created_at", ASCENDING),
+            ],
+            name="lane_origin_status_priority_created",
+        )
+        self.metrics.ensure_indexes()
 
     def enqueue(
         self,
@@ -96,24 +135,17 @@ class WorkItemQueue:
         payload: dict[str, Any],
         result_ref: Optional[dict[str, Any]] = None,
         revive_statuses: Optional[Iterable[str]] = None,
+        origin: Optional[str] = None,
         now: Optional[datetime] = None,
     ) -> EnqueueResult:
-        """Idempotently enqueue one work item."""
+        """Idempotently enqueue one work item; origin feeds fair-share claims."""
         current_time = now or utc_now()
         subject_value = str(subject_id)
         existing = self.collection.find_one({"idempotency_key": idempotency_key})
         if existing is not None:
             revivable = set(revive_statuses or ())
             if existing.get("status") in revivable:
-                default_result_ref = result_ref or {
-                    "legacy_queue_written": False,
-                    "legacy_queue_written_at": None,
-                    "scrape_status": None,
-                    "scored_jsonl_written": False,
-                    "scored_jsonl_written_at": None,
-                    "level1_upserted": False,
-                    "level1_upserted_at": None,
-                }
+                default_result_ref = result_ref or _default_result_ref()
                 revived = self.collection.find_one_and_update(
                     {
                         "_id": existing["_id"],
@@ -127,6 +159,7 @@ class WorkItemQueue:
                             "subject_type": subject_type,
                             "subject_id": subject_value,
                             "status": "pending",
+                            "origin": normalize_origin(origin),
                             "priority": priority,
                             "available_at": available_at or current_time,
                             "lease_owner": None,
@@ -143,38 +176,29 @@ class WorkItemQueue:
                     return_document=ReturnDocument.AFTER,
                 )
                 if revived is not None:
+                    self.metrics.record(
+                        Transition(lane, task_type, "enqueued", from_status=existing.get("status"), to_status="pending"),
+                        now=current_time,
+                    )
                     return EnqueueResult(created=False, document=revived)
             return EnqueueResult(created=False, document=existing)
 
-        document = {
-            "task_type": task_type,
-            "lane": lane,
-            "consumer_mode": consumer_mode,
-            "subject_type": subject_type,
-            "subject_id": subject_value,
-            "status": "pending",
-            "priority": priority,
-            "available_at": available_at or current_time,
-            "lease_owner": None,
-            "lease_expires_at": None,
-            "attempt_count": 0,
-            "max_attempts": max_attempts,
-            "idempotency_key": idempotency_key,
-            "correlation_id": correlation_id,
-            "payload": payload,
-            "result_ref": result_ref or {
-                "legacy_queue_written": False,
-                "legacy_queue_written_at": None,
-                "scrape_status": None,
-                "scored_jsonl_written": False,
-                "scored_jsonl_written_at": None,
-                "level1_upserted": False,
-                "level1_upserted_at": None,
-            },
-            "last_error": None,
-            "created_at": current_time,
-            "updated_at": current_time,
-        }
+        document = _new_work_item(
+            task_type=task_type,
+            lane=lane,
+            consumer_mode=consumer_mode,
+            subject_type=subject_type,
+            subject_id=subject_value,
+            priority=priority,
+            available_at=available_at or current_time,
+            max_attempts=max_attempts,
+            idempotency_key=idempotency_key,
+            correlation_id=correlation_id,
+            payload=payload,
+            result_ref=result_ref,
+            origin=origin,
+            now=current_time,
+        )
         try:
             inserted = self.collection.insert_one(document)
         except DuplicateKeyError:
@@ -183,8 +207,85 @@ class WorkItemQueue:
                 raise
             return EnqueueResult(created=False, document=existing)
         document["_id"] = inserted.inserted_id
+        self.metrics.record(Transition(lane, task_type, "enqueued", to_status="pending"), now=current_time)
         return EnqueueResult(created=True, document=document)
 
+    def enqueue_many(
+        self,
+        items: list[dict[str, Any]],
+        *,
+        now: Optional[datetime] = None,
+    ) -> list[EnqueueResult]:
+        """
+        Idempotently enqueue many work items in a constant number of round trips.
+
+        Each item carries the keyword arguments of enqueue() (without
+        revive_statuses). New items go out in one unordered bulk insert; items
+        whose idempotency_key already exists are left untouched, exactly like
+        enqueue(), and only those are read back to return the stored documents.
+
+        Returns:
+            One EnqueueResult per item, in input order.
+        """
+        if not items:
+            return []
+        current_time = now or utc_now()
+        documents = [
+            _new_work_item(
+                task_type=item["task_type"],
+                lane=item["lane"],
+                consumer_mode=item["consumer_mode"],
+                subject_type=item["subject_type"],
+                subject_id=str(item["subject_id"]),
+                priority=item["priority"],
+                available_at=item.get("available_at") or current_time,
+                max_attempts=item["max_attempts"],
+                idempotency_key=item["idempotency_key"],
+                correlation_id=item["correlation_id"],
+                payload=item["payload"],
+                result_ref=item.get("result_ref"),
+                origin=item.get("origin"),
+                now=current_time,
+            )
+            for item in items
+        ]
+        for document in documents:
+            # Client-side ids mean only duplicates need reading back
+            document["_id"] = ObjectId()
+        duplicate_indexes: set[int] = set()
+        try:
+            self.collection.bulk_write([InsertOne(document) for document in documents], ordered=False)
+        except BulkWriteError as exc:
+            errors = exc.details.get("writeErrors") or []
+            if any(error.get("code") != DUPLICATE_KEY_ERROR_CODE for error in errors):
+                raise
+            duplicate_indexes = {int(error["index"]) for error in errors}
+
+        created_counts: dict[tuple[str, str], int] = {}
+        for index, document in enumerate(documents):
+            if index not in duplicate_indexes:
+                key = (document["lane"], document["task_type"])
+                created_counts[key] = created_counts.get(key, 0) + 1
+        self.metrics.record(
+            *(
+                Transition(lane, task_type, "enqueued", to_status="pending", count=count)
+                for (lane, task_type), count in created_counts.items()
+            ),
+            now=current_time,
+        )
+
+        stored: dict[str, dict[str, Any]] = {}
+        if duplicate_indexes:
+            keys = [documents[index]["idempotency_key"] for index in sorted(duplicate_indexes)]
+            stored = {doc["idempotency_key"]: doc for doc in self.collection.find({"idempotency_key": {"$in": keys}})}
+        return [
+            EnqueueResult(
+                created=index not in duplicate_indexes,
+                document=stored.get(document["idempotency_key"], document),
+            )
+            for index, document in enumerate(documents)
+        ]
+
     def claim_next(
         self,
         *,
@@ -199,31 +300,16 @@ class WorkItemQueue:
         """Claim the next eligible work item with a lease."""
         current_time = now or utc_now()
         lease_expires_at = current_time + timedelta(seconds=lease_seconds)
-        base_query: dict[str, Any] = {
-            "lane": lane,
-            "$or": [
-                {
-                    "status": {"$in": ["pending", "failed"]},
-                    "available_at": {"$lte": current_time},
-                },
-                {
-                    "status": "leased",
-                    "lease_expires_at": {"$lte": current_time},
-                },
-            ],
-        }
-        if task_type is not None:
-            base_query["task_type"] = task_type
-        if consumer_mode is not None:
-            base_query["consumer_mode"] = consumer_mode
+        base_query = _claim_query(lane=lane, task_type=task_type, consumer_mode=consumer_mode, now=current_time)
         excluded = list(exclude_ids or [])
         if excluded:
             base_query["_id"] = {"$nin": [_coerce_object_id(item_id) for item_id in excluded]}
 
-        candidates = list(
-            self.collection.find(base_query)
-            .sort([("priority", ASCENDING), ("created_at", ASCENDING)])
-            .limit(25)
+        candidates = self.claim_candidates(
+            base_query,
+            sort=[("priority", ASCENDING), ("created_at", ASCENDING)],
+            limit=25,
+            now=current_time,
         )
         for candidate in candidates:
             if candidate.get("attempt_count", 0) >= candidate.get("max_attempts", 5):
@@ -234,39 +320,143 @@ class WorkItemQueue:
                 )
                 continue
 
-            claim_query = {
-                "_id": candidate["_id"],
-                "$or": [
-                    {
-                        "status": {"$in": ["pending", "failed"]},
-                        "available_at": {"$lte": current_time},
-                    },
-                    {
-                        "status": "leased",
-                        "lease_expires_at": {"$lte": current_time},
-                    },
-                ],
-            }
             updated = self.collection.find_one_and_update(
-                claim_query,
-                {
-                    "$set": {
-                        "status": "leased",
-                        "lease_owner": worker_name,
-                        "lease_expires_at": lease_expires_at,
-                        "updated_at": current_time,
-                    },
-                    "$inc": {
-                        "attempt_count": 1,
-                    },
-                },
+                {"_id": candidate["_id"], "$or": _claimable(current_time)},
+                _lease_update(worker_name, lease_expires_at, now=current_time),
                 return_document=ReturnDocument.AFTER,
             )
             if updated is not None:
+                self.metrics.record(claim_transition(candidate, now=current_time), now=current_time)
                 return updated
 
         return None
 
+    def claim_batch(
+        self,
+        size: int,
+        *,
+        task_type: Optional[str] = None,
+        lane: str,
+        worker_name: str,
+        consumer_mode: Optional[str] = None,
+        lease_seconds: int = 300,
+        now: Optional[datetime] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Claim up to size eligible work items with one lease.
+
+        Candidates are chosen as in claim_next (priority, then age, fair
+        share across origins when enabled, with the origin picked per item;
+        exhausted items are deadlettered). The chosen ids are leased with a single update_many
+        that re-checks eligibility and tags them with a fresh claim token,
+        then read back by id and token, so items another worker won in the
+        meantime are simply not returned. Lost races are refilled from the
+        remaining candidates for a few rounds.
+
+        Args:
+            size: Maximum items to claim
+            task_type: Restrict to one task type
+            lane: Queue lane
+            worker_name: Lease owner
+            consumer_mode: Restrict to one consumer mode
+            lease_seconds: Lease length for the whole batch
+            now: Current time
+
+        Returns:
+            Leased work items in claim order
+        """
+        if size <= 0:
+            return []
+        current_time = now or utc_now()
+        lease_expires_at = current_time + timedelta(seconds=lease_seconds)
+        base_query = _claim_query(lane=lane, task_type=task_type, consumer_mode=consumer_mode, now=current_time)
+        claimed: list[dict[str, Any]] = []
+        passed_over: list[ObjectId] = []
+        for _round in range(_CLAIM_BATCH_ROUNDS):
+            wanted = size - len(claimed)
+            query = dict(base_query)
+            if passed_over:
+                query["_id"] = {"$nin": passed_over}
+            candidates = self.claim_candidates(
+                query,
+                sort=[("priority", ASCENDING), ("created_at", ASCENDING)],
+                limit=max(wanted, 25),
+                picks=wanted,
+                now=current_time,
+            )
+            if not candidates:
+                break
+            chosen: list[dict[str, Any]] = []
+            deadlettered = 0
+            for candidate in candidates:
+                if len(chosen) == wanted:
+                    break
+                passed_over.append(candidate["_id"])
+                if candidate.get("attempt_count", 0) >= candidate.get("max_attempts", 5):
+                    self.mark_deadletter(
+                        candidate["_id"],
+                        error="max_attempts_exhausted_before_claim",
+                        now=current_time,
+                    )
+                    deadlettered += 1
+                    continue
+                chosen.append(candidate)
+            if not chosen:
+                continue
+
+            token = uuid4().hex
+            ids = [candidate["_id"] for candidate in chosen]
+            update = _lease_update(worker_name, lease_expires_at, now=current_time)
+            update["$set"]["claim_token"] = token
+            self.collection.update_many({"_id": {"$in": ids}, "$or": _claimable(current_time)}, update)
+            won = {doc["_id"]: doc for doc in self.collection.find({"_id": {"$in": ids}, "claim_token": token})}
+            self.metrics.record(
+                *(claim_transition(candidate, now=current_time) for candidate in chosen if candidate["_id"] in won),
+                now=current_time,
+            )
+            claimed.extend(won[item_id] for item_id in ids if item_id in won)
+            # Another round only helps if candidates were lost or deadlettered
+            if len(claimed) >= size or (len(won) == len(chosen) and not deadlettered):
+                break
+        return claimed
+
+    def claim_candidates(
+        self,
+        query: dict[str, Any],
+        *,
+        sort: list[tuple[str, int]],
+        limit: int,
+        picks: int = 1,
+        now: Optional[datetime] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Claim candidates for a query, interleaved fairly across origins.
+
+        With fair share enabled, each origin's best `limit` candidates are
+        read with their own indexed query and the scheduler chooses the
+        origin of each of the first `picks` candidates in turn; the rest
+        follow as fallbacks for lost races. Otherwise this is a single
+        sorted query.
+
+        Args:
+            query: Eligibility filter (lane, status/availability, ...)
+            sort: Order within an origin
+            limit: Candidates read per origin
+            picks: Items the caller means to claim
+            now: Current time, for aging
+
+        Returns:
+            Candidate documents in the order they should be tried
+        """
+        if not fair_share_enabled():
+            return list(self.collection.find(query).sort(sort).limit(limit))
+        current_time = now or utc_now()
+        by_origin = {
+            origin: list(self.collection.find({**query, **origin_filter(origin)}).sort(sort).limit(limit))
+            for origin in ORIGINS
+        }
+        return self.fair_share.interleave(by_origin, picks=picks, now=current_time)
+
     def heartbeat(
         self,
         work_item_id: ObjectId | str,
@@ -292,6 +482,40 @@ class WorkItemQueue:
         )
         return result.modified_count == 1
 
+    def heartbeat_batch(
+        self,
+        work_item_ids: Iterable[ObjectId | str],
+        *,
+        lease_owner: str,
+        lease_seconds: int = 300,
+        now: Optional[datetime] = None,
+    ) -> int:
+        """
+        Extend the leases of many owned work items in one update.
+
+        Returns:
+            Number of items still leased to lease_owner (and so extended);
+            the rest are left alone
+        """
+        ids = [_coerce_object_id(item_id) for item_id in work_item_ids]
+        if not ids:
+            return 0
+        current_time = now or utc_now()
+        result = self.collection.update_many(
+            {
+                "_id": {"$in": ids},
+                "status": "leased",
+                "lease_owner": lease_owner,
+            },
+            {
+                "$set": {
+                    "lease_expires_at": current_time + timedelta(seconds=lease_seconds),
+                    "updated_at": current_time,
+                }
+            },
+        )
+        return result.matched_count
+
     def mark_done(
         self,
         work_item_id: ObjectId | str,
@@ -309,10 +533,71 @@ class WorkItemQueue:
         }
         if result_ref is not None:
             update["result_ref"] = result_ref
-        self.collection.update_one(
+        before = self.collection.find_one_and_update(
             {"_id": _coerce_object_id(work_item_id)},
             {"$set": update},
+            projection=_TRANSITION_FIELDS,
+            return_document=ReturnDocument.BEFORE,
         )
+        if before is not None:
+            self.metrics.record(
+                Transition.for_item(
+                    before,
+                    "completed",
+                    from_status=before.get("status"),
+                    to_status="done",
+                    run_ms=ms_between(before.get("leased_at"), current_time),
+                ),
+                now=current_time,
+            )
+
+    def release(
+        self,
+        work_item_id: ObjectId | str,
+        *,
+        lease_owner: str,
+        delay_seconds: float = 0,
+        now: Optional[datetime] = None,
+    ) -> bool:
+        """
+        Hand a leased work item back to the queue without running it.
+
+        The item returns to pending, becomes claimable again after
+        delay_seconds, and the claim does not count as an attempt.
+
+        Args:
+            work_item_id: Work item to release
+            lease_owner: Worker holding the lease; a lease lost to another
+                worker is left alone
+            delay_seconds: How long to keep the item unclaimable
+            now: Current time
+
+        Returns:
+            Whether the lease was still owned and has been released
+        """
+        current_time = now or utc_now()
+        before = self.collection.find_one_and_update(
+            {"_id": _coerce_object_id(work_item_id), "status": "leased", "lease_owner": lease_owner},
+            {
+                "$set": {
+                    "status": "pending",
+                    "available_at": current_time + timedelta(seconds=max(0.0, delay_seconds)),
+                    "lease_owner": None,
+                    "lease_expires_at": None,
+                    "updated_at": current_time,
+                },
+                "$inc": {"attempt_count": -1},
+            },
+            projection=_TRANSITION_FIELDS,
+            return_document=ReturnDocument.BEFORE,
+        )
+        if before is None:
+            return False
+        self.metrics.record(
+            Transition.for_item(before, "released", from_status="leased", to_status="pending"),
+            now=current_time,
+        )
+        return True
 
     def patch_result_ref(
         self,
@@ -350,7 +635,7 @@ class WorkItemQueue:
         if delay_seconds is None:
             delay_seconds = min(300, 30 * max(1, work_item.get("attempt_count", 1)))
 
-        self.collection.update_one(
+        result = self.collection.update_one(
             {"_id": work_item["_id"]},
             {
                 "$set": {
@@ -367,6 +652,17 @@ class WorkItemQueue:
                 }
             },
         )
+        if result.modified_count:
+            self.metrics.record(
+                Transition.for_item(
+                    work_item,
+                    "retried",
+                    from_status=work_item.get("status"),
+                    to_status="failed",
+                    run_ms=ms_between(work_item.get("leased_at"), current_time),
+                ),
+                now=current_time,
+            )
         return self.collection.find_one({"_id": work_item["_id"]}) or {}
 
     def mark_deadletter(
@@ -378,7 +674,7 @@ class WorkItemQueue:
     ) -> None:
         """Move a work item to deadletter state."""
         current_time = now or utc_now()
-        self.collection.update_one(
+        before = self.collection.find_one_and_update(
             {"_id": _coerce_object_id(work_item_id)},
             {
                 "$set": {
@@ -393,7 +689,74 @@ class WorkItemQueue:
                     "updated_at": current_time,
                 }
             },
+            projection=_TRANSITION_FIELDS,
+            return_document=ReturnDocument.BEFORE,
+        )
+        if before is not None and before.get("status") != "deadletter":
+            self.metrics.record(
+                Transition.for_item(
+                    before,
+                    "deadlettered",
+                    from_status=before.get("status"),
+                    to_status="deadletter",
+                    run_ms=(
+                        ms_between(before.get("leased_at"), current_time) if before.get("status") == "leased" else None
+                    ),
+                ),
+                now=current_time,
+            )
+
+    def cancel_matching(
+        self,
+        query: dict[str, Any],
+        *,
+        last_error: dict[str, Any],
+        now: Optional[datetime] = None,
+    ) -> int:
+        """
+        Cancel every active work item matching query.
+
+        The matching items are read first (status/lane/task_type only) so the
+        cancellation can be attributed per task type in the queue metrics.
+
+        Returns:
+            Number of items cancelled
+        """
+        current_time = now or utc_now()
+        active = {"status": {"$in": list(iter_active_statuses())}}
+        matched = list(self.collection.find({**query, **active}, _TRANSITION_FIELDS))
+        if not matched:
+            return 0
+        result = self.collection.update_many(
+            {"_id": {"$in": [item["_id"] for item in matched]}, **active},
+            {
+                "$set": {
+                    "status": "cancelled",
+                    "lease_owner": None,
+                    "lease_expires_at": None,
+                    "updated_at": current_time,
+                    "last_error": last_error,
+                }
+            },
         )
+        grouped: dict[tuple[str, str, str], int] = {}
+        for item in matched:
+            key = (item.get("lane"), item.get("task_type"), item.get("status"))
+            grouped[key] = grouped.get(key, 0) + 1
+        self.metrics.record(
+            *(
+                Transition.for_item(
+                    {"lane": lane, "task_type": task_type},
+                    "cancelled",
+                    from_status=status,
+                    to_status="cancelled",
+                    count=count,
+                )
+                for (lane, task_type, status), count in grouped.items()
+            ),
+            now=current_time,
+        )
+        return result.modified_count
 
     def get_snapshot(
         self,
@@ -432,6 +795,132 @@ class WorkItemQueue:
         )
 
 
+# Rounds claim_batch spends refilling items lost to concurrent claimers
+_CLAIM_BATCH_ROUNDS = 3
+
+
+def _claimable(now: datetime) -> list[dict[str, Any]]:
+    """$or branches for items that are due or whose lease has expired."""
+    return [
+        {
+            "status": {"$in": ["pending", "failed"]},
+            "available_at": {"$lte": now},
+        },
+        {
+            "status": "leased",
+            "lease_expires_at": {"$lte": now},
+        },
+    ]
+
+
+def _claim_query(
+    *,
+    lane: str,
+    task_type: Optional[str],
+    consumer_mode: Optional[str],
+    now: datetime,
+) -> dict[str, Any]:
+    """Eligibility filter shared by claim_next and claim_batch."""
+    query: dict[str, Any] = {"lane": lane, "$or": _claimable(now)}
+    if task_type is not None:
+        query["task_type"] = task_type
+    if consumer_mode is not None:
+        query["consumer_mode"] = consumer_mode
+    return query
+
+
+def _lease_update(worker_name: str, lease_expires_at: datetime, *, now: datetime) -> dict[str, Any]:
+    """Update that leases an item to worker_name and counts the attempt."""
+    return {
+        "$set": {
+            "status": "leased",
+            "lease_owner": worker_name,
+            "lease_expires_at": lease_expires_at,
+            "leased_at": now,
+            "updated_at": now,
+        },
+        "$inc": {
+            "attempt_count": 1,
+        },
+    }
+
+
+# Fields read back from status updates to attribute the transition
+_TRANSITION_FIELDS = {"lane": 1, "task_type": 1, "status": 1, "leased_at": 1}
+
+
+def claim_transition(candidate: dict[str, Any], *, now: datetime) -> Transition:
+    """
+    Metrics transition for claiming a candidate read before the claim.
+
+    Claim wait is measured from available_at for pending/failed items and
+    from lease expiry for reclaimed leases.
+    """
+    status = candidate.get("status")
+    waited_since = candidate.get("lease_expires_at") if status == "leased" else candidate.get("available_at")
+    return Transition.for_item(
+        candidate,
+        "reclaimed" if status == "leased" else "claimed",
+        from_status=status,
+        to_status="leased",
+        claim_wait_ms=ms_between(waited_since, now),
+    )
+
+
+def _default_result_ref() -> dict[str, Any]:
+    return {
+        "legacy_queue_written": False,
+        "legacy_queue_written_at": None,
+        "scrape_status": None,
+        "scored_jsonl_written": False,
+        "scored_jsonl_written_at": None,
+        "level1_upserted": False,
+        "level1_upserted_at": None,
+    }
+
+
+def _new_work_item(
+    *,
+    task_type: str,
+    lane: str,
+    consumer_mode: str,
+    subject_type: str,
+    subject_id: str,
+    priority: int,
+    available_at: datetime,
+    max_attempts: int,
+    idempotency_key: str,
+    correlation_id: str,
+    payload: dict[str, Any],
+    result_ref: Optional[dict[str, Any]],
+    now: datetime,
+    origin: Optional[str] = None,
+) -> dict[str, Any]:
+    """Build a fresh pending work-item document."""
+    return {
+        "task_type": task_type,
+        "lane": lane,
+        "consumer_mode": consumer_mode,
+        "subject_type": subject_type,
+        "subject_id": subject_id,
+        "status": "pending",
+        "origin": normalize_origin(origin),
+        "priority": priority,
+        "available_at": available_at,
+        "lease_owner": None,
+        "lease_expires_at": None,
+        "attempt_count": 0,
+        "max_attempts": max_attempts,
+        "idempotency_key": idempotency_key,
+        "correlation_id": correlation_id,
+        "payload": payload,
+        "result_ref": result_ref or _default_result_ref(),
+        "last_error": None,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
 def iter_active_statuses() -> Iterable[str]:
     """Statuses that still represent outstanding work."""
     return ("pending", "leased", "failed")
@@ -0,0 +1,416 @@
+"""
+Work-item queue depth and latency telemetry.
+
+Queue state used to be answered by count_documents scans over work_items,
+which get slower as the collection grows and say nothing about latency.
+QueueMetrics instead maintains a compact rollup in the work_item_metrics
+collection, written from WorkItemQueue / StageWorker status transitions:
+
+- one depth document per (lane, task_type) holding per-status gauges,
+  moved by $inc on every transition whose source status is known;
+- one window document per (lane, task_type, hour) holding event counters
+  (enqueued, claimed, completed, retried, deadlettered, ...) and fixed-bucket
+  histograms of claim wait (available -> leased) and run time
+  (leased -> done/failed).
+
+Each transition costs one unordered bulk_write. Recording is best-effort:
+a metrics failure is logged and never fails the queue operation, so the
+gauges can drift (crash between the two writes, metrics disabled for a
+while); reconcile_depth() resets the active gauges from one grouped
+aggregation.
+
+CLI:
+    python -m src.pipeline.queue_metrics [--lane preenrich] [--hours 24] [--reconcile]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Optional
+
+from pymongo import ASCENDING, UpdateOne
+
+logger = logging.getLogger(__name__)
+
+METRICS_COLLECTION = "work_item_metrics"
+WINDOW_SECONDS = 3600
+WINDOW_RETENTION_DAYS = 14
+ACTIVE_STATUSES = ("pending", "leased", "failed")
+# Upper bounds (ms) of the latency histogram buckets; le_inf catches the rest
+LATENCY_BUCKETS_MS = (
+    100,
+    250,
+    500,
+    1_000,
+    2_500,
+    5_000,
+    10_000,
+    30_000,
+    60_000,
+    120_000,
+    300_000,
+    600_000,
+    1_800_000,
+    3_600_000,
+)
+HISTOGRAMS = ("claim_wait_ms", "run_ms")
+# Shared with scripts/migrations/iteration4_indexes.py
+METRICS_INDEXES = (
+    {
+        "keys": [("kind", ASCENDING), ("window_start", ASCENDING)],
+        "kwargs": {"name": "kind_window_start"},
+    },
+    {
+        # Window documents carry their own expiry (WINDOW_RETENTION_DAYS)
+        "keys": [("expires_at", ASCENDING)],
+        "kwargs": {"name": "expires_at_ttl", "expireAfterSeconds": 0},
+    },
+)
+
+
+def metrics_enabled() -> bool:
+    return os.getenv("WORK_ITEM_METRICS_ENABLED", "true").strip().lower() == "true"
+
+
+def bucket_key(value_ms: float) -> str:
+    """Histogram bucket field for a latency sample."""
+    for bound in LATENCY_BUCKETS_MS:
+        if value_ms <= bound:
+            return f"le_{bound}"
+    return "le_inf"
+
+
+def quantile_from_buckets(buckets: dict[str, int], q: float) -> Optional[float]:
+    """
+    Estimate a quantile from histogram bucket counts.
+
+    Interpolates linearly inside the bucket holding the target rank; samples
+    in le_inf are reported at the largest finite bound.
+
+    Args:
+        buckets: Mapping of bucket field (le_<ms>/le_inf) to sample count
+        q: Quantile in [0, 1]
+
+    Returns:
+        Estimated latency in ms, or None when there are no samples
+    """
+    total = sum(int(buckets.get(f"le_{bound}", 0)) for bound in LATENCY_BUCKETS_MS) + int(buckets.get("le_inf", 0))
+    if total <= 0:
+        return None
+    target = q * total
+    cumulative = 0
+    lower = 0.0
+    for bound in LATENCY_BUCKETS_MS:
+        count = int(buckets.get(f"le_{bound}", 0))
+        if count and cumulative + count >= target:
+            return lower + (bound - lower) * max(0.0, target - cumulative) / count
+        cumulative += count
+        lower = float(bound)
+    return float(LATENCY_BUCKETS_MS[-1])
+
+
+@dataclass(frozen=True)
+class Transition:
+    """One work-item status change to record."""
+
+    lane: str
+    task_type: str
+    event: str
+    from_status: Optional[str] = None
+    to_status: Optional[str] = None
+    claim_wait_ms: Optional[float] = None
+    run_ms: Optional[float] = None
+    count: int = 1
+
+    @classmethod
+    def for_item(cls, item: dict[str, Any], event: str, **kwargs: Any) -> "Transition":
+        """Transition attributed to a work-item document's lane and task type."""
+        return cls(str(item.get("lane") or "unknown"), str(item.get("task_type") or "unknown"), event, **kwargs)
+
+
+class QueueMetrics:
+    """Rollup writer/reader for work-item transitions."""
+
+    def __init__(self, db: Any):
+        self.db = db
+        self.collection = db[METRICS_COLLECTION]
+
+    def ensure_indexes(self) -> None:
+        """Create the window lookup index and the retention TTL."""
+        for spec in METRICS_INDEXES:
+            self.collection.create_index(spec["keys"], **spec["kwargs"])
+
+    def record(self, *transitions: Transition, now: Optional[datetime] = None) -> None:
+        """
+        Record transitions in one bulk write (best-effort).
+
+        Args:
+            transitions: Status changes to record
+            now: Transition time; selects the hourly window
+        """
+        if not transitions or not metrics_enabled():
+            return
+        current_time = now or datetime.now(timezone.utc)
+        window_start = _window_start(current_time)
+        window_id = window_start.strftime("%Y%m%d%H")
+        increments: dict[str, dict[str, int | float]] = {}
+        inserts: dict[str, dict[str, Any]] = {}
+        for transition in transitions:
+            key = f"{transition.lane}|{transition.task_type}"
+            window_doc = f"window|{key}|{window_id}"
+            window_inc = increments.setdefault(window_doc, {})
+            inserts.setdefault(
+                window_doc,
+                {
+                    "kind": "window",
+                    "lane": transition.lane,
+                    "task_type": transition.task_type,
+                    "window_start": window_start,
+                    "expires_at": window_start + timedelta(days=WINDOW_RETENTION_DAYS),
+                },
+            )
+            _inc(window_inc, f"counts.{transition.event}", transition.count)
+            for name, value in (("claim_wait_ms", transition.claim_wait_ms), ("run_ms", transition.run_ms)):
+                if value is None:
+                    continue
+                sample = max(0.0, float(value))
+                _inc(window_inc, f"{name}.{bucket_key(sample)}", 1)
+                _inc(window_inc, f"{name}.sum", sample)
+                _inc(window_inc, f"{name}.count", 1)
+
+            if transition.from_status == transition.to_status:
+                continue
+            depth_doc = f"depth|{key}"
+            depth_inc = increments.setdefault(depth_doc, {})
+            inserts.setdefault(depth_doc, {"kind": "depth", "lane": transition.lane, "task_type": transition.task_type})
+            if transition.from_status:
+                _inc(depth_inc, f"depth.{transition.from_status}", -transition.count)
+            if transition.to_status:
+                _inc(depth_inc, f"depth.{transition.to_status}", transition.count)
+
+        operations = [
+            UpdateOne(
+                {"_id": doc_id},
+                {"$inc": inc, "$set": {"updated_at": current_time}, "$setOnInsert": inserts[doc_id]},
+                upsert=True,
+            )
+            for doc_id, inc in increments.items()
+            if inc
+        ]
+        if not operations:
+            return
+        try:
+            self.collection.bulk_write(operations, ordered=False)
+        except Exception as exc:
+            logger.warning("work item metrics write failed: %s", exc)
+
+    def reconcile_depth(self, *, lane: Optional[str] = None, now: Optional[datetime] = None) -> int:
+        """
+        Reset active-status gauges from the work_items collection.
+
+        Only active statuses are aggregated (index-backed and bounded by the
+        backlog); terminal gauges stay cumulative.
+
+        Args:
+            lane: Restrict to one lane
+            now: Reconcile timestamp
+
+        Returns:
+            Number of (lane, task_type) gauges written
+        """
+        current_time = now or datetime.now(timezone.utc)
+        match: dict[str, Any] = {"status": {"$in": list(ACTIVE_STATUSES)}}
+        if lane is not None:
+            match["lane"] = lane
+        actual: dict[tuple[str, str], dict[str, int]] = {}
+        for row in self.db["work_items"].aggregate(
+            [
+                {"$match": match},
+                {"$group": {"_id": {"lane": "$lane", "task_type": "$task_type", "status": "$status"}, "n": {"$sum": 1}}},
+            ]
+        ):
+            group = row["_id"]
+            actual.setdefault((group["lane"], group["task_type"]), {})[group["status"]] = int(row["n"])
+
+        depth_query: dict[str, Any] = {"kind": "depth"}
+        if lane is not None:
+            depth_query["lane"] = lane
+        for doc in self.collection.find(depth_query, {"lane": 1, "task_type": 1}):
+            actual.setdefault((doc["lane"], doc["task_type"]), {})
+
+        operations = [
+            UpdateOne(
+                {"_id": f"depth|{item_lane}|{task_type}"},
+                {
+                    "$set": {
+                        **{f"depth.{status}": counts.get(status, 0) for status in ACTIVE_STATUSES},
+                        "updated_at": current_time,
+                        "reconciled_at": current_time,
+                    },
+                    "$setOnInsert": {"kind": "depth", "lane": item_lane, "task_type": task_type},
+                },
+                upsert=True,
+            )
+            for (item_lane, task_type), counts in actual.items()
+        ]
+        if operations:
+            self.collection.bulk_write(operations, ordered=False)
+        return len(operations)
+
+    def summary(
+        self,
+        *,
+        lane: Optional[str] = None,
+        hours: int = 24,
+        now: Optional[datetime] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Per-(lane, task_type) depth, event counts and latency quantiles.
+
+        Reads only the rollup collection: the depth documents plus the window
+        documents of the last `hours` hours.
+
+        Args:
+            lane: Restrict to one lane
+            hours: Look-back for counters and histograms
+            now: Reference time
+
+        Returns:
+            One dict per (lane, task_type), sorted by lane then task_type
+        """
+        current_time = now or datetime.now(timezone.utc)
+        since = _window_start(current_time) - timedelta(hours=max(0, hours - 1))
+        scope: dict[str, Any] = {} if lane is None else {"lane": lane}
+        rows: dict[tuple[str, str], dict[str, Any]] = {}
+
+        for doc in self.collection.find({"kind": "depth", **scope}):
+            row = _empty_row(doc["lane"], doc["task_type"])
+            row["depth"] = {status: int(value) for status, value in (doc.get("depth") or {}).items()}
+            rows[(doc["lane"], doc["task_type"])] = row
+
+        for doc in self.collection.find({"kind": "window", "window_start": {"$gte": since}, **scope}):
+            key = (doc["lane"], doc["task_type"])
+            row = rows.setdefault(key, _empty_row(*key))
+            for event, value in (doc.get("counts") or {}).items():
+                row["counts"][event] = row["counts"].get(event, 0) + int(value)
+            for name in HISTOGRAMS:
+                merged = row["_buckets"][name]
+                for field, value in (doc.get(name) or {}).items():
+                    merged[field] = merged.get(field, 0) + value
+
+        summaries = []
+        for key in sorted(rows):
+            row = rows[key]
+            buckets = row.pop("_buckets")
+            for name in HISTOGRAMS:
+                samples = int(buckets[name].get("count", 0))
+                row[name] = {
+                    "count": samples,
+                    "mean": round(buckets[name].get("sum", 0) / samples, 1) if samples else None,
+                    "p50": _round(quantile_from_buckets(buckets[name], 0.50)),
+                    "p95": _round(quantile_from_buckets(buckets[name], 0.95)),
+                }
+            attempts = row["counts"].get("claimed", 0) + row["counts"].get("reclaimed", 0)
+            row["retry_rate"] = round(row["counts"].get("retried", 0) / attempts, 4) if attempts else None
+            row["deadletter_rate"] = round(row["counts"].get("deadlettered", 0) / attempts, 4) if attempts else None
+            summaries.append(row)
+        return summaries
+
+
+def ms_between(start: Any, end: datetime) -> Optional[float]:
+    """Milliseconds from start to end, tolerating naive UTC datetimes from PyMongo."""
+    if not isinstance(start, datetime):
+        return None
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    return max(0.0, (end - start).total_seconds() * 1000)
+
+
+def _window_start(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    epoch = int(value.timestamp())
+    return datetime.fromtimestamp(epoch - epoch % WINDOW_SECONDS, tz=timezone.utc)
+
+
+def _inc(target: dict[str, int | float], field: str, amount: int | float) -> None:
+    target[field] = target.get(field, 0) + amount
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value, 1)
+
+
+def _empty_row(lane: str, task_type: str) -> dict[str, Any]:
+    return {
+        "lane": lane,
+        "task_type": task_type,
+        "depth": {},
+        "counts": {},
+        "_buckets": {name: {} for name in HISTOGRAMS},
+    }
+
+
+def format_summary(rows: Iterable[dict[str, Any]]) -> str:
+    """Render summary() rows as a fixed-width table."""
+    header = (
+        f"{'task_type':<40} {'pending':>8} {'leased':>7} {'failed':>7} "
+        f"{'wait p50':>9} {'wait p95':>9} {'run p50':>9} {'run p95':>9} {'retry%':>7} {'dlq%':>6}"
+    )
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        depth = row["depth"]
+        lines.append(
+            f"{row['task_type']:<40} {depth.get('pending', 0):>8} {depth.get('leased', 0):>7} "
+            f"{depth.get('failed', 0):>7} {_fmt_ms(row['claim_wait_ms']['p50']):>9} "
+            f"{_fmt_ms(row['claim_wait_ms']['p95']):>9} {_fmt_ms(row['run_ms']['p50']):>9} "
+            f"{_fmt_ms(row['run_ms']['p95']):>9} {_fmt_pct(row['retry_rate']):>7} {_fmt_pct(row['deadletter_rate']):>6}"
+        )
+    return "\n".join(lines)
+
+
+def _fmt_ms(value: Optional[float]) -> str:
+    if value is None:
+        return "-"
+    if value >= 60_000:
+        return f"{value / 60_000:.1f}m"
+    if value >= 1_000:
+        return f"{value / 1_000:.1f}s"
+    return f"{value:.0f}ms"
+
+
+def _fmt_pct(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value * 100:.1f}"
+
+
+def _get_db() -> Any:
+    from pymongo import MongoClient
+
+    uri = os.getenv("MONGODB_URI")
+    if not uri:
+        raise RuntimeError("MONGODB_URI not set")
+    return MongoClient(uri)["jobs"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Print work-item queue depth and p50/p95 latencies per stage")
+    parser.add_argument("--lane", default="preenrich", help="Lane to report (use 'all' for every lane)")
+    parser.add_argument("--hours", type=int, default=24, help="Look-back window for counters and histograms")
+    parser.add_argument("--reconcile", action="store_true", help="Reset active depth gauges from work_items first")
+    args = parser.parse_args()
+
+    lane = None if args.lane == "all" else args.lane
+    metrics = QueueMetrics(_get_db())
+    if args.reconcile:
+        metrics.reconcile_depth(lane=lane)
+    print(format_summary(metrics.summary(lane=lane, hours=args.hours)))
+
+
+if __name__ == "__main__":
+    main()
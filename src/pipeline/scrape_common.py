@@ -7,11 +7,13 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Optional
 
+import httpx
 import requests
 from pymongo.collection import Collection
 
 from src.common.blacklist import is_blacklisted
 from src.common.dedupe import generate_dedupe_key
+from src.common.dedupe_filter import record_dedupe_keys
 from src.common.proxy_pool import fetch_with_proxy
 from src.common.rule_scorer import compute_rule_score
 from src.services.linkedin_scraper import (
@@ -96,6 +98,14 @@ def evaluate_scrape_candidate(
     use_proxy: bool,
 ) -> ScrapeSkipResult | ScrapeSuccessResult:
     """Apply skip checks, then fetch, parse, and score one job."""
+    skipped = screen_scrape_candidate(job)
+    if skipped is not None:
+        return skipped
+    return scrape_and_score(job, pool=pool, use_proxy=use_proxy)
+
+
+def screen_scrape_candidate(job: dict[str, Any]) -> Optional[ScrapeSkipResult]:
+    """Return the pre-fetch skip for a job, or None when it should be fetched."""
     title = job.get("title", "")
     if is_blacklisted(job):
         return ScrapeSkipResult(
@@ -107,7 +117,7 @@ def evaluate_scrape_candidate(
             status="skipped_title_filter",
             reason=f"title_filter:{title}",
         )
-    return scrape_and_score(job, pool=pool, use_proxy=use_proxy)
+    return None
 
 
 def scrape_and_score(
@@ -125,14 +135,49 @@ def scrape_and_score(
     else:
         response = requests.get(url, headers=HEADERS, timeout=15)
 
-    if response.status_code == 429:
+    raise_for_scrape_status(job_id, response.status_code)
+    return build_scored_job(
+        job,
+        response.text,
+        http_status=response.status_code,
+        used_proxy=bool(use_proxy and pool),
+    )
+
+
+def raise_for_scrape_status(job_id: str, status_code: int) -> None:
+    """Map a non-200 job-page response onto the scraper's exception types."""
+    if status_code == 429:
         raise RateLimitError(f"Rate limited on {job_id}")
-    if response.status_code == 404:
+    if status_code == 404:
         raise JobNotFoundError(f"Job {job_id} not found (404)")
-    if response.status_code != 200:
-        raise LinkedInScraperError(f"HTTP {response.status_code} for {job_id}")
+    if status_code != 200:
+        raise LinkedInScraperError(f"HTTP {status_code} for {job_id}")
+
 
-    job_data = _parse_job_html(job_id, response.text)
+def build_scored_job(
+    job: dict[str, Any],
+    html: str,
+    *,
+    http_status: int,
+    used_proxy: bool,
+) -> ScrapeSuccessResult:
+    """
+    Parse a fetched job page and compute the rule score.
+
+    Module-level and free of I/O so the async worker can run it in a
+    process pool.
+
+    Args:
+        job: Work-item payload (job_id, search_profile, ...)
+        html: Job page HTML
+        http_status: Status of the response the HTML came from
+        used_proxy: Whether the page was fetched through a proxy
+
+    Returns:
+        The scored job, ready for the selector compatibility writes
+    """
+    job_id = job["job_id"]
+    job_data = _parse_job_html(job_id, html)
     score_input = {
         "title": job_data.title,
         "job_description": job_data.description,
@@ -171,8 +216,8 @@ def scrape_and_score(
             "source_cron": job.get("source_cron", ""),
             "scored_at": scored_at,
         },
-        http_status=response.status_code,
-        used_proxy=bool(use_proxy and pool),
+        http_status=http_status,
+        used_proxy=used_proxy,
     )
 
 
@@ -217,6 +262,7 @@ def upsert_level1_scored_job(
         },
         upsert=True,
     )
+    record_dedupe_keys([dedupe_key])
     return {
         "dedupe_key": dedupe_key,
         "upserted": result.upserted_id is not None,
@@ -231,9 +277,9 @@ def classify_scrape_exception(exc: Exception) -> FailureDisposition:
         return FailureDisposition(retryable=False, error_type="job_not_found")
     if isinstance(exc, ParseError):
         return FailureDisposition(retryable=True, error_type="parse_error")
-    if isinstance(exc, requests.Timeout):
+    if isinstance(exc, (requests.Timeout, httpx.TimeoutException)):
         return FailureDisposition(retryable=True, error_type="timeout")
-    if isinstance(exc, requests.RequestException):
+    if isinstance(exc, (requests.RequestException, httpx.TransportError)):
         return FailureDisposition(retryable=True, error_type="network_error")
     if isinstance(exc, LinkedInScraperError):
         message = str(exc)
@@ -6,6 +6,7 @@ import argparse
 import logging
 import os
 import socket
+import time
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
@@ -44,6 +45,7 @@ class ScrapeFeatureFlags:
     write_level1: bool
     selector_compat_mode: bool
     persist_selector_payload: bool
+    async_mode: bool = False
 
     @classmethod
     def from_env(cls) -> "ScrapeFeatureFlags":
@@ -59,6 +61,7 @@ class ScrapeFeatureFlags:
             write_level1=_env_flag("SCOUT_SCRAPE_WRITE_LEVEL1", True),
             selector_compat_mode=_env_flag("SCOUT_SCRAPE_SELECTOR_COMPAT_MODE", True),
             persist_selector_payload=_env_flag("SCOUT_SCRAPE_PERSIST_SELECTOR_PAYLOAD", True),
+            async_mode=_env_flag("SCOUT_SCRAPE_ASYNC_MODE", False),
         )
 
     def validate(self) -> None:
@@ -84,6 +87,27 @@ class CompatibilityWriteResult:
     scored_jsonl_written_now: bool = False
 
 
+@dataclass
+class ScrapeRun:
+    """Per-run state shared by the claim, prepare and finish steps."""
+
+    run_id: str
+    tracer: ScrapeTracingSession
+    stats: dict[str, int]
+    errors: list[dict[str, Any]]
+    now: Optional[datetime]
+
+
+@dataclass
+class PreparedScrape:
+    """A leased work item whose payload is ready to fetch."""
+
+    item: dict[str, Any]
+    hit: dict[str, Any]
+    payload: dict[str, Any]
+    span: Any
+
+
 class CompatibilityWriteError(RuntimeError):
     """Raised when selector-compatible outputs fail after scrape succeeds."""
 
@@ -99,6 +123,12 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--lease-seconds", type=int, default=300, help="Lease duration for claimed work items")
     parser.add_argument("--worker-id", type=str, default=None, help="Override generated worker id")
     parser.add_argument("--no-proxy", action="store_true", help="Skip proxy rotation and use direct requests")
+    parser.add_argument(
+        "--async",
+        dest="async_mode",
+        action="store_true",
+        help="Fetch concurrently (also enabled by SCOUT_SCRAPE_ASYNC_MODE=true)",
+    )
     parser.add_argument("--trigger-mode", type=str, default="single_tick", choices=["single_tick", "manual", "daemon"])
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable debug logging")
     return parser
@@ -126,7 +156,12 @@ def main(argv: Optional[list[str]] = None) -> int:
         raise RuntimeError("MONGODB_URI not set")
 
     db = MongoClient(mongodb_uri)["jobs"]
-    worker = NativeScrapeWorker(db, flags=flags, worker_id=args.worker_id or build_worker_id(), use_proxy=not args.no_proxy)
+    worker_cls = NativeScrapeWorker
+    if args.async_mode or flags.async_mode:
+        from src.pipeline.async_scrape import AsyncNativeScrapeWorker
+
+        worker_cls = AsyncNativeScrapeWorker
+    worker = worker_cls(db, flags=flags, worker_id=args.worker_id or build_worker_id(), use_proxy=not args.no_proxy)
     result = worker.run_once(max_items=args.limit, lease_seconds=args.lease_seconds, trigger_mode=args.trigger_mode)
     logger.info("Native scrape result: %s", result)
     return 0
@@ -142,11 +177,13 @@ class NativeScrapeWorker:
         flags: ScrapeFeatureFlags,
         worker_id: str,
         use_proxy: bool,
+        claim_batch_size: Optional[int] = None,
     ) -> None:
         self.db = db
         self.flags = flags
         self.worker_id = worker_id
         self.use_proxy = use_proxy
+        self.claim_batch_size = claim_batch_size or _env_int("SCOUT_SCRAPE_CLAIM_BATCH_SIZE", 10)
         self.discovery = SearchDiscoveryStore(db)
         self.queue = WorkItemQueue(db)
         self.discovery.ensure_indexes()
@@ -162,7 +199,34 @@ class NativeScrapeWorker:
         trigger_mode: str,
         now: Optional[datetime] = None,
     ) -> dict[str, int]:
-        """Process up to max_items native scrape work-items."""
+        """Process up to max_items native scrape work-items, claimed in batches."""
+        run = self._start_run(trigger_mode=trigger_mode, now=now)
+        try:
+            claimed = 0
+            while claimed < max_items:
+                batch = self._claim_batch(min(self.claim_batch_size, max_items - claimed), lease_seconds=lease_seconds, now=now)
+                if not batch:
+                    break
+                claimed += len(batch)
+                renew_at = time.monotonic() + lease_seconds / 2
+                for index, (item, hit) in enumerate(batch):
+                    if time.monotonic() >= renew_at:
+                        self._renew_leases([queued for queued, _hit in batch[index:]], lease_seconds=lease_seconds, now=now)
+                        renew_at = time.monotonic() + lease_seconds / 2
+                    prepared = self._prepare_item(item, hit, run)
+                    if prepared is None:
+                        continue
+                    try:
+                        outcome = evaluate_scrape_candidate(prepared.payload, pool=self._proxy_pool, use_proxy=self.use_proxy)
+                    except Exception as exc:
+                        outcome = exc
+                    self._finish_item(prepared, outcome, run)
+            return self._complete_run(run)
+        except Exception as exc:
+            self._fail_run(run, exc)
+            raise
+
+    def _start_run(self, *, trigger_mode: str, now: Optional[datetime]) -> ScrapeRun:
         if self.use_proxy:
             self._proxy_pool = load_proxy_pool()
             logger.info("Proxy pool: %s proxies", len(self._proxy_pool))
@@ -183,222 +247,282 @@ class NativeScrapeWorker:
             langfuse_trace_url=tracer.trace_url,
             now=now,
         )
+        return ScrapeRun(
+            run_id=run_context.run_id,
+            tracer=tracer,
+            stats={
+                "claimed": 0,
+                "skipped_blacklist": 0,
+                "skipped_title_filter": 0,
+                "scraped_success": 0,
+                "retried": 0,
+                "deadlettered": 0,
+                "level1_upserts": 0,
+                "scored_jsonl_writes": 0,
+                "scored_pool_writes": 0,
+            },
+            errors=[],
+            now=now,
+        )
+
+    def _complete_run(self, run: ScrapeRun) -> dict[str, int]:
+        self.discovery.finalize_scrape_run(run.run_id, status="completed", stats=run.stats, errors=run.errors, now=run.now)
+        run.tracer.complete(output={"stats": run.stats, "errors": run.errors})
+        return run.stats
 
-        stats = {
-            "claimed": 0,
-            "skipped_blacklist": 0,
-            "skipped_title_filter": 0,
-            "scraped_success": 0,
-            "retried": 0,
-            "deadlettered": 0,
-            "level1_upserts": 0,
-            "scored_jsonl_writes": 0,
-            "scored_pool_writes": 0,
-        }
-        errors: list[dict[str, Any]] = []
+    def _fail_run(self, run: ScrapeRun, exc: Exception) -> None:
+        logger.exception("Native scrape worker failed: %s", exc)
+        run.errors.append({"stage": "run", "message": str(exc)})
+        self.discovery.finalize_scrape_run(run.run_id, status="failed", stats=run.stats, errors=run.errors, now=run.now)
+        run.tracer.complete(output={"stats": run.stats, "errors": run.errors, "failed": True})
 
+    def _claim_batch(
+        self,
+        size: int,
+        *,
+        lease_seconds: int,
+        now: Optional[datetime],
+    ) -> list[tuple[dict[str, Any], Optional[dict[str, Any]]]]:
+        """Lease up to size work items and prefetch their search hits with one query."""
+        items = self.queue.claim_batch(
+            size,
+            task_type="scrape.hit",
+            lane="scrape",
+            consumer_mode="native_scrape",
+            worker_name=self.worker_id,
+            lease_seconds=lease_seconds,
+            now=now,
+        )
+        hits = self.discovery.get_hits([item["subject_id"] for item in items])
+        return [(item, hits.get(str(item["subject_id"]))) for item in items]
+
+    def _renew_leases(self, items: list[dict[str, Any]], *, lease_seconds: int, now: Optional[datetime]) -> None:
+        """Extend the leases of claimed items that have not been finished yet."""
+        if not items:
+            return
+        self.queue.heartbeat_batch(
+            [item["_id"] for item in items],
+            lease_owner=self.worker_id,
+            lease_seconds=lease_seconds,
+            now=now,
+        )
+        lease_expires_at = (now or datetime.now(timezone.utc)) + timedelta(seconds=lease_seconds)
+        for item in items:
+            item["lease_expires_at"] = lease_expires_at
+
+    def _prepare_item(self, item: dict[str, Any], hit: Optional[dict[str, Any]], run: ScrapeRun) -> Optional[PreparedScrape]:
+        """
+        Resolve a claimed item up to the point where it needs a fetch.
+
+        Args:
+            item: Claimed work item
+            hit: Its prefetched search hit, or None when the hit is missing
+            run: Current run
+
+        Returns:
+            The leased item and its payload, or None when the item was
+            already settled (missing hit, idempotent replay, bad payload)
+        """
+        now = run.now
+        tracer = run.tracer
+        run.stats["claimed"] += 1
+        if hit is None:
+            self.queue.mark_deadletter(item["_id"], error="search_hit_missing", now=now)
+            run.errors.append({"work_item_id": str(item["_id"]), "error": "search_hit_missing"})
+            run.stats["deadlettered"] += 1
+            return None
+
+        if hit.get("scrape", {}).get("selector_handoff_status") == "written":
+            final_ref = dict(item.get("result_ref") or {})
+            final_ref["scrape_status"] = "succeeded"
+            final_ref["scored_jsonl_written"] = True
+            final_ref["level1_upserted"] = True
+            self.queue.mark_done(item["_id"], result_ref=final_ref, now=now)
+            tracer.record_stage(
+                "idempotent_done",
+                {
+                    "work_item_id": str(item["_id"]),
+                    "subject_id": item["subject_id"],
+                    "correlation_id": item.get("correlation_id"),
+                },
+            )
+            return None
+
+        span = tracer.start_work_item_span(
+            {
+                "work_item_id": str(item["_id"]),
+                "subject_id": item["subject_id"],
+                "correlation_id": item.get("correlation_id"),
+            }
+        )
+
+        lease_expires_at = item.get("lease_expires_at") or datetime.now(timezone.utc)
+        self.discovery.mark_scrape_leased(
+            item["subject_id"],
+            run_id=run.run_id,
+            work_item_id=item["_id"],
+            lease_owner=self.worker_id,
+            lease_expires_at=lease_expires_at,
+            attempt_count=item.get("attempt_count", 0),
+            consumer_mode=item.get("consumer_mode", "native_scrape"),
+            now=now,
+        )
+
+        prepared = PreparedScrape(item=item, hit=hit, payload={}, span=span)
         try:
-            for _ in range(max_items):
-                item = self.queue.claim_next(
-                    task_type="scrape.hit",
-                    lane="scrape",
-                    consumer_mode="native_scrape",
-                    worker_name=self.worker_id,
-                    lease_seconds=lease_seconds,
-                    now=now,
-                )
-                if item is None:
-                    break
+            prepared.payload = self._build_job_payload(item, hit)
+        except Exception as exc:
+            self._finish_item(prepared, exc, run)
+            return None
+        tracer.record_stage("claim", {"work_item_id": str(item["_id"]), "payload_job_id": prepared.payload.get("job_id")})
+        return prepared
 
-                stats["claimed"] += 1
-                hit = self.discovery.get_hit(item["subject_id"])
-                if hit is None:
-                    self.queue.mark_deadletter(item["_id"], error="search_hit_missing", now=now)
-                    errors.append({"work_item_id": str(item["_id"]), "error": "search_hit_missing"})
-                    stats["deadlettered"] += 1
-                    continue
-
-                if hit.get("scrape", {}).get("selector_handoff_status") == "written":
-                    final_ref = dict(item.get("result_ref") or {})
-                    final_ref["scrape_status"] = "succeeded"
-                    final_ref["scored_jsonl_written"] = True
-                    final_ref["level1_upserted"] = True
-                    self.queue.mark_done(item["_id"], result_ref=final_ref, now=now)
-                    tracer.record_stage(
-                        "idempotent_done",
-                        {
-                            "work_item_id": str(item["_id"]),
-                            "subject_id": item["subject_id"],
-                            "correlation_id": item.get("correlation_id"),
-                        },
-                    )
-                    continue
+    def _finish_item(
+        self,
+        prepared: PreparedScrape,
+        outcome: ScrapeSkipResult | ScrapeSuccessResult | Exception,
+        run: ScrapeRun,
+    ) -> None:
+        """Record a prepared item's skip, success or failure and settle its work item."""
+        item, hit, payload, span = prepared.item, prepared.hit, prepared.payload, prepared.span
+        now = run.now
+        tracer = run.tracer
+        stats = run.stats
+        errors = run.errors
+        try:
+            if isinstance(outcome, Exception):
+                raise outcome
 
-                span = tracer.start_work_item_span(
+            if isinstance(outcome, ScrapeSkipResult):
+                tracer.record_stage(
+                    outcome.status,
                     {
                         "work_item_id": str(item["_id"]),
-                        "subject_id": item["subject_id"],
-                        "correlation_id": item.get("correlation_id"),
-                    }
+                        "reason": outcome.reason,
+                        "title": payload.get("title"),
+                    },
                 )
-
-                lease_expires_at = item.get("lease_expires_at") or datetime.now(timezone.utc)
-                self.discovery.mark_scrape_leased(
+                self.discovery.mark_scrape_skipped(
                     item["subject_id"],
-                    run_id=run_context.run_id,
-                    work_item_id=item["_id"],
-                    lease_owner=self.worker_id,
-                    lease_expires_at=lease_expires_at,
+                    run_id=run.run_id,
+                    status=outcome.status,
+                    reason=outcome.reason,
                     attempt_count=item.get("attempt_count", 0),
-                    consumer_mode=item.get("consumer_mode", "native_scrape"),
                     now=now,
                 )
-
-                try:
-                    payload = self._build_job_payload(item, hit)
-                    tracer.record_stage("claim", {"work_item_id": str(item["_id"]), "payload_job_id": payload.get("job_id")})
-                    outcome = evaluate_scrape_candidate(payload, pool=self._proxy_pool, use_proxy=self.use_proxy)
-
-                    if isinstance(outcome, ScrapeSkipResult):
-                        tracer.record_stage(
-                            outcome.status,
-                            {
-                                "work_item_id": str(item["_id"]),
-                                "reason": outcome.reason,
-                                "title": payload.get("title"),
-                            },
-                        )
-                        self.discovery.mark_scrape_skipped(
-                            item["subject_id"],
-                            run_id=run_context.run_id,
-                            status=outcome.status,
-                            reason=outcome.reason,
-                            attempt_count=item.get("attempt_count", 0),
-                            now=now,
-                        )
-                        self.queue.mark_done(
-                            item["_id"],
-                            result_ref={
-                                **dict(item.get("result_ref") or {}),
-                                "scrape_status": outcome.status,
-                                "scored_jsonl_written": False,
-                                "level1_upserted": False,
-                            },
-                            now=now,
-                        )
-                        stats[outcome.status] += 1
-                        tracer.end_span(span, output={"status": outcome.status})
-                        continue
-
-                    assert isinstance(outcome, ScrapeSuccessResult)
-                    scored = outcome.scored_job
-                    tracer.record_stage("fetch", {"work_item_id": str(item["_id"]), "http_status": outcome.http_status, "used_proxy": outcome.used_proxy})
-                    tracer.record_stage("parse", {"work_item_id": str(item["_id"]), "title": scored.get("title"), "company": scored.get("company")})
-                    tracer.record_stage("score", {"work_item_id": str(item["_id"]), "score": scored.get("score"), "tier": scored.get("tier"), "detected_role": scored.get("detected_role")})
-
-                    self.discovery.mark_scrape_succeeded(
-                        item["subject_id"],
-                        run_id=run_context.run_id,
-                        attempt_count=item.get("attempt_count", 0),
-                        http_status=outcome.http_status,
-                        used_proxy=outcome.used_proxy,
-                        scored_job=scored,
-                        persist_selector_payload=self.flags.persist_selector_payload,
-                        now=now,
-                    )
-
-                    compat = self._write_selector_compatibility(
-                        hit=hit,
-                        item=item,
-                        scored=scored,
-                        run_id=run_context.run_id,
-                        tracer=tracer,
-                        now=now,
-                    )
-
-                    self.discovery.mark_selector_handoff_written(
-                        item["subject_id"],
-                        run_id=run_context.run_id,
-                        scored_jsonl_written=compat.scored_jsonl_written,
-                        level1_upserted=compat.level1_upserted,
-                        now=now,
-                    )
-                    final_ref = {
+                self.queue.mark_done(
+                    item["_id"],
+                    result_ref={
                         **dict(item.get("result_ref") or {}),
-                        "scrape_status": "succeeded",
-                        "scored_payload": {
-                            "score": scored.get("score"),
-                            "tier": scored.get("tier"),
-                            "detected_role": scored.get("detected_role"),
-                        },
-                        "scored_jsonl_written": compat.scored_jsonl_written,
-                        "level1_upserted": compat.level1_upserted,
-                    }
-                    self.queue.mark_done(item["_id"], result_ref=final_ref, now=now)
-                    stats["scraped_success"] += 1
-                    if compat.level1_upserted_now:
-                        stats["level1_upserts"] += 1
-                    if compat.scored_jsonl_written_now:
-                        stats["scored_jsonl_writes"] += 1
-                    tracer.end_span(span, output={"status": "succeeded", "score": scored.get("score"), "tier": scored.get("tier")})
-                except CompatibilityWriteError as exc:
-                    transition = self._handle_failure(
-                        item=item,
-                        hit_id=item["subject_id"],
-                        run_id=run_context.run_id,
-                        error_type="compatibility_write_failed",
-                        error_message=str(exc),
-                        disposition=FailureDisposition(retryable=True, error_type="compatibility_write_failed"),
-                        now=now,
-                        errors=errors,
-                    )
-                    self._persist_partial_result_ref(item["_id"], exc.partial, now=now)
-                    if transition == "retried":
-                        stats["retried"] += 1
-                        self.discovery.mark_selector_handoff_failed(
-                            item["subject_id"],
-                            run_id=run_context.run_id,
-                            error_type="compatibility_write_failed",
-                            message=str(exc),
-                            next_attempt_at=self._next_attempt_at(item, now=now),
-                            now=now,
-                        )
-                        tracer.record_stage("retry_transition", {"work_item_id": str(item["_id"]), "error": str(exc)})
-                        tracer.end_span(span, output={"status": "retry_pending", "error": str(exc)})
-                    else:
-                        stats["deadlettered"] += 1
-                        tracer.record_stage("deadletter_transition", {"work_item_id": str(item["_id"]), "error": str(exc)})
-                        tracer.end_span(span, output={"status": "deadletter", "error": str(exc)})
-                except Exception as exc:
-                    disposition = classify_scrape_exception(exc)
-                    transition = self._handle_failure(
-                        item=item,
-                        hit_id=item["subject_id"],
-                        run_id=run_context.run_id,
-                        error_type=disposition.error_type,
-                        error_message=str(exc),
-                        disposition=disposition,
-                        now=now,
-                        errors=errors,
-                    )
-                    if transition == "retried":
-                        stats["retried"] += 1
-                        tracer.record_stage("retry_transition", {"work_item_id": str(item["_id"]), "error": str(exc), "error_type": disposition.error_type})
-                        tracer.end_span(span, output={"status": "retry_pending", "error": str(exc)})
-                    else:
-                        stats["deadlettered"] += 1
-                        tracer.record_stage("deadletter_transition", {"work_item_id": str(item["_id"]), "error": str(exc), "error_type": disposition.error_type})
-                        tracer.end_span(span, output={"status": "deadletter", "error": str(exc)})
+                        "scrape_status": outcome.status,
+                        "scored_jsonl_written": False,
+                        "level1_upserted": False,
+                    },
+                    now=now,
+                )
+                stats[outcome.status] += 1
+                tracer.end_span(span, output={"status": outcome.status})
+                return
+
+            assert isinstance(outcome, ScrapeSuccessResult)
+            scored = outcome.scored_job
+            tracer.record_stage("fetch", {"work_item_id": str(item["_id"]), "http_status": outcome.http_status, "used_proxy": outcome.used_proxy})
+            tracer.record_stage("parse", {"work_item_id": str(item["_id"]), "title": scored.get("title"), "company": scored.get("company")})
+            tracer.record_stage("score", {"work_item_id": str(item["_id"]), "score": scored.get("score"), "tier": scored.get("tier"), "detected_role": scored.get("detected_role")})
+
+            self.discovery.mark_scrape_succeeded(
+                item["subject_id"],
+                run_id=run.run_id,
+                attempt_count=item.get("attempt_count", 0),
+                http_status=outcome.http_status,
+                used_proxy=outcome.used_proxy,
+                scored_job=scored,
+                persist_selector_payload=self.flags.persist_selector_payload,
+                now=now,
+            )
+
+            compat = self._write_selector_compatibility(
+                hit=hit,
+                item=item,
+                scored=scored,
+                run_id=run.run_id,
+                tracer=tracer,
+                now=now,
+            )
 
-            self.discovery.finalize_scrape_run(run_context.run_id, status="completed", stats=stats, errors=errors, now=now)
-            tracer.complete(output={"stats": stats, "errors": errors})
-            return stats
+            self.discovery.mark_selector_handoff_written(
+                item["subject_id"],
+                run_id=run.run_id,
+                scored_jsonl_written=compat.scored_jsonl_written,
+                level1_upserted=compat.level1_upserted,
+                now=now,
+            )
+            final_ref = {
+                **dict(item.get("result_ref") or {}),
+                "scrape_status": "succeeded",
+                "scored_payload": {
+                    "score": scored.get("score"),
+                    "tier": scored.get("tier"),
+                    "detected_role": scored.get("detected_role"),
+                },
+                "scored_jsonl_written": compat.scored_jsonl_written,
+                "level1_upserted": compat.level1_upserted,
+            }
+            self.queue.mark_done(item["_id"], result_ref=final_ref, now=now)
+            stats["scraped_success"] += 1
+            if compat.level1_upserted_now:
+                stats["level1_upserts"] += 1
+            if compat.scored_jsonl_written_now:
+                stats["scored_jsonl_writes"] += 1
+            tracer.end_span(span, output={"status": "succeeded", "score": scored.get("score"), "tier": scored.get("tier")})
+        except CompatibilityWriteError as exc:
+            transition = self._handle_failure(
+                item=item,
+                hit_id=item["subject_id"],
+                run_id=run.run_id,
+                error_type="compatibility_write_failed",
+                error_message=str(exc),
+                disposition=FailureDisposition(retryable=True, error_type="compatibility_write_failed"),
+                now=now,
+                errors=errors,
+            )
+            self._persist_partial_result_ref(item["_id"], exc.partial, now=now)
+            if transition == "retried":
+                stats["retried"] += 1
+                self.discovery.mark_selector_handoff_failed(
+                    item["subject_id"],
+                    run_id=run.run_id,
+                    error_type="compatibility_write_failed",
+                    message=str(exc),
+                    next_attempt_at=self._next_attempt_at(item, now=now),
+                    now=now,
+                )
+                tracer.record_stage("retry_transition", {"work_item_id": str(item["_id"]), "error": str(exc)})
+                tracer.end_span(span, output={"status": "retry_pending", "error": str(exc)})
+            else:
+                stats["deadlettered"] += 1
+                tracer.record_stage("deadletter_transition", {"work_item_id": str(item["_id"]), "error": str(exc)})
+                tracer.end_span(span, output={"status": "deadletter", "error": str(exc)})
         except Exception as exc:
-            logger.exception("Native scrape worker failed: %s", exc)
-            errors.append({"stage": "run", "message": str(exc)})
-            self.discovery.finalize_scrape_run(run_context.run_id, status="failed", stats=stats, errors=errors, now=now)
-            tracer.complete(output={"stats": stats, "errors": errors, "failed": True})
-            raise
+            disposition = classify_scrape_exception(exc)
+            transition = self._handle_failure(
+                item=item,
+                hit_id=item["subject_id"],
+                run_id=run.run_id,
+                error_type=disposition.error_type,
+                error_message=str(exc),
+                disposition=disposition,
+                now=now,
+                errors=errors,
+            )
+            if transition == "retried":
+                stats["retried"] += 1
+                tracer.record_stage("retry_transition", {"work_item_id": str(item["_id"]), "error": str(exc), "error_type": disposition.error_type})
+                tracer.end_span(span, output={"status": "retry_pending", "error": str(exc)})
+            else:
+                stats["deadlettered"] += 1
+                tracer.record_stage("deadletter_transition", {"work_item_id": str(item["_id"]), "error": str(exc), "error_type": disposition.error_type})
+                tracer.end_span(span, output={"status": "deadletter", "error": str(exc)})
 
     def _build_job_payload(self, item: dict[str, Any], hit: dict[str, Any]) -> dict[str, Any]:
         payload = dict(item.get("payload") or {})
@@ -546,5 +670,12 @@ def _env_flag(name: str, default: bool) -> bool:
     return value.strip().lower() in {"1", "true", "yes", "on"}
 
 
+def _env_int(name: str, default: int, *, minimum: int = 1) -> int:
+    try:
+        return max(minimum, int(os.getenv(name, str(default))))
+    except ValueError:
+        return default
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -3,28 +3,34 @@
 from __future__ import annotations
 
 import logging
+import os
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
 import yaml
+from pymongo import UpdateOne
 from pymongo.collection import Collection
 
 from src.common.blacklist import is_blacklisted
 from src.common.dedupe import (
     REGION_PRIORITY,
+    company_title_key,
     detect_region,
     generate_dedupe_key,
     normalize_for_dedupe,
 )
+from src.common.dedupe_filter import get_dedupe_prefilter, record_dedupe_keys
 from src.common.rule_scorer import is_non_english_jd
+from src.common.search_prefixes import SEARCH_PREFIX_FIELD, search_prefixes
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_MAIN_QUOTA = 8
 POOL_MAX_AGE_HOURS = 48
 PROFILES_PATH = Path(__file__).resolve().parents[2] / "data" / "selector_profiles.yaml"
+COMPANY_TITLE_BACKFILL_BATCH = 500
 
 LEADERSHIP_KEYWORDS = {
     "head", "lead", "director", "vp", "vice president",
@@ -318,6 +324,7 @@ def upsert_low_tier_level1_job(
                 "jobUrl": job.get("job_url"),
                 "description": job.get("description", ""),
                 "dedupeKey": dedupe_key,
+                "company_title_key": company_title_key(job.get("company"), job.get("title")),
                 "createdAt": current_time,
                 "updatedAt": current_time,
                 "source": "scout_discarded",
@@ -338,6 +345,7 @@ def upsert_low_tier_level1_job(
         },
         upsert=True,
     )
+    record_dedupe_keys([dedupe_key])
     document = level1.find_one({"dedupeKey": dedupe_key}, {"_id": 1}) or {}
     return {
         "dedupe_key": dedupe_key,
@@ -369,6 +377,7 @@ def upsert_level2_job(
         "jobUrl": job.get("job_url"),
         "description": job.get("description", ""),
         "dedupeKey": dedupe_key,
+        "company_title_key": company_title_key(job.get("company"), job.get("title")),
         "createdAt": current_time,
         "updatedAt": current_time,
         "status": status,
@@ -397,11 +406,13 @@ def upsert_level2_job(
             "rule_score_breakdown": job.get("breakdown"),
         },
     }
+    set_on_insert[SEARCH_PREFIX_FIELD] = search_prefixes(set_on_insert)
     if selected_for_preenrich:
         set_on_insert["lifecycle"] = "selected"
         set_on_insert["selected_at"] = selected_time
 
     level2.update_one({"dedupeKey": dedupe_key}, {"$setOnInsert": set_on_insert}, upsert=True)
+    record_dedupe_keys([dedupe_key])
     document = level2.find_one({"dedupeKey": dedupe_key}, {"_id": 1, "lifecycle": 1}) or {}
     level2_job_id = document.get("_id")
     lifecycle_updated = False
@@ -445,9 +456,13 @@ def _dedupe_against_db(
         dedupe_keys.append(generate_dedupe_key("linkedin_scout", source_id=job["job_id"]))
         dedupe_keys.append(generate_dedupe_key("linkedin_import", source_id=job["job_id"]))
 
+    # Definite Bloom misses are new; only possible hits are confirmed in Mongo
+    prefilter = get_dedupe_prefilter(db)
+    lookup_keys = prefilter.possible(dedupe_keys) if prefilter is not None else dedupe_keys
+
     existing_keys: set[str] = set()
-    for collection_name in collection_names:
-        for document in db[collection_name].find({"dedupeKey": {"$in": dedupe_keys}}, {"dedupeKey": 1}):
+    for collection_name in collection_names if lookup_keys else ():
+        for document in db[collection_name].find({"dedupeKey": {"$in": lookup_keys}}, {"dedupeKey": 1}):
             existing_keys.add(document["dedupeKey"])
 
     after_primary: list[dict[str, Any]] = []
@@ -461,24 +476,26 @@ def _dedupe_against_db(
             after_primary.append(job)
 
     secondary_collections = ("level-2", "level-1") if secondary_on_level1 else ("level-2",)
+    candidate_keys = {company_title_key(job.get("company"), job.get("title")) for job in after_primary}
+    candidate_keys.discard("")
     existing_company_title: set[str] = set()
-    for collection_name in secondary_collections:
-        for document in db[collection_name].find(
-            {"company": {"$exists": True}, "title": {"$exists": True}},
-            {"company": 1, "title": 1},
-        ):
-            company_norm = normalize_for_dedupe(document.get("company"))
-            title_norm = normalize_for_dedupe(document.get("title"))
-            if company_norm and title_norm:
-                existing_company_title.add(f"{company_norm}|{title_norm}")
+    if candidate_keys:
+        catch_up_limit = int(os.getenv("SELECTOR_COMPANY_TITLE_CATCHUP_LIMIT", "1000"))
+        for collection_name in secondary_collections:
+            collection = db[collection_name]
+            # Rows written by other ingest paths carry no key yet; key them first
+            backfill_company_title_keys(collection, limit=catch_up_limit)
+            for document in collection.find(
+                {"company_title_key": {"$in": sorted(candidate_keys)}},
+                {"company_title_key": 1},
+            ):
+                existing_company_title.add(document["company_title_key"])
 
     fresh: list[dict[str, Any]] = []
     duplicate_secondary: list[dict[str, Any]] = []
     for job in after_primary:
-        company_norm = normalize_for_dedupe(job.get("company"))
-        title_norm = normalize_for_dedupe(job.get("title"))
-        company_title = f"{company_norm}|{title_norm}"
-        if company_title in existing_company_title:
+        company_title = company_title_key(job.get("company"), job.get("title"))
+        if company_title and company_title in existing_company_title:
             duplicate_secondary.append(_annotate(job, "_decision_reason", "company_title"))
         else:
             fresh.append(job)
@@ -487,6 +504,47 @@ def _dedupe_against_db(
     return fresh, duplicates
 
 
+def backfill_company_title_keys(
+    collection: Collection,
+    *,
+    limit: Optional[int] = None,
+    batch_size: int = COMPANY_TITLE_BACKFILL_BATCH,
+) -> int:
+    """
+    Write `company_title_key` on rows that do not have one yet.
+
+    Unkeyed rows are found through the company_title_key index (a missing
+    field indexes as null), so once a collection is backfilled this is a
+    cheap no-op.
+
+    Args:
+        collection: level-1 or level-2
+        limit: Stop after keying this many rows (None = all)
+        batch_size: Rows read and written per round trip
+
+    Returns:
+        Number of rows keyed
+    """
+    keyed = 0
+    while limit is None or keyed < limit:
+        size = batch_size if limit is None else min(batch_size, limit - keyed)
+        documents = list(collection.find({"company_title_key": None}, {"company": 1, "title": 1}).limit(size))
+        if not documents:
+            break
+        collection.bulk_write(
+            [
+                UpdateOne(
+                    {"_id": document["_id"], "company_title_key": None},
+                    {"$set": {"company_title_key": company_title_key(document.get("company"), document.get("title"))}},
+                )
+                for document in documents
+            ],
+            ordered=False,
+        )
+        keyed += len(documents)
+    return keyed
+
+
 def _consolidate_with_remainders(jobs: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     groups: dict[str, list[dict[str, Any]]] = {}
     for job in jobs:
@@ -11,6 +11,8 @@ from pymongo import ASCENDING, DESCENDING, ReturnDocument
 from pymongo.collection import Collection
 from pymongo.database import Database
 
+from src.common.created_at import ensure_created_at_index
+from src.common.search_prefixes import ensure_search_prefix_index
 from src.pipeline.selector_common import POOL_MAX_AGE_HOURS, load_selector_profiles, utc_now
 
 logger = logging.getLogger(__name__)
@@ -109,6 +111,12 @@ class SelectorStore:
             sparse=True,
             name="selection_main_level2_job_id",
         )
+        # Secondary (company|title) dedupe looks candidates up by key
+        self.level2.create_index([("company_title_key", ASCENDING)], name="company_title_key")
+        # Date-filtered job listing range-scans createdAt
+        ensure_created_at_index(self.level2)
+        # Job list typeahead matches query words against search_prefixes
+        ensure_search_prefix_index(self.level2)
         for profile_name in load_selector_profiles().keys():
             self.search_hits.create_index(
                 [(f"selection.profiles.{profile_name}.status", ASCENDING), ("scrape.completed_at", ASCENDING)],
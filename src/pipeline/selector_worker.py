@@ -15,7 +15,9 @@ from typing import Any, Optional
 from dotenv import load_dotenv
 from pymongo import MongoClient
 
+from src.common.created_at import backfill_created_at
 from src.common.scout_queue import append_to_pool
+from src.common.search_prefixes import backfill_search_prefixes
 from src.pipeline.discovery import SearchDiscoveryStore
 from src.pipeline.queue import WorkItemQueue
 from src.pipeline.selector_common import (
@@ -100,6 +102,8 @@ class NativeSelectorWorker:
         self.level1 = db["level-1"]
         self.level2 = db["level-2"]
         self.main_quota = int(os.getenv("SCOUT_SELECTOR_MAIN_QUOTA", str(DEFAULT_MAIN_QUOTA)))
+        self.created_at_catch_up_limit = int(os.getenv("SELECTOR_CREATED_AT_CATCHUP_LIMIT", "1000"))
+        self.search_prefix_catch_up_limit = int(os.getenv("SELECTOR_SEARCH_PREFIX_CATCHUP_LIMIT", "1000"))
 
     def run_once(
         self,
@@ -226,6 +230,10 @@ class NativeSelectorWorker:
         candidates = [candidate for candidate in candidates if not _already_processed_main(candidate, run["run_id"])]
         tracer.record_stage("candidate_query", {"run_id": run["run_id"], "candidates_seen": len(candidates)})
         plan = compute_main_selector_plan(candidates, db=self.db, quota=self.main_quota)
+        # Rows written by other ingest paths may still carry string createdAt values
+        # or lack search prefixes
+        backfill_created_at(self.level2, limit=self.created_at_catch_up_limit)
+        backfill_search_prefixes(self.level2, limit=self.search_prefix_catch_up_limit)
 
         tracer.record_stage("blacklist_filter", {"count": len(plan.filtered_blacklist)})
         tracer.record_stage("non_english_filter", {"count": len(plan.filtered_non_english)})
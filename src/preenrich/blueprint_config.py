@@ -184,6 +184,14 @@ def research_company_cache_ttl_hours() -> int:
     return _int("PREENRICH_RESEARCH_COMPANY_CACHE_TTL_HOURS", 168)
 
 
+def research_company_artifact_cache_enabled() -> bool:
+    return _flag("PREENRICH_RESEARCH_COMPANY_ARTIFACT_CACHE_ENABLED", False)
+
+
+def research_company_cache_lock_seconds() -> int:
+    return _int("PREENRICH_RESEARCH_COMPANY_CACHE_LOCK_SECONDS", 300)
+
+
 def research_application_cache_ttl_hours() -> int:
     return _int("PREENRICH_RESEARCH_APPLICATION_CACHE_TTL_HOURS", 48)
 
@@ -240,6 +248,39 @@ def presentation_contract_emphasis_rules_enabled() -> bool:
     return _flag("PREENRICH_PRESENTATION_CONTRACT_EMPHASIS_RULES_ENABLED", False)
 
 
+def validation_cache_enabled() -> bool:
+    return _flag("PREENRICH_VALIDATION_CACHE_ENABLED", True)
+
+
+def validation_cache_size() -> int:
+    return max(_int("PREENRICH_VALIDATION_CACHE_SIZE", 256), 1)
+
+
+def supervisor_max_workers() -> int:
+    return max(_int("PREENRICH_SUPERVISOR_MAX_WORKERS", 4), 1)
+
+
+def supervisor_stage_max_workers(stage_name: str) -> int:
+    return max(_int(f"PREENRICH_SUPERVISOR_MAX_WORKERS_{stage_name.upper()}", 2), 0)
+
+
+def supervisor_provider_max_workers(provider: str) -> int:
+    """Concurrent workers allowed per LLM provider; 0 means uncapped."""
+    return max(_int(f"PREENRICH_SUPERVISOR_PROVIDER_MAX_WORKERS_{provider.upper()}", 0), 0)
+
+
+def supervisor_rebalance_seconds() -> int:
+    return max(_int("PREENRICH_SUPERVISOR_REBALANCE_SECONDS", 10), 1)
+
+
+def supervisor_reconcile_seconds() -> int:
+    return max(_int("PREENRICH_SUPERVISOR_RECONCILE_SECONDS", 300), 1)
+
+
+def supervisor_drain_seconds() -> int:
+    return max(_int("PREENRICH_SUPERVISOR_DRAIN_SECONDS", 120), 0)
+
+
 def pain_point_intelligence_enabled() -> bool:
     return _flag("PREENRICH_PAIN_POINT_INTELLIGENCE_ENABLED", False)
 
@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 from typing import Any
 
 from bson import ObjectId
+from pymongo import ReturnDocument
 
 
 def utc_now() -> datetime:
@@ -30,18 +31,19 @@ def upsert_artifact(
     document: dict[str, Any],
     now: datetime | None = None,
 ) -> dict[str, Any]:
+    """Upsert one artifact and return the stored document in a single round trip."""
     current_time = now or utc_now()
     payload = dict(document)
     payload["updated_at"] = current_time
-    db[collection].update_one(
+    stored = db[collection].find_one_and_update(
         unique_filter,
         {
             "$set": payload,
             "$setOnInsert": {"created_at": current_time},
         },
         upsert=True,
+        return_document=ReturnDocument.AFTER,
     )
-    stored = db[collection].find_one(unique_filter)
     if stored is None:
         raise RuntimeError(f"artifact upsert lost document in {collection}")
     return stored
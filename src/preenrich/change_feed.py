@@ -0,0 +1,233 @@
+"""
+Change-stream notifications for event-driven preenrich scheduling.
+
+Stage workers and the sweepers normally poll: workers call
+claim_next_work_item() on a timer and the sweepers scan level-2 every
+30 seconds. With PREENRICH_CHANGE_STREAMS_ENABLED=true they block on a
+MongoDB change stream instead, so a stage completion wakes the downstream
+worker within milliseconds:
+
+- ChangeStreamNotifier watches a collection with a $match pipeline and
+  returns matching change events as they arrive (resuming after errors,
+  with backoff, and polling while the stream cannot be reopened).
+- PollingNotifier is the fallback for standalone servers and mongomock,
+  which do not support change streams: it just waits out the interval.
+
+Callers treat every wait() return as "re-check for work", so both modes
+share one loop and time-based work (retry backoff, lease expiry) is still
+picked up at the polling interval.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+from pymongo.errors import ConfigurationError, OperationFailure, PyMongoError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_SECONDS = 5.0
+# Upper bound on a single getMore so wait() stays responsive to stop requests
+MAX_AWAIT_MS = 500
+REOPEN_BACKOFF_SECONDS = 0.5
+MAX_REOPEN_BACKOFF_SECONDS = 30.0
+# ChangeStreamHistoryLost, ChangeStreamFatalError
+_HISTORY_LOST_CODES = frozenset({286, 280})
+
+
+def change_streams_enabled() -> bool:
+    return os.getenv("PREENRICH_CHANGE_STREAMS_ENABLED", "false").strip().lower() == "true"
+
+
+def poll_seconds() -> float:
+    try:
+        return float(os.getenv("PREENRICH_POLL_SECONDS", str(DEFAULT_POLL_SECONDS)))
+    except ValueError:
+        return DEFAULT_POLL_SECONDS
+
+
+class ChangeNotifier(ABC):
+    """Blocks until a collection may have new work."""
+
+    event_driven: bool = False
+
+    @abstractmethod
+    def wait(self, timeout: float) -> list[dict[str, Any]]:
+        """
+        Block for up to timeout seconds.
+
+        Returns:
+            Change events that arrived (empty on timeout or in polling mode)
+        """
+
+    def close(self) -> None:
+        """Release any server-side resources."""
+
+
+class PollingNotifier(ChangeNotifier):
+    """Sleep-based fallback used when change streams are unavailable."""
+
+    def __init__(self, stop_event: Optional[threading.Event] = None):
+        self._stop_event = stop_event or threading.Event()
+
+    def wait(self, timeout: float) -> list[dict[str, Any]]:
+        self._stop_event.wait(timeout)
+        return []
+
+
+class ChangeStreamNotifier(ChangeNotifier):
+    """
+    Change-stream backed notifier that resumes from its last token after errors.
+
+    A broken stream is reopened with exponential backoff (REOPEN_BACKOFF_SECONDS
+    doubling up to MAX_REOPEN_BACKOFF_SECONDS). While it cannot be reopened,
+    wait() sleeps out its timeout like PollingNotifier, so callers keep
+    re-checking for work at the polling interval. A resume token whose oplog
+    history is gone is dropped so the next open starts from "now".
+    """
+
+    event_driven = True
+
+    def __init__(
+        self,
+        collection: Any,
+        pipeline: list[dict[str, Any]],
+        *,
+        stop_event: Optional[threading.Event] = None,
+    ):
+        self._collection = collection
+        self._pipeline = pipeline
+        self._stop_event = stop_event or threading.Event()
+        self._resume_token: Optional[dict[str, Any]] = None
+        self._backoff = REOPEN_BACKOFF_SECONDS
+        self._retry_at = 0.0
+        self._stream: Optional[Any] = self._open()
+
+    def _open(self) -> Any:
+        return self._collection.watch(
+            self._pipeline,
+            full_document="updateLookup",
+            max_await_time_ms=MAX_AWAIT_MS,
+            resume_after=self._resume_token,
+        )
+
+    def _mark_broken(self, exc: PyMongoError) -> None:
+        """Drop the stream (and a dead resume token) and schedule the next reopen."""
+        if self._stream is not None:
+            try:
+                self._stream.close()
+            except PyMongoError:
+                pass
+        self._stream = None
+        if _history_lost(exc):
+            logger.warning("change stream on %s lost its resume point, restarting from now", self._collection.name)
+            self._resume_token = None
+        self._retry_at = time.monotonic() + self._backoff
+        self._backoff = min(self._backoff * 2, MAX_REOPEN_BACKOFF_SECONDS)
+
+    def wait(self, timeout: float) -> list[dict[str, Any]]:
+        deadline = time.monotonic() + timeout
+        events: list[dict[str, Any]] = []
+        while not self._stop_event.is_set():
+            now = time.monotonic()
+            if self._stream is None:
+                if now < self._retry_at:
+                    # Polling fallback until the next reopen attempt
+                    if now >= deadline:
+                        return events
+                    self._stop_event.wait(min(self._retry_at, deadline) - now)
+                    continue
+                try:
+                    self._stream = self._open()
+                except PyMongoError as exc:
+                    logger.warning("change stream on %s could not be reopened: %s", self._collection.name, exc)
+                    self._mark_broken(exc)
+                    continue
+            try:
+                change = self._stream.try_next()
+            except PyMongoError as exc:
+                logger.warning("change stream on %s interrupted, resuming: %s", self._collection.name, exc)
+                self._mark_broken(exc)
+                continue
+            self._backoff = REOPEN_BACKOFF_SECONDS
+            if change is not None:
+                self._resume_token = self._stream.resume_token
+                events.append(change)
+                continue
+            # Drained everything buffered; return what we have or keep waiting
+            if events or time.monotonic() >= deadline:
+                return events
+        return events
+
+    def close(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+
+
+def _history_lost(exc: PyMongoError) -> bool:
+    """True when the resume token points past the retained oplog."""
+    if isinstance(exc, OperationFailure) and exc.code in _HISTORY_LOST_CODES:
+        return True
+    return exc.has_error_label("NonResumableChangeStreamError")
+
+
+def open_notifier(
+    collection: Any,
+    pipeline: list[dict[str, Any]],
+    *,
+    stop_event: Optional[threading.Event] = None,
+) -> ChangeNotifier:
+    """
+    Open a change-stream notifier, falling back to polling.
+
+    Polling is used when PREENRICH_CHANGE_STREAMS_ENABLED is off, for
+    mongomock collections, and when the server rejects change streams
+    (standalone mongod).
+
+    Args:
+        collection: PyMongo collection to watch
+        pipeline: $match stages selecting relevant changes
+        stop_event: Interrupts polling waits on shutdown
+
+    Returns:
+        ChangeNotifier implementation
+    """
+    if not change_streams_enabled() or "mongomock" in type(collection).__module__:
+        return PollingNotifier(stop_event)
+    try:
+        return ChangeStreamNotifier(collection, pipeline, stop_event=stop_event)
+    except (OperationFailure, ConfigurationError) as exc:
+        logger.warning("change streams unavailable on %s, falling back to polling: %s", collection.name, exc)
+        return PollingNotifier(stop_event)
+
+
+def work_item_pipeline(task_type: str) -> list[dict[str, Any]]:
+    """Changes that make a work item of task_type claimable."""
+    return [
+        {
+            "$match": {
+                "operationType": {"$in": ["insert", "update", "replace"]},
+                "fullDocument.lane": "preenrich",
+                "fullDocument.task_type": task_type,
+                "fullDocument.status": {"$in": ["pending", "failed"]},
+            }
+        }
+    ]
+
+
+def level2_dag_pipeline() -> list[dict[str, Any]]:
+    """level-2 writes on DAG-orchestrated jobs that are still preenriching."""
+    return [
+        {
+            "$match": {
+                "operationType": {"$in": ["update", "replace"]},
+                "fullDocument.lifecycle": "preenriching",
+                "fullDocument.pre_enrichment.orchestration": "dag",
+            }
+        }
+    ]
@@ -0,0 +1,140 @@
+"""
+Cross-job company research cache with single-flight recomputation.
+
+Company research depends only on the company identity, yet it used to run
+once per job. This module wraps a compute callable so that, per
+(company_checksum, prompt_version):
+
+- a fresh stored artifact (younger than the TTL) is returned as-is;
+- otherwise exactly one worker takes the compute lock and runs the live
+  research, while concurrent workers poll for its result instead of
+  duplicating the call;
+- a lock that outlives its lease is taken over, and a waiter that times out
+  computes for itself without caching.
+
+Storage errors never fail the stage: the cache is bypassed and research runs
+live, matching the fail-open behaviour of the legacy company_cache.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional
+
+from src.common.repositories import (
+    CompanyResearchArtifactRepositoryInterface,
+    get_company_research_artifact_repository,
+)
+from src.preenrich.blueprint_config import research_company_cache_lock_seconds, research_company_cache_ttl_hours
+
+logger = logging.getLogger(__name__)
+
+# Outcome labels recorded in research_enrichment cache_refs
+CACHE_HIT = "hit"
+CACHE_SHARED = "shared"
+CACHE_COMPUTED = "computed"
+CACHE_BYPASS = "bypass"
+
+
+def _as_utc(value: datetime) -> datetime:
+    # PyMongo returns naive UTC datetimes unless the client is tz_aware
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def is_fresh(doc: Optional[dict[str, Any]], ttl_hours: float, *, now: Optional[datetime] = None) -> bool:
+    """Whether a stored artifact has a payload computed within the TTL."""
+    if not doc or not doc.get("computed_at"):
+        return False
+    current_time = now or datetime.now(timezone.utc)
+    return current_time - _as_utc(doc["computed_at"]) < timedelta(hours=ttl_hours)
+
+
+def get_or_compute_company_research(
+    company_checksum: str,
+    prompt_version: str,
+    compute: Callable[[], dict[str, Any]],
+    *,
+    cacheable: Callable[[dict[str, Any]], bool] = lambda _artifact: True,
+    owner: Optional[str] = None,
+    repository: Optional[CompanyResearchArtifactRepositoryInterface] = None,
+    ttl_hours: Optional[float] = None,
+    lock_seconds: Optional[float] = None,
+    poll_seconds: float = 1.0,
+) -> tuple[dict[str, Any], str]:
+    """
+    Return the company research artifact, computing it at most once per TTL.
+
+    Args:
+        company_checksum: Company identity checksum (see checksums.company_checksum)
+        prompt_version: Prompt version of the research; part of the cache key
+        compute: Runs the live research and returns the artifact payload
+        cacheable: Predicate deciding whether a computed payload may be shared
+            (e.g. reject seed fallbacks after a failed live call)
+        owner: Lock owner identity (defaults to a random id)
+        repository: Artifact store (defaults to the singleton)
+        ttl_hours: Freshness window (default PREENRICH_RESEARCH_COMPANY_CACHE_TTL_HOURS)
+        lock_seconds: Compute lease / max wait for another worker
+            (default PREENRICH_RESEARCH_COMPANY_CACHE_LOCK_SECONDS)
+        poll_seconds: Interval between checks while another worker computes
+
+    Returns:
+        (artifact payload, outcome) where outcome is one of "hit", "shared",
+        "computed" or "bypass"
+    """
+    ttl = research_company_cache_ttl_hours() if ttl_hours is None else ttl_hours
+    lease = research_company_cache_lock_seconds() if lock_seconds is None else lock_seconds
+    owner = owner or f"company-research-{uuid.uuid4().hex[:12]}"
+
+    try:
+        repo = repository or get_company_research_artifact_repository()
+        doc = repo.find_artifact(company_checksum, prompt_version)
+        if is_fresh(doc, ttl):
+            return doc, CACHE_HIT
+
+        deadline = time.monotonic() + lease
+        while not repo.try_acquire_lock(company_checksum, prompt_version, owner, lease):
+            if time.monotonic() >= deadline:
+                logger.warning(
+                    "company research lock wait timed out for %s; computing without cache",
+                    company_checksum,
+                )
+                repo = None
+                break
+            time.sleep(poll_seconds)
+            doc = repo.find_artifact(company_checksum, prompt_version)
+            if is_fresh(doc, ttl):
+                return doc, CACHE_SHARED
+    except Exception as exc:
+        logger.warning("company research cache unavailable for %s: %s", company_checksum, exc)
+        repo = None
+
+    if repo is None:
+        return compute(), CACHE_BYPASS
+
+    try:
+        artifact = compute()
+    except BaseException:
+        _release_quietly(repo, company_checksum, prompt_version, owner)
+        raise
+
+    if cacheable(artifact):
+        if not repo.save_artifact(company_checksum, prompt_version, owner, artifact):
+            _release_quietly(repo, company_checksum, prompt_version, owner)
+    else:
+        _release_quietly(repo, company_checksum, prompt_version, owner)
+    return artifact, CACHE_COMPUTED
+
+
+def _release_quietly(
+    repo: CompanyResearchArtifactRepositoryInterface,
+    company_checksum: str,
+    prompt_version: str,
+    owner: str,
+) -> None:
+    try:
+        repo.release_lock(company_checksum, prompt_version, owner)
+    except Exception as exc:
+        logger.warning("failed to release company research lock for %s: %s", company_checksum, exc)
@@ -1,6 +1,8 @@
 """Pre-enrichment stage DAG definition and transitive invalidation."""
 
-from typing import Dict, List, Set
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
 
 from src.preenrich.blueprint_config import (
     blueprint_enabled,
@@ -143,6 +145,60 @@ def _current_input_invalidations() -> Dict[str, Set[str]]:
     return mapping
 
 
+def topological_levels(
+    stage_names: List[str],
+    dependencies: Dict[str, List[str]],
+) -> List[List[str]]:
+    """
+    Group stages into topological levels for concurrent execution.
+
+    A stage's level is one more than the highest level of its dependencies;
+    stages on the same level have no dependencies on each other and can run
+    concurrently. Dependencies outside stage_names are ignored (they are
+    enforced as prerequisites instead). Within a level, stages keep their
+    order in stage_names so merging their outputs is deterministic.
+
+    Args:
+        stage_names: Stages to schedule, in canonical order
+        dependencies: stage -> stages it depends on
+
+    Returns:
+        List of levels, each a list of stage names
+
+    Raises:
+        ValueError: If the dependencies among stage_names contain a cycle
+
+    Example:
+        >>> topological_levels(["jd_structure", "jd_facts", "classification", "annotations"],
+        ...                    _BLUEPRINT_DEPENDENCIES)
+        [['jd_structure'], ['jd_facts', 'annotations'], ['classification']]
+    """
+    names = set(stage_names)
+    level: Dict[str, int] = {}
+    visiting: Set[str] = set()
+
+    def resolve(stage: str) -> int:
+        if stage in level:
+            return level[stage]
+        if stage in visiting:
+            raise ValueError(f"Dependency cycle involving stage '{stage}'")
+        visiting.add(stage)
+        prereqs = [dep for dep in dependencies.get(stage, []) if dep in names and dep != stage]
+        level[stage] = 1 + max((resolve(dep) for dep in prereqs), default=-1)
+        visiting.discard(stage)
+        return level[stage]
+
+    levels: List[List[str]] = []
+    for stage in stage_names:
+        depth = resolve(stage)
+        while len(levels) <= depth:
+            levels.append([])
+    for stage in stage_names:
+        if stage not in levels[level[stage]]:
+            levels[level[stage]].append(stage)
+    return levels
+
+
 def _transitive_closure(initial: Set[str]) -> Set[str]:
     """
     Compute the transitive closure of stages reachable from the initial set
@@ -170,6 +226,122 @@ def _transitive_closure(initial: Set[str]) -> Set[str]:
     return result
 
 
+@dataclass(frozen=True)
+class DagClosures:
+    """
+    Invalidation closures of one DAG configuration, as bitmasks.
+
+    Bit i stands for stages[i]. closures[stage] holds the stage plus every
+    stage that depends on it, directly or transitively; inputs[key] is the
+    union of the closures of the stages an input directly affects. Built
+    once per configuration (see dag_closures()), so invalidating a stage
+    set is a handful of integer ORs rather than a graph walk per call.
+    """
+
+    stages: Tuple[str, ...]
+    bits: Dict[str, int]
+    closures: Dict[str, int]
+    inputs: Dict[str, int]
+
+    def mask(self, stages: Iterable[str]) -> int:
+        """Bitmask of the given stages; unknown names are ignored."""
+        value = 0
+        for stage in stages:
+            value |= self.bits.get(stage, 0)
+        return value
+
+    def closure_mask(self, stages: Iterable[str]) -> int:
+        """Bitmask of the given stages plus all of their dependents."""
+        value = 0
+        for stage in stages:
+            value |= self.closures.get(stage, 0)
+        return value
+
+    def input_mask(self, changed_inputs: Iterable[str]) -> int:
+        """Bitmask of every stage invalidated by the changed inputs."""
+        value = 0
+        for key in changed_inputs:
+            value |= self.inputs.get(key, 0)
+        return value
+
+    def stage_set(self, mask: int) -> Set[str]:
+        """Decode a bitmask back into stage names."""
+        return {stage for index, stage in enumerate(self.stages) if mask >> index & 1}
+
+
+def _build_closures(
+    deps: Dict[str, List[str]],
+    direct_invalidations: Dict[str, Set[str]],
+) -> DagClosures:
+    names: List[str] = list(deps)
+    for prereqs in deps.values():
+        names.extend(prereq for prereq in prereqs if prereq not in names)
+    for affected in direct_invalidations.values():
+        names.extend(sorted(stage for stage in affected if stage not in names))
+    bits = {stage: 1 << index for index, stage in enumerate(names)}
+
+    reverse_deps: Dict[str, Set[str]] = {stage: set() for stage in names}
+    for stage, prereqs in deps.items():
+        for prereq in prereqs:
+            reverse_deps[prereq].add(stage)
+
+    closures: Dict[str, int] = {}
+
+    def resolve(stage: str, visiting: FrozenSet[str]) -> int:
+        if stage in closures:
+            return closures[stage]
+        if stage in visiting:
+            raise ValueError(f"Dependency cycle involving stage '{stage}'")
+        value = bits[stage]
+        for dependent in reverse_deps[stage]:
+            value |= resolve(dependent, visiting | {stage})
+        closures[stage] = value
+        return value
+
+    for stage in names:
+        resolve(stage, frozenset())
+
+    inputs = {
+        key: _or_all(closures[stage] for stage in affected)
+        for key, affected in direct_invalidations.items()
+    }
+    return DagClosures(stages=tuple(names), bits=bits, closures=closures, inputs=inputs)
+
+
+def _or_all(masks: Iterable[int]) -> int:
+    value = 0
+    for mask in masks:
+        value |= mask
+    return value
+
+
+@lru_cache(maxsize=None)
+def _closures_for(flags: Tuple[bool, ...]) -> DagClosures:
+    # flags only keys the cache; the graph helpers read the same flags
+    return _build_closures(_current_dependencies(), _current_input_invalidations())
+
+
+def dag_closures() -> DagClosures:
+    """
+    Precomputed invalidation closures for the current DAG configuration.
+
+    Cached per combination of the feature flags that shape the graph, so
+    flipping a flag (tests, config reloads) picks up the right closures.
+
+    Returns:
+        DagClosures for the active stage graph
+    """
+    blueprint = blueprint_enabled()
+    flags = (
+        blueprint,
+        blueprint and persona_compat_enabled(),
+        blueprint and stakeholder_surface_enabled(),
+        blueprint and pain_point_intelligence_enabled(),
+        blueprint and presentation_contract_enabled(),
+    )
+    return _closures_for(flags)
+
+
 def invalidate(changed_inputs: Set[str]) -> Set[str]:
     """
     Compute the full set of stages to mark stale given a set of changed inputs.
@@ -179,10 +351,11 @@ def invalidate(changed_inputs: Set[str]) -> Set[str]:
                annotations, + transitive dependants (persona, role_research, fit_signal)
     - "company" -> company_research, + transitive dependants (role_research, fit_signal)
     - "priors" -> annotations, + transitive dependants (persona, fit_signal)
+    - "taxonomy" (blueprint only) -> classification, + transitive dependants
 
     Args:
         changed_inputs: Set of input keys that changed.
-                        Valid keys: "jd", "company", "priors"
+                        Valid keys: "jd", "company", "priors", "taxonomy"
 
     Returns:
         Set of stage names that should be marked stale.
@@ -194,25 +367,5 @@ def invalidate(changed_inputs: Set[str]) -> Set[str]:
         >>> invalidate({"company"})
         {'company_research', 'role_research'}
     """
-    deps = _current_dependencies()
-    direct_invalidations = _current_input_invalidations()
-    reverse_deps: Dict[str, Set[str]] = {stage: set() for stage in deps}
-    for stage, prereqs in deps.items():
-        for prereq in prereqs:
-            reverse_deps.setdefault(prereq, set()).add(stage)
-
-    directly_affected: Set[str] = set()
-    for inp in changed_inputs:
-        directly_affected |= direct_invalidations.get(inp, set())
-
-    result: Set[str] = set(directly_affected)
-    frontier = set(directly_affected)
-    while frontier:
-        next_frontier: Set[str] = set()
-        for stage in frontier:
-            for dependent in reverse_deps.get(stage, set()):
-                if dependent not in result:
-                    result.add(dependent)
-                    next_frontier.add(dependent)
-        frontier = next_frontier
-    return result
+    closures = dag_closures()
+    return closures.stage_set(closures.input_mask(changed_inputs))
@@ -13,17 +13,27 @@ Key guarantees:
 - On failure: increments retry_count; at >=3 marks failed_terminal
 - On all completed: sets lifecycle="ready" + ready_at
 
+Level-parallel mode (PREENRICH_STAGE_PARALLELISM > 1): run_sequence groups
+stages into DAG topological levels and runs each level's stages on a bounded
+thread pool, merging their output patches in stage order once the level
+finishes. A failure stops only the stages downstream of it; independent
+branches still run. The default (1) keeps strict sequential execution.
+
 Public API:
     single_stage(db, ctx, stage, *, force=False) -> StageResult
     run_sequence(db, ctx, stages) -> dict
 """
 
+import copy
+import dataclasses
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from src.observability import record_error
-from src.preenrich.dag import _DEPENDENCIES
+from src.preenrich.dag import _DEPENDENCIES, _current_dependencies, topological_levels
 from src.preenrich.lease import heartbeat
 from src.preenrich.types import (
     StageContext,
@@ -39,6 +49,14 @@ logger = logging.getLogger(__name__)
 MAX_RETRIES = 3
 
 
+def stage_parallelism() -> int:
+    """Max stages run concurrently per job (PREENRICH_STAGE_PARALLELISM, default 1)."""
+    try:
+        return max(1, int(os.getenv("PREENRICH_STAGE_PARALLELISM", "1")))
+    except ValueError:
+        return 1
+
+
 def _legacy_trace_metadata(
     ctx: StageContext,
     *,
@@ -499,6 +517,173 @@ def _merge_patch_into_job_doc(job_doc: Dict[str, Any], patch: Dict[str, Any]) ->
             node[parts[-1]] = value
 
 
+def _is_completed_at_checksum(ctx: StageContext, stage_doc: Dict[str, Any]) -> bool:
+    return (
+        stage_doc.get("status") == StageStatus.COMPLETED
+        and stage_doc.get("jd_checksum_at_completion") == ctx.jd_checksum
+    )
+
+
+def _attempt_stage(
+    db: Any,
+    ctx: StageContext,
+    stage: Any,
+    worker_id: str,
+) -> Tuple[str, Optional[StageResult]]:
+    """
+    Run one stage via single_stage() and classify the outcome.
+
+    Returns:
+        ("completed" | "skipped" | "failed", StageResult or None)
+    """
+    job_id = ctx.job_doc["_id"]
+    try:
+        result = single_stage(db, ctx, stage, worker_id, force=False)
+    except PrerequisiteNotMet as exc:
+        logger.error(
+            "Prerequisites not met for stage %s on job %s: %s",
+            stage.name,
+            job_id,
+            exc.missing,
+        )
+        return "failed", None
+    except RuntimeError as exc:
+        logger.error(
+            "Stage %s failed for job %s: %s",
+            stage.name,
+            job_id,
+            exc,
+        )
+        return "failed", None
+
+    # Check if single_stage returned a "skipped" result
+    if result.skip_reason == "already_completed_at_current_checksum":
+        return "skipped", result
+    return "completed", result
+
+
+def _record_outcome(
+    ctx: StageContext,
+    summary: Dict[str, Any],
+    stage_name: str,
+    outcome: str,
+    result: Optional[StageResult],
+) -> None:
+    """Add a stage outcome to the summary and merge a completed stage's output into ctx."""
+    summary[outcome].append(stage_name)
+    if outcome != "completed" or result is None:
+        return
+
+    # Phase 2b: record fallback metrics
+    summary["fallback_counts"][stage_name] = {
+        "success": 1,
+        "fallback": 1 if result.provider_fallback_reason else 0,
+        "fallback_reason": result.provider_fallback_reason,
+    }
+    # Phase 2a: merge output patch into ctx.job_doc so downstream
+    # stages in this same sequence see the upstream results.
+    if result.output:
+        _merge_patch_into_job_doc(ctx.job_doc, result.output)
+        # Also update the pre_enrichment.stages view so prerequisites
+        # are visible to _check_prerequisites on the next stage.
+        pre_enrich = ctx.job_doc.setdefault("pre_enrichment", {})
+        stages_map = pre_enrich.setdefault("stages", {})
+        stages_map[stage_name] = {
+            "status": StageStatus.COMPLETED,
+            "jd_checksum_at_completion": ctx.jd_checksum,
+        }
+
+
+def _stage_dependency_map(stages: List[Any]) -> Dict[str, List[str]]:
+    """
+    Dependencies among the given stages.
+
+    Union of each stage's declared ``dependencies``, the active DAG and the
+    prerequisite map enforced by single_stage(), restricted to stages in the
+    list (anything else is enforced as a prerequisite, not scheduled).
+    """
+    names = {stage.name for stage in stages}
+    dag_deps = _current_dependencies()
+    deps: Dict[str, List[str]] = {}
+    for stage in stages:
+        declared = list(getattr(stage, "dependencies", None) or [])
+        declared += dag_deps.get(stage.name, []) + _DEPENDENCIES.get(stage.name, [])
+        deps[stage.name] = sorted({dep for dep in declared if dep in names and dep != stage.name})
+    return deps
+
+
+def _run_levels(
+    db: Any,
+    ctx: StageContext,
+    stages: List[Any],
+    worker_id: str,
+    summary: Dict[str, Any],
+    parallelism: int,
+) -> None:
+    """
+    Run stages level by level, concurrently within a level.
+
+    Each concurrently running stage gets its own StageContext with a private
+    copy of job_doc, so stages never observe a sibling's half-merged output.
+    Patches are merged into ctx.job_doc in stage order after the level, and
+    a failed stage blocks only its transitive dependants.
+    """
+    job_id = ctx.job_doc["_id"]
+    by_name = {stage.name: stage for stage in stages}
+    deps = _stage_dependency_map(stages)
+    existing_stages = (ctx.job_doc.get("pre_enrichment") or {}).get("stages") or {}
+    stopped: Set[str] = set()
+
+    with ThreadPoolExecutor(max_workers=parallelism, thread_name_prefix="preenrich-stage") as pool:
+        for level in topological_levels([stage.name for stage in stages], deps):
+            runnable: List[str] = []
+            for stage_name in level:
+                if any(dep in stopped for dep in deps[stage_name]):
+                    logger.info(
+                        "Not running stage %s for job %s: upstream stage failed",
+                        stage_name,
+                        job_id,
+                    )
+                    stopped.add(stage_name)
+                elif _is_completed_at_checksum(ctx, existing_stages.get(stage_name) or {}):
+                    logger.debug(
+                        "Skipping completed stage %s for job %s", stage_name, job_id
+                    )
+                    summary["skipped"].append(stage_name)
+                else:
+                    runnable.append(stage_name)
+
+            if len(runnable) == 1:
+                outcomes = {runnable[0]: _attempt_stage(db, ctx, by_name[runnable[0]], worker_id)}
+            else:
+                futures = {
+                    stage_name: pool.submit(
+                        _attempt_stage,
+                        db,
+                        dataclasses.replace(ctx, job_doc=copy.deepcopy(ctx.job_doc)),
+                        by_name[stage_name],
+                        worker_id,
+                    )
+                    for stage_name in runnable
+                }
+                # Wait for the whole level before merging or re-raising
+                outcomes = {}
+                error: Optional[BaseException] = None
+                for stage_name in runnable:
+                    try:
+                        outcomes[stage_name] = futures[stage_name].result()
+                    except BaseException as exc:
+                        error = error or exc
+                if error is not None:
+                    raise error
+
+            for stage_name in runnable:
+                outcome, result = outcomes[stage_name]
+                _record_outcome(ctx, summary, stage_name, outcome, result)
+                if outcome == "failed":
+                    stopped.add(stage_name)
+
+
 def run_sequence(
     db: Any,
     ctx: StageContext,
@@ -516,6 +701,10 @@ def run_sequence(
     ctx.job_doc in-place so subsequent stages see upstream results
     without requiring a Mongo re-read (Phase 2a).
 
+    With PREENRICH_STAGE_PARALLELISM > 1, stages run concurrently by DAG
+    level instead (see _run_levels): wall time follows the critical path,
+    and a failure stops only its own downstream branch.
+
     After all required stages complete, sets lifecycle="ready" and ready_at.
 
     Args:
@@ -547,67 +736,28 @@ def run_sequence(
         "fallback_counts": {},
     }
 
-    pre = ctx.job_doc.get("pre_enrichment") or {}
-    existing_stages = pre.get("stages") or {}
+    parallelism = stage_parallelism()
+    if parallelism > 1:
+        _run_levels(db, ctx, stages, worker_id, summary, parallelism)
+    else:
+        pre = ctx.job_doc.get("pre_enrichment") or {}
+        existing_stages = pre.get("stages") or {}
 
-    for stage in stages:
-        stage_name = stage.name
-        stage_doc = existing_stages.get(stage_name) or {}
+        for stage in stages:
+            stage_name = stage.name
 
-        # Skip if already completed at the current checksum
-        if (
-            stage_doc.get("status") == StageStatus.COMPLETED
-            and stage_doc.get("jd_checksum_at_completion") == ctx.jd_checksum
-        ):
-            logger.debug(
-                "Skipping completed stage %s for job %s", stage_name, job_id
-            )
-            summary["skipped"].append(stage_name)
-            continue
-
-        try:
-            result = single_stage(db, ctx, stage, worker_id, force=False)
-            # Check if single_stage returned a "skipped" result
-            if result.skip_reason == "already_completed_at_current_checksum":
+            # Skip if already completed at the current checksum
+            if _is_completed_at_checksum(ctx, existing_stages.get(stage_name) or {}):
+                logger.debug(
+                    "Skipping completed stage %s for job %s", stage_name, job_id
+                )
                 summary["skipped"].append(stage_name)
-            else:
-                summary["completed"].append(stage_name)
-                # Phase 2b: record fallback metrics
-                summary["fallback_counts"][stage_name] = {
-                    "success": 1,
-                    "fallback": 1 if result.provider_fallback_reason else 0,
-                    "fallback_reason": result.provider_fallback_reason,
-                }
-                # Phase 2a: merge output patch into ctx.job_doc so downstream
-                # stages in this same sequence see the upstream results.
-                if result.output:
-                    _merge_patch_into_job_doc(ctx.job_doc, result.output)
-                    # Also update the pre_enrichment.stages view so prerequisites
-                    # are visible to _check_prerequisites on the next stage.
-                    pre_enrich = ctx.job_doc.setdefault("pre_enrichment", {})
-                    stages_map = pre_enrich.setdefault("stages", {})
-                    stages_map[stage_name] = {
-                        "status": StageStatus.COMPLETED,
-                        "jd_checksum_at_completion": ctx.jd_checksum,
-                    }
-        except PrerequisiteNotMet as exc:
-            logger.error(
-                "Prerequisites not met for stage %s on job %s: %s",
-                stage_name,
-                job_id,
-                exc.missing,
-            )
-            summary["failed"].append(stage_name)
-            break
-        except RuntimeError as exc:
-            logger.error(
-                "Stage %s failed for job %s: %s",
-                stage_name,
-                job_id,
-                exc,
-            )
-            summary["failed"].append(stage_name)
-            break
+                continue
+
+            outcome, result = _attempt_stage(db, ctx, stage, worker_id)
+            _record_outcome(ctx, summary, stage_name, outcome, result)
+            if outcome == "failed":
+                break
 
     # If all stages completed successfully, set lifecycle to "ready"
     if not summary["failed"]:
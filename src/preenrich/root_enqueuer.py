@@ -12,6 +12,7 @@ from typing import Any, Optional
 from bson import ObjectId
 from pymongo import ReturnDocument
 
+from src.pipeline.fair_share import ORIGINS, normalize_origin
 from src.pipeline.queue import WorkItemQueue
 from src.pipeline.tracing import emit_standalone_event
 from src.preenrich.blueprint_config import (
@@ -127,12 +128,78 @@ class RootEnqueuer:
                 stats["enqueued"] += 1
         return stats
 
-    def enqueue_one(self, level2_id: ObjectId | str, *, now: Optional[datetime] = None) -> bool:
-        """CAS ownership to the DAG path and seed the root work item."""
+    def request_preenrich(
+        self,
+        level2_ids: list[ObjectId | str],
+        *,
+        origin: str,
+        now: Optional[datetime] = None,
+    ) -> dict[str, int]:
+        """
+        Select jobs for preenrich on request, tagging who asked.
+
+        Used by the user-triggered endpoints (origin "interactive") and by
+        backfill scripts (origin "backfill"). Jobs not yet owned by a
+        preenrich path are marked selected with preenrich_origin set; with
+        the DAG enabled their root stage is enqueued right away, bypassing
+        the canary, so an interactive request does not wait for the cron scan.
+
+        Args:
+            level2_ids: level-2 job ids
+            origin: interactive, cron or backfill
+            now: Current time
+
+        Returns:
+            Counts of jobs selected, enqueued into the DAG, and skipped
+            (missing, or already preenriching/ready)
+        """
+        current_time = now or utc_now()
+        job_origin = normalize_origin(origin)
+        stats = {"selected": 0, "enqueued": 0, "skipped": 0}
+        dag_enabled = is_stage_dag_enabled()
+        if dag_enabled:
+            validate_blueprint_feature_flags()
+        for level2_id in level2_ids:
+            object_id = _coerce_object_id(level2_id)
+            selected = self.level2.find_one_and_update(
+                {
+                    "_id": object_id,
+                    "lifecycle": {"$in": [None, "", "selected"]},
+                    "pre_enrichment.orchestration": {"$in": [None, "legacy"]},
+                },
+                {
+                    "$set": {"lifecycle": "selected", "preenrich_origin": job_origin, "updated_at": current_time},
+                    "$min": {"selected_at": current_time},
+                },
+                return_document=ReturnDocument.AFTER,
+            )
+            if selected is None:
+                stats["skipped"] += 1
+                continue
+            stats["selected"] += 1
+            if dag_enabled and self.enqueue_one(object_id, origin=job_origin, now=current_time):
+                stats["enqueued"] += 1
+        return stats
+
+    def enqueue_one(
+        self,
+        level2_id: ObjectId | str,
+        *,
+        origin: Optional[str] = None,
+        now: Optional[datetime] = None,
+    ) -> bool:
+        """
+        CAS ownership to the DAG path and seed the root work item.
+
+        origin (interactive, cron, backfill) is stored on the job and carried
+        by every stage work item so claims can share workers fairly; it
+        defaults to the job's preenrich_origin field, then cron.
+        """
         current_time = now or utc_now()
         document = self.level2.find_one({"_id": _coerce_object_id(level2_id)})
         if document is None:
             return False
+        job_origin = normalize_origin(origin or document.get("preenrich_origin"))
 
         normalized_jd_checksum = str(
             ((document.get("pre_enrichment") or {}).get("jd_checksum"))
@@ -162,6 +229,7 @@ class RootEnqueuer:
                     "pre_enrichment.company_checksum": normalized_company_checksum,
                     "pre_enrichment.taxonomy_version": taxonomy_version() if dag_version != DAG_VERSION else None,
                     "pre_enrichment.orchestration": "dag",
+                    "pre_enrichment.origin": job_origin,
                     "pre_enrichment.stage_states": build_stage_states(snapshot_id),
                     "pre_enrichment.pending_next_stages": [],
                     "pre_enrichment.cv_ready_at": None,
@@ -198,6 +266,7 @@ class RootEnqueuer:
                 "langfuse_session_id": session_id,
             },
             revive_statuses=("cancelled", "deadletter"),
+            origin=job_origin,
         )
         work_item_id = enqueue_result.document.get("_id")
         if work_item_id is not None:
@@ -251,12 +320,28 @@ def main() -> None:
     """CLI entrypoint for the root enqueuer one-shot job."""
     parser = argparse.ArgumentParser(description="Iteration-4 preenrich DAG root enqueuer")
     parser.add_argument("--limit", type=int, default=DEFAULT_BATCH_LIMIT, help="Max selected jobs to scan")
+    parser.add_argument(
+        "--job-ids",
+        default="",
+        help="Comma-separated level-2 ids to select and enqueue instead of scanning (backfills)",
+    )
+    parser.add_argument(
+        "--origin",
+        default="backfill",
+        choices=ORIGINS,
+        help="Fair-share origin recorded on --job-ids requests",
+    )
     args = parser.parse_args()
 
     logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
-    stats = run_once(_get_db(), limit=args.limit)
+    job_ids = [item.strip() for item in args.job_ids.split(",") if item.strip()]
+    if job_ids:
+        stats = RootEnqueuer(_get_db()).request_preenrich(job_ids, origin=args.origin)
+    else:
+        stats = run_once(_get_db(), limit=args.limit)
     logger.info("preenrich root enqueuer stats=%s", stats)
 
+
 def _coerce_object_id(value: ObjectId | str) -> ObjectId:
     if isinstance(value, ObjectId):
         return value
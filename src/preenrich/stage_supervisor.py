@@ -0,0 +1,367 @@
+"""
+Adaptive supervisor for preenrich stage workers.
+
+stage_worker.main() runs one loop for one stage per process, so capacity is
+fixed per stage whatever the backlog. StageSupervisor runs stage workers as
+threads in a single process and, every PREENRICH_SUPERVISOR_REBALANCE_SECONDS,
+moves a fixed worker budget toward the stages with the deepest backlog and
+longest claim wait:
+
+- demand is read from the work_item_metrics rollup (depth gauges and the
+  last hour's claim-wait p95), never by scanning work_items; the active
+  gauges are reconciled every PREENRICH_SUPERVISOR_RECONCILE_SECONDS;
+- plan_allocation() gives every stage with backlog one worker (highest
+  score first), then water-fills the rest by score / (workers + 1), within
+  PREENRICH_SUPERVISOR_MAX_WORKERS_<STAGE> and
+  PREENRICH_SUPERVISOR_PROVIDER_MAX_WORKERS_<PROVIDER>;
+- scaling down asks surplus worker threads to stop after their current work
+  item; when <PROVIDER>_RATE_LIMIT_PER_MIN is set, each claimed item also
+  waits for the shared provider rate limiter before running, and is
+  released back to the queue (available again after the limiter's
+  max wait) when no slot frees up in time.
+
+SIGTERM/SIGINT stop rebalancing and drain in-flight items for up to
+PREENRICH_SUPERVISOR_DRAIN_SECONDS; anything still leased after that is
+returned to the queue by the lease sweeper.
+
+Usage:
+    python -m src.preenrich.stage_supervisor [--stages jd_structure,jd_facts] [--max-workers 6]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import signal
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Mapping, Optional
+
+from src.pipeline.queue_metrics import QueueMetrics, metrics_enabled
+from src.preenrich.blueprint_config import (
+    supervisor_drain_seconds,
+    supervisor_max_workers,
+    supervisor_provider_max_workers,
+    supervisor_rebalance_seconds,
+    supervisor_reconcile_seconds,
+    supervisor_stage_max_workers,
+    validate_blueprint_feature_flags,
+)
+from src.preenrich.change_feed import poll_seconds
+from src.preenrich.stage_registry import iter_stage_definitions
+from src.preenrich.stage_worker import StageWorker, build_worker_id
+from src.preenrich.types import get_stage_step_config
+
+logger = logging.getLogger(__name__)
+
+# Claim wait (seconds) that counts as much as doubling a stage's backlog
+WAIT_SCORE_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class StageDemand:
+    """Backlog signal for one stage."""
+
+    stage_name: str
+    provider: str
+    backlog: int
+    claim_wait_p95_ms: Optional[float] = None
+
+    @property
+    def score(self) -> float:
+        wait_seconds = (self.claim_wait_p95_ms or 0.0) / 1000
+        return self.backlog * (1 + wait_seconds / WAIT_SCORE_SECONDS)
+
+
+def plan_allocation(
+    demands: Iterable[StageDemand],
+    *,
+    max_workers: int,
+    stage_caps: Mapping[str, int],
+    provider_caps: Mapping[str, int],
+) -> dict[str, int]:
+    """
+    Split a worker budget across stages.
+
+    A stage never gets more workers than its backlog, its stage cap or what
+    is left of its provider's cap (0 = uncapped).
+
+    Args:
+        demands: Current per-stage demand
+        max_workers: Total worker budget
+        stage_caps: Max workers per stage
+        provider_caps: Max concurrent workers per provider
+
+    Returns:
+        Target worker count per stage (every demanded stage present)
+    """
+    ranked = sorted(demands, key=lambda demand: (-demand.score, demand.stage_name))
+    allocation = {demand.stage_name: 0 for demand in ranked}
+    provider_used: dict[str, int] = {}
+    remaining = max_workers
+
+    def _can_add(demand: StageDemand) -> bool:
+        workers = allocation[demand.stage_name]
+        provider_cap = provider_caps.get(demand.provider, 0)
+        return (
+            workers < demand.backlog
+            and workers < stage_caps.get(demand.stage_name, 0)
+            and (provider_cap <= 0 or provider_used.get(demand.provider, 0) < provider_cap)
+        )
+
+    def _add(demand: StageDemand) -> None:
+        nonlocal remaining
+        allocation[demand.stage_name] += 1
+        provider_used[demand.provider] = provider_used.get(demand.provider, 0) + 1
+        remaining -= 1
+
+    for demand in ranked:
+        if remaining <= 0:
+            break
+        if _can_add(demand):
+            _add(demand)
+
+    while remaining > 0:
+        candidates = [demand for demand in ranked if _can_add(demand)]
+        if not candidates:
+            break
+        _add(max(candidates, key=lambda demand: demand.score / (allocation[demand.stage_name] + 1)))
+    return allocation
+
+
+class _WorkerSlot:
+    """One worker thread bound to a stage."""
+
+    def __init__(self, stage_name: str, worker: StageWorker, run: Callable[["_WorkerSlot"], None]):
+        self.stage_name = stage_name
+        self.worker = worker
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(
+            target=run,
+            args=(self,),
+            name=f"preenrich-{stage_name}-{worker.worker_id[-6:]}",
+            daemon=True,
+        )
+
+    @property
+    def active(self) -> bool:
+        return self.thread.is_alive() and not self.stop_event.is_set()
+
+
+class StageSupervisor:
+    """Run and rebalance stage worker threads for every preenrich stage."""
+
+    def __init__(
+        self,
+        db: Any,
+        *,
+        stages: Optional[Iterable[str]] = None,
+        max_workers: Optional[int] = None,
+        worker_factory: Optional[Callable[[str, str], StageWorker]] = None,
+        idle_seconds: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the supervisor.
+
+        Args:
+            db: PyMongo database handle
+            stages: Stage names to supervise (default: every registered stage)
+            max_workers: Total worker budget (default PREENRICH_SUPERVISOR_MAX_WORKERS)
+            worker_factory: Builds a StageWorker for (stage_name, worker_id)
+            idle_seconds: Sleep between empty claims (default PREENRICH_POLL_SECONDS)
+        """
+        self.db = db
+        definitions = {definition.name: definition for definition in iter_stage_definitions()}
+        selected = list(stages) if stages is not None else list(definitions)
+        unknown = [name for name in selected if name not in definitions]
+        if unknown:
+            raise ValueError(f"Unknown preenrich stages: {', '.join(unknown)}")
+        self.task_types = {definitions[name].task_type: name for name in selected}
+        self.providers = {name: get_stage_step_config(name).provider for name in selected}
+        self.max_workers = max_workers or supervisor_max_workers()
+        self.stage_caps = {name: supervisor_stage_max_workers(name) for name in selected}
+        self.provider_caps = {
+            provider: supervisor_provider_max_workers(provider) for provider in set(self.providers.values())
+        }
+        self.worker_factory = worker_factory or (
+            lambda stage_name, worker_id: StageWorker(db, stage_name=stage_name, worker_id=worker_id)
+        )
+        self.idle_seconds = poll_seconds() if idle_seconds is None else idle_seconds
+        self.metrics = QueueMetrics(db)
+        self.stop_event = threading.Event()
+        self.slots: list[_WorkerSlot] = []
+        self.stats = {"processed": 0, "released": 0, "errors": 0, "rebalances": 0}
+        self._stats_lock = threading.Lock()
+        self._base_worker_id = build_worker_id()
+        self._next_slot = 0
+        self._last_reconcile = float("-inf")
+
+    def read_demand(self) -> list[StageDemand]:
+        """Per-stage backlog and claim-wait p95 from the metrics rollup."""
+        reconcile_every = supervisor_reconcile_seconds() if metrics_enabled() else 0
+        if time.monotonic() - self._last_reconcile >= reconcile_every:
+            self.metrics.reconcile_depth(lane="preenrich")
+            self._last_reconcile = time.monotonic()
+        rows = {row["task_type"]: row for row in self.metrics.summary(lane="preenrich", hours=1)}
+        demands = []
+        for task_type, stage_name in self.task_types.items():
+            row = rows.get(task_type) or {}
+            depth = row.get("depth") or {}
+            demands.append(
+                StageDemand(
+                    stage_name=stage_name,
+                    provider=self.providers[stage_name],
+                    backlog=max(0, int(depth.get("pending", 0)) + int(depth.get("failed", 0))),
+                    claim_wait_p95_ms=(row.get("claim_wait_ms") or {}).get("p95"),
+                )
+            )
+        return demands
+
+    def rebalance(self) -> dict[str, int]:
+        """
+        Recompute targets and start/stop worker threads to match.
+
+        Returns:
+            Target worker count per stage
+        """
+        target = plan_allocation(
+            self.read_demand(),
+            max_workers=self.max_workers,
+            stage_caps=self.stage_caps,
+            provider_caps=self.provider_caps,
+        )
+        self.slots = [slot for slot in self.slots if slot.thread.is_alive()]
+        for stage_name, wanted in target.items():
+            active = [slot for slot in self.slots if slot.stage_name == stage_name and slot.active]
+            for slot in active[wanted:]:
+                slot.stop_event.set()
+            for _ in range(wanted - len(active)):
+                self._start_slot(stage_name)
+        self.stats["rebalances"] += 1
+        logger.debug("preenrich supervisor targets=%s", {name: count for name, count in target.items() if count})
+        return target
+
+    def run(self, *, max_cycles: Optional[int] = None) -> dict[str, int]:
+        """
+        Rebalance until stopped, then drain worker threads.
+
+        Args:
+            max_cycles: Stop after this many rebalances (tests)
+
+        Returns:
+            Dict with processed, released, errors and rebalances counts
+        """
+        logger.info(
+            "preenrich stage supervisor %s starting: stages=%d max_workers=%d",
+            self._base_worker_id,
+            len(self.task_types),
+            self.max_workers,
+        )
+        cycles = 0
+        try:
+            while not self.stop_event.is_set():
+                try:
+                    self.rebalance()
+                except Exception as exc:
+                    logger.warning("preenrich supervisor rebalance failed: %s", exc)
+                cycles += 1
+                if max_cycles is not None and cycles >= max_cycles:
+                    break
+                self.stop_event.wait(supervisor_rebalance_seconds())
+        finally:
+            self.shutdown()
+        return dict(self.stats)
+
+    def shutdown(self, *, drain_seconds: Optional[float] = None) -> None:
+        """Stop all worker threads, waiting for in-flight items to finish."""
+        self.stop_event.set()
+        for slot in self.slots:
+            slot.stop_event.set()
+        deadline = time.monotonic() + (supervisor_drain_seconds() if drain_seconds is None else drain_seconds)
+        for slot in self.slots:
+            slot.thread.join(max(0.0, deadline - time.monotonic()))
+        still_running = [slot.thread.name for slot in self.slots if slot.thread.is_alive()]
+        if still_running:
+            logger.warning("preenrich supervisor exiting with busy workers (leases will expire): %s", still_running)
+
+    def _start_slot(self, stage_name: str) -> None:
+        self._next_slot += 1
+        worker = self.worker_factory(stage_name, f"{self._base_worker_id}:{stage_name}:{self._next_slot}")
+        slot = _WorkerSlot(stage_name, worker, self._run_slot)
+        self.slots.append(slot)
+        slot.thread.start()
+
+    def _run_slot(self, slot: _WorkerSlot) -> None:
+        limiter = _provider_rate_limiter(self.providers[slot.stage_name])
+        while not slot.stop_event.is_set():
+            try:
+                validate_blueprint_feature_flags()
+                work_item = slot.worker.claim_next_work_item()
+                if work_item is None:
+                    slot.stop_event.wait(self.idle_seconds)
+                    continue
+                if limiter is not None and not limiter.acquire():
+                    # No provider budget within max_wait: hand the item back instead of overrunning the limit
+                    logger.warning(
+                        "rate limiter wait timed out for %s; releasing work item %s for %.0fs",
+                        slot.stage_name,
+                        work_item["_id"],
+                        limiter.max_wait_seconds,
+                    )
+                    slot.worker.release_claimed_work_item(work_item, delay_seconds=limiter.max_wait_seconds)
+                    self._bump("released")
+                    continue
+                slot.worker.process_claimed_work_item(work_item)
+                self._bump("processed")
+            except Exception as exc:
+                self._bump("errors")
+                logger.exception("preenrich supervisor worker %s failed: %s", slot.worker.worker_id, exc)
+                slot.stop_event.wait(self.idle_seconds)
+
+    def _bump(self, key: str) -> None:
+        with self._stats_lock:
+            self.stats[key] += 1
+
+
+def _provider_rate_limiter(provider: str) -> Optional[Any]:
+    """Shared per-minute limiter for a provider, only when one is configured."""
+    if provider == "none" or not os.getenv(f"{provider.upper()}_RATE_LIMIT_PER_MIN"):
+        return None
+    from src.common.rate_limiter import get_rate_limiter
+
+    return get_rate_limiter(provider)
+
+
+def _get_db() -> Any:
+    from pymongo import MongoClient
+
+    uri = os.getenv("MONGODB_URI")
+    if not uri:
+        raise RuntimeError("MONGODB_URI not set")
+    return MongoClient(uri)["jobs"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Adaptive supervisor for preenrich stage workers")
+    parser.add_argument("--stages", default="", help="Comma-separated stages (default: all registered stages)")
+    parser.add_argument("--max-workers", type=int, default=None, help="Total worker budget")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    stages = [item.strip() for item in args.stages.split(",") if item.strip()] or None
+    supervisor = StageSupervisor(_get_db(), stages=stages, max_workers=args.max_workers)
+
+    def _handle(signum: int, frame: Any) -> None:
+        logger.info("Received signal %d — draining stage workers then shutting down", signum)
+        supervisor.stop_event.set()
+
+    signal.signal(signal.SIGTERM, _handle)
+    signal.signal(signal.SIGINT, _handle)
+    stats = supervisor.run()
+    logger.info("preenrich stage supervisor stopped stats=%s", stats)
+
+
+if __name__ == "__main__":
+    main()
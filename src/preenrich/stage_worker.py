@@ -17,8 +17,11 @@ from typing import Any, Callable, Optional
 from bson import ObjectId
 from pymongo import ReturnDocument
 
+from src.common.llm_scheduler import llm_scheduling_context
 from src.observability import record_error
-from src.pipeline.queue import WorkItemQueue
+from src.pipeline.fair_share import normalize_origin
+from src.pipeline.queue import WorkItemQueue, claim_transition
+from src.pipeline.queue_metrics import Transition, ms_between
 from src.pipeline.tracing import PreenrichTracingSession
 from src.preenrich.blueprint_config import (
     current_dag_version,
@@ -26,6 +29,7 @@ from src.preenrich.blueprint_config import (
     validate_blueprint_feature_flags,
 )
 from src.preenrich.blueprint_store import artifact_ref, upsert_artifact
+from src.preenrich.change_feed import ChangeNotifier, open_notifier, poll_seconds, work_item_pipeline
 from src.preenrich.checksums import company_checksum, jd_checksum
 from src.preenrich.root_enqueuer import DAG_VERSION, SCHEMA_VERSION
 from src.preenrich.schema import attempt_token, idempotency_key, input_snapshot_id
@@ -36,6 +40,8 @@ from src.preenrich.types import StageContext, get_stage_step_config
 logger = logging.getLogger(__name__)
 
 RETRY_BACKOFF_SECONDS = (30, 120, 600, 1800, 3600)
+# LLM scheduler priority class for a stage, by its work item's origin
+_LLM_PRIORITY_BY_ORIGIN = {"interactive": "interactive", "cron": "batch", "backfill": "backfill"}
 
 
 def utc_now() -> datetime:
@@ -147,10 +153,11 @@ class StageWorker:
             ],
         }
 
-        candidates = list(
-            self.work_items.find(query)
-            .sort([("priority", -1), ("available_at", 1), ("created_at", 1)])
-            .limit(10)
+        candidates = self.queue.claim_candidates(
+            query,
+            sort=[("priority", -1), ("available_at", 1), ("created_at", 1)],
+            limit=10,
+            now=current_time,
         )
         for candidate in candidates:
             updated = self.work_items.find_one_and_update(
@@ -176,6 +183,7 @@ class StageWorker:
                         "status": "leased",
                         "lease_owner": self.worker_id,
                         "lease_expires_at": lease_expires_at,
+                        "leased_at": current_time,
                         "updated_at": current_time,
                     },
                     "$inc": {"attempt_count": 1},
@@ -184,6 +192,7 @@ class StageWorker:
             )
             if updated is None:
                 continue
+            self.queue.metrics.record(claim_transition(candidate, now=current_time), now=current_time)
 
             self.level2.update_one(
                 {"_id": _coerce_object_id(updated["subject_id"])},
@@ -203,6 +212,98 @@ class StageWorker:
 
         return None
 
+    def release_claimed_work_item(
+        self,
+        work_item: dict[str, Any],
+        *,
+        delay_seconds: float,
+        now: Optional[datetime] = None,
+    ) -> bool:
+        """
+        Give a claimed work item back without running the stage.
+
+        The work item returns to pending after delay_seconds without using
+        up an attempt, and the level-2 stage state goes back to pending.
+
+        Returns:
+            Whether this worker still held the lease
+        """
+        current_time = now or utc_now()
+        released = self.queue.release(
+            work_item["_id"],
+            lease_owner=self.worker_id,
+            delay_seconds=delay_seconds,
+            now=current_time,
+        )
+        if released:
+            self.level2.update_one(
+                {
+                    "_id": _coerce_object_id(work_item["subject_id"]),
+                    f"pre_enrichment.stage_states.{self.stage_name}.lease_owner": self.worker_id,
+                },
+                {
+                    "$set": {
+                        f"pre_enrichment.stage_states.{self.stage_name}.status": "pending",
+                        f"pre_enrichment.stage_states.{self.stage_name}.attempt_count": max(
+                            0, int(work_item.get("attempt_count", 1)) - 1
+                        ),
+                        f"pre_enrichment.stage_states.{self.stage_name}.lease_owner": None,
+                        f"pre_enrichment.stage_states.{self.stage_name}.lease_expires_at": None,
+                        "updated_at": current_time,
+                    }
+                },
+            )
+        return released
+
+    def run_forever(
+        self,
+        *,
+        stop_event: Optional[threading.Event] = None,
+        notifier: Optional[ChangeNotifier] = None,
+        max_items: Optional[int] = None,
+    ) -> dict[str, int]:
+        """
+        Process work items until stopped, blocking on change notifications when idle.
+
+        With change streams enabled the worker wakes as soon as an upstream
+        stage enqueues (or a retry re-arms) a work item for this stage;
+        otherwise it re-polls every PREENRICH_POLL_SECONDS.
+
+        Args:
+            stop_event: Set to stop after the current work item
+            notifier: Override the notifier (defaults to open_notifier on work_items)
+            max_items: Stop after processing this many work items
+
+        Returns:
+            Dict with processed and idle_waits counts
+        """
+        stop_event = stop_event or threading.Event()
+        notifier = notifier or open_notifier(
+            self.work_items,
+            work_item_pipeline(self.definition.task_type),
+            stop_event=stop_event,
+        )
+        stats = {"processed": 0, "idle_waits": 0}
+        logger.info(
+            "preenrich stage worker %s looping on %s (event_driven=%s)",
+            self.worker_id,
+            self.stage_name,
+            notifier.event_driven,
+        )
+        try:
+            while not stop_event.is_set():
+                result = self.process_one()
+                if result.get("status") != "idle":
+                    stats["processed"] += 1
+                    if max_items is not None and stats["processed"] >= max_items:
+                        break
+                    continue
+                stats["idle_waits"] += 1
+                notifier.wait(poll_seconds())
+        finally:
+            notifier.close()
+        return stats
+
     def process_one(self, *, now: Optional[datetime] = None) -> dict[str, Any]:
         """Claim and process a single stage work item."""
         validate_blueprint_feature_flags()
@@ -356,7 +457,10 @@ class StageWorker:
             ),
         )
         ctx.tracer = stage_tracer
-        with self._heartbeat_loop(work_item["_id"], level2_id):
+        llm_priority = _LLM_PRIORITY_BY_ORIGIN[normalize_origin(work_item.get("origin"))]
+        with self._heartbeat_loop(work_item["_id"], level2_id), llm_scheduling_context(
+            priority=llm_priority, job_key=str(level2_id)
+        ):
             try:
                 result = stage.run(ctx)
             except Exception as exc:  # pragma: no cover - exercised through tests via fake stages
@@ -431,8 +535,9 @@ class StageWorker:
             jd_cs=ctx.jd_checksum,
             company_cs=ctx.company_checksum,
             session_id=payload.get("langfuse_session_id") or work_item["correlation_id"],
+            origin=work_item.get("origin"),
         )
-        self._persist_stage_success_phase_a(
+        updated_job_doc = self._persist_stage_success_phase_a(
             job_doc=job_doc,
             work_item=work_item,
             result=result,
@@ -446,7 +551,7 @@ class StageWorker:
         self._finish_stage_run(run_id, status="completed", duration_ms=duration_ms, result=result)
 
         try:
-            self._inline_phase_b_enqueue(level2_id=job_doc["_id"], now=finished_at)
+            self._inline_phase_b_enqueue(level2_id=job_doc["_id"], now=finished_at, level2_doc=updated_job_doc)
             tracer.record_event(
                 "scout.preenrich.enqueue_next",
                 self._trace_metadata(
@@ -463,6 +568,8 @@ class StageWorker:
             )
         except Exception as exc:  # pragma: no cover - defensive; sweeper covers this path
             logger.warning("inline next-stage enqueue failed for %s/%s: %s", level2_id, self.stage_name, exc)
+            # The in-memory outbox may now disagree with Mongo; let finalize re-read
+            updated_job_doc = None
 
         self.queue.mark_done(
             work_item["_id"],
@@ -475,7 +582,7 @@ class StageWorker:
             },
             now=finished_at,
         )
-        finalized = finalize_cv_ready(self.db, level2_id=level2_id, now=finished_at)
+        finalized = finalize_cv_ready(self.db, level2_id=level2_id, now=finished_at, doc=updated_job_doc)
         tracer.record_event(
             "scout.preenrich.finalize_cv_ready",
             self._trace_metadata(
@@ -512,8 +619,14 @@ class StageWorker:
         next_stage_entries: list[dict[str, Any]],
         now: datetime,
         duration_ms: int,
-    ) -> None:
-        """Phase A single-document write for stage success."""
+    ) -> dict[str, Any]:
+        """
+        Phase A single-document write for stage success.
+
+        Returns:
+            The level-2 document after the write, so phase B and the cv_ready
+            finalizer can work from it without re-reading.
+        """
         stage_output = self._resolve_placeholders(
             dict(result.stage_output or {}),
             refs={**self._known_artifact_refs(job_doc), **artifact_refs},
@@ -567,19 +680,29 @@ class StageWorker:
                 }
             }
 
-        result_update = self.level2.update_one(
+        updated = self.level2.find_one_and_update(
             {
                 "_id": job_doc["_id"],
                 f"pre_enrichment.stage_states.{self.stage_name}.lease_owner": self.worker_id,
                 f"pre_enrichment.stage_states.{self.stage_name}.attempt_token": {"$ne": token},
             },
             update,
+            return_document=ReturnDocument.AFTER,
         )
-        if result_update.modified_count != 1:
+        if updated is None:
             raise RuntimeError(f"phase-a success write lost lease for {job_doc['_id']}:{self.stage_name}")
+        return updated
 
-    def _inline_phase_b_enqueue(self, *, level2_id: ObjectId | str, now: Optional[datetime] = None) -> dict[str, int]:
+    def _inline_phase_b_enqueue(
+        self,
+        *,
+        level2_id: ObjectId | str,
+        now: Optional[datetime] = None,
+        level2_doc: Optional[dict[str, Any]] = None,
+    ) -> dict[str, int]:
         """Inline Phase B downstream enqueue, backed by the sweeper implementation."""
+        if level2_doc is not None:
+            return drain_pending_next_stages(self.db, now=now, docs=[level2_doc])
         return drain_pending_next_stages(self.db, level2_id=level2_id, now=now, limit=1)
 
     def _build_next_stage_entries(
@@ -590,8 +713,9 @@ class StageWorker:
         jd_cs: str,
         company_cs: str,
         session_id: str,
+        origin: Optional[str] = None,
     ) -> list[dict[str, Any]]:
-        """Build pending_next_stages entries for direct downstream stages."""
+        """Build pending_next_stages entries for direct downstream stages; they inherit the claim's origin."""
         entries: list[dict[str, Any]] = []
         for stage in iter_stage_definitions():
             if self.stage_name not in stage.prerequisites:
@@ -604,6 +728,7 @@ class StageWorker:
                     "priority": stage.default_priority,
                     "max_attempts": stage.max_attempts,
                     "correlation_id": session_id,
+                    "origin": normalize_origin(origin),
                     "payload": {
                         "stage_name": stage.name,
                         "input_snapshot_id": snapshot_id,
@@ -674,7 +799,7 @@ class StageWorker:
         """Move the work item and stage state back to retry-pending."""
         retry_delay = retry_delay_seconds(int(work_item.get("attempt_count", 1)))
         available_at = now + timedelta(seconds=retry_delay)
-        self.work_items.update_one(
+        retried = self.work_items.update_one(
             {"_id": work_item["_id"], "lease_owner": self.worker_id},
             {
                 "$set": {
@@ -691,6 +816,17 @@ class StageWorker:
                 }
             },
         )
+        if retried.modified_count:
+            self.queue.metrics.record(
+                Transition.for_item(
+                    work_item,
+                    "retried",
+                    from_status="leased",
+                    to_status="pending",
+                    run_ms=ms_between(work_item.get("leased_at"), now),
+                ),
+                now=now,
+            )
         self.level2.update_one(
             {"_id": job_doc["_id"]},
             {
@@ -777,26 +913,18 @@ class StageWorker:
             error_message=error_message,
             now=now,
         )
-        self.work_items.update_many(
+        self.queue.cancel_matching(
             {
                 "lane": "preenrich",
                 "subject_id": str(job_doc["_id"]),
-                "status": {"$in": ["pending", "leased", "failed"]},
                 "_id": {"$ne": work_item["_id"]},
             },
-            {
-                "$set": {
-                    "status": "cancelled",
-                    "lease_owner": None,
-                    "lease_expires_at": None,
-                    "updated_at": now,
-                    "last_error": {
-                        "class": "cancelled_due_to_deadletter",
-                        "message": error_message,
-                        "at": now,
-                    },
-                }
+            last_error={
+                "class": "cancelled_due_to_deadletter",
+                "message": error_message,
+                "at": now,
             },
+            now=now,
         )
 
     def _send_deadletter_alert_if_allowed(
@@ -870,7 +998,7 @@ class StageWorker:
 
     def _cancel_work_item(self, work_item: dict[str, Any], *, reason: str, now: datetime) -> None:
         """Cancel a claimed work item."""
-        self.work_items.update_one(
+        cancelled = self.work_items.update_one(
             {"_id": work_item["_id"], "lease_owner": self.worker_id},
             {
                 "$set": {
@@ -886,6 +1014,11 @@ class StageWorker:
                 }
             },
         )
+        if cancelled.modified_count:
+            self.queue.metrics.record(
+                Transition.for_item(work_item, "cancelled", from_status="leased", to_status="cancelled"),
+                now=now,
+            )
 
     def _missing_prerequisites(self, job_doc: dict[str, Any], snapshot_id: str) -> list[str]:
         """Return any prerequisites that are not completed at the current snapshot."""
@@ -1210,11 +1343,19 @@ def _parse_stage_name() -> str:
 def main() -> None:
     parser = argparse.ArgumentParser(description="Iteration-4 preenrich stage worker")
     parser.add_argument("--stage", dest="stage_name", default=None, help="Override the single allowed stage name")
+    parser.add_argument(
+        "--loop",
+        action="store_true",
+        help="Keep processing; wait on change streams (or poll) when idle",
+    )
     args = parser.parse_args()
 
     stage_name = args.stage_name or _parse_stage_name()
     logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
-    result = run_once(_get_db(), stage_name=stage_name)
+    if args.loop:
+        result = StageWorker(_get_db(), stage_name=stage_name).run_forever()
+    else:
+        result = run_once(_get_db(), stage_name=stage_name)
     logger.info("preenrich stage worker result=%s", result)
 
 
@@ -26,6 +26,7 @@ from src.preenrich.blueprint_prompts import PROMPT_VERSIONS, build_p_pain_point_
 from src.preenrich.research_transport import CodexResearchTransport
 from src.preenrich.stages.base import _invoke_codex_json_traced
 from src.preenrich.types import ArtifactWrite, StageContext, StageResult, StepConfig
+from src.preenrich.validation_cache import validate_artifact
 
 PROMPT_VERSION = "pain_point_intelligence@v4.2.3"
 STAGE_VERSION = "pain_point_intelligence.v4.2.3"
@@ -677,7 +678,13 @@ class PainPointIntelligenceStage:
                     "prompt_version": PROMPT_VERSION,
                 },
             )
-            artifact = _stabilize_doc(PainPointIntelligenceDoc.model_validate(normalize_pain_point_intelligence_payload(existing, jd_excerpt=_jd_excerpt(ctx))))
+            artifact = _stabilize_doc(
+                validate_artifact(
+                    PainPointIntelligenceDoc,
+                    normalize_pain_point_intelligence_payload(existing, jd_excerpt=_jd_excerpt(ctx)),
+                    schema_version=PROMPT_VERSION,
+                )
+            )
             cached_stage_output = dict(existing)
             cached_stage_output.setdefault("trace_ref", {"trace_id": ctx.tracer.trace_id, "trace_url": ctx.tracer.trace_url})
             cached_stage_output.setdefault("compact", build_pain_point_intelligence_compact(cached_stage_output))
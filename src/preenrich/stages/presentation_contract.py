@@ -46,6 +46,7 @@ from src.preenrich.blueprint_prompts import (
 )
 from src.preenrich.stages.base import _invoke_codex_json_traced
 from src.preenrich.types import ArtifactWrite, StageContext, StageResult
+from src.preenrich.validation_cache import validate_artifact
 
 PROMPT_VERSION = "presentation_contract@v4.2.6"
 STAGE_VERSION = "presentation_contract.v4.2.6"
@@ -1114,7 +1115,8 @@ def _validate_experience_dimension_weights(
         except Exception:
             confidence["score"] = 0.79
         working["confidence"] = confidence
-    doc = ExperienceDimensionWeightsDoc.model_validate(
+    doc = validate_artifact(
+        ExperienceDimensionWeightsDoc,
         working,
         context={"evaluator_coverage_target": evaluator_coverage_target},
     )
@@ -1784,7 +1786,7 @@ def _mark_emphasis_defaults_applied(
         max_score=float(payload["confidence"]["score"]),
     )
     payload.update(_bucket_emphasis_rules(adjusted_rules))
-    return TruthConstrainedEmphasisRulesDoc.model_validate(payload)
+    return validate_artifact(TruthConstrainedEmphasisRulesDoc, payload)
 
 
 def _emphasis_rule_priors(
@@ -2365,7 +2367,7 @@ def _validate_truth_constrained_emphasis_rules(
     )
     debug_context["defaults_applied"] = list(dict.fromkeys([*list(debug_context.get("defaults_applied") or []), *list(working.get("defaults_applied") or [])]))
     working["debug_context"] = debug_context
-    doc = TruthConstrainedEmphasisRulesDoc.model_validate(working)
+    doc = validate_artifact(TruthConstrainedEmphasisRulesDoc, working)
     if stakeholder_status in {"inferred_only", "no_research", "unresolved"} and doc.confidence.band == "high":
         doc = _mark_emphasis_defaults_applied(
             doc,
@@ -2441,7 +2443,8 @@ def _apply_emphasis_dimension_caps(
     updated_dimension_payload["overall_weights"] = overall
     updated_dimension_payload["stakeholder_variant_weights"] = variants
     updated_dimension_payload["normalization_events"] = normalization_events
-    updated_dimension = ExperienceDimensionWeightsDoc.model_validate(
+    updated_dimension = validate_artifact(
+        ExperienceDimensionWeightsDoc,
         updated_dimension_payload,
         context={"evaluator_coverage_target": evaluator_coverage_target},
     )
@@ -2450,7 +2453,7 @@ def _apply_emphasis_dimension_caps(
         **emphasis_rules.debug_context.model_dump(),
         "conflict_resolution_log": conflict_entries,
     }
-    updated_emphasis = TruthConstrainedEmphasisRulesDoc.model_validate(updated_emphasis_payload)
+    updated_emphasis = validate_artifact(TruthConstrainedEmphasisRulesDoc, updated_emphasis_payload)
     return updated_dimension, updated_emphasis
 
 
@@ -2460,7 +2463,8 @@ def _validate_document_expectations(
     evaluator_coverage_target: list[str],
     stakeholder_status: str,
 ) -> DocumentExpectationsDoc:
-    doc = DocumentExpectationsDoc.model_validate(
+    doc = validate_artifact(
+        DocumentExpectationsDoc,
         payload,
         context={"evaluator_coverage_target": evaluator_coverage_target},
     )
@@ -2476,7 +2480,8 @@ def _validate_cv_shape_expectations(
     ai_intensity: str,
     document_header_density: str,
 ) -> CvShapeExpectationsDoc:
-    return CvShapeExpectationsDoc.model_validate(
+    return validate_artifact(
+        CvShapeExpectationsDoc,
         payload,
         context={
             "ai_intensity": ai_intensity,
@@ -2565,7 +2570,8 @@ def _validate_ideal_candidate(
         confidence_payload["band"] = "medium" if str(confidence_payload.get("band") or "").strip().lower() == "high" else (confidence_payload.get("band") or "medium")
         confidence_payload["score"] = min(numeric_score, 0.79)
         candidate_payload["confidence"] = confidence_payload
-    doc = IdealCandidatePresentationModelDoc.model_validate(
+    doc = validate_artifact(
+        IdealCandidatePresentationModelDoc,
         candidate_payload,
         context={
             "evaluator_coverage_target": evaluator_coverage_target,
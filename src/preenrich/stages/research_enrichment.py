@@ -11,6 +11,7 @@ from pydantic import BaseModel
 
 from src.preenrich.blueprint_config import (
     current_git_sha,
+    research_company_artifact_cache_enabled,
     research_enable_outreach_guidance,
     research_enable_stakeholders,
     research_enrichment_v2_enabled,
@@ -54,9 +55,11 @@ from src.preenrich.blueprint_prompts import (
     build_p_stakeholder_profile,
     build_p_transport_preamble,
 )
+from src.preenrich.company_research_cache import get_or_compute_company_research
 from src.preenrich.research_transport import CodexResearchTransport
 from src.preenrich.stages.blueprint_common import canonical_domain_from_url, company_slug, normalize_url
 from src.preenrich.types import ArtifactWrite, StageContext, StageResult
+from src.preenrich.validation_cache import validate_artifact
 
 PROMPT_VERSION = "research_enrichment_bundle@v4.1.3.1"
 RESEARCH_VERSION = "research_enrichment.v4.1.3.1"
@@ -471,6 +474,53 @@ def _live_company_profile(
     return profile, []
 
 
+def _shared_company_profile(
+    ctx: StageContext,
+    transport: CodexResearchTransport,
+    application_profile: ApplicationProfile,
+) -> tuple[CompanyProfile, list[str], str | None]:
+    """
+    Live company research reused across jobs of the same company when the artifact cache is on.
+
+    Jobs without a company name or domain all hash to company_checksum("", ""),
+    so they bypass the cache rather than share one unrelated profile.
+    """
+    has_company = any(str(ctx.job_doc.get(field) or "").strip() for field in ("company", "company_domain"))
+    if not research_company_artifact_cache_enabled() or not has_company:
+        company_profile, notes = _live_company_profile(ctx, transport, application_profile)
+        return company_profile, notes, None
+
+    def compute() -> dict[str, Any]:
+        company_profile, notes = _live_company_profile(ctx, transport, application_profile)
+        return {
+            "company_profile": company_profile.model_dump(),
+            "notes": notes,
+            "source_job_id": str(ctx.job_doc.get("_id")),
+        }
+
+    artifact, outcome = get_or_compute_company_research(
+        ctx.company_checksum,
+        PROMPT_VERSION,
+        compute,
+        # Only share clean live results; seed/fail-open fallbacks carry notes
+        cacheable=lambda payload: not payload["notes"],
+        owner=f"{ctx.job_doc.get('_id')}:{ctx.attempt_number}",
+    )
+    logger.info(
+        "research_enrichment company artifact cache: outcome=%s company_checksum=%s source_job_id=%s",
+        outcome,
+        ctx.company_checksum,
+        artifact.get("source_job_id"),
+    )
+    profile = validate_artifact(
+        CompanyProfile,
+        artifact["company_profile"],
+        artifact_id=str(artifact.get("_id") or ctx.company_checksum),
+        schema_version=PROMPT_VERSION,
+    )
+    return profile, list(artifact.get("notes") or []), outcome
+
+
 def _live_role_profile(
     ctx: StageContext,
     transport: CodexResearchTransport,
@@ -967,7 +1017,7 @@ class ResearchEnrichmentStage:
         if web_research_enabled() and transport.is_live_configured():
             seed_company_profile = company_profile
             with ThreadPoolExecutor(max_workers=2, thread_name_prefix="research_enrichment") as executor:
-                company_future = executor.submit(_live_company_profile, ctx, transport, application_profile)
+                company_future = executor.submit(_shared_company_profile, ctx, transport, application_profile)
                 role_future = executor.submit(
                     _live_role_profile,
                     ctx,
@@ -975,7 +1025,7 @@ class ResearchEnrichmentStage:
                     seed_company_profile,
                     application_profile,
                 )
-                company_profile, company_notes = company_future.result()
+                company_profile, company_notes, company_artifact_outcome = company_future.result()
                 role_profile, role_notes = role_future.result()
             logger.info(
                 "research_enrichment parallel live subpasses complete: company_status=%s company_domain=%s role_status=%s role_summary=%s company_notes=%s role_notes=%s",
@@ -1024,6 +1074,7 @@ class ResearchEnrichmentStage:
         else:
             stakeholders = []
             stakeholder_notes = []
+            company_artifact_outcome = None
 
         capability_flags = {
             "research_v2_enabled": True,
@@ -1082,6 +1133,8 @@ class ResearchEnrichmentStage:
         )
         cache_refs = {
             "company_cache_key": company_cache_key,
+            "company_artifact_key": f"{ctx.company_checksum}|{PROMPT_VERSION}",
+            "company_artifact_outcome": company_artifact_outcome,
             "application_cache_key": application_cache_key,
             "stakeholder_cache_keys": [
                 f"{company_domain or company_slug(company_profile.canonical_name)}|{record.profile_url or record.name or record.candidate_rank}|{transport_version}|{PROMPT_VERSION}"
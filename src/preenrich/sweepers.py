@@ -6,21 +6,29 @@ import argparse
 import logging
 import os
 import socket
+import threading
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 from uuid import uuid4
 
 from bson import ObjectId
-from pymongo import ReturnDocument
+from pymongo import ASCENDING, ReturnDocument, UpdateOne
 
 from src.pipeline.queue import WorkItemQueue
+from src.pipeline.queue_metrics import QueueMetrics, Transition
 from src.pipeline.tracing import emit_preenrich_sweeper_event
 from src.preenrich.blueprint_config import (
+    blueprint_enabled,
     current_dag_version,
     current_input_snapshot_id,
+    taxonomy_version,
     validate_blueprint_feature_flags,
 )
+from src.preenrich.change_feed import ChangeNotifier, level2_dag_pipeline, open_notifier, poll_seconds
 from src.preenrich.checksums import company_checksum, jd_checksum
+from src.preenrich.dag import dag_closures
 from src.preenrich.root_enqueuer import DAG_VERSION, ROOT_STAGE, SCHEMA_VERSION, build_stage_states
 from src.preenrich.schema import idempotency_key, input_snapshot_id
 from src.preenrich.stage_registry import get_stage_definition, iter_stage_definitions
@@ -28,6 +36,16 @@ from src.preenrich.stage_registry import get_stage_definition, iter_stage_defini
 logger = logging.getLogger(__name__)
 RETRY_BACKOFF_SECONDS = (30, 120, 600, 1800, 3600)
 SWEEPER_WORKER_ID = f"{socket.gethostname()}-{os.getpid()}-sweeper"
+VERSIONED_INPUTS = ("taxonomy", "priors")
+_REVIVABLE_STATUSES = ("done", "cancelled", "deadletter")
+_SNAPSHOT_PROJECTION = {
+    "description": 1,
+    "job_description": 1,
+    "company": 1,
+    "company_domain": 1,
+    "pre_enrichment.dag_version": 1,
+    "pre_enrichment.input_snapshot_id": 1,
+}
 
 
 def utc_now() -> datetime:
@@ -86,8 +104,29 @@ def drain_pending_next_stages(
     level2_id: Optional[ObjectId | str] = None,
     now: Optional[datetime] = None,
     limit: int = 50,
+    docs: Optional[list[dict[str, Any]]] = None,
 ) -> dict[str, int]:
-    """Drain stage-outbox entries whose downstream work item is not yet enqueued."""
+    """
+    Drain stage-outbox entries whose downstream work item is not yet enqueued.
+
+    Works in bulk so a tick costs a constant number of round trips regardless
+    of how many entries are pending: one scan of level-2, one unordered bulk
+    insert of work items (idempotency_key dedupes against earlier drains; only
+    duplicates are read back), and one unordered bulk write of the level-2
+    outbox/stage-state updates.
+
+    Args:
+        db: Mongo database handle
+        level2_id: Restrict the scan to one job
+        now: Override the current time
+        limit: Maximum jobs scanned
+        docs: Already-loaded level-2 documents to drain instead of scanning
+            (the stage worker passes its phase-A result). Drained entries
+            are marked enqueued on these documents in place.
+
+    Returns:
+        {"jobs": ..., "entries": ...}
+    """
     validate_blueprint_feature_flags()
     current_time = now or utc_now()
     queue = WorkItemQueue(db)
@@ -99,59 +138,71 @@ def drain_pending_next_stages(
 
     stats = {"jobs": 0, "entries": 0}
     run_id = _sweeper_run_id("enqueue_next")
-    cursor = level2.find(query).limit(limit)
-    for doc in cursor:
+    drained: list[tuple[dict[str, Any], list[dict[str, Any]], list[dict[str, Any]]]] = []
+    items: list[dict[str, Any]] = []
+    if docs is None:
+        docs = level2.find(query).limit(limit)
+    for doc in docs:
         pending = list(((doc.get("pre_enrichment") or {}).get("pending_next_stages")) or [])
         if not pending:
             continue
 
-        changed = False
         stats["jobs"] += 1
-        stage_state_updates: dict[str, Any] = {}
-        for entry in pending:
-            if entry.get("enqueued_at") is not None:
-                continue
-
-            result = queue.enqueue(
-                task_type=entry["task_type"],
-                lane="preenrich",
-                consumer_mode="native_stage_dag",
-                subject_type="job",
-                subject_id=str(doc["_id"]),
-                priority=int(entry.get("priority", 100)),
-                available_at=current_time,
-                max_attempts=int(entry["max_attempts"]),
-                idempotency_key=entry["idempotency_key"],
-                correlation_id=entry["correlation_id"],
-                payload=dict(entry["payload"]),
+        new_entries = [entry for entry in pending if entry.get("enqueued_at") is None]
+        for entry in new_entries:
+            items.append(
+                {
+                    "task_type": entry["task_type"],
+                    "lane": "preenrich",
+                    "consumer_mode": "native_stage_dag",
+                    "subject_type": "job",
+                    "subject_id": str(doc["_id"]),
+                    "priority": int(entry.get("priority", 100)),
+                    "available_at": current_time,
+                    "max_attempts": int(entry["max_attempts"]),
+                    "idempotency_key": entry["idempotency_key"],
+                    "correlation_id": entry["correlation_id"],
+                    "payload": dict(entry["payload"]),
+                    "origin": entry.get("origin"),
+                }
             )
+        if new_entries:
+            drained.append((doc, pending, new_entries))
+
+    if not items:
+        return stats
+
+    results = iter(queue.enqueue_many(items))
+    updates: list[UpdateOne] = []
+    for doc, pending, new_entries in drained:
+        set_doc: dict[str, Any] = {"pre_enrichment.pending_next_stages": pending, "updated_at": current_time}
+        for entry in new_entries:
+            result = next(results)
             entry["enqueued_at"] = current_time
-            changed = True
             stats["entries"] += 1
             stage_name = str(entry["payload"]["stage_name"])
-            stage_state_updates[f"pre_enrichment.stage_states.{stage_name}.work_item_id"] = result.document.get("_id")
-
-        if changed:
-            set_doc = {"pre_enrichment.pending_next_stages": pending, "updated_at": current_time}
-            set_doc.update(stage_state_updates)
-            level2.update_one({"_id": doc["_id"]}, {"$set": set_doc})
-            emit_preenrich_sweeper_event(
-                name="scout.preenrich.enqueue_next",
-                level2_job_id=str(doc["_id"]),
-                metadata=_sweeper_trace_metadata(
-                    doc,
-                    run_id=run_id,
-                    task_type="preenrich.sweeper.enqueue_next",
-                    stage_name="sweeper",
-                    lifecycle_before=str(doc.get("lifecycle") or "preenriching"),
-                    lifecycle_after=str(doc.get("lifecycle") or "preenriching"),
-                    extra={
-                        "entries_enqueued": len(stage_state_updates),
-                        "stage_names": [str(entry["payload"]["stage_name"]) for entry in pending if entry.get("enqueued_at") == current_time],
-                    },
-                ),
+            set_doc[f"pre_enrichment.stage_states.{stage_name}.work_item_id"] = result.document.get("_id")
+        updates.append(UpdateOne({"_id": doc["_id"]}, {"$set": set_doc}))
+    level2.bulk_write(updates, ordered=False)
+
+    for doc, _pending, new_entries in drained:
+        emit_preenrich_sweeper_event(
+            name="scout.preenrich.enqueue_next",
+            level2_job_id=str(doc["_id"]),
+            metadata=_sweeper_trace_metadata(
+                doc,
                 run_id=run_id,
-            )
+                task_type="preenrich.sweeper.enqueue_next",
+                stage_name="sweeper",
+                lifecycle_before=str(doc.get("lifecycle") or "preenriching"),
+                lifecycle_after=str(doc.get("lifecycle") or "preenriching"),
+                extra={
+                    "entries_enqueued": len({str(entry["payload"]["stage_name"]) for entry in new_entries}),
+                    "stage_names": [str(entry["payload"]["stage_name"]) for entry in new_entries],
+                },
+            ),
+            run_id=run_id,
+        )
 
     return stats
 
@@ -161,11 +212,23 @@ def finalize_cv_ready(
     *,
     level2_id: ObjectId | str,
     now: Optional[datetime] = None,
+    doc: Optional[dict[str, Any]] = None,
 ) -> bool:
-    """Atomically finalize a DAG-owned job to `cv_ready` when all required stages are complete."""
+    """
+    Atomically finalize a DAG-owned job to `cv_ready` when all required stages are complete.
+
+    The readiness conditions are part of the compare-and-set filter, so a
+    caller that already holds a recent level-2 document (the stage worker
+    after its phase-A write) passes it as doc and the finalizer skips both
+    the read and the in-memory pre-check: a sibling stage completing
+    concurrently is then judged by the server at write time, not from the
+    caller's snapshot.
+    """
     current_time = now or utc_now()
     level2 = db["level-2"]
-    doc = level2.find_one({"_id": _coerce_object_id(level2_id)})
+    prefetched = doc is not None
+    if doc is None:
+        doc = level2.find_one({"_id": _coerce_object_id(level2_id)})
     if doc is None:
         return False
 
@@ -175,28 +238,35 @@ def finalize_cv_ready(
         return False
 
     required_stages = [stage.name for stage in iter_stage_definitions() if stage.required_for_cv_ready]
-    stage_states = pre.get("stage_states") or {}
-    for stage_name in required_stages:
-        state = stage_states.get(stage_name) or {}
-        if state.get("status") != "completed":
-            return False
-        if state.get("input_snapshot_id") != snapshot_id:
-            return False
+    if not prefetched:
+        stage_states = pre.get("stage_states") or {}
+        for stage_name in required_stages:
+            state = stage_states.get(stage_name) or {}
+            if state.get("status") != "completed":
+                return False
+            if state.get("input_snapshot_id") != snapshot_id:
+                return False
 
-    for entry in pre.get("pending_next_stages") or []:
-        if entry.get("enqueued_at") is None:
-            return False
+        for entry in pre.get("pending_next_stages") or []:
+            if entry.get("enqueued_at") is None:
+                return False
+
+    ready_filter: dict[str, Any] = {
+        "_id": doc["_id"],
+        "lifecycle": "preenriching",
+        "$or": [
+            {"pre_enrichment.cv_ready_at": {"$exists": False}},
+            {"pre_enrichment.cv_ready_at": None},
+        ],
+        "pre_enrichment.input_snapshot_id": snapshot_id,
+        "pre_enrichment.pending_next_stages": {"$not": {"$elemMatch": {"enqueued_at": None}}},
+    }
+    for stage_name in required_stages:
+        ready_filter[f"pre_enrichment.stage_states.{stage_name}.status"] = "completed"
+        ready_filter[f"pre_enrichment.stage_states.{stage_name}.input_snapshot_id"] = snapshot_id
 
     result = level2.update_one(
-        {
-            "_id": doc["_id"],
-            "lifecycle": "preenriching",
-            "$or": [
-                {"pre_enrichment.cv_ready_at": {"$exists": False}},
-                {"pre_enrichment.cv_ready_at": None},
-            ],
-            "pre_enrichment.input_snapshot_id": snapshot_id,
-        },
+        ready_filter,
         {
             "$set": {
                 "lifecycle": "cv_ready",
@@ -246,6 +316,7 @@ def release_expired_stage_leases(
         **_lte_now("lease_expires_at", current_time, collection=work_items),
     }
     stats = {"released": 0}
+    metrics = QueueMetrics(db)
     run_id = _sweeper_run_id("release_lease")
     cursor = work_items.find(query).limit(limit)
     for item in cursor:
@@ -277,6 +348,10 @@ def release_expired_stage_leases(
         )
         if updated is None:
             continue
+        metrics.record(
+            Transition.for_item(item, "lease_expired", from_status="leased", to_status="pending"),
+            now=current_time,
+        )
 
         payload = item.get("payload") or {}
         stage_name = str(payload.get("stage_name") or _task_type_to_stage(item["task_type"]))
@@ -321,13 +396,180 @@ def release_expired_stage_leases(
     return stats
 
 
+@dataclass(frozen=True)
+class StageReset:
+    """Outcome of planning a snapshot change for one job."""
+
+    stage_states: dict[str, dict[str, Any]]
+    reset_stages: list[str]
+    frontier: list[str]
+
+
+def plan_stage_reset(
+    pre: dict[str, Any],
+    *,
+    new_snapshot: str,
+    changed_inputs: Optional[set[str]],
+    now: datetime,
+) -> StageReset:
+    """
+    Decide which stages of one job to reset for a new input snapshot.
+
+    With changed_inputs=None every stage is reset and the DAG is re-rooted.
+    Otherwise only the stages dag.invalidate() attributes to those inputs,
+    plus anything not yet completed, are reset (with their dependents);
+    completed stages outside that closure are carried forward onto the new
+    snapshot so their outputs stay valid prerequisites.
+
+    Args:
+        pre: The job's pre_enrichment sub-document
+        new_snapshot: Snapshot id the stages move to
+        changed_inputs: Input keys that changed, or None for a full reset
+        now: Timestamp recorded on reset stages
+
+    Returns:
+        StageReset with the new stage_states, the reset stages and the
+        frontier (reset stages whose prerequisites are all carried forward)
+    """
+    old_states = pre.get("stage_states") or {}
+    old_snapshot = pre.get("input_snapshot_id")
+    states = build_stage_states(new_snapshot)
+    if changed_inputs is None:
+        reset = set(states)
+        frontier = [ROOT_STAGE]
+    else:
+        unfinished = [
+            name
+            for name in states
+            if (old_states.get(name) or {}).get("status") != "completed"
+            or (old_states.get(name) or {}).get("input_snapshot_id") != old_snapshot
+        ]
+        closures = dag_closures()
+        reset_mask = closures.input_mask(changed_inputs) | closures.closure_mask(unfinished)
+        reset = (closures.stage_set(reset_mask) | set(unfinished)) & set(states)
+        frontier = [
+            name
+            for name in states
+            if name in reset and not reset.intersection(get_stage_definition(name).prerequisites)
+        ]
+
+    for stage_name in states:
+        old_state = old_states.get(stage_name) or {}
+        if stage_name not in reset:
+            states[stage_name] = {**old_state, "input_snapshot_id": new_snapshot}
+            continue
+        if old_state.get("output_ref") is not None:
+            states[stage_name]["output_ref"] = old_state["output_ref"]
+        states[stage_name]["last_error"] = {
+            "class": "snapshot_changed",
+            "message": "stage invalidated because the job snapshot changed",
+            "at": now,
+        }
+    return StageReset(
+        stage_states=states,
+        reset_stages=[name for name in states if name in reset],
+        frontier=frontier,
+    )
+
+
+def _fresh_snapshot(doc: dict[str, Any]) -> tuple[str, str, str, str]:
+    """Recompute (snapshot, jd checksum, company checksum, dag version) from a level-2 doc."""
+    pre = doc.get("pre_enrichment") or {}
+    dag_version = str(pre.get("dag_version") or DAG_VERSION)
+    new_jd_checksum = jd_checksum(doc.get("description", "") or doc.get("job_description", "") or "")
+    new_company_checksum = company_checksum(doc.get("company"), doc.get("company_domain"))
+    if dag_version == current_dag_version():
+        new_snapshot = current_input_snapshot_id(new_jd_checksum, new_company_checksum, dag_version=dag_version)
+    else:
+        new_snapshot = input_snapshot_id(new_jd_checksum, new_company_checksum, dag_version)
+    return new_snapshot, new_jd_checksum, new_company_checksum, dag_version
+
+
+def _partial_reset_supported(dag_version: str) -> bool:
+    """Partial resets rely on dag.py mirroring the stage registry, which holds for blueprint DAGs."""
+    return blueprint_enabled() and dag_version == current_dag_version()
+
+
+def _changed_inputs(pre: dict[str, Any], *, jd_cs: str, company_cs: str) -> set[str]:
+    changed: set[str] = set()
+    if pre.get("jd_checksum") != jd_cs:
+        changed.add("jd")
+    if pre.get("company_checksum") != company_cs:
+        changed.add("company")
+    if pre.get("taxonomy_version") != taxonomy_version():
+        changed.add("taxonomy")
+    return changed
+
+
+def _stage_work_item(
+    level2_id: ObjectId,
+    stage_name: str,
+    *,
+    snapshot_id: str,
+    jd_cs: Optional[str],
+    company_cs: Optional[str],
+    dag_version: str,
+    session_id: str,
+    now: datetime,
+    origin: Optional[str] = None,
+) -> dict[str, Any]:
+    """Build enqueue() kwargs for one stage of one job."""
+    definition = get_stage_definition(stage_name)
+    return {
+        "task_type": definition.task_type,
+        "lane": "preenrich",
+        "consumer_mode": "native_stage_dag",
+        "subject_type": "job",
+        "subject_id": str(level2_id),
+        "priority": definition.default_priority,
+        "available_at": now,
+        "max_attempts": definition.max_attempts,
+        "idempotency_key": idempotency_key(stage_name, str(level2_id), snapshot_id),
+        "correlation_id": session_id,
+        "origin": origin,
+        "payload": {
+            "stage_name": stage_name,
+            "input_snapshot_id": snapshot_id,
+            "jd_checksum": jd_cs,
+            "company_checksum": company_cs,
+            "dag_version": dag_version,
+            "schema_version": SCHEMA_VERSION,
+            "langfuse_session_id": session_id,
+        },
+    }
+
+
+def _enqueue_stage_items(queue: WorkItemQueue, items: list[dict[str, Any]], *, now: datetime) -> list[dict[str, Any]]:
+    """
+    Enqueue stage work items, reviving finished duplicates.
+
+    A snapshot that did not change (priors bumps) reuses idempotency keys,
+    so the previous done/cancelled item is revived rather than skipped.
+
+    Returns:
+        The stored work-item document for each item, in input order
+    """
+    documents: list[dict[str, Any]] = []
+    for item, result in zip(items, queue.enqueue_many(items, now=now)):
+        document = result.document
+        if not result.created and document.get("status") in _REVIVABLE_STATUSES:
+            document = queue.enqueue(**item, revive_statuses=_REVIVABLE_STATUSES, now=now).document
+        documents.append(document)
+    return documents
+
+
 def invalidate_snapshot_if_changed(
     db: Any,
     *,
     level2_id: ObjectId | str,
     now: Optional[datetime] = None,
 ) -> bool:
-    """Invalidate stale stage work when a DAG-owned job's snapshot has changed."""
+    """
+    Invalidate stale stage work when a DAG-owned job's snapshot has changed.
+
+    On blueprint DAGs only the stages that depend on the changed inputs
+    (jd, company, taxonomy) are reset; otherwise the DAG is re-rooted.
+    """
     current_time = now or utc_now()
     queue = WorkItemQueue(db)
     level2 = db["level-2"]
@@ -341,95 +583,69 @@ def invalidate_snapshot_if_changed(
     if doc.get("lifecycle") != "preenriching":
         return False
 
-    dag_version = str(pre.get("dag_version") or DAG_VERSION)
-    new_jd_checksum = jd_checksum(doc.get("description", "") or doc.get("job_description", "") or "")
-    new_company_checksum = company_checksum(doc.get("company"), doc.get("company_domain"))
-    if dag_version == current_dag_version():
-        new_snapshot = current_input_snapshot_id(new_jd_checksum, new_company_checksum, dag_version=dag_version)
-    else:
-        new_snapshot = input_snapshot_id(new_jd_checksum, new_company_checksum, dag_version)
+    new_snapshot, new_jd_checksum, new_company_checksum, dag_version = _fresh_snapshot(doc)
     if new_snapshot == pre.get("input_snapshot_id"):
         return False
 
-    session_id = ((doc.get("observability") or {}).get("langfuse_session_id")) or f"job:{doc['_id']}"
-    cancelled_states = build_stage_states(new_snapshot)
-    for stage_name, old_state in ((pre.get("stage_states") or {}).items()):
-        if stage_name not in cancelled_states:
-            continue
-        if old_state.get("output_ref") is not None:
-            cancelled_states[stage_name]["output_ref"] = old_state["output_ref"]
-        cancelled_states[stage_name]["last_error"] = {
-            "class": "snapshot_changed",
-            "message": "stage invalidated because the job snapshot changed",
-            "at": current_time,
-        }
+    changed_inputs: Optional[set[str]] = None
+    if _partial_reset_supported(dag_version):
+        changed_inputs = _changed_inputs(pre, jd_cs=new_jd_checksum, company_cs=new_company_checksum) or None
+    plan = plan_stage_reset(pre, new_snapshot=new_snapshot, changed_inputs=changed_inputs, now=current_time)
 
-    queue.collection.update_many(
+    session_id = ((doc.get("observability") or {}).get("langfuse_session_id")) or f"job:{doc['_id']}"
+    queue.cancel_matching(
         {
             "lane": "preenrich",
             "subject_id": str(doc["_id"]),
-            "status": {"$in": ["pending", "leased", "failed"]},
             "payload.input_snapshot_id": {"$ne": new_snapshot},
         },
-        {
-            "$set": {
-                "status": "cancelled",
-                "lease_owner": None,
-                "lease_expires_at": None,
-                "updated_at": current_time,
-                "last_error": {
-                    "class": "snapshot_changed",
-                    "message": "work item invalidated because the job snapshot changed",
-                    "at": current_time,
-                },
-            }
+        last_error={
+            "class": "snapshot_changed",
+            "message": "work item invalidated because the job snapshot changed",
+            "at": current_time,
         },
+        now=current_time,
     )
 
-    root_definition = get_stage_definition(ROOT_STAGE)
-    root_result = queue.enqueue(
-        task_type=root_definition.task_type,
-        lane="preenrich",
-        consumer_mode="native_stage_dag",
-        subject_type="job",
-        subject_id=str(doc["_id"]),
-        priority=root_definition.default_priority,
-        available_at=current_time,
-        max_attempts=root_definition.max_attempts,
-        idempotency_key=idempotency_key(ROOT_STAGE, str(doc["_id"]), new_snapshot),
-        correlation_id=session_id,
-        payload={
-            "stage_name": ROOT_STAGE,
-            "input_snapshot_id": new_snapshot,
-            "jd_checksum": new_jd_checksum,
-            "company_checksum": new_company_checksum,
-            "dag_version": dag_version,
-            "schema_version": SCHEMA_VERSION,
-            "langfuse_session_id": session_id,
-        },
-    )
-    cancelled_states[ROOT_STAGE]["work_item_id"] = root_result.document.get("_id")
+    items = [
+        _stage_work_item(
+            doc["_id"],
+            stage_name,
+            snapshot_id=new_snapshot,
+            jd_cs=new_jd_checksum,
+            company_cs=new_company_checksum,
+            dag_version=dag_version,
+            session_id=session_id,
+            now=current_time,
+            origin=pre.get("origin"),
+        )
+        for stage_name in plan.frontier
+    ]
+    for stage_name, document in zip(plan.frontier, _enqueue_stage_items(queue, items, now=current_time)):
+        plan.stage_states[stage_name]["work_item_id"] = document.get("_id")
 
-    level2.update_one(
-        {"_id": doc["_id"]},
-        {
-            "$set": {
-                "pre_enrichment.input_snapshot_id": new_snapshot,
-                "pre_enrichment.jd_checksum": new_jd_checksum,
-                "pre_enrichment.company_checksum": new_company_checksum,
-                "pre_enrichment.stage_states": cancelled_states,
-                "pre_enrichment.pending_next_stages": [],
-                "pre_enrichment.last_error": {
-                    "stage": ROOT_STAGE,
-                    "class": "snapshot_changed",
-                    "message": "job snapshot changed; DAG stages reset to the new snapshot",
-                    "at": current_time,
-                },
-                "pre_enrichment.snapshot_revalidated_at": current_time,
-                "updated_at": current_time,
-            }
+    set_doc: dict[str, Any] = {
+        "pre_enrichment.input_snapshot_id": new_snapshot,
+        "pre_enrichment.jd_checksum": new_jd_checksum,
+        "pre_enrichment.company_checksum": new_company_checksum,
+        "pre_enrichment.stage_states": plan.stage_states,
+        "pre_enrichment.pending_next_stages": [],
+        "pre_enrichment.last_error": {
+            "stage": ROOT_STAGE if changed_inputs is None else (plan.frontier or [ROOT_STAGE])[0],
+            "class": "snapshot_changed",
+            "message": (
+                "job snapshot changed; DAG stages reset to the new snapshot"
+                if changed_inputs is None
+                else f"job inputs changed ({', '.join(sorted(changed_inputs))}); dependent stages reset"
+            ),
+            "at": current_time,
         },
-    )
+        "pre_enrichment.snapshot_revalidated_at": current_time,
+        "updated_at": current_time,
+    }
+    if dag_version != DAG_VERSION:
+        set_doc["pre_enrichment.taxonomy_version"] = taxonomy_version()
+    level2.update_one({"_id": doc["_id"]}, {"$set": set_doc})
     run_id = _sweeper_run_id("snapshot_invalidation")
     emit_preenrich_sweeper_event(
         name="scout.preenrich.snapshot_invalidation",
@@ -450,7 +666,9 @@ def invalidate_snapshot_if_changed(
                 "new_company_checksum": new_company_checksum,
                 "dag_version": dag_version,
                 "reason": "snapshot_changed",
-                "rerooted": True,
+                "rerooted": changed_inputs is None,
+                "changed_inputs": sorted(changed_inputs or ()),
+                "reset_stages": plan.reset_stages,
             },
         ),
         run_id=run_id,
@@ -458,6 +676,187 @@ def invalidate_snapshot_if_changed(
     return True
 
 
+def invalidate_input_version(
+    db: Any,
+    input_key: str,
+    *,
+    version: Optional[str] = None,
+    now: Optional[datetime] = None,
+    limit: int = 500,
+) -> dict[str, int]:
+    """
+    Reset only the stages that depend on a bumped versioned input, across jobs.
+
+    Jobs still on another version are found through the indexed
+    pre_enrichment.<input>_version field, each is planned with
+    plan_stage_reset(), and all of them are written in one guarded level-2
+    bulk update. Only jobs whose update matched then have their stale work
+    cancelled and their frontier enqueued, so a job whose snapshot moved
+    concurrently is left to whoever moved it. Taxonomy takes part in the
+    snapshot id, so affected jobs move to a new snapshot; priors do not, so
+    their stages are reset in place and their finished work items revived.
+    Re-enqueued stages are tagged as backfill so fair-share claims keep
+    interactive work moving.
+
+    Args:
+        db: Mongo database
+        input_key: "taxonomy" or "priors"
+        version: New version; defaults to the taxonomy file's version and
+            is required for priors
+        now: Override for the current time
+        limit: Max jobs handled per call
+
+    Returns:
+        Counts of matched, invalidated and enqueued items
+    """
+    if input_key not in VERSIONED_INPUTS:
+        raise ValueError(f"Unknown versioned input '{input_key}'; expected one of {VERSIONED_INPUTS}")
+    if input_key == "taxonomy":
+        if version is not None and str(version) != taxonomy_version():
+            raise ValueError("taxonomy version must match the loaded taxonomy file")
+        version = taxonomy_version()
+    elif version is None:
+        raise ValueError("priors version must be given explicitly")
+    version = str(version)
+
+    current_time = now or utc_now()
+    stats = {"matched": 0, "invalidated": 0, "enqueued": 0}
+    dag_version = current_dag_version()
+    if not _partial_reset_supported(dag_version) or not dag_closures().input_mask({input_key}):
+        return stats
+
+    level2 = db["level-2"]
+    queue = WorkItemQueue(db)
+    version_field = f"pre_enrichment.{input_key}_version"
+    docs = list(
+        level2.find(
+            {
+                "lifecycle": "preenriching",
+                "pre_enrichment.orchestration": "dag",
+                "pre_enrichment.dag_version": dag_version,
+                version_field: {"$ne": version},
+            },
+            {
+                "job_id": 1,
+                "observability.langfuse_session_id": 1,
+                "pre_enrichment.stage_states": 1,
+                "pre_enrichment.input_snapshot_id": 1,
+                "pre_enrichment.jd_checksum": 1,
+                "pre_enrichment.company_checksum": 1,
+            },
+        )
+        .sort("_id", ASCENDING)
+        .limit(limit)
+    )
+    stats["matched"] = len(docs)
+    if not docs:
+        return stats
+
+    # Marks this call's writes so only jobs whose guarded update matched get work
+    run_id = _sweeper_run_id(f"{input_key}_version_invalidation")
+    updates: list[UpdateOne] = []
+    pending: dict[ObjectId, tuple[list[dict[str, Any]], list[dict[str, Any]], list[str]]] = {}
+    for doc in docs:
+        pre = doc.get("pre_enrichment") or {}
+        old_snapshot = pre.get("input_snapshot_id")
+        jd_cs = pre.get("jd_checksum")
+        company_cs = pre.get("company_checksum")
+        if input_key == "taxonomy":
+            new_snapshot = current_input_snapshot_id(jd_cs or "", company_cs or "", dag_version=dag_version)
+        else:
+            new_snapshot = old_snapshot
+        plan = plan_stage_reset(pre, new_snapshot=new_snapshot, changed_inputs={input_key}, now=current_time)
+        subject_id = str(doc["_id"])
+        session_id = ((doc.get("observability") or {}).get("langfuse_session_id")) or f"job:{subject_id}"
+
+        cancel_clauses = [
+            {
+                "subject_id": subject_id,
+                "task_type": {"$in": [get_stage_definition(name).task_type for name in plan.reset_stages]},
+            }
+        ]
+        if new_snapshot != old_snapshot:
+            cancel_clauses.append({"subject_id": subject_id, "payload.input_snapshot_id": {"$ne": new_snapshot}})
+        items = [
+            _stage_work_item(
+                doc["_id"],
+                stage_name,
+                snapshot_id=new_snapshot,
+                jd_cs=jd_cs,
+                company_cs=company_cs,
+                dag_version=dag_version,
+                session_id=session_id,
+                now=current_time,
+                origin="backfill",
+            )
+            for stage_name in plan.frontier
+        ]
+        pending[doc["_id"]] = (cancel_clauses, items, plan.frontier)
+        # Guarded against a concurrent snapshot move
+        updates.append(
+            UpdateOne(
+                {"_id": doc["_id"], "pre_enrichment.input_snapshot_id": old_snapshot, version_field: {"$ne": version}},
+                {
+                    "$set": {
+                        "pre_enrichment.input_snapshot_id": new_snapshot,
+                        "pre_enrichment.stage_states": plan.stage_states,
+                        "pre_enrichment.pending_next_stages": [],
+                        version_field: version,
+                        "pre_enrichment.last_error": {
+                            "stage": (plan.frontier or [ROOT_STAGE])[0],
+                            "class": "snapshot_changed",
+                            "message": f"{input_key} version changed to {version}; dependent stages reset",
+                            "at": current_time,
+                            "run_id": run_id,
+                        },
+                        "updated_at": current_time,
+                    }
+                },
+            )
+        )
+
+    # Reset first: a job that moved on concurrently keeps its work items
+    stats["invalidated"] = level2.bulk_write(updates, ordered=False).modified_count
+    reset_ids = [
+        doc["_id"]
+        for doc in level2.find({"_id": {"$in": list(pending)}, "pre_enrichment.last_error.run_id": run_id}, {"_id": 1})
+    ]
+    if not reset_ids:
+        return stats
+
+    queue.cancel_matching(
+        {"lane": "preenrich", "$or": [clause for job_id in reset_ids for clause in pending[job_id][0]]},
+        last_error={
+            "class": "snapshot_changed",
+            "message": f"work item invalidated because the {input_key} version changed",
+            "at": current_time,
+        },
+        now=current_time,
+    )
+    items = [item for job_id in reset_ids for item in pending[job_id][1]]
+    documents = iter(_enqueue_stage_items(queue, items, now=current_time))
+    links: list[UpdateOne] = []
+    for job_id in reset_ids:
+        work_item_ids = {
+            f"pre_enrichment.stage_states.{stage_name}.work_item_id": next(documents).get("_id")
+            for stage_name in pending[job_id][2]
+        }
+        if work_item_ids:
+            links.append(UpdateOne({"_id": job_id, "pre_enrichment.last_error.run_id": run_id}, {"$set": work_item_ids}))
+    if links:
+        level2.bulk_write(links, ordered=False)
+    stats["enqueued"] = len(items)
+    logger.info(
+        "preenrich %s version=%s invalidated %d/%d jobs, enqueued %d stage items",
+        input_key,
+        version,
+        stats["invalidated"],
+        stats["matched"],
+        stats["enqueued"],
+    )
+    return stats
+
+
 def retry_delay_seconds(attempt_count: int) -> int:
     """Return the configured retry backoff for a stage attempt count."""
     index = max(0, min(attempt_count - 1, len(RETRY_BACKOFF_SECONDS) - 1))
@@ -501,24 +900,110 @@ def finalize_cv_ready_scan(db: Any, *, now: Optional[datetime] = None, limit: in
 
 
 def snapshot_invalidator_scan(db: Any, *, now: Optional[datetime] = None, limit: int = 100) -> dict[str, int]:
-    """Scan DAG-owned preenriching jobs and invalidate any changed snapshots."""
+    """
+    Scan DAG-owned preenriching jobs and invalidate any changed snapshots.
+
+    Taxonomy bumps are handled first in bulk. The per-job pass then reads
+    only the jobs whose last revalidation fell outside the window (oldest
+    first, projected to the snapshot inputs) and stamps the unchanged ones
+    in a single update so the next scan moves on to other jobs.
+    """
     current_time = now or utc_now()
     level2 = db["level-2"]
     revalidate_window_seconds = int(os.getenv("PREENRICH_SNAPSHOT_REVALIDATE_WINDOW_SECONDS", "120"))
-    stats = {"invalidated": 0}
-    cursor = level2.find(
-        {
-            "lifecycle": "preenriching",
-            "pre_enrichment.orchestration": "dag",
-        }
-    ).limit(limit)
+    stats = {"invalidated": 0, "revalidated": 0, "taxonomy_invalidated": 0}
+    if blueprint_enabled():
+        stats["taxonomy_invalidated"] = invalidate_input_version(db, "taxonomy", now=current_time, limit=limit)["invalidated"]
+
+    cutoff = current_time - timedelta(seconds=revalidate_window_seconds)
+    cursor = (
+        level2.find(
+            {
+                "lifecycle": "preenriching",
+                "pre_enrichment.orchestration": "dag",
+                "$or": [
+                    {"pre_enrichment.snapshot_revalidated_at": None},
+                    {"pre_enrichment.snapshot_revalidated_at": {"$lt": cutoff}},
+                ],
+            },
+            _SNAPSHOT_PROJECTION,
+        )
+        .sort("pre_enrichment.snapshot_revalidated_at", ASCENDING)
+        .limit(limit)
+    )
+    unchanged: list[ObjectId] = []
     for doc in cursor:
-        last_checked = ((doc.get("pre_enrichment") or {}).get("snapshot_revalidated_at"))
-        if isinstance(last_checked, datetime):
-            if (current_time - _ensure_utc(last_checked)).total_seconds() < revalidate_window_seconds:
-                continue
-        if invalidate_snapshot_if_changed(db, level2_id=doc["_id"], now=current_time):
+        if _fresh_snapshot(doc)[0] == (doc.get("pre_enrichment") or {}).get("input_snapshot_id"):
+            unchanged.append(doc["_id"])
+        elif invalidate_snapshot_if_changed(db, level2_id=doc["_id"], now=current_time):
             stats["invalidated"] += 1
+    if unchanged:
+        level2.update_many(
+            {"_id": {"$in": unchanged}},
+            {"$set": {"pre_enrichment.snapshot_revalidated_at": current_time}},
+        )
+        stats["revalidated"] = len(unchanged)
+    return stats
+
+
+def watch_dag_changes(
+    db: Any,
+    *,
+    stop_event: Optional[threading.Event] = None,
+    notifier: Optional[ChangeNotifier] = None,
+    limit: int = 100,
+    scan_interval_seconds: Optional[float] = None,
+    max_cycles: Optional[int] = None,
+) -> dict[str, int]:
+    """
+    Event-driven next-stage and cv_ready sweeper.
+
+    Reacts to level-2 change events on preenriching DAG jobs by draining that
+    job's stage outbox and attempting cv_ready finalization immediately. The
+    periodic full scans still run every scan interval as a safety net; without
+    change streams (standalone, mongomock) they are the only trigger.
+
+    Lease expiry and snapshot invalidation stay on their timers: they are
+    driven by the clock, not by writes.
+
+    Args:
+        db: PyMongo database handle
+        stop_event: Set to stop the loop
+        notifier: Override the notifier (defaults to open_notifier on level-2)
+        limit: Max jobs per full scan
+        scan_interval_seconds: Full-scan interval (default PREENRICH_POLL_SECONDS)
+        max_cycles: Stop after this many wait cycles (tests)
+
+    Returns:
+        Dict with events, entries, finalized and scans counts
+    """
+    stop_event = stop_event or threading.Event()
+    interval = poll_seconds() if scan_interval_seconds is None else scan_interval_seconds
+    notifier = notifier or open_notifier(db["level-2"], level2_dag_pipeline(), stop_event=stop_event)
+    stats = {"events": 0, "entries": 0, "finalized": 0, "scans": 0}
+    last_scan = float("-inf")
+    cycles = 0
+    try:
+        while not stop_event.is_set():
+            if time.monotonic() - last_scan >= interval:
+                stats["entries"] += drain_pending_next_stages(db, limit=limit)["entries"]
+                stats["finalized"] += finalize_cv_ready_scan(db, limit=limit)["finalized"]
+                stats["scans"] += 1
+                last_scan = time.monotonic()
+
+            events = notifier.wait(interval)
+            stats["events"] += len(events)
+            level2_ids = list(dict.fromkeys(event["documentKey"]["_id"] for event in events))
+            for level2_id in level2_ids:
+                stats["entries"] += drain_pending_next_stages(db, level2_id=level2_id, limit=1)["entries"]
+                if finalize_cv_ready(db, level2_id=level2_id):
+                    stats["finalized"] += 1
+
+            cycles += 1
+            if max_cycles is not None and cycles >= max_cycles:
+                break
+    finally:
+        notifier.close()
     return stats
 
 
@@ -541,10 +1026,12 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Iteration-4 preenrich sweeper entrypoint")
     parser.add_argument(
         "command",
-        choices=("next-stage", "stage", "cv-ready", "snapshot"),
+        choices=("next-stage", "stage", "cv-ready", "snapshot", "watch", "input-version"),
         help="Which sweeper to run",
     )
     parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--input", choices=VERSIONED_INPUTS, default="taxonomy", help="input-version: bumped input")
+    parser.add_argument("--version", default=None, help="input-version: new version (required for priors)")
     args = parser.parse_args()
 
     logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
@@ -553,8 +1040,12 @@ def main() -> None:
         stats = drain_pending_next_stages(db, limit=args.limit)
     elif args.command == "stage":
         stats = release_expired_stage_leases(db, limit=args.limit)
+    elif args.command == "watch":
+        stats = watch_dag_changes(db, limit=args.limit)
     elif args.command == "cv-ready":
         stats = finalize_cv_ready_scan(db, limit=args.limit)
+    elif args.command == "input-version":
+        stats = invalidate_input_version(db, args.input, version=args.version, limit=args.limit)
     else:
         stats = snapshot_invalidator_scan(db, limit=args.limit)
     logger.info("preenrich sweeper command=%s stats=%s", args.command, stats)
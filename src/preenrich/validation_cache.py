@@ -0,0 +1,139 @@
+"""
+Validated-artifact cache for blueprint Pydantic models.
+
+Blueprint artifacts carry hundreds of field/model validators, and stages
+such as presentation_contract re-validate the same payload several times
+within one job (normalise, cap, repair, re-check), while the stage
+dispatcher hands the same upstream artifacts to every downstream stage.
+validate_artifact() memoises model_validate per
+(model, artifact id, schema version, content hash, context).
+
+Hits are served by unpickling the stored validated instance. That is
+2-4x cheaper than re-validating a large artifact and, unlike returning a
+shared instance, leaves callers free to mutate what they get back.
+Payloads that cannot be pickled are validated uncached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from src.preenrich.blueprint_config import validation_cache_enabled, validation_cache_size
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def content_hash(payload: Any, context: Optional[dict[str, Any]] = None) -> Optional[str]:
+    """
+    Digest of a payload and its validation context.
+
+    Pickle is used instead of canonical JSON because it is several times
+    faster; equal content serialised with a different key order simply
+    misses the cache.
+
+    Returns:
+        Hex digest, or None when the payload cannot be pickled
+    """
+    try:
+        encoded = pickle.dumps((payload, context), protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return None
+    return hashlib.blake2b(encoded, digest_size=20).hexdigest()
+
+
+class ValidatedArtifactCache:
+    """Thread-safe LRU of pickled validated models."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[Any, ...], bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[Any, ...]) -> Optional[bytes]:
+        with self._lock:
+            blob = self._entries.get(key)
+            if blob is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return blob
+
+    def put(self, key: tuple[Any, ...], blob: bytes) -> None:
+        with self._lock:
+            self._entries[key] = blob
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_validation_cache: Optional[ValidatedArtifactCache] = None
+
+
+def get_validation_cache() -> ValidatedArtifactCache:
+    """Get the process-wide validated-artifact cache (singleton)."""
+    global _validation_cache
+    if _validation_cache is None:
+        _validation_cache = ValidatedArtifactCache(validation_cache_size())
+    return _validation_cache
+
+
+def reset_validation_cache() -> None:
+    """Reset the cache singleton (tests, config changes)."""
+    global _validation_cache
+    _validation_cache = None
+
+
+def validate_artifact(
+    model_cls: type[ModelT],
+    payload: Any,
+    *,
+    context: Optional[dict[str, Any]] = None,
+    artifact_id: Optional[str] = None,
+    schema_version: Optional[str] = None,
+) -> ModelT:
+    """
+    model_validate with a memoised result.
+
+    Validation errors are never cached; the call raises exactly like
+    model_validate. Disabled via PREENRICH_VALIDATION_CACHE_ENABLED=false.
+
+    Args:
+        model_cls: Pydantic model to validate into
+        payload: Raw payload
+        context: Validation context; part of the cache key
+        artifact_id: Stored artifact id, when the payload has one
+        schema_version: Artifact schema/prompt version
+
+    Returns:
+        A fresh model instance owned by the caller
+    """
+    if not validation_cache_enabled() or isinstance(payload, BaseModel):
+        return model_cls.model_validate(payload, context=context)
+    digest = content_hash(payload, context)
+    if digest is None:
+        return model_cls.model_validate(payload, context=context)
+
+    cache = get_validation_cache()
+    key = (f"{model_cls.__module__}.{model_cls.__qualname__}", artifact_id, schema_version, digest)
+    blob = cache.get(key)
+    if blob is not None:
+        return pickle.loads(blob)
+
+    validated = model_cls.model_validate(payload, context=context)
+    try:
+        cache.put(key, pickle.dumps(validated, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        pass  # e.g. an Any field holding an unpicklable object; just don't cache
+    return validated
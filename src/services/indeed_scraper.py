@@ -25,6 +25,12 @@ import requests
 from bs4 import BeautifulSoup
 
 from src.common.dedupe import generate_dedupe_key as _unified_dedupe_key
+from src.common.search_prefixes import SEARCH_PREFIX_FIELD, search_prefixes
+from src.services.job_html_fastpath import (
+    collapse_description_lines,
+    fast_parse_enabled,
+    parse_indeed_fields,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -264,6 +270,17 @@ def _parse_indeed_html(job_key: str, url: str, html: str) -> IndeedJobData:
     Raises:
         ParseError: If required fields cannot be extracted
     """
+    # lxml fast path; BeautifulSoup handles anything it declines
+    fields = parse_indeed_fields(html) if fast_parse_enabled() else None
+    if fields is not None:
+        return IndeedJobData(
+            job_key=job_key,
+            job_url=url,
+            scraped_at=datetime.utcnow(),
+            raw_html=html[:5000],
+            **fields,
+        )
+
     soup = BeautifulSoup(html, "html.parser")
 
     # Extract title
@@ -456,21 +473,7 @@ def _clean_description(elem) -> str:
     text = elem.get_text()
 
     # Clean up excessive whitespace while preserving paragraph breaks
-    lines = text.split("\n")
-    cleaned_lines = []
-    prev_empty = False
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            if not prev_empty:
-                cleaned_lines.append("")
-                prev_empty = True
-        else:
-            cleaned_lines.append(line)
-            prev_empty = False
-
-    return "\n".join(cleaned_lines).strip()
+    return collapse_description_lines(text)
 
 
 def _generate_dedupe_key(
@@ -523,7 +526,7 @@ def indeed_job_to_mongodb_doc(job_data: IndeedJobData) -> Dict[str, Any]:
         job_key=job_data.job_key,  # Use Indeed's unique ID for robust deduplication
     )
 
-    return {
+    document = {
         "jobId": job_data.job_key,  # Use Indeed job key
         "title": job_data.title,
         "company": job_data.company,
@@ -546,3 +549,5 @@ def indeed_job_to_mongodb_doc(job_data: IndeedJobData) -> Dict[str, Any]:
             "scrape_method": job_data.scrape_method,
         }
     }
+    document[SEARCH_PREFIX_FIELD] = search_prefixes(document)
+    return document
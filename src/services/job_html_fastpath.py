@@ -0,0 +1,443 @@
+"""
+lxml fast path for LinkedIn and Indeed job-page parsing.
+
+The BeautifulSoup parsers in linkedin_scraper and indeed_scraper build a
+Python-level html.parser tree and run a dozen regex-class find() passes per
+page. This module extracts the same fields from a libxml2 tree with
+precompiled XPath, mirroring each BeautifulSoup lookup (same selectors, same
+fallback order, same get_text semantics) so the resulting LinkedInJobData /
+IndeedJobData are identical.
+
+libxml2 and html.parser build different trees from malformed markup (lxml
+repairs mismatched tags and implicitly closes <p>/<li>, html.parser nests
+them), and description text depends on that structure. The fast path
+therefore returns None, and the caller falls back to BeautifulSoup, when:
+
+- libxml2 reports a tag mismatch it had to repair
+- <p> or <li> open/close tag counts differ (implicit closes)
+- a required field (title, company, description) is missing
+
+Set SCRAPER_FAST_PARSE_ENABLED=false to always use BeautifulSoup.
+"""
+
+import os
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import lxml.html
+from lxml import etree
+
+# Text inside these is not part of BeautifulSoup's get_text().
+_NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+_TAG_REPAIR_ERROR = "ERR_TAG_NAME_MISMATCH"
+_IMPLICIT_CLOSE_TAGS = (
+    (re.compile(r"<p[\s>/]", re.IGNORECASE), re.compile(r"</p\s*>", re.IGNORECASE)),
+    (re.compile(r"<li[\s>/]", re.IGNORECASE), re.compile(r"</li\s*>", re.IGNORECASE)),
+)
+_WORK_MODE_SUFFIX = re.compile(r"\((Remote|Hybrid|On-site)\)\s*$", re.IGNORECASE)
+_LOCATION_WORK_MODE = re.compile(r"\s*\((Remote|Hybrid|On-site)\)\s*$", re.IGNORECASE)
+_INDEED_LOCATION_SPLIT = re.compile(r"[•·|]")
+INDEED_JOB_TYPES = ["Full-time", "Part-time", "Contract", "Temporary", "Internship", "Remote"]
+
+
+def _xpath(expression: str) -> etree.XPath:
+    return etree.XPath(expression)
+
+
+def _has_class(fragment: str) -> str:
+    return f"contains(@class, '{fragment}')"
+
+
+# LinkedIn selectors, in the order linkedin_scraper tries them.
+_LI_TITLE = [
+    _xpath(f"(//h1[{_has_class('top-card-layout__title')}])[1]"),
+    _xpath(f"(//h2[{_has_class('title')}])[1]"),
+    _xpath("(//h1)[1]"),
+]
+_LI_COMPANY_LINK = _xpath(f"(//a[{_has_class('topcard__org-name-link')}])[1]")
+_LI_COMPANY_FLAVOR = _xpath(f"(//span[{_has_class('topcard__flavor')}])[1]")
+_LI_SUBTITLE = _xpath(f"(//*[{_has_class('subtitle')}])[1]")
+_LI_LOCATION_BULLET = _xpath(f"(//span[{_has_class('topcard__flavor--bullet')}])[1]")
+_LI_LOCATION_ANY = _xpath(f"//*[{_has_class('location')}]")
+_LI_DESCRIPTION_DIV = _xpath(f"(//div[{_has_class('description')}])[1]")
+_LI_SHOW_MORE = _xpath(f"(.//div[{_has_class('show-more')}])[1]")
+_LI_DESCRIPTION_SECTION = _xpath(f"(//section[{_has_class('description')}])[1]")
+_LI_CRITERIA_LIST = _xpath(f"(//ul[{_has_class('job-criteria')}])[1]")
+_LI_CRITERIA_ITEMS = _xpath(f".//li[{_has_class('job-criteria__item')}]")
+_LI_CRITERIA_HEADER = _xpath(f"(.//*[{_has_class('job-criteria__subheader')}])[1]")
+_LI_CRITERIA_TEXT = _xpath(f"(.//*[{_has_class('job-criteria__text')}])[1]")
+
+# Indeed selectors, in the order indeed_scraper tries them.
+_IN_TITLE_CLASS = _xpath(f"(//*[{_has_class('jobsearch-JobInfoHeader-title')}])[1]")
+_IN_TITLE_TESTID = _xpath("(//*[@data-testid='jobsearch-JobInfoHeader-title'])[1]")
+_IN_H1 = _xpath("(//h1)[1]")
+_IN_COMPANY_TESTID = _xpath("(//*[@data-testid='inlineHeader-companyName'])[1]")
+_IN_FIRST_LINK = _xpath("(.//a)[1]")
+_IN_COMPANY_CLASSES = [
+    _xpath(f"(//*[{_has_class(pattern)}])[1]")
+    for pattern in ("companyName", "css-1h7lukg", "css-1saizt3", "icl-u-lg-mr--sm")
+]
+_IN_COMPANY_LINK = _xpath("(//a[@data-tn-element='companyName'])[1]")
+_IN_LOCATION_TESTID = _xpath("(//*[@data-testid='inlineHeader-companyLocation'])[1]")
+_IN_LOCATION_CLASS = _xpath(f"(//*[{_has_class('companyLocation')}])[1]")
+_IN_LOCATION_SUBTITLE = _xpath(
+    f"(//*[{_has_class('css-1rldrqf')} or {_has_class('jobsearch-JobInfoHeader-subtitle')}])[1]"
+)
+_IN_DESCRIPTION = [
+    _xpath("(//*[@id='jobDescriptionText'])[1]"),
+    _xpath(f"(//*[{_has_class('jobsearch-jobDescriptionText')}])[1]"),
+    _xpath(f"(//*[{_has_class('description')}])[1]"),
+]
+_IN_SALARY_CLASS = _xpath(
+    f"(//*[{_has_class('salary-snippet')} or {_has_class('attribute_snippet')} or {_has_class('metadata')}])[1]"
+)
+_IN_SALARY_TESTID = _xpath("(//*[contains(@data-testid, 'salary') or contains(@data-testid, 'compensation')])[1]")
+_IN_METADATA = _xpath(f"(//*[{_has_class('jobsearch-JobMetadataHeader')} or {_has_class('metadata')}])[1]")
+_IN_ATTRIBUTES = _xpath(f"//*[{_has_class('attribute')} or {_has_class('tag')} or {_has_class('badge')}]")
+
+
+def fast_parse_enabled() -> bool:
+    """Whether the lxml fast path is tried first (SCRAPER_FAST_PARSE_ENABLED, default true)."""
+    return os.getenv("SCRAPER_FAST_PARSE_ENABLED", "true").strip().lower() == "true"
+
+
+# ------------------------------------------------------------------
+# Shared helpers (also used by the BeautifulSoup parsers)
+# ------------------------------------------------------------------
+
+
+def collapse_description_lines(text: str) -> str:
+    """Strip each line and collapse runs of blank lines to one."""
+    cleaned_lines = []
+    prev_empty = False
+    for line in text.split("\n"):
+        line = line.strip()
+        if not line:
+            if not prev_empty:
+                cleaned_lines.append("")
+                prev_empty = True
+        else:
+            cleaned_lines.append(line)
+            prev_empty = False
+    return "\n".join(cleaned_lines).strip()
+
+
+def strip_work_mode(raw: str) -> str:
+    """Drop a trailing "(Remote)"/"(Hybrid)"/"(On-site)" from a location."""
+    return _LOCATION_WORK_MODE.sub("", raw).strip() or raw
+
+
+def work_mode_suffix(text: str) -> Optional[str]:
+    """The work mode in a trailing parenthetical, capitalised, if any."""
+    match = _WORK_MODE_SUFFIX.search(text)
+    return match.group(1).capitalize() if match else None
+
+
+def criteria_from_pairs(pairs: List[Tuple[str, str]]) -> Dict[str, Any]:
+    """Map LinkedIn (lowercased header, value) criteria pairs onto job fields."""
+    criteria: Dict[str, Any] = {}
+    for header_text, value in pairs:
+        if "seniority" in header_text:
+            criteria["seniority_level"] = value
+        elif "employment" in header_text or "type" in header_text:
+            criteria["employment_type"] = value
+        elif "function" in header_text:
+            criteria["job_function"] = value
+        elif "industr" in header_text:
+            criteria["industries"] = [v.strip() for v in value.split(",")]
+    return criteria
+
+
+def indeed_job_type_in(text: str) -> Optional[str]:
+    """First known Indeed job type mentioned in text."""
+    lowered = text.lower()
+    for jtype in INDEED_JOB_TYPES:
+        if jtype.lower() in lowered:
+            return jtype
+    return None
+
+
+# ------------------------------------------------------------------
+# lxml primitives
+# ------------------------------------------------------------------
+
+
+def _document(html: str) -> Optional[etree._Element]:
+    """Parse with libxml2; None when the tree may differ from html.parser's."""
+    for opened, closed in _IMPLICIT_CLOSE_TAGS:
+        if len(opened.findall(html)) != len(closed.findall(html)):
+            return None
+    parser = lxml.html.HTMLParser()
+    try:
+        root = lxml.html.document_fromstring(html, parser=parser)
+    except (etree.ParserError, ValueError):
+        return None
+    if any(error.type_name == _TAG_REPAIR_ERROR for error in parser.error_log):
+        return None
+    return root
+
+
+def _first(xpath: etree.XPath, node: etree._Element) -> Optional[etree._Element]:
+    found = xpath(node)
+    return found[0] if found else None
+
+
+def _strings(node: etree._Element) -> Iterator[str]:
+    tag = node.tag
+    if not isinstance(tag, str) or tag in _NON_TEXT_TAGS:
+        return
+    if node.text:
+        yield node.text
+    for child in node:
+        yield from _strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def _text(node: etree._Element) -> str:
+    """BeautifulSoup get_text(strip=True)."""
+    return "".join(piece.strip() for piece in _strings(node) if piece.strip())
+
+
+def _description_strings(node: etree._Element, *, root: bool) -> Iterator[str]:
+    tag = node.tag
+    if not isinstance(tag, str) or tag in _NON_TEXT_TAGS:
+        return
+    if not root and tag == "br":
+        yield "\n"
+        return
+    bullet = not root and tag == "li"
+    if bullet:
+        yield "• "
+    if node.text:
+        yield node.text
+    for child in node:
+        yield from _description_strings(child, root=False)
+        if child.tail:
+            yield child.tail
+    if bullet:
+        yield "\n"
+    if not root and tag == "p":
+        yield "\n\n"
+
+
+def _clean_description(node: etree._Element) -> str:
+    """Mirror of the scrapers' _clean_description: br/li/p markers, then line cleanup."""
+    return collapse_description_lines("".join(_description_strings(node, root=True)))
+
+
+# ------------------------------------------------------------------
+# LinkedIn
+# ------------------------------------------------------------------
+
+
+def _linkedin_title(root: etree._Element) -> Optional[str]:
+    for xpath in _LI_TITLE:
+        elem = _first(xpath, root)
+        if elem is not None:
+            return _text(elem)
+    return None
+
+
+def _linkedin_company(root: etree._Element) -> Optional[str]:
+    for xpath in (_LI_COMPANY_LINK, _LI_COMPANY_FLAVOR):
+        elem = _first(xpath, root)
+        if elem is not None:
+            return _text(elem)
+    subtitle = _first(_LI_SUBTITLE, root)
+    if subtitle is not None:
+        text = _text(subtitle)
+        return text.split("·")[0].strip() if "·" in text else text
+    return None
+
+
+def _linkedin_location_and_mode(root: etree._Element) -> Tuple[Optional[str], Optional[str], List[str]]:
+    bullet = _first(_LI_LOCATION_BULLET, root)
+    bullet_text = _text(bullet) if bullet is not None else None
+    location_texts = [_text(elem) for elem in _LI_LOCATION_ANY(root)]
+    raw = bullet_text or next((text for text in location_texts if text), None)
+    return (strip_work_mode(raw) if raw else None), bullet_text, location_texts
+
+
+def _linkedin_criteria_pairs(root: etree._Element) -> List[Tuple[str, str, bool]]:
+    """(header, value, has_value) per criteria item, in document order."""
+    criteria_list = _first(_LI_CRITERIA_LIST, root)
+    if criteria_list is None:
+        return []
+    pairs = []
+    for item in _LI_CRITERIA_ITEMS(criteria_list):
+        header = _first(_LI_CRITERIA_HEADER, item)
+        if header is None:
+            continue
+        value = _first(_LI_CRITERIA_TEXT, item)
+        pairs.append((_text(header).lower(), _text(value) if value is not None else "", value is not None))
+    return pairs
+
+
+def _linkedin_work_mode(bullet_text: Optional[str], location_texts: List[str], pairs) -> Optional[str]:
+    if bullet_text is not None:
+        mode = work_mode_suffix(bullet_text)
+        if mode:
+            return mode
+    for text in location_texts:
+        mode = work_mode_suffix(text)
+        if mode:
+            return mode
+    for header_text, value, has_value in pairs:
+        if "workplace" in header_text or "work type" in header_text or "work mode" in header_text:
+            if has_value:
+                return value
+    return None
+
+
+def _linkedin_description(root: etree._Element) -> Optional[str]:
+    desc = _first(_LI_DESCRIPTION_DIV, root)
+    if desc is not None:
+        content = _first(_LI_SHOW_MORE, desc)
+        return _clean_description(content if content is not None else desc)
+    section = _first(_LI_DESCRIPTION_SECTION, root)
+    if section is not None:
+        return _clean_description(section)
+    return None
+
+
+def parse_linkedin_fields(html: str) -> Optional[Dict[str, Any]]:
+    """
+    Extract LinkedInJobData fields from a LinkedIn guest job page.
+
+    Args:
+        html: Raw HTML
+
+    Returns:
+        title, company, location, description, seniority_level,
+        employment_type, job_function, industries and work_mode, or None
+        when the BeautifulSoup parser should handle the page
+    """
+    root = _document(html)
+    if root is None:
+        return None
+    title = _linkedin_title(root)
+    company = _linkedin_company(root) if title else None
+    description = _linkedin_description(root) if company else None
+    if not description:
+        return None
+    location, bullet_text, location_texts = _linkedin_location_and_mode(root)
+    pairs = _linkedin_criteria_pairs(root)
+    criteria = criteria_from_pairs([(header, value) for header, value, has_value in pairs if has_value])
+    return {
+        "title": title,
+        "company": company,
+        "location": location or "Location not specified",
+        "description": description,
+        "seniority_level": criteria.get("seniority_level"),
+        "employment_type": criteria.get("employment_type"),
+        "job_function": criteria.get("job_function"),
+        "industries": criteria.get("industries"),
+        "work_mode": _linkedin_work_mode(bullet_text, location_texts, pairs),
+    }
+
+
+# ------------------------------------------------------------------
+# Indeed
+# ------------------------------------------------------------------
+
+
+def _indeed_title(root: etree._Element) -> Optional[str]:
+    for xpath in (_IN_TITLE_CLASS, _IN_TITLE_TESTID):
+        elem = _first(xpath, root)
+        if elem is not None:
+            return _text(elem)
+    h1 = _first(_IN_H1, root)
+    if h1 is not None:
+        text = _text(h1)
+        if text and len(text) > 3 and "indeed" not in text.lower():
+            return text
+    return None
+
+
+def _indeed_company(root: etree._Element) -> Optional[str]:
+    elem = _first(_IN_COMPANY_TESTID, root)
+    if elem is not None:
+        link = _first(_IN_FIRST_LINK, elem)
+        return _text(link if link is not None else elem)
+    for xpath in _IN_COMPANY_CLASSES:
+        elem = _first(xpath, root)
+        if elem is not None:
+            text = _text(elem)
+            if text and len(text) > 1:
+                return text
+    link = _first(_IN_COMPANY_LINK, root)
+    return _text(link) if link is not None else None
+
+
+def _indeed_location(root: etree._Element) -> Optional[str]:
+    for xpath in (_IN_LOCATION_TESTID, _IN_LOCATION_CLASS):
+        elem = _first(xpath, root)
+        if elem is not None:
+            return _text(elem)
+    elem = _first(_IN_LOCATION_SUBTITLE, root)
+    if elem is not None:
+        parts = _INDEED_LOCATION_SPLIT.split(_text(elem))
+        if len(parts) > 1:
+            return parts[-1].strip()
+    return None
+
+
+def _indeed_description(root: etree._Element) -> Optional[str]:
+    for xpath in _IN_DESCRIPTION:
+        elem = _first(xpath, root)
+        if elem is not None:
+            return _clean_description(elem)
+    return None
+
+
+def _indeed_salary(root: etree._Element) -> Optional[str]:
+    elem = _first(_IN_SALARY_CLASS, root)
+    if elem is not None:
+        text = _text(elem)
+        if "$" in text or "year" in text.lower() or "hour" in text.lower():
+            return text
+    elem = _first(_IN_SALARY_TESTID, root)
+    return _text(elem) if elem is not None else None
+
+
+def _indeed_job_type(root: etree._Element) -> Optional[str]:
+    elem = _first(_IN_METADATA, root)
+    if elem is not None:
+        jtype = indeed_job_type_in(_text(elem))
+        if jtype:
+            return jtype
+    for elem in _IN_ATTRIBUTES(root):
+        jtype = indeed_job_type_in(_text(elem))
+        if jtype:
+            return jtype
+    return None
+
+
+def parse_indeed_fields(html: str) -> Optional[Dict[str, Any]]:
+    """
+    Extract IndeedJobData fields from an Indeed job page.
+
+    Args:
+        html: Raw HTML
+
+    Returns:
+        title, company, location, description, salary and job_type, or None
+        when the BeautifulSoup parser should handle the page
+    """
+    root = _document(html)
+    if root is None:
+        return None
+    title = _indeed_title(root)
+    company = _indeed_company(root) if title else None
+    description = _indeed_description(root) if company else None
+    if not description:
+        return None
+    return {
+        "title": title,
+        "company": company,
+        "location": _indeed_location(root) or "Location not specified",
+        "description": description,
+        "salary": _indeed_salary(root),
+        "job_type": _indeed_job_type(root),
+    }
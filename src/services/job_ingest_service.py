@@ -39,6 +39,7 @@ from src.common.repositories import (
     get_job_repository,
     get_system_state_repository,
 )
+from src.common.search_prefixes import SEARCH_PREFIX_FIELD, search_prefixes
 from src.services.job_sources import JobData
 
 logger = logging.getLogger(__name__)
@@ -310,7 +311,7 @@ class IngestService:
         """
         from src.services.claude_quick_scorer import derive_tier_from_score
 
-        return {
+        document = {
             "company": job.company,
             "title": job.title,
             "location": job.location,
@@ -335,6 +336,8 @@ class IngestService:
             "postedDate": job.posted_date,
             "sourceId": job.source_id,
         }
+        document[SEARCH_PREFIX_FIELD] = search_prefixes(document)
+        return document
 
     async def _score_job(
         self,
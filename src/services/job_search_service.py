@@ -40,6 +40,7 @@ from src.common.repositories import (
     get_job_repository,
     get_job_search_repository,
 )
+from src.common.search_prefixes import SEARCH_PREFIX_FIELD, search_prefixes
 from src.services.job_sources import BaytSource, HimalayasSource, IndeedSource, JobData
 
 logger = logging.getLogger(__name__)
@@ -690,6 +691,7 @@ class JobSearchService:
                 "promoted_from_index": True,
                 "index_job_id": ObjectId(job_id),
             }
+            level2_doc[SEARCH_PREFIX_FIELD] = search_prefixes(level2_doc)
 
             # Insert into level-2 using job repository
             result = job_repo.insert_one(level2_doc)
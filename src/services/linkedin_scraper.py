@@ -18,6 +18,13 @@ import requests
 from bs4 import BeautifulSoup
 
 from src.common.dedupe import generate_dedupe_key as _unified_dedupe_key
+from src.common.search_prefixes import SEARCH_PREFIX_FIELD, search_prefixes
+from src.services.job_html_fastpath import (
+    collapse_description_lines,
+    criteria_from_pairs,
+    fast_parse_enabled,
+    parse_linkedin_fields,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -232,6 +239,20 @@ def _parse_job_html(job_id: str, html: str) -> LinkedInJobData:
     Raises:
         ParseError: If required fields cannot be extracted
     """
+    # Build job URL
+    job_url = f"https://www.linkedin.com/jobs/view/{job_id}"
+
+    # lxml fast path; BeautifulSoup handles anything it declines
+    fields = parse_linkedin_fields(html) if fast_parse_enabled() else None
+    if fields is not None:
+        return LinkedInJobData(
+            job_id=job_id,
+            job_url=job_url,
+            scraped_at=datetime.utcnow(),
+            raw_html=html[:5000],
+            **fields,
+        )
+
     soup = BeautifulSoup(html, "html.parser")
 
     # Extract title
@@ -256,9 +277,6 @@ def _parse_job_html(job_id: str, html: str) -> LinkedInJobData:
     criteria = _extract_job_criteria(soup)
     work_mode = _extract_work_mode(soup)
 
-    # Build job URL
-    job_url = f"https://www.linkedin.com/jobs/view/{job_id}"
-
     return LinkedInJobData(
         job_id=job_id,
         title=title,
@@ -410,58 +428,29 @@ def _clean_description(elem) -> str:
     text = elem.get_text()
 
     # Clean up excessive whitespace while preserving paragraph breaks
-    lines = text.split("\n")
-    cleaned_lines = []
-    prev_empty = False
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            if not prev_empty:
-                cleaned_lines.append("")
-                prev_empty = True
-        else:
-            cleaned_lines.append(line)
-            prev_empty = False
-
-    return "\n".join(cleaned_lines).strip()
+    return collapse_description_lines(text)
 
 
 def _extract_job_criteria(soup: BeautifulSoup) -> Dict[str, Any]:
     """Extract job criteria (seniority, type, function, industries)."""
-    criteria = {}
-
     # Find criteria list
     criteria_list = soup.find("ul", class_=re.compile(r"job-criteria"))
     if not criteria_list:
-        return criteria
+        return {}
 
-    # Parse each criterion
+    # Collect (criterion type, value) pairs
+    pairs = []
     for item in criteria_list.find_all("li", class_=re.compile(r"job-criteria__item")):
-        # Get header (criterion type)
         header = item.find(class_=re.compile(r"job-criteria__subheader"))
         if not header:
             continue
-        header_text = header.get_text(strip=True).lower()
-
-        # Get value
         value_elem = item.find(class_=re.compile(r"job-criteria__text"))
         if not value_elem:
             continue
-        value = value_elem.get_text(strip=True)
-
-        # Map to our fields
-        if "seniority" in header_text:
-            criteria["seniority_level"] = value
-        elif "employment" in header_text or "type" in header_text:
-            criteria["employment_type"] = value
-        elif "function" in header_text:
-            criteria["job_function"] = value
-        elif "industr" in header_text:
-            # Industries can be multiple
-            criteria["industries"] = [v.strip() for v in value.split(",")]
+        pairs.append((header.get_text(strip=True).lower(), value_elem.get_text(strip=True)))
 
-    return criteria
+    # Map to our fields
+    return criteria_from_pairs(pairs)
 
 
 def _generate_dedupe_key(
@@ -514,7 +503,7 @@ def linkedin_job_to_mongodb_doc(job_data: LinkedInJobData) -> Dict[str, Any]:
         job_id=job_data.job_id,  # Use LinkedIn's unique ID for robust deduplication
     )
 
-    return {
+    document = {
         "jobId": job_data.job_id,  # Use LinkedIn job ID directly
         "title": job_data.title,
         "company": job_data.company,
@@ -539,3 +528,5 @@ def linkedin_job_to_mongodb_doc(job_data: LinkedInJobData) -> Dict[str, Any]:
             "scraped_at": job_data.scraped_at.isoformat() if job_data.scraped_at else None,
         }
     }
+    document[SEARCH_PREFIX_FIELD] = search_prefixes(document)
+    return document
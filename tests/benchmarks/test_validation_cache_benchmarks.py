@@ -0,0 +1,69 @@
+"""
+Validation-time benchmarks for the validated-artifact cache.
+
+Runs the presentation_contract stage on its deterministic fail-open path
+(no LLM output, so every sub-artifact goes through the normalise/validate
+helpers) and reports time spent in validate_artifact per run with the cache
+off ("before") and on ("after"). The first cached run pays the misses;
+later runs of the same job (retries, redelivered work items) are hits.
+
+Run with: pytest tests/benchmarks/test_validation_cache_benchmarks.py -v -s -n 0
+"""
+
+import time
+
+import pytest
+
+from src.preenrich.stages import presentation_contract
+from src.preenrich.stages.presentation_contract import PresentationContractStage
+from src.preenrich.validation_cache import get_validation_cache, reset_validation_cache
+from tests.unit.preenrich._emphasis_rules_test_data import build_stage_context
+
+RUNS = 20
+
+
+@pytest.fixture
+def timed_validation(monkeypatch):
+    """Accumulate wall time spent inside validate_artifact."""
+    spent = [0.0]
+    original = presentation_contract.validate_artifact
+
+    def _timed(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            spent[0] += time.perf_counter() - start
+
+    monkeypatch.setattr(presentation_contract, "validate_artifact", _timed)
+    monkeypatch.setattr(presentation_contract, "_invoke_codex_json_traced", lambda **kwargs: (None, {"outcome": "error_missing_binary"}))
+    for flag in ("IDEAL_CANDIDATE", "DIMENSION_WEIGHTS", "EMPHASIS_RULES"):
+        monkeypatch.setenv(f"PREENRICH_PRESENTATION_CONTRACT_{flag}_ENABLED", "true")
+    return spent
+
+
+def _validation_ms_per_run(spent, ctx) -> float:
+    spent[0] = 0.0
+    for _ in range(RUNS):
+        PresentationContractStage().run(ctx)
+    return spent[0] / RUNS * 1000
+
+
+def test_presentation_contract_validation_time_before_and_after(monkeypatch, timed_validation):
+    ctx = build_stage_context(stakeholder_status="inferred_only")
+
+    monkeypatch.setenv("PREENRICH_VALIDATION_CACHE_ENABLED", "false")
+    before = _validation_ms_per_run(timed_validation, ctx)
+
+    monkeypatch.setenv("PREENRICH_VALIDATION_CACHE_ENABLED", "true")
+    reset_validation_cache()
+    after = _validation_ms_per_run(timed_validation, ctx)
+    cache = get_validation_cache()
+    reset_validation_cache()
+
+    print(
+        f"\npresentation_contract validation per run: before={before:.2f}ms after={after:.2f}ms "
+        f"(hits={cache.hits} misses={cache.misses})"
+    )
+    assert cache.hits > cache.misses
+    assert after < before
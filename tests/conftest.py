@@ -1,6 +1,7 @@
 """Global test guards shared across the full test suite."""
 
 import importlib.util
+import inspect
 import os
 
 pytest_plugins = ["pytest_playwright"] if importlib.util.find_spec("pytest_playwright") else []
@@ -10,3 +11,29 @@ os.environ["LANGCHAIN_TRACING_V2"] = "false"
 os.environ["LANGCHAIN_API_KEY"] = ""
 os.environ["LANGSMITH_API_KEY"] = ""
 os.environ["LANGSMITH_ENDPOINT"] = ""
+
+
+def _mongomock_accepts_bulk_sort() -> None:
+    """
+    Let mongomock run UpdateOne/ReplaceOne inside bulk_write.
+
+    pymongo >= 4.9 passes a `sort` argument to the bulk builder, which
+    mongomock 4.x does not accept. Production code uses the single-document
+    ops as they are; the test double ignores the (unset) sort.
+    """
+    try:
+        from mongomock.collection import BulkOperationBuilder
+    except ImportError:
+        return
+    for name in ("add_update", "add_replace"):
+        original = getattr(BulkOperationBuilder, name)
+        if "sort" in inspect.signature(original).parameters:
+            continue
+
+        def accept_sort(self, *args, _original=original, sort=None, **kwargs):
+            return _original(self, *args, **kwargs)
+
+        setattr(BulkOperationBuilder, name, accept_sort)
+
+
+_mongomock_accepts_bulk_sort()
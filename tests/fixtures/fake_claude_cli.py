@@ -0,0 +1,60 @@
+"""
+Fake `claude` CLI speaking the stream-json protocol, for pool tests.
+
+Reads one JSON user message per stdin line and answers with an init event
+(once), an assistant event and a terminal result event. The result text is a
+JSON object carrying this process's pid and per-process call count so tests
+can observe worker reuse and recycling.
+
+Prompt directives:
+    CRASH  - exit(3) without answering
+    SLOW   - sleep 5s before answering
+    ERROR  - answer with an is_error result
+    TEXT   - answer with plain (non-JSON) text
+"""
+
+import json
+import os
+import sys
+import time
+
+
+def emit(event):
+    sys.stdout.write(json.dumps(event) + "\n")
+    sys.stdout.flush()
+
+
+def main():
+    model = sys.argv[sys.argv.index("--model") + 1] if "--model" in sys.argv else "unknown"
+    emit({"type": "system", "subtype": "init", "model": model})
+    calls = 0
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        message = json.loads(line)
+        prompt = message["message"]["content"][0]["text"]
+        calls += 1
+
+        if "CRASH" in prompt:
+            sys.exit(3)
+        if "SLOW" in prompt:
+            time.sleep(5)
+
+        if "TEXT" in prompt:
+            text = f"plain answer from {os.getpid()}"
+        else:
+            text = json.dumps({"pid": os.getpid(), "calls": calls, "echo": prompt, "model": model})
+        emit({"type": "assistant", "message": {"content": [{"type": "text", "text": text}]}})
+        emit({
+            "type": "result",
+            "subtype": "success",
+            "is_error": "ERROR" in prompt,
+            "result": "Error: something broke" if "ERROR" in prompt else text,
+            "total_cost_usd": 0.0012,
+            "usage": {"input_tokens": 11, "output_tokens": 7},
+        })
+
+
+if __name__ == "__main__":
+    main()
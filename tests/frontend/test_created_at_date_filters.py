@@ -0,0 +1,81 @@
+"""
+Date-filtered job listing queries match createdAt directly.
+
+createdAt is always stored as a BSON Date (scripts/migrations/normalize_created_at.py),
+so date filters must be plain range conditions the createdAt index can serve,
+not $toDate conversions of every document.
+"""
+
+import json
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def repo(mocker):
+    repo = MagicMock()
+    repo.aggregate.return_value = []
+    repo.count_documents.return_value = 0
+    repo.find.return_value = []
+    mocker.patch("app._get_repo", return_value=repo)
+    return repo
+
+
+def _assert_no_conversion(pipeline):
+    text = json.dumps(pipeline, default=str)
+    assert "$toDate" not in text
+    assert "_normalizedDate" not in text
+
+
+def _conditions(query):
+    return query.get("$and", [query])
+
+
+def test_list_jobs_date_filter_is_find_range(authenticated_client, repo):
+    response = authenticated_client.get(
+        "/api/jobs?sort=title&datetime_from=2026-01-01T10:00&date_to=2026-01-31"
+    )
+
+    assert response.status_code == 200
+    repo.aggregate.assert_not_called()
+    query = repo.find.call_args.args[0]
+    assert {"createdAt": {
+        "$gte": datetime(2026, 1, 1, 10, 0),
+        "$lte": datetime(2026, 1, 31, 23, 59, 59, 999999),
+    }} in _conditions(query)
+
+
+def test_list_jobs_default_sort_matches_created_at_first(authenticated_client, repo):
+    response = authenticated_client.get("/api/jobs?date_from=2026-01-01")
+
+    assert response.status_code == 200
+    pipeline = repo.aggregate.call_args.args[0]
+    _assert_no_conversion(pipeline)
+    assert {"createdAt": {"$gte": datetime(2026, 1, 1)}} in _conditions(pipeline[0]["$match"])
+
+
+def test_locations_date_filter_in_initial_match(authenticated_client, repo):
+    response = authenticated_client.get("/api/locations?datetime_from=2026-01-01T00:00")
+
+    assert response.status_code == 200
+    pipeline = repo.aggregate.call_args.args[0]
+    _assert_no_conversion(pipeline)
+    assert pipeline[0]["$match"]["createdAt"] == {"$gte": datetime(2026, 1, 1)}
+
+
+def test_locations_without_date_filter_has_no_created_at_condition(authenticated_client, repo):
+    authenticated_client.get("/api/locations")
+
+    assert "createdAt" not in repo.aggregate.call_args.args[0][0]["$match"]
+
+
+def test_mobile_time_filter_is_part_of_initial_match(authenticated_client, repo):
+    response = authenticated_client.get("/api/mobile/jobs?mode=main&time_filter=24h")
+
+    assert response.status_code == 200
+    pipeline = repo.aggregate.call_args.args[0]
+    _assert_no_conversion(pipeline)
+    created_at = [condition["createdAt"] for condition in _conditions(pipeline[0]["$match"]) if "createdAt" in condition]
+    assert len(created_at) == 1 and isinstance(created_at[0]["$gte"], datetime)
@@ -0,0 +1,73 @@
+"""
+Job list free-text search matches indexed search prefixes.
+
+Each query word must prefix a word of title/company/location/jobId, looked up
+through the search_prefixes index (src/common/search_prefixes.py) rather than
+an unanchored $regex over every document.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from bson import ObjectId
+
+
+@pytest.fixture
+def repo(mocker):
+    repo = MagicMock()
+    repo.aggregate.return_value = []
+    repo.count_documents.return_value = 0
+    repo.find.return_value = []
+    mocker.patch("app._get_repo", return_value=repo)
+    return repo
+
+
+def _conditions(query):
+    return query.get("$and", [query])
+
+
+def test_list_jobs_search_uses_prefix_index(authenticated_client, repo):
+    response = authenticated_client.get("/api/jobs?sort=title&query=Senior%20Eng")
+
+    assert response.status_code == 200
+    query = repo.find.call_args.args[0]
+    assert {"search_prefixes": {"$all": ["eng", "senior"]}} in _conditions(query)
+    assert "$regex" not in json.dumps(query, default=str)
+
+
+def test_list_jobs_search_without_usable_word_falls_back_to_regex(authenticated_client, repo):
+    response = authenticated_client.get("/api/jobs?sort=title&query=c%2B%2B")
+
+    assert response.status_code == 200
+    query = repo.find.call_args.args[0]
+    assert "search_prefixes" not in json.dumps(query, default=str)
+    assert {"title": {"$regex": "c++", "$options": "i"}} in _conditions(query)[0]["$or"]
+
+
+def test_update_job_recomputes_prefixes_from_edited_fields(authenticated_client, repo):
+    job_id = ObjectId()
+    repo.find_one.side_effect = [
+        {"_id": job_id, "title": "Old Title", "company": "Acme", "location": "Berlin"},
+        {"_id": job_id, "title": "Data Engineer", "search_prefixes": ["da"]},
+    ]
+    repo.update_one.return_value = MagicMock(matched_count=1)
+
+    response = authenticated_client.put(f"/api/jobs/{job_id}", json={"title": "Data Engineer"})
+
+    assert response.status_code == 200
+    prefixes = repo.update_one.call_args.args[1]["$set"]["search_prefixes"]
+    assert {"data", "engineer", "acme", "berlin"} <= set(prefixes)
+    assert "old" not in prefixes
+    assert "search_prefixes" not in response.get_json()["job"]
+
+
+def test_update_job_leaves_prefixes_alone_for_other_fields(authenticated_client, repo):
+    job_id = ObjectId()
+    repo.find_one.return_value = {"_id": job_id, "status": "applied"}
+    repo.update_one.return_value = MagicMock(matched_count=1)
+
+    response = authenticated_client.put(f"/api/jobs/{job_id}", json={"status": "applied"})
+
+    assert response.status_code == 200
+    assert "search_prefixes" not in repo.update_one.call_args.args[1]["$set"]
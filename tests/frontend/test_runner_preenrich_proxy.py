@@ -0,0 +1,30 @@
+"""
+Unit tests for frontend/runner.py - preenrich request proxy.
+
+POST /api/runner/jobs/<job_id>/preenrich forwards to the runner, which tags
+the request with fair-share origin "interactive".
+"""
+
+from unittest.mock import MagicMock
+
+import requests
+
+
+def test_proxy_preenrich_forwards_to_runner(authenticated_client, mock_db, mocker):
+    runner_response = MagicMock(status_code=200)
+    runner_response.json.return_value = {"success": True, "origin": "interactive", "selected": True, "enqueued": True}
+    post = mocker.patch("frontend.runner.requests.post", return_value=runner_response)
+
+    response = authenticated_client.post("/api/runner/jobs/abc123/preenrich")
+
+    assert response.status_code == 200
+    assert response.get_json()["origin"] == "interactive"
+    assert post.call_args[0][0].endswith("/api/jobs/abc123/preenrich")
+
+
+def test_proxy_preenrich_runner_unreachable(authenticated_client, mock_db, mocker):
+    mocker.patch("frontend.runner.requests.post", side_effect=requests.exceptions.ConnectionError())
+
+    response = authenticated_client.post("/api/runner/jobs/abc123/preenrich")
+
+    assert response.status_code == 503
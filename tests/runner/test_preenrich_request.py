@@ -0,0 +1,79 @@
+"""
+End-to-end test for user-triggered preenrich requests.
+
+POST /api/jobs/{job_id}/preenrich selects the job with origin "interactive";
+its root work item must then be claimed ahead of queued cron and backfill work.
+"""
+
+from datetime import datetime, timezone
+
+import mongomock
+import pytest
+from bson import ObjectId
+
+from src.pipeline.queue import WorkItemQueue
+
+
+@pytest.fixture
+def mongo_client(mocker, monkeypatch):
+    monkeypatch.setenv("PREENRICH_STAGE_DAG_ENABLED", "true")
+    monkeypatch.setenv("PREENRICH_DAG_CANARY_PCT", "0")
+    client = mongomock.MongoClient()
+    mocker.patch("runner_service.routes.operations._get_mongo_client", return_value=client)
+    return client
+
+
+def _seed_background_work(db, now):
+    queue = WorkItemQueue(db)
+    for origin in ("backfill", "cron"):
+        for index in range(5):
+            queue.enqueue(
+                task_type="preenrich.jd_structure",
+                lane="preenrich",
+                consumer_mode="native_stage_dag",
+                subject_type="job",
+                subject_id=f"{origin}-{index}",
+                priority=100,
+                available_at=now,
+                max_attempts=3,
+                idempotency_key=f"{origin}-{index}",
+                correlation_id=f"{origin}-{index}",
+                payload={},
+                origin=origin,
+                now=now,
+            )
+
+
+def test_preenrich_request_is_claimed_before_background_work(client, auth_headers, mongo_client):
+    db = mongo_client["jobs"]
+    now = datetime.now(timezone.utc)
+    _seed_background_work(db, now)
+    job_id = ObjectId()
+    db["level-2"].insert_one({"_id": job_id, "description": "Lead the data platform team", "company": "Acme"})
+
+    response = client.post(f"/api/jobs/{job_id}/preenrich", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "success": True,
+        "job_id": str(job_id),
+        "origin": "interactive",
+        "selected": True,
+        "enqueued": True,
+    }
+    assert db["level-2"].find_one({"_id": job_id})["preenrich_origin"] == "interactive"
+    claimed = WorkItemQueue(db).claim_next(lane="preenrich", worker_name="w1", now=datetime.now(timezone.utc))
+    assert claimed["subject_id"] == str(job_id)
+    assert claimed["origin"] == "interactive"
+
+
+def test_preenrich_request_for_unknown_job_is_404(client, auth_headers, mongo_client):
+    response = client.post(f"/api/jobs/{ObjectId()}/preenrich", headers=auth_headers)
+
+    assert response.status_code == 404
+
+
+def test_preenrich_request_rejects_bad_id(client, auth_headers, mongo_client):
+    response = client.post("/api/jobs/not-an-id/preenrich", headers=auth_headers)
+
+    assert response.status_code == 400
@@ -0,0 +1,86 @@
+"""Tests for createdAt normalisation."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import mongomock
+import pytest
+from pymongo.errors import OperationFailure
+
+from src.common.created_at import (
+    CREATED_AT_INDEX_NAME,
+    backfill_created_at,
+    coerce_created_at,
+    ensure_created_at_index,
+)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2025-11-30T14:30:00.000Z", datetime(2025, 11, 30, 14, 30, tzinfo=timezone.utc)),
+        ("2025-11-30T14:30:00.7Z", datetime(2025, 11, 30, 14, 30, 0, 700000, tzinfo=timezone.utc)),
+        ("2025-11-30T16:30:00+02:00", datetime(2025, 11, 30, 14, 30, tzinfo=timezone.utc)),
+        ("2025-11-30T14:30:00", datetime(2025, 11, 30, 14, 30, tzinfo=timezone.utc)),
+        ("2025-11-30", datetime(2025, 11, 30, tzinfo=timezone.utc)),
+        (datetime(2025, 11, 30, 14, 30), datetime(2025, 11, 30, 14, 30, tzinfo=timezone.utc)),
+        ("not a date", None),
+        ("", None),
+        (None, None),
+        (1732977000, None),
+    ],
+)
+def test_coerce_created_at(value, expected):
+    assert coerce_created_at(value) == expected
+
+
+def test_backfill_converts_strings_and_skips_unparseable():
+    collection = mongomock.MongoClient().db["level-2"]
+    stored = datetime(2026, 1, 2, 3, 4)
+    collection.insert_many([
+        {"_id": 1, "createdAt": "2026-01-01T10:00:00.000Z"},
+        {"_id": 2, "createdAt": "garbage"},
+        {"_id": 3, "createdAt": stored},
+        {"_id": 4, "createdAt": "2026-01-03T10:00:00+01:00"},
+        {"_id": 5},
+    ])
+
+    assert backfill_created_at(collection, batch_size=1) == {"converted": 2, "unparseable": 1}
+    documents = {document["_id"]: document.get("createdAt") for document in collection.find()}
+    assert documents == {
+        1: datetime(2026, 1, 1, 10, 0),
+        2: "garbage",
+        3: stored,
+        4: datetime(2026, 1, 3, 9, 0),
+        5: None,
+    }
+    # Only the unparseable row is still a string; a rerun changes nothing
+    assert backfill_created_at(collection) == {"converted": 0, "unparseable": 1}
+
+
+def test_backfill_limit_bounds_rows_examined():
+    collection = mongomock.MongoClient().db["level-2"]
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    collection.insert_many(
+        [{"_id": index, "createdAt": (start + timedelta(hours=index)).isoformat()} for index in range(7)]
+    )
+
+    assert backfill_created_at(collection, limit=5, batch_size=2) == {"converted": 5, "unparseable": 0}
+    assert collection.count_documents({"createdAt": {"$type": "string"}}) == 2
+
+
+def test_ensure_index_creates_and_tolerates_existing_equivalent():
+    collection = mongomock.MongoClient().db["level-2"]
+    ensure_created_at_index(collection)
+    assert CREATED_AT_INDEX_NAME in collection.index_information()
+
+    conflicting = MagicMock()
+    conflicting.create_index.side_effect = OperationFailure("exists", code=85)
+    ensure_created_at_index(conflicting)
+
+    failing = MagicMock()
+    failing.create_index.side_effect = OperationFailure("denied", code=13)
+    with pytest.raises(OperationFailure):
+        ensure_created_at_index(failing)
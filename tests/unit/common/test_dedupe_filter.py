@@ -0,0 +1,185 @@
+"""Tests for the dedupeKey Bloom prefilter."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import mongomock
+import pytest
+
+from src.common.dedupe import generate_dedupe_key
+from src.common.dedupe_filter import (
+    BloomFilter,
+    DedupeFilterConfig,
+    DedupePrefilter,
+    get_dedupe_prefilter,
+    record_dedupe_keys,
+)
+from src.pipeline.discovery.scout_search_pipeline import dedupe_against_db
+
+NOW = datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _keys(prefix: str, count: int) -> list[str]:
+    return [f"{prefix}|{index}" for index in range(count)]
+
+
+class CountingCollection:
+    """Collection proxy counting dedupeKey lookups (the prefilter's own _id-range reads are not counted)."""
+
+    def __init__(self, collection, counter):
+        self._collection = collection
+        self._counter = counter
+
+    def find(self, filter=None, *args, **kwargs):
+        if "$in" in (filter or {}).get("dedupeKey", {}):
+            self._counter["find"] += 1
+        return self._collection.find(filter, *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._collection, name)
+
+
+class CountingDb:
+    def __init__(self, db):
+        self._db = db
+        self.counter = {"find": 0}
+        self.name = db.name
+
+    def __getitem__(self, name):
+        return CountingCollection(self._db[name], self.counter)
+
+
+class TestBloomFilter:
+    def test_sized_for_target_and_never_misses_added_keys(self):
+        bloom = BloomFilter.for_capacity(20_000, 0.01)
+        stored = _keys("stored", 20_000)
+        bloom.add_many(stored)
+
+        assert bloom.num_hashes == 7
+        assert bloom.memory_bytes == pytest.approx(20_000 * 9.585 / 8, rel=0.01)
+        assert all(bloom.contains_many(stored))
+        measured = sum(bloom.contains_many(_keys("absent", 20_000))) / 20_000
+        assert measured < 0.02
+        assert bloom.expected_fp_rate() == pytest.approx(0.01, rel=0.05)
+
+    def test_memory_cap_binds(self):
+        bloom = BloomFilter.for_capacity(1_000_000, 0.01, max_bytes=65_536)
+
+        assert bloom.memory_bytes == 65_536
+        assert bloom.num_hashes >= 1
+
+    def test_invalid_arguments_rejected(self):
+        with pytest.raises(ValueError):
+            BloomFilter.for_capacity(10, 1.5)
+        with pytest.raises(ValueError):
+            BloomFilter(0, 3)
+
+
+class TestDedupePrefilter:
+    def test_rebuild_persist_and_catch_up(self, tmp_path):
+        db = mongomock.MongoClient().db
+        db["level-1"].insert_many([{"dedupeKey": key} for key in _keys("l1", 50)])
+        db["level-2"].insert_many([{"dedupeKey": key} for key in _keys("l2", 50)] + [{"dedupeKey": None}])
+        path = tmp_path / "bloom.bin"
+
+        # With no saved filter the first sync builds it before returning
+        prefilter = DedupePrefilter(path=path)
+        prefilter.sync(db, now=NOW)
+        assert prefilter.bloom.count == 100
+        assert set(prefilter.possible(["l1|3", "l2|7"])) == {"l1|3", "l2|7"}
+        assert path.exists()
+
+        # A new process loads the file and only catches up on new documents
+        db["level-1"].insert_one({"dedupeKey": "l1|new"})
+        reloaded = DedupePrefilter(path=path)
+        reloaded.sync(db, now=NOW + timedelta(minutes=1))
+        assert reloaded.wait_for_rebuild(timeout=10)
+        assert reloaded.built_at == NOW
+        assert reloaded.bloom.count > 100
+        assert reloaded.possible(["l1|new"]) == ["l1|new"]
+
+    def test_serves_every_key_until_first_build_finishes(self, tmp_path):
+        prefilter = DedupePrefilter(path=tmp_path / "bloom.bin")
+        assert prefilter.possible(["a|1", "b|2"]) == ["a|1", "b|2"]
+
+    def test_catch_up_is_rate_limited_and_record_adds_immediately(self, tmp_path):
+        db = mongomock.MongoClient().db
+        path = tmp_path / "bloom.bin"
+        prefilter = DedupePrefilter(DedupeFilterConfig(refresh_seconds=60, catch_up_seconds=30), path=path)
+        prefilter.sync(db, now=NOW)
+        saved = path.read_bytes()
+
+        # Written by another process: seen by the first catch-up after the interval
+        db["level-2"].insert_one({"dedupeKey": "late|1"})
+        prefilter.sync(db, now=NOW + timedelta(seconds=10))
+        assert prefilter.possible(["late|1"]) == []
+        prefilter.sync(db, now=NOW + timedelta(seconds=30))
+        assert prefilter.possible(["late|1"]) == ["late|1"]
+        assert prefilter.bloom.count == 1
+        assert path.read_bytes() == saved
+
+        # Re-reading the catch-up margin does not count keys twice
+        prefilter.sync(db, now=NOW + timedelta(seconds=60))
+        assert prefilter.bloom.count == 1
+
+        prefilter.add(["mine|1"])
+        assert prefilter.possible(["mine|1"]) == ["mine|1"]
+
+    def test_rebuilds_when_stale_or_over_capacity(self, tmp_path):
+        db = mongomock.MongoClient().db
+        prefilter = DedupePrefilter(DedupeFilterConfig(rebuild_hours=1), path=tmp_path / "bloom.bin")
+        prefilter.sync(db, now=NOW)
+
+        prefilter.sync(db, now=NOW + timedelta(hours=2))
+        assert prefilter._rebuild_thread.daemon is False
+        assert prefilter.wait_for_rebuild(timeout=10)
+        assert prefilter.built_at == NOW + timedelta(hours=2)
+
+        prefilter.bloom.count = prefilter.bloom.capacity + 1
+        prefilter.sync(db, now=NOW + timedelta(hours=2, minutes=5))
+        assert prefilter.wait_for_rebuild(timeout=10)
+        assert prefilter.built_at == NOW + timedelta(hours=2, minutes=5)
+        assert prefilter.bloom.count == 0
+
+    def test_unreadable_file_falls_back_to_rebuild(self, tmp_path):
+        path = tmp_path / "bloom.bin"
+        path.write_bytes(b"not a filter")
+        db = mongomock.MongoClient().db
+        db["level-1"].insert_one({"dedupeKey": "a|1"})
+
+        prefilter = DedupePrefilter(path=path)
+        prefilter.sync(db, now=NOW)
+
+        assert prefilter.bloom is not None
+        assert prefilter.possible(["a|1"]) == ["a|1"]
+
+
+class TestSingleton:
+    def test_disabled_returns_none(self, monkeypatch):
+        monkeypatch.setenv("DEDUPE_BLOOM_ENABLED", "false")
+        assert get_dedupe_prefilter(mongomock.MongoClient().db) is None
+
+    def test_record_reaches_shared_filter(self):
+        db = mongomock.MongoClient().db
+        prefilter = get_dedupe_prefilter(db)
+        record_dedupe_keys(["fresh|1", None])
+
+        assert get_dedupe_prefilter(db) is prefilter
+        assert prefilter.possible(["fresh|1"]) == ["fresh|1"]
+
+
+def test_dedupe_against_db_skips_mongo_for_definite_misses():
+    base = mongomock.MongoClient().jobs
+    existing = {"job_id": "111", "title": "AI Engineer", "company": "Acme", "location": "Remote"}
+    base["level-2"].insert_one({"dedupeKey": generate_dedupe_key("linkedin_scout", source_id="111")})
+    db = CountingDb(base)
+    get_dedupe_prefilter(db)
+
+    fresh = [{"job_id": "222", "title": "ML Engineer", "company": "Beta", "location": "Berlin"}]
+    db.counter["find"] = 0
+    assert dedupe_against_db(fresh, db) == fresh
+    assert db.counter["find"] == 0
+
+    assert dedupe_against_db([existing, *fresh], db) == fresh
+    assert db.counter["find"] == 2
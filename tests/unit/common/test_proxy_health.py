@@ -0,0 +1,135 @@
+"""Tests for health-scored proxy selection."""
+
+from __future__ import annotations
+
+import json
+import random
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from src.common import proxy_pool
+from src.common.proxy_health import (
+    HealthPolicy,
+    ProxyHealth,
+    ProxyHealthStore,
+    ProxySelector,
+    apply_outcome,
+    get_proxy_selector,
+    reset_proxy_selector,
+)
+from src.common.proxy_pool import ProxyPool, fetch_with_proxy
+
+POLICY = HealthPolicy(alpha=0.5, cooldown_seconds=60, failure_threshold=2, quarantine_seconds=100)
+GOOD, BAD = "http://1.1.1.1:80", "http://2.2.2.2:80"
+
+
+@pytest.fixture(autouse=True)
+def _isolated_selector(monkeypatch, tmp_path):
+    monkeypatch.setenv("SCOUT_QUEUE_DIR", str(tmp_path))
+    monkeypatch.setenv("PROXY_HEALTH_SHARED", "false")
+    reset_proxy_selector()
+    yield
+    reset_proxy_selector()
+
+
+class TestApplyOutcome:
+    def test_success_updates_ewmas(self):
+        health = apply_outcome(ProxyHealth(GOOD), "success", latency_ms=1000, now=0, policy=POLICY)
+        assert health.success_rate == pytest.approx(0.85)
+        assert health.latency_ms == pytest.approx(1500)
+
+    def test_rate_limit_cools_down_without_penalising_success(self):
+        health = apply_outcome(ProxyHealth(GOOD), "rate_limited", latency_ms=None, now=10, policy=POLICY)
+        assert health.success_rate == ProxyHealth(GOOD).success_rate
+        assert not health.available(69)
+        assert health.available(70)
+
+    def test_consecutive_failures_quarantine_with_backoff_and_half_open_readmission(self):
+        health = apply_outcome(ProxyHealth(BAD), "failure", latency_ms=None, now=0, policy=POLICY)
+        assert health.available(0)
+        health = apply_outcome(health, "failure", latency_ms=None, now=0, policy=POLICY)
+        assert (health.quarantined_until, health.quarantines) == (100, 1)
+
+        # Re-admitted half-open: one failure re-quarantines for twice as long.
+        assert health.half_open(100)
+        health = apply_outcome(health, "failure", latency_ms=None, now=100, policy=POLICY)
+        assert (health.quarantined_until, health.quarantines) == (300, 2)
+
+        # One success closes the circuit.
+        health = apply_outcome(health, "success", latency_ms=500, now=300, policy=POLICY)
+        assert health.quarantines == 0
+        assert not health.half_open(300)
+
+    def test_unknown_outcome_rejected(self):
+        with pytest.raises(ValueError, match="outcome"):
+            apply_outcome(ProxyHealth(GOOD), "meh", latency_ms=None, now=0, policy=POLICY)
+
+
+def test_choose_prefers_healthy_and_skips_benched():
+    selector = ProxySelector([GOOD, BAD, "http://3.3.3.3:80"], policy=POLICY, rng=random.Random(1))
+    for _ in range(5):
+        selector.record(GOOD, "success", latency_ms=200, now=0)
+    selector.record(BAD, "failure", now=0)
+    selector.quarantine("http://3.3.3.3:80", now=0)
+
+    picks = [selector.choose(1, now=1)[0] for _ in range(200)]
+
+    assert "http://3.3.3.3:80" not in picks
+    assert picks.count(GOOD) > 150
+    assert selector.choose(5, now=1) in ([GOOD, BAD], [BAD, GOOD])
+
+    selector.quarantine(GOOD, now=1)
+    selector.quarantine(BAD, now=1)
+    assert selector.choose(2, now=2) == []
+
+
+def test_health_is_shared_through_the_store(tmp_path):
+    path = str(tmp_path / "health.sqlite3")
+    first = ProxySelector([GOOD, BAD], store=ProxyHealthStore(path), policy=POLICY, refresh_seconds=0)
+    second = ProxySelector([GOOD, BAD], store=ProxyHealthStore(path), policy=POLICY, refresh_seconds=0)
+
+    first.record(BAD, "failure", now=0)
+    second.record(BAD, "failure", now=0)  # read-modify-write sees first's failure
+
+    assert second.available(now=1) == [GOOD]
+    assert first.available(now=1) == [GOOD]
+    assert first.health(BAD).quarantines == 1
+
+
+def test_proxy_pool_quarantines_instead_of_dropping(tmp_path):
+    cache = tmp_path / "proxies.json"
+    cache.write_text(json.dumps([GOOD, BAD]))
+    pool = ProxyPool(cache_path=str(cache), selector=ProxySelector(policy=POLICY))
+    assert pool.initialize() == 2
+
+    pool.mark_failed(BAD)
+
+    assert pool.size == 1
+    assert pool.proxies == [GOOD, BAD]
+    assert {pool.get_proxy()["http"] for _ in range(20)} == {GOOD}
+
+
+def test_fetch_with_proxy_records_outcomes_and_falls_back(monkeypatch):
+    calls = []
+
+    def fake_get(url, headers=None, timeout=None, proxies=None, **kwargs):
+        proxy = (proxies or {}).get("http")
+        calls.append(proxy)
+        if proxy == BAD:
+            raise requests.exceptions.ProxyError("dead")
+        if proxy == GOOD:
+            return SimpleNamespace(status_code=429)
+        return SimpleNamespace(status_code=200)
+
+    monkeypatch.setattr(proxy_pool.requests, "get", fake_get)
+    pool = [GOOD, BAD]
+
+    response = fetch_with_proxy("https://example.test/job", pool=pool)
+
+    assert response.status_code == 200
+    assert sorted(calls[:2]) == sorted(pool) and calls[2] is None
+    selector = get_proxy_selector(pool)
+    assert selector.health(BAD).consecutive_failures == 1
+    assert not selector.health(GOOD).available(selector.health(GOOD).cooldown_until - 1)
@@ -0,0 +1,114 @@
+"""Tests for typeahead search prefixes."""
+
+from __future__ import annotations
+
+import mongomock
+import pytest
+
+from src.common.search_prefixes import (
+    MAX_PREFIX_LENGTH,
+    SEARCH_PREFIX_FIELD,
+    SEARCH_PREFIX_INDEX_NAME,
+    backfill_search_prefixes,
+    ensure_search_prefix_index,
+    query_prefixes,
+    search_prefixes,
+)
+from src.pipeline.selector_common import upsert_level2_job
+
+
+def test_search_prefixes_cover_every_word_of_every_field():
+    prefixes = search_prefixes({"title": "Senior ML-Engineer", "company": "Acme", "location": None, "jobId": 42})
+
+    assert prefixes == sorted(set(prefixes))
+    for expected in ("se", "sen", "senior", "ml", "en", "engineer", "ac", "acme", "42"):
+        assert expected in prefixes
+    assert "e" not in prefixes
+    assert "ior" not in prefixes
+
+
+def test_search_prefixes_fold_case_and_accents():
+    assert "zurich" in search_prefixes({"location": "ZÜRICH"})
+    assert query_prefixes("Zürich") == ["zurich"]
+
+
+def test_long_words_are_truncated_on_both_sides():
+    word = "internationalisation"
+    prefixes = search_prefixes({"title": word})
+
+    assert max(len(prefix) for prefix in prefixes) == MAX_PREFIX_LENGTH
+    assert query_prefixes(word) == [word[:MAX_PREFIX_LENGTH]]
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("senior eng", ["eng", "senior"]),
+        ("  Eng  eng ", ["eng"]),
+        ("a", []),
+        ("c++", []),
+        ("", []),
+    ],
+)
+def test_query_prefixes(query, expected):
+    assert query_prefixes(query) == expected
+
+
+def test_prefix_query_matches_like_word_prefix_search():
+    collection = mongomock.MongoClient().db["level-2"]
+    jobs = [
+        {"_id": 1, "title": "Senior Engineer", "company": "Acme", "location": "Berlin"},
+        {"_id": 2, "title": "Engineering Manager", "company": "Globex", "location": "Senior Park"},
+        {"_id": 3, "title": "Designer", "company": "Seniority Labs", "location": "London"},
+    ]
+    collection.insert_many([{**job, SEARCH_PREFIX_FIELD: search_prefixes(job)} for job in jobs])
+
+    def matches(text):
+        return sorted(doc["_id"] for doc in collection.find({SEARCH_PREFIX_FIELD: {"$all": query_prefixes(text)}}))
+
+    assert matches("senior eng") == [1, 2]
+    assert matches("acme") == [1]
+    assert matches("lond des") == [3]
+    assert matches("gineer") == []
+
+
+def test_backfill_fills_missing_rows_only():
+    collection = mongomock.MongoClient().db["level-2"]
+    collection.insert_many([
+        {"_id": 1, "title": "Staff Engineer", "company": "Acme"},
+        {"_id": 2, "title": "Designer", SEARCH_PREFIX_FIELD: ["kept"]},
+        {"_id": 3, "title": "Head of Data", "jobId": "777"},
+        {"_id": 4},
+    ])
+
+    assert backfill_search_prefixes(collection, batch_size=2) == 3
+    documents = {document["_id"]: document[SEARCH_PREFIX_FIELD] for document in collection.find()}
+    assert "staff" in documents[1] and "acme" in documents[1]
+    assert documents[2] == ["kept"]
+    assert "77" in documents[3]
+    assert documents[4] == []
+    assert backfill_search_prefixes(collection) == 0
+
+
+def test_backfill_limit_bounds_rows_written():
+    collection = mongomock.MongoClient().db["level-2"]
+    collection.insert_many([{"_id": index, "title": f"Role {index}"} for index in range(7)])
+
+    assert backfill_search_prefixes(collection, limit=5, batch_size=2) == 5
+    assert collection.count_documents({SEARCH_PREFIX_FIELD: None}) == 2
+
+
+def test_ensure_index():
+    collection = mongomock.MongoClient().db["level-2"]
+    ensure_search_prefix_index(collection)
+    assert SEARCH_PREFIX_INDEX_NAME in collection.index_information()
+
+
+def test_level2_upsert_writes_prefixes():
+    level2 = mongomock.MongoClient().db["level-2"]
+    job = {"job_id": "4100000001", "title": "Platform Engineer", "company": "Initech", "location": "Remote"}
+
+    upsert_level2_job(level2, job, source_tag="test", selected_for_preenrich=False)
+
+    document = level2.find_one()
+    assert {"platform", "engineer", "initech", "remote"} <= set(document[SEARCH_PREFIX_FIELD])
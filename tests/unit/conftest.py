@@ -69,3 +69,19 @@ def isolate_environment(monkeypatch):
     monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test-mock-key")
     monkeypatch.setenv("OPENROUTER_API_KEY", "sk-or-test-mock-key")
     monkeypatch.setenv("FIRECRAWL_API_KEY", "fc-test-mock-key")
+
+
+@pytest.fixture(autouse=True)
+def isolate_dedupe_prefilter(monkeypatch, tmp_path):
+    """
+    Keep the dedupe Bloom prefilter per-test and out of the repo's data/ dir.
+
+    The filter is a process-wide singleton persisted to disk, so without this
+    a test could load another test's keys or leave a filter file behind.
+    """
+    from src.common.dedupe_filter import reset_dedupe_prefilter
+
+    monkeypatch.setenv("DEDUPE_BLOOM_PATH", str(tmp_path / "dedupe_bloom.bin"))
+    reset_dedupe_prefilter()
+    yield
+    reset_dedupe_prefilter()
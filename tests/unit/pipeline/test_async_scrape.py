@@ -0,0 +1,182 @@
+"""Tests for the concurrent async scrape mode."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from dataclasses import replace
+
+import httpx
+import mongomock
+import pytest
+
+from scripts.benchmark_async_scrape import FakeLinkedInServer
+from src.common.proxy_health import ProxyHealthStore, ProxySelector
+from src.pipeline.async_scrape import AsyncFetcher, AsyncNativeScrapeWorker, AsyncScrapeConfig, scrape_jobs
+from src.pipeline.discovery import SearchDiscoveryStore
+from src.pipeline.queue import WorkItemQueue
+from src.pipeline.scrape_common import ScrapeSuccessResult, classify_scrape_exception
+from src.pipeline.scrape_worker import ScrapeFeatureFlags
+from src.services.linkedin_scraper import JobNotFoundError
+
+
+@pytest.fixture
+def server():
+    with FakeLinkedInServer(latency_seconds=0.02, status_by_job={"404": 404, "429": 429}) as fake:
+        yield fake
+
+
+def _config(server: FakeLinkedInServer, **overrides) -> AsyncScrapeConfig:
+    base = AsyncScrapeConfig(concurrency=4, per_host=4, pool_size=4, parse_processes=0, url_template=server.url_template)
+    return replace(base, **overrides)
+
+
+def _flags() -> ScrapeFeatureFlags:
+    return ScrapeFeatureFlags(
+        enable_native_worker=True,
+        use_mongo_work_items=True,
+        enable_legacy_jsonl_consumer=False,
+        write_scored_jsonl=True,
+        write_level1=True,
+        selector_compat_mode=True,
+        persist_selector_payload=True,
+        async_mode=True,
+    )
+
+
+def _create_hit_and_item(db, *, job_id: str, title: str = "Senior AI Engineer", company: str = "Acme"):
+    store = SearchDiscoveryStore(db)
+    queue = WorkItemQueue(db)
+    store.ensure_indexes()
+    queue.ensure_indexes()
+    hit = store.upsert_search_hit(
+        source="linkedin",
+        external_job_id=job_id,
+        job_url=f"https://linkedin.com/jobs/view/{job_id}",
+        title=title,
+        company=company,
+        location="Remote",
+        search_profile="ai_core",
+        search_region="de",
+        source_cron="hourly",
+        run_id="searchrun:test",
+        correlation_id=f"hit:linkedin:{job_id}",
+        langfuse_session_id="searchrun:test",
+        scout_metadata={},
+        raw_search_payload={"job_id": job_id, "title": title},
+    )
+    enqueued = queue.enqueue(
+        task_type="scrape.hit",
+        lane="scrape",
+        consumer_mode="native_scrape",
+        subject_type="search_hit",
+        subject_id=hit.hit_id,
+        priority=100,
+        available_at=None,
+        max_attempts=5,
+        idempotency_key=f"scrape.hit:linkedin:{job_id}:native_scrape",
+        correlation_id=f"hit:linkedin:{job_id}",
+        payload={"job_id": job_id, "title": title, "company": company, "source_cron": "hourly"},
+    )
+    return hit.hit_id, enqueued.document["_id"]
+
+
+def test_async_worker_settles_every_outcome(tmp_path, monkeypatch, server):
+    monkeypatch.setenv("SCOUT_QUEUE_DIR", str(tmp_path))
+    db = mongomock.MongoClient()["jobs"]
+    ok_ids = [_create_hit_and_item(db, job_id=str(job_id))[1] for job_id in (501, 502, 503)]
+    _, missing_id = _create_hit_and_item(db, job_id="404")
+    _, limited_id = _create_hit_and_item(db, job_id="429")
+    _, skipped_id = _create_hit_and_item(db, job_id="600", title="Office Manager")
+    worker = AsyncNativeScrapeWorker(db, flags=_flags(), worker_id="worker-1", use_proxy=False, config=_config(server))
+
+    result = worker.run_once(max_items=10, lease_seconds=300, trigger_mode="manual")
+
+    assert result["claimed"] == 6
+    assert result["scraped_success"] == 3
+    assert result["level1_upserts"] == 3
+    assert result["skipped_title_filter"] == 1
+    assert result["retried"] == 1
+    assert result["deadlettered"] == 1
+    items = db["work_items"]
+    assert {items.find_one({"_id": item_id})["status"] for item_id in ok_ids} == {"done"}
+    assert items.find_one({"_id": missing_id})["status"] == "deadletter"
+    assert items.find_one({"_id": limited_id})["status"] == "failed"
+    assert items.find_one({"_id": skipped_id})["status"] == "done"
+    scored = [json.loads(line) for line in (tmp_path / "scored.jsonl").read_text().splitlines() if line.strip()]
+    assert sorted(entry["job_id"] for entry in scored) == ["501", "502", "503"]
+    assert scored[0]["company"] == "Acme Labs"
+    assert server.requests == 5  # the skipped title is never fetched
+
+
+def test_scrape_jobs_respects_per_host_limit(server):
+    jobs = [{"job_id": str(700 + index)} for index in range(8)]
+
+    results = asyncio.run(scrape_jobs(jobs, config=_config(server, per_host=2)))
+
+    assert all(isinstance(result, ScrapeSuccessResult) for result in results)
+    assert [result.scored_job["job_id"] for result in results] == [job["job_id"] for job in jobs]
+    assert server.max_concurrent <= 2
+
+
+def test_scrape_jobs_parses_in_process_pool_and_maps_statuses(server):
+    results = asyncio.run(scrape_jobs([{"job_id": "801"}, {"job_id": "404"}], config=_config(server, parse_processes=1)))
+
+    assert results[0].scored_job["title"] == "Senior AI Engineer 801"
+    assert isinstance(results[1], JobNotFoundError)
+
+
+def test_dead_proxy_falls_back_to_direct(server):
+    results = asyncio.run(scrape_jobs([{"job_id": "901"}], config=_config(server), proxies=["http://127.0.0.1:9"]))
+
+    assert results[0].used_proxy is False
+    assert results[0].http_status == 200
+
+
+def test_shared_health_store_is_used_off_the_event_loop(tmp_path, server):
+    class _ThreadRecordingStore(ProxyHealthStore):
+        def __init__(self, path):
+            super().__init__(path)
+            self.threads = []
+
+        def load_all(self):
+            self.threads.append(threading.current_thread())
+            return super().load_all()
+
+        def update(self, proxy, fn, *, now):
+            self.threads.append(threading.current_thread())
+            return super().update(proxy, fn, now=now)
+
+    store = _ThreadRecordingStore(str(tmp_path / "health.sqlite3"))
+    fetcher = AsyncFetcher(_config(server), selector=ProxySelector(["http://127.0.0.1:9"], store=store))
+
+    async def _fetch():
+        try:
+            return await fetcher.fetch(server.url_template.format(job_id="902"))
+        finally:
+            await fetcher.aclose()
+
+    page = asyncio.run(_fetch())
+
+    assert page.used_proxy is False
+    assert store.threads
+    assert threading.main_thread() not in store.threads
+    assert store.load_all()["http://127.0.0.1:9"].consecutive_failures == 1
+
+
+def test_httpx_errors_are_retryable():
+    assert classify_scrape_exception(httpx.ReadTimeout("slow")).error_type == "timeout"
+    assert classify_scrape_exception(httpx.ConnectError("refused")).error_type == "network_error"
+
+
+def test_config_from_env(monkeypatch):
+    monkeypatch.setenv("SCOUT_SCRAPE_ASYNC_CONCURRENCY", "64")
+    monkeypatch.setenv("SCOUT_SCRAPE_PARSE_PROCESSES", "0")
+    monkeypatch.setenv("SCOUT_SCRAPE_ASYNC_PER_HOST", "bogus")
+
+    config = AsyncScrapeConfig.from_env()
+
+    assert config.concurrency == 64
+    assert config.parse_processes == 0
+    assert config.per_host == 8
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import json
+from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
 
 import mongomock
 
-from src.pipeline.discovery import SearchDiscoveryStore
+from src.pipeline.discovery import SearchDiscoveryStore, SearchHitWrite
 from src.pipeline.legacy_scrape_handoff import LegacyScrapeHandoffBridge
 from src.pipeline.queue import WorkItemQueue
 
@@ -115,6 +116,94 @@ def test_search_hit_upsert_updates_last_seen_and_times_seen():
     assert document["last_seen_at"] == _naive_utc(second_seen)
 
 
+def _hit(job_id: str, *, job_url: str | None = None, run_id: str = "run-1") -> SearchHitWrite:
+    return SearchHitWrite(
+        source="linkedin",
+        external_job_id=job_id,
+        job_url=job_url or f"https://www.linkedin.com/jobs/view/{job_id}/",
+        title=f"AI Engineer {job_id}",
+        company="Acme",
+        location="Remote",
+        search_profile="ai_core",
+        search_region="eea",
+        source_cron="hourly",
+        run_id=run_id,
+    )
+
+
+def test_bulk_search_hit_upsert_matches_single_upsert():
+    db = _db()
+    store = SearchDiscoveryStore(db)
+    store.ensure_indexes()
+    first_seen = datetime(2026, 4, 18, 9, 0, tzinfo=timezone.utc)
+    existing = store.upsert_search_hit(**asdict(_hit("1")), now=first_seen)
+
+    second_seen = first_seen + timedelta(hours=1)
+    results = store.upsert_search_hits_bulk([_hit("2", run_id="run-2"), _hit("1", run_id="run-2"), _hit("3")], now=second_seen)
+
+    assert [result.inserted for result in results] == [True, False, True]
+    assert results[1].hit_id == existing.hit_id
+    assert [result.document["external_job_id"] for result in results] == ["2", "1", "3"]
+    refreshed = db["scout_search_hits"].find_one({"_id": existing.hit_id})
+    assert refreshed["times_seen"] == 2
+    assert refreshed["run_id"] == "run-2"
+    assert refreshed["first_seen_at"] == _naive_utc(first_seen)
+    assert refreshed["last_seen_at"] == _naive_utc(second_seen)
+    new_hit = results[0].document
+    assert new_hit["hit_status"] == "discovered"
+    assert new_hit["correlation_id"] == "hit:linkedin:2"
+    assert new_hit["scrape"]["status"] is None
+    assert store.upsert_search_hits_bulk([]) == []
+
+
+def test_bulk_search_hit_upsert_uses_constant_round_trips(monkeypatch):
+    db = _db()
+    store = SearchDiscoveryStore(db)
+    store.ensure_indexes()
+    calls: list[str] = []
+    for name in ("find_one", "find", "update_one", "bulk_write"):
+        method = getattr(store.search_hits, name)
+        monkeypatch.setattr(
+            store.search_hits,
+            name,
+            lambda *args, _name=name, _method=method, **kwargs: calls.append(_name) or _method(*args, **kwargs),
+        )
+
+    results = store.upsert_search_hits_bulk([_hit(str(job_id)) for job_id in range(50)])
+
+    assert len(results) == 50 and all(result.inserted for result in results)
+    assert calls == ["bulk_write", "find"]
+
+
+def test_bulk_search_hit_upsert_retries_duplicate_canonical_url():
+    db = _db()
+    store = SearchDiscoveryStore(db)
+    store.ensure_indexes()
+    original = store.upsert_search_hit(**asdict(_hit("1")))
+
+    # A different job id reusing hit 1's URL collides on canonical_url_hash.
+    results = store.upsert_search_hits_bulk([_hit("2", job_url="https://www.linkedin.com/jobs/view/1/"), _hit("3")])
+
+    assert [result.inserted for result in results] == [False, True]
+    assert results[0].hit_id == original.hit_id
+    assert db["scout_search_hits"].count_documents({}) == 2
+
+
+def test_hits_marked_queued_in_bulk():
+    db = _db()
+    store = SearchDiscoveryStore(db)
+    store.ensure_indexes()
+    first, second = store.upsert_search_hits_bulk([_hit("1"), _hit("2")])
+
+    store.mark_hits_queued([(first.hit_id, "wi-1"), (second.hit_id, None)], consumer_mode="native_scrape")
+
+    marked = {doc["external_job_id"]: doc for doc in db["scout_search_hits"].find()}
+    assert marked["1"]["hit_status"] == "queued_for_scrape"
+    assert marked["1"]["scrape"]["work_item_id"] == "wi-1"
+    assert marked["2"]["scrape"]["consumer_mode"] == "native_scrape"
+    assert marked["2"]["scrape"]["work_item_id"] is None
+
+
 def test_duplicate_enqueue_prevented_by_idempotency_key():
     db = _db()
     queue = WorkItemQueue(db)
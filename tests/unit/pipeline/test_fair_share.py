@@ -0,0 +1,120 @@
+"""Tests for fair-share work-item claims."""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+import mongomock
+import pytest
+
+from src.pipeline.fair_share import FairShareScheduler, normalize_origin, origin_weight
+from src.pipeline.queue import WorkItemQueue
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def mock_db():
+    db = mongomock.MongoClient()["jobs"]
+    WorkItemQueue(db).ensure_indexes()
+    return db
+
+
+def _enqueue(queue: WorkItemQueue, key: str, *, origin=None, available_at=NOW):
+    return queue.enqueue(
+        task_type="preenrich.jd_structure",
+        lane="preenrich",
+        consumer_mode="native_stage_dag",
+        subject_type="job",
+        subject_id=key,
+        priority=100,
+        available_at=available_at,
+        max_attempts=3,
+        idempotency_key=key,
+        correlation_id=key,
+        payload={},
+        origin=origin,
+        now=NOW,
+    ).document
+
+
+def test_origin_defaults_and_weights(monkeypatch):
+    assert normalize_origin(None) == "cron"
+    assert normalize_origin(" Interactive ") == "interactive"
+    assert normalize_origin("bulk") == "cron"
+    monkeypatch.setenv("WORK_ITEM_FAIR_SHARE_WEIGHT_BACKFILL", "5")
+    assert origin_weight("backfill") == 5
+    assert origin_weight("interactive") == 8
+
+
+def test_weighted_round_robin_is_proportional_and_interleaved():
+    scheduler = FairShareScheduler({"interactive": 8, "cron": 3, "backfill": 1}, aging=10_000)
+    oldest = {"interactive": NOW, "cron": NOW, "backfill": NOW}
+
+    picks = [scheduler.order(oldest, now=NOW)[0] for _ in range(24)]
+
+    assert Counter(picks) == {"interactive": 16, "cron": 6, "backfill": 2}
+    assert "backfill" in picks[:12]  # never starved within a cycle
+
+
+def test_aging_boosts_a_starved_origin():
+    scheduler = FairShareScheduler({"interactive": 8, "backfill": 1}, aging=60)
+    oldest = {"interactive": NOW, "backfill": NOW - timedelta(minutes=30)}
+
+    picks = [scheduler.order(oldest, now=NOW)[0] for _ in range(39)]
+
+    assert Counter(picks)["backfill"] > Counter(picks)["interactive"]
+
+
+def test_claim_next_serves_interactive_behind_a_backfill(mock_db):
+    queue = WorkItemQueue(mock_db)
+    for index in range(20):
+        _enqueue(queue, f"backfill-{index}", origin="backfill", available_at=NOW - timedelta(minutes=5))
+    interactive = _enqueue(queue, "interactive-1", origin="interactive")
+
+    claimed = queue.claim_next(lane="preenrich", worker_name="w1", now=NOW)
+
+    assert claimed["_id"] == interactive["_id"]
+    assert claimed["origin"] == "interactive"
+    assert queue.claim_next(lane="preenrich", worker_name="w1", now=NOW)["origin"] == "backfill"
+
+
+def test_items_without_origin_are_claimed_as_cron(mock_db):
+    queue = WorkItemQueue(mock_db)
+    legacy = _enqueue(queue, "legacy")
+    mock_db["work_items"].update_one({"_id": legacy["_id"]}, {"$unset": {"origin": ""}})
+
+    assert queue.claim_next(lane="preenrich", worker_name="w1", now=NOW)["_id"] == legacy["_id"]
+
+
+def test_disabled_keeps_single_priority_order(mock_db, monkeypatch):
+    monkeypatch.setenv("WORK_ITEM_FAIR_SHARE_ENABLED", "false")
+    queue = WorkItemQueue(mock_db)
+    first = _enqueue(queue, "backfill-1", origin="backfill")
+    _enqueue(queue, "interactive-1", origin="interactive")
+
+    assert queue.claim_next(lane="preenrich", worker_name="w1", now=NOW)["_id"] == first["_id"]
+
+
+def test_work_enqueued_elsewhere_is_claimed_on_the_next_claim(mock_db):
+    queue = WorkItemQueue(mock_db)
+    _enqueue(queue, "cron-1")
+    _enqueue(queue, "cron-2")
+    assert queue.claim_next(lane="preenrich", worker_name="w1", now=NOW)["origin"] == "cron"
+
+    # Enqueued by another process (the runner, a sweeper): no local state to clear
+    interactive = _enqueue(WorkItemQueue(mock_db), "interactive-1", origin="interactive")
+
+    assert queue.claim_next(lane="preenrich", worker_name="w1", now=NOW)["_id"] == interactive["_id"]
+
+
+def test_claim_batch_picks_the_origin_per_item(mock_db):
+    queue = WorkItemQueue(mock_db)
+    for index in range(20):
+        _enqueue(queue, f"cron-{index}")
+        _enqueue(queue, f"backfill-{index}", origin="backfill")
+
+    claimed = queue.claim_batch(8, lane="preenrich", worker_name="w1", now=NOW)
+
+    assert Counter(item["origin"] for item in claimed) == {"cron": 6, "backfill": 2}
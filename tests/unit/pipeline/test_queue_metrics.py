@@ -0,0 +1,183 @@
+"""Tests for the work-item queue telemetry rollup."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import mongomock
+import pytest
+from bson import ObjectId
+
+from src.pipeline.queue import WorkItemQueue
+from src.pipeline.queue_metrics import (
+    QueueMetrics,
+    Transition,
+    bucket_key,
+    format_summary,
+    quantile_from_buckets,
+)
+
+NOW = datetime(2026, 10, 18, 12, 30, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def mock_db():
+    db = mongomock.MongoClient()["jobs"]
+    WorkItemQueue(db).ensure_indexes()
+    return db
+
+
+def test_queue_indexes_include_metrics_ttl(mock_db):
+    indexes = mock_db["work_item_metrics"].index_information()
+    assert indexes["expires_at_ttl"]["expireAfterSeconds"] == 0
+    assert "kind_window_start" in indexes
+
+
+def _enqueue(queue: WorkItemQueue, key: str, *, task_type: str = "preenrich.jd_structure", available_at=None):
+    return queue.enqueue(
+        task_type=task_type,
+        lane="preenrich",
+        consumer_mode="native_stage_dag",
+        subject_type="job",
+        subject_id=str(ObjectId()),
+        priority=100,
+        available_at=available_at or NOW,
+        max_attempts=3,
+        idempotency_key=key,
+        correlation_id=key,
+        payload={},
+        now=NOW,
+    )
+
+
+def _stage(summary: list[dict], task_type: str = "preenrich.jd_structure") -> dict:
+    return next(row for row in summary if row["task_type"] == task_type)
+
+
+class TestHistogram:
+    def test_bucket_key_bounds(self):
+        assert bucket_key(0) == "le_100"
+        assert bucket_key(100) == "le_100"
+        assert bucket_key(101) == "le_250"
+        assert bucket_key(10_000_000) == "le_inf"
+
+    def test_quantiles_interpolate_within_bucket(self):
+        buckets = {"le_100": 50, "le_1000": 50}
+        assert quantile_from_buckets(buckets, 0.5) == pytest.approx(100.0)
+        assert quantile_from_buckets(buckets, 0.95) == pytest.approx(950.0)  # le_1000 spans 500-1000
+
+    def test_quantile_without_samples(self):
+        assert quantile_from_buckets({}, 0.5) is None
+        assert quantile_from_buckets({"le_inf": 3}, 0.5) == 3_600_000.0
+
+
+def test_queue_transitions_maintain_depth_and_latency(mock_db):
+    queue = WorkItemQueue(mock_db)
+    first = _enqueue(queue, "a", available_at=NOW - timedelta(seconds=2)).document
+    _enqueue(queue, "b")
+    _enqueue(queue, "a")  # duplicate: no transition
+
+    claimed = queue.claim_next(lane="preenrich", worker_name="w1", now=NOW)
+    assert claimed["_id"] == first["_id"]
+    queue.mark_done(claimed["_id"], now=NOW + timedelta(seconds=30))
+
+    second = queue.claim_next(lane="preenrich", worker_name="w1", now=NOW)
+    queue.mark_failed(second["_id"], error="boom", now=NOW + timedelta(seconds=1))
+
+    row = _stage(QueueMetrics(mock_db).summary(now=NOW))
+    assert row["depth"] == {"pending": 0, "leased": 0, "done": 1, "failed": 1}
+    assert row["counts"] == {"enqueued": 2, "claimed": 2, "completed": 1, "retried": 1}
+    assert row["claim_wait_ms"]["count"] == 2
+    assert row["claim_wait_ms"]["mean"] == 1000.0
+    assert row["run_ms"]["count"] == 2
+    assert 10_000 < row["run_ms"]["p95"] <= 30_000
+    assert row["retry_rate"] == 0.5
+    assert row["deadletter_rate"] == 0.0
+
+
+def test_enqueue_many_and_deadletter(mock_db):
+    queue = WorkItemQueue(mock_db)
+    results = queue.enqueue_many(
+        [
+            {
+                "task_type": task_type,
+                "lane": "preenrich",
+                "consumer_mode": "native_stage_dag",
+                "subject_type": "job",
+                "subject_id": "job-1",
+                "priority": 100,
+                "max_attempts": 3,
+                "idempotency_key": key,
+                "correlation_id": key,
+                "payload": {},
+            }
+            for key, task_type in (("x", "preenrich.jd_structure"), ("y", "preenrich.jd_facts"))
+        ],
+        now=NOW,
+    )
+    queue.mark_deadletter(results[0].document["_id"], error="fatal", now=NOW)
+    queue.mark_deadletter(results[0].document["_id"], error="fatal", now=NOW)  # already deadlettered
+
+    summary = QueueMetrics(mock_db).summary(now=NOW)
+    assert _stage(summary)["depth"] == {"pending": 0, "deadletter": 1}
+    assert _stage(summary)["counts"] == {"enqueued": 1, "deadlettered": 1}
+    assert _stage(summary, "preenrich.jd_facts")["depth"] == {"pending": 1}
+
+
+def test_cancel_matching_attributes_each_task_type(mock_db):
+    queue = WorkItemQueue(mock_db)
+    _enqueue(queue, "a")
+    _enqueue(queue, "b", task_type="preenrich.jd_facts")
+    queue.claim_next(lane="preenrich", worker_name="w1", task_type="preenrich.jd_facts", now=NOW)
+
+    cancelled = queue.cancel_matching({"lane": "preenrich"}, last_error={"class": "test"}, now=NOW)
+
+    assert cancelled == 2
+    summary = QueueMetrics(mock_db).summary(now=NOW)
+    assert _stage(summary)["depth"] == {"pending": 0, "cancelled": 1}
+    assert _stage(summary, "preenrich.jd_facts")["depth"] == {"pending": 0, "leased": 0, "cancelled": 1}
+
+
+def test_reconcile_depth_corrects_drift(mock_db):
+    queue = WorkItemQueue(mock_db)
+    _enqueue(queue, "a")
+    _enqueue(queue, "b")
+    mock_db["work_items"].update_many({}, {"$set": {"status": "failed"}})  # unrecorded writer
+    metrics = QueueMetrics(mock_db)
+    metrics.record(Transition("preenrich", "preenrich.gone", "enqueued", to_status="pending"), now=NOW)
+
+    assert metrics.reconcile_depth(lane="preenrich", now=NOW) == 2
+
+    summary = metrics.summary(now=NOW)
+    assert _stage(summary)["depth"] == {"pending": 0, "leased": 0, "failed": 2}
+    assert _stage(summary, "preenrich.gone")["depth"] == {"pending": 0, "leased": 0, "failed": 0}
+
+
+def test_summary_only_reads_recent_windows(mock_db):
+    metrics = QueueMetrics(mock_db)
+    metrics.record(Transition("preenrich", "preenrich.jd_structure", "claimed", claim_wait_ms=50), now=NOW)
+    metrics.record(
+        Transition("preenrich", "preenrich.jd_structure", "claimed", claim_wait_ms=50),
+        now=NOW - timedelta(hours=30),
+    )
+
+    row = _stage(metrics.summary(now=NOW, hours=24))
+    assert row["counts"] == {"claimed": 1}
+    assert row["claim_wait_ms"]["p50"] == 50.0
+    assert "jd_structure" in format_summary([row])
+
+
+def test_metrics_failures_never_fail_queue_ops(mock_db, monkeypatch):
+    queue = WorkItemQueue(mock_db)
+
+    def _broken(*args, **kwargs):
+        raise RuntimeError("metrics store down")
+
+    monkeypatch.setattr(queue.metrics.collection, "bulk_write", _broken)
+    assert _enqueue(queue, "a").created
+
+
+def test_disabled_records_nothing(mock_db, monkeypatch):
+    monkeypatch.setenv("WORK_ITEM_METRICS_ENABLED", "false")
+    _enqueue(WorkItemQueue(mock_db), "a")
+    assert mock_db["work_item_metrics"].count_documents({}) == 0
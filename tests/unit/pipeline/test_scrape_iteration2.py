@@ -125,6 +125,87 @@ def test_claim_and_lease_scrape_hit_work_item():
     assert claimed["attempt_count"] == 1
 
 
+def test_claim_batch_leases_in_priority_order_without_overlap():
+    db = _db()
+    for job_id in ("1", "2", "3", "4", "5"):
+        _create_hit_and_item(db, job_id=job_id, title="Senior AI Engineer")
+    db["work_items"].update_one({"payload.job_id": "5"}, {"$set": {"priority": 1}})
+    queue = WorkItemQueue(db)
+    now = datetime.now(timezone.utc)
+
+    first = queue.claim_batch(3, task_type="scrape.hit", lane="scrape", consumer_mode="native_scrape", worker_name="worker-1", now=now)
+    second = queue.claim_batch(3, task_type="scrape.hit", lane="scrape", consumer_mode="native_scrape", worker_name="worker-2", now=now)
+
+    assert [item["payload"]["job_id"] for item in first] == ["5", "1", "2"]
+    assert [item["payload"]["job_id"] for item in second] == ["3", "4"]
+    assert all(item["status"] == "leased" and item["attempt_count"] == 1 for item in first + second)
+    assert {item["lease_owner"] for item in first} == {"worker-1"}
+    assert queue.claim_batch(3, lane="scrape", worker_name="worker-3", now=now) == []
+
+    # Expired leases are reclaimable as a batch.
+    later = now + timedelta(seconds=301)
+    reclaimed = queue.claim_batch(10, lane="scrape", worker_name="worker-3", now=later)
+    assert len(reclaimed) == 5
+    assert all(item["attempt_count"] == 2 for item in reclaimed)
+
+
+def test_claim_batch_refills_past_exhausted_items():
+    db = _db()
+    _create_hit_and_item(db, job_id="1", title="Senior AI Engineer", max_attempts=1)
+    _create_hit_and_item(db, job_id="2", title="Senior AI Engineer")
+    db["work_items"].update_one({"payload.job_id": "1"}, {"$set": {"attempt_count": 1}})
+    queue = WorkItemQueue(db)
+
+    claimed = queue.claim_batch(2, lane="scrape", worker_name="worker-1")
+
+    assert [item["payload"]["job_id"] for item in claimed] == ["2"]
+    assert db["work_items"].find_one({"payload.job_id": "1"})["status"] == "deadletter"
+
+
+def test_heartbeat_batch_extends_only_owned_leases():
+    db = _db()
+    for job_id in ("1", "2"):
+        _create_hit_and_item(db, job_id=job_id, title="Senior AI Engineer")
+    queue = WorkItemQueue(db)
+    now = (datetime.now(timezone.utc) + timedelta(seconds=1)).replace(microsecond=0)
+    claimed = queue.claim_batch(2, lane="scrape", worker_name="worker-1", lease_seconds=60, now=now)
+    assert len(claimed) == 2
+
+    later = now + timedelta(seconds=30)
+    assert queue.heartbeat_batch([item["_id"] for item in claimed], lease_owner="worker-2", now=later) == 0
+    assert queue.heartbeat_batch([item["_id"] for item in claimed], lease_owner="worker-1", lease_seconds=60, now=later) == 2
+    leases = {item["lease_expires_at"] for item in db["work_items"].find()}
+    assert leases == {(later + timedelta(seconds=60)).replace(tzinfo=None)}
+
+
+def test_native_worker_claims_in_batches_with_one_hit_prefetch(tmp_path, monkeypatch):
+    monkeypatch.setenv("SCOUT_QUEUE_DIR", str(tmp_path))
+    db = _db()
+    for job_id in ("500", "501", "502", "503", "504"):
+        _create_hit_and_item(db, job_id=job_id, title="Senior AI Engineer")
+    worker = NativeScrapeWorker(db, flags=_flags(), worker_id="worker-1", use_proxy=False, claim_batch_size=2)
+    monkeypatch.setattr(
+        "src.pipeline.scrape_worker.evaluate_scrape_candidate",
+        lambda payload, pool, use_proxy: ScrapeSuccessResult(
+            scored_job=_scored_payload(payload["job_id"]),
+            http_status=200,
+            used_proxy=False,
+        ),
+    )
+    claim_sizes: list[int] = []
+    claim_batch, get_hits = worker.queue.claim_batch, worker.discovery.get_hits
+    monkeypatch.setattr(worker.queue, "claim_batch", lambda size, **kwargs: claim_sizes.append(size) or claim_batch(size, **kwargs))
+    monkeypatch.setattr(worker.discovery, "get_hits", lambda ids: claim_sizes.append(-len(ids)) or get_hits(ids))
+    monkeypatch.setattr(worker.discovery, "get_hit", lambda hit_id: (_ for _ in ()).throw(AssertionError("per-item lookup")))
+
+    result = worker.run_once(max_items=5, lease_seconds=300, trigger_mode="manual")
+
+    assert result["claimed"] == 5
+    assert result["scraped_success"] == 5
+    assert claim_sizes == [2, -2, 2, -2, 1, -1]
+    assert db["work_items"].count_documents({"status": "done"}) == 5
+
+
 def test_blacklist_skip_path(tmp_path, monkeypatch):
     monkeypatch.setenv("SCOUT_QUEUE_DIR", str(tmp_path))
     db = _db()
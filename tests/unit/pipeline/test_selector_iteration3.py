@@ -7,12 +7,15 @@ from datetime import datetime, timedelta, timezone
 import mongomock
 import pytest
 
-from src.common.dedupe import generate_dedupe_key
+from src.common.dedupe import company_title_key, generate_dedupe_key
 from src.pipeline.discovery import SearchDiscoveryStore
 from src.pipeline.queue import WorkItemQueue
 from src.pipeline.selector_common import (
+    backfill_company_title_keys,
     compute_profile_selector_plan,
     load_selector_profiles,
+    main_dedupe_against_db,
+    upsert_level2_job,
 )
 from src.pipeline.selector_scheduler import SelectorFeatureFlags, SelectorScheduler
 from src.pipeline.selector_store import SelectorStore
@@ -179,6 +182,57 @@ def test_main_selector_dedupe_parity_and_tier_split(monkeypatch):
     assert db["level-2"].count_documents({"dedupeKey": generate_dedupe_key("linkedin_scout", source_id="302")}) == 1
 
 
+def test_company_title_key_is_persisted_and_backfilled():
+    db = _db()
+    upsert_level2_job(
+        db["level-2"],
+        {"job_id": "350", "company": "McKinsey & Company", "title": "Senior AI Engineer"},
+        source_tag="scout_selector",
+        selected_for_preenrich=False,
+    )
+    db["level-2"].insert_many([{"company": "Acme", "title": "AI Lead"}, {"company": "Acme"}])
+
+    assert backfill_company_title_keys(db["level-2"], batch_size=1) == 2
+    assert backfill_company_title_keys(db["level-2"]) == 0
+    assert sorted(doc["company_title_key"] for doc in db["level-2"].find()) == [
+        "",
+        "acme|ailead",
+        "mckinseycompany|senioraiengineer",
+    ]
+    assert company_title_key("Acme", "") == ""
+
+
+def test_secondary_dedupe_queries_only_candidate_keys(monkeypatch):
+    db = _db()
+    db["level-2"].insert_one({"company": "Acme, Inc.", "title": "Senior AI Engineer"})  # unkeyed legacy row
+    db["level-2"].insert_many(
+        [
+            {"company": f"Archive {index}", "title": "Engineer", "company_title_key": f"archive{index}|engineer"}
+            for index in range(50)
+        ]
+    )
+    queries: list[dict] = []
+    original_find = type(db["level-2"]).find
+
+    def _recording_find(self, filter=None, *args, **kwargs):
+        if self.name == "level-2" and filter and "company_title_key" in filter:
+            queries.append(filter)
+        return original_find(self, filter, *args, **kwargs)
+
+    monkeypatch.setattr(type(db["level-2"]), "find", _recording_find)
+    fresh, duplicates = main_dedupe_against_db(
+        [
+            {"job_id": "360", "company": "ACME Inc", "title": "Senior AI Engineer"},
+            {"job_id": "361", "company": "NewCo", "title": "Senior AI Engineer"},
+        ],
+        db,
+    )
+
+    assert [job["job_id"] for job in fresh] == ["361"]
+    assert duplicates[0]["_decision_reason"] == "company_title"
+    assert {"company_title_key": {"$in": ["acmeinc|senioraiengineer", "newco|senioraiengineer"]}} in queries
+
+
 def test_top_n_lifecycle_selected_handoff_and_preenrich_claim(monkeypatch):
     db = _db()
     monkeypatch.setenv("SCOUT_SELECTOR_MAIN_QUOTA", "1")
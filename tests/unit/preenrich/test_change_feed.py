@@ -0,0 +1,274 @@
+"""Tests for change-stream driven preenrich scheduling."""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timezone
+from typing import Any
+
+import mongomock
+import pytest
+from bson import ObjectId
+from pymongo.errors import OperationFailure, PyMongoError
+
+from src.pipeline.queue import WorkItemQueue
+from src.preenrich import change_feed
+from src.preenrich.change_feed import (
+    ChangeNotifier,
+    ChangeStreamNotifier,
+    PollingNotifier,
+    open_notifier,
+    work_item_pipeline,
+)
+from src.preenrich.checksums import company_checksum, jd_checksum
+from src.preenrich.root_enqueuer import build_stage_states
+from src.preenrich.schema import idempotency_key, input_snapshot_id
+from src.preenrich.stage_worker import StageWorker
+from src.preenrich.sweepers import watch_dag_changes
+from src.preenrich.types import StageResult
+
+
+class _FakeStream:
+    def __init__(self, batches: list[Any]):
+        self._batches = list(batches)
+        self.resume_token = None
+        self.closed = False
+
+    def try_next(self):
+        if not self._batches:
+            return None
+        item = self._batches.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        self.resume_token = {"_data": item["_id"]}
+        return item
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeCollection:
+    name = "work_items"
+
+    def __init__(self, streams: list[_FakeStream]):
+        self._streams = list(streams)
+        self.watch_calls: list[dict[str, Any]] = []
+
+    def watch(self, pipeline, **kwargs):
+        self.watch_calls.append(kwargs)
+        return self._streams.pop(0)
+
+
+class _ScriptedNotifier(ChangeNotifier):
+    """Runs a callback on each wait() to simulate writes from other processes."""
+
+    event_driven = True
+
+    def __init__(self, on_wait):
+        self._on_wait = on_wait
+        self.waits = 0
+        self.closed = False
+
+    def wait(self, timeout: float) -> list[dict[str, Any]]:
+        self.waits += 1
+        return self._on_wait(self.waits) or []
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def mock_db():
+    db = mongomock.MongoClient()["jobs"]
+    WorkItemQueue(db).ensure_indexes()
+    return db
+
+
+def _insert_job(db: Any) -> tuple[ObjectId, str]:
+    job_id = ObjectId()
+    jd_cs = jd_checksum("Build reliable AI systems")
+    company_cs = company_checksum("Acme", None)
+    snapshot_id = input_snapshot_id(jd_cs, company_cs, "iteration4.v1")
+    db["level-2"].insert_one(
+        {
+            "_id": job_id,
+            "job_id": f"job-{job_id}",
+            "title": "AI Platform Engineer",
+            "company": "Acme",
+            "description": "Build reliable AI systems",
+            "lifecycle": "preenriching",
+            "pre_enrichment": {
+                "orchestration": "dag",
+                "dag_version": "iteration4.v1",
+                "input_snapshot_id": snapshot_id,
+                "jd_checksum": jd_cs,
+                "company_checksum": company_cs,
+                "stage_states": build_stage_states(snapshot_id),
+                "pending_next_stages": [],
+            },
+            "observability": {"langfuse_session_id": f"job:{job_id}"},
+        }
+    )
+    return job_id, snapshot_id
+
+
+class TestNotifiers:
+    def test_polling_when_disabled(self, monkeypatch):
+        monkeypatch.delenv("PREENRICH_CHANGE_STREAMS_ENABLED", raising=False)
+        collection = _FakeCollection([_FakeStream([])])
+        assert isinstance(open_notifier(collection, []), PollingNotifier)
+        assert collection.watch_calls == []
+
+    def test_polling_for_mongomock(self, monkeypatch, mock_db):
+        monkeypatch.setenv("PREENRICH_CHANGE_STREAMS_ENABLED", "true")
+        assert isinstance(open_notifier(mock_db["work_items"], []), PollingNotifier)
+
+    def test_polling_when_server_rejects_change_streams(self, monkeypatch):
+        monkeypatch.setenv("PREENRICH_CHANGE_STREAMS_ENABLED", "true")
+
+        class _Standalone(_FakeCollection):
+            def watch(self, pipeline, **kwargs):
+                raise OperationFailure("The $changeStream stage is only supported on replica sets", code=40573)
+
+        assert isinstance(open_notifier(_Standalone([]), []), PollingNotifier)
+
+    def test_change_stream_returns_events_and_resumes(self, monkeypatch):
+        monkeypatch.setenv("PREENRICH_CHANGE_STREAMS_ENABLED", "true")
+        monkeypatch.setattr(change_feed, "REOPEN_BACKOFF_SECONDS", 0.01)
+        first = _FakeStream([{"_id": "e1"}, PyMongoError("primary stepped down")])
+        second = _FakeStream([{"_id": "e2"}])
+        collection = _FakeCollection([first, second])
+
+        notifier = open_notifier(collection, work_item_pipeline("preenrich.jd_structure"))
+        assert isinstance(notifier, ChangeStreamNotifier)
+        assert notifier.wait(1.0) == [{"_id": "e1"}, {"_id": "e2"}]
+        assert collection.watch_calls[0]["full_document"] == "updateLookup"
+        assert collection.watch_calls[1]["resume_after"] == {"_data": "e1"}
+
+    def test_persistent_errors_back_off_and_poll(self, monkeypatch):
+        monkeypatch.setattr(change_feed, "REOPEN_BACKOFF_SECONDS", 0.05)
+
+        class _Broken(_FakeCollection):
+            def watch(self, pipeline, **kwargs):
+                self.watch_calls.append(kwargs)
+                if len(self.watch_calls) == 1:
+                    return _FakeStream([PyMongoError("node is recovering")])
+                raise PyMongoError("no primary")
+
+        collection = _Broken([])
+        notifier = ChangeStreamNotifier(collection, [])
+
+        assert notifier.wait(0.3) == []
+        # 0.05 + 0.1 + 0.2 backoff: a handful of reopen attempts, not a spin
+        assert 2 <= len(collection.watch_calls) <= 4
+
+    def test_history_lost_drops_resume_token(self, monkeypatch):
+        monkeypatch.setattr(change_feed, "REOPEN_BACKOFF_SECONDS", 0.0)
+        lost = OperationFailure("resume point no longer in the oplog", code=286)
+        collection = _FakeCollection(
+            [_FakeStream([{"_id": "e1"}, lost]), _FakeStream([{"_id": "e2"}])]
+        )
+        notifier = ChangeStreamNotifier(collection, [])
+
+        assert notifier.wait(1.0) == [{"_id": "e1"}, {"_id": "e2"}]
+        assert collection.watch_calls[1]["resume_after"] is None
+
+    def test_stop_event_interrupts_reopen_backoff(self, monkeypatch):
+        monkeypatch.setattr(change_feed, "REOPEN_BACKOFF_SECONDS", 60.0)
+        stop = threading.Event()
+        collection = _FakeCollection([_FakeStream([PyMongoError("stepdown")])])
+        notifier = ChangeStreamNotifier(collection, [], stop_event=stop)
+        threading.Timer(0.05, stop.set).start()
+
+        assert notifier.wait(30) == []
+        assert len(collection.watch_calls) == 1
+
+    def test_change_stream_wait_times_out_empty(self):
+        notifier = ChangeStreamNotifier(_FakeCollection([_FakeStream([])]), [])
+        assert notifier.wait(0.0) == []
+
+    def test_polling_wait_interrupted_by_stop(self):
+        stop = threading.Event()
+        stop.set()
+        assert PollingNotifier(stop).wait(30) == []
+
+
+class _HappyStage:
+    name = "jd_structure"
+
+    def run(self, ctx):
+        return StageResult(
+            output={"processed_jd_sections": [{"section_type": "summary", "content": "ok"}]},
+            provider_used="codex",
+            model_used="gpt-5.4",
+            prompt_version="v1",
+            duration_ms=5,
+        )
+
+
+def test_stage_worker_wakes_on_notification(mock_db):
+    job_id, snapshot_id = _insert_job(mock_db)
+
+    def _upstream_enqueues(wait_number):
+        if wait_number == 1:
+            WorkItemQueue(mock_db).enqueue(
+                task_type="preenrich.jd_structure",
+                lane="preenrich",
+                consumer_mode="native_stage_dag",
+                subject_type="job",
+                subject_id=str(job_id),
+                priority=100,
+                available_at=datetime.now(timezone.utc),
+                max_attempts=3,
+                idempotency_key=idempotency_key("jd_structure", str(job_id), snapshot_id),
+                correlation_id=f"job:{job_id}",
+                payload={"stage_name": "jd_structure", "input_snapshot_id": snapshot_id},
+            )
+            return [{"operationType": "insert"}]
+        return []
+
+    notifier = _ScriptedNotifier(_upstream_enqueues)
+    worker = StageWorker(mock_db, stage_name="jd_structure", stage_factories={"jd_structure": _HappyStage})
+
+    stats = worker.run_forever(notifier=notifier, max_items=1)
+
+    assert stats == {"processed": 1, "idle_waits": 1}
+    assert notifier.closed
+    assert mock_db["work_items"].find_one({"task_type": "preenrich.jd_structure"})["status"] == "done"
+
+
+def test_watch_dag_changes_drains_changed_job(mock_db):
+    job_id, snapshot_id = _insert_job(mock_db)
+
+    def _stage_completes(wait_number):
+        if wait_number != 1:
+            return []
+        mock_db["level-2"].update_one(
+            {"_id": job_id},
+            {
+                "$set": {
+                    "pre_enrichment.pending_next_stages": [
+                        {
+                            "idempotency_key": idempotency_key("jd_extraction", str(job_id), snapshot_id),
+                            "task_type": "preenrich.jd_extraction",
+                            "priority": 100,
+                            "max_attempts": 3,
+                            "correlation_id": f"job:{job_id}",
+                            "payload": {"stage_name": "jd_extraction", "input_snapshot_id": snapshot_id},
+                            "enqueued_at": None,
+                        }
+                    ]
+                }
+            },
+        )
+        return [{"operationType": "update", "documentKey": {"_id": job_id}}] * 2
+
+    stats = watch_dag_changes(
+        mock_db,
+        notifier=_ScriptedNotifier(_stage_completes),
+        scan_interval_seconds=3600,
+        max_cycles=2,
+    )
+
+    assert stats == {"events": 2, "entries": 1, "finalized": 0, "scans": 1}
+    assert mock_db["work_items"].count_documents({"task_type": "preenrich.jd_extraction"}) == 1
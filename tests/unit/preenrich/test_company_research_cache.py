@@ -0,0 +1,190 @@
+"""
+Tests for the cross-job company research artifact cache.
+
+Runs the Atlas repository against mongomock (patched MongoClient) and covers
+fresh hits, TTL expiry, single-flight locking across threads (with repository
+calls serialized the way Atlas applies them), lock takeover
+and fail-open behaviour.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import mongomock
+import pytest
+
+from src.common.repositories.company_research_artifact_repository import (
+    AtlasCompanyResearchArtifactRepository,
+)
+from src.preenrich.company_research_cache import (
+    CACHE_BYPASS,
+    CACHE_COMPUTED,
+    CACHE_HIT,
+    CACHE_SHARED,
+    get_or_compute_company_research,
+    is_fresh,
+)
+
+CHECKSUM = "sha256:acme"
+PROMPT = "research_enrichment_bundle@test"
+
+
+@pytest.fixture
+def repo():
+    AtlasCompanyResearchArtifactRepository.reset_connection()
+    with patch(
+        "src.common.repositories.company_research_artifact_repository.MongoClient",
+        mongomock.MongoClient,
+    ):
+        repository = AtlasCompanyResearchArtifactRepository("mongodb://test")
+        repository.ensure_indexes()
+        yield repository
+    AtlasCompanyResearchArtifactRepository._client = None
+
+
+def _compute(calls, delay=0.0, summary="Acme builds AI software."):
+    def compute():
+        calls.append(threading.current_thread().name)
+        time.sleep(delay)
+        return {"company_profile": {"summary": summary}, "notes": []}
+
+    return compute
+
+
+class _AtomicRepository:
+    """
+    Serializes repository calls across threads.
+
+    Atlas applies each single-document write atomically and enforces the
+    unique key between concurrent upserts; mongomock does neither, so
+    unsynchronized threads can both insert the lock document.
+    """
+
+    def __init__(self, inner, *, waiters):
+        self._inner = inner
+        self._lock = threading.Lock()
+        self._waiters = waiters
+        self._refused = set()
+        self.all_refused = threading.Event()
+
+    def __getattr__(self, name):
+        method = getattr(self._inner, name)
+
+        def call(*args, **kwargs):
+            with self._lock:
+                return method(*args, **kwargs)
+
+        return call
+
+    def try_acquire_lock(self, company_checksum, prompt_version, owner, lease_seconds):
+        with self._lock:
+            acquired = self._inner.try_acquire_lock(company_checksum, prompt_version, owner, lease_seconds)
+            if not acquired:
+                self._refused.add(owner)
+                if len(self._refused) >= self._waiters:
+                    self.all_refused.set()
+            return acquired
+
+
+class TestCompanyResearchCache:
+    def test_miss_then_hit(self, repo):
+        calls = []
+        first, outcome = get_or_compute_company_research(CHECKSUM, PROMPT, _compute(calls), repository=repo)
+        assert outcome == CACHE_COMPUTED
+        assert first["company_profile"]["summary"] == "Acme builds AI software."
+
+        second, outcome = get_or_compute_company_research(CHECKSUM, PROMPT, _compute(calls), repository=repo)
+        assert outcome == CACHE_HIT
+        assert second["company_profile"] == first["company_profile"]
+        assert second["artifact_version"] == 1
+        assert second["lock_owner"] is None
+        assert len(calls) == 1
+
+    def test_prompt_version_is_part_of_key(self, repo):
+        calls = []
+        get_or_compute_company_research(CHECKSUM, PROMPT, _compute(calls), repository=repo)
+        _, outcome = get_or_compute_company_research(CHECKSUM, "other@v2", _compute(calls), repository=repo)
+        assert outcome == CACHE_COMPUTED
+        assert len(calls) == 2
+
+    def test_stale_artifact_is_recomputed(self, repo):
+        calls = []
+        get_or_compute_company_research(CHECKSUM, PROMPT, _compute(calls), repository=repo)
+        artifact, outcome = get_or_compute_company_research(
+            CHECKSUM, PROMPT, _compute(calls, summary="updated"), repository=repo, ttl_hours=0
+        )
+        assert outcome == CACHE_COMPUTED
+        assert repo.find_artifact(CHECKSUM, PROMPT)["artifact_version"] == 2
+        assert repo.find_artifact(CHECKSUM, PROMPT)["company_profile"]["summary"] == "updated"
+
+    def test_uncacheable_result_is_not_stored(self, repo):
+        calls = []
+        get_or_compute_company_research(
+            CHECKSUM, PROMPT, _compute(calls), repository=repo, cacheable=lambda _payload: False
+        )
+        _, outcome = get_or_compute_company_research(CHECKSUM, PROMPT, _compute(calls), repository=repo)
+        assert outcome == CACHE_COMPUTED
+        assert len(calls) == 2
+
+    def test_compute_error_releases_lock(self, repo):
+        def boom():
+            raise RuntimeError("transport down")
+
+        with pytest.raises(RuntimeError):
+            get_or_compute_company_research(CHECKSUM, PROMPT, boom, repository=repo)
+        assert repo.try_acquire_lock(CHECKSUM, PROMPT, "next-worker", 60)
+
+    def test_concurrent_workers_single_flight(self, repo):
+        atomic = _AtomicRepository(repo, waiters=4)
+        calls = []
+        outcomes = []
+
+        def compute():
+            calls.append(threading.current_thread().name)
+            # Finish only once every other worker has found the lock taken
+            assert atomic.all_refused.wait(timeout=5)
+            return {"company_profile": {"summary": "Acme builds AI software."}, "notes": []}
+
+        def worker(i):
+            _, outcome = get_or_compute_company_research(
+                CHECKSUM, PROMPT, compute, repository=atomic,
+                owner=f"w{i}", poll_seconds=0.01, lock_seconds=5,
+            )
+            outcomes.append(outcome)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10)
+
+        assert len(calls) == 1
+        assert sorted(outcomes) == [CACHE_COMPUTED] + [CACHE_SHARED] * 4
+
+    def test_expired_lock_is_taken_over(self, repo):
+        assert repo.try_acquire_lock(CHECKSUM, PROMPT, "crashed-worker", lease_seconds=0.05)
+        assert not repo.try_acquire_lock(CHECKSUM, PROMPT, "other", lease_seconds=60)
+        calls = []
+        _, outcome = get_or_compute_company_research(
+            CHECKSUM, PROMPT, _compute(calls), repository=repo, poll_seconds=0.02, lock_seconds=2
+        )
+        assert outcome == CACHE_COMPUTED
+        assert repo.find_artifact(CHECKSUM, PROMPT)["computed_by"] != "crashed-worker"
+
+    def test_storage_failure_fails_open(self):
+        broken = MagicMock()
+        broken.find_artifact.side_effect = ConnectionError("mongo down")
+        calls = []
+        artifact, outcome = get_or_compute_company_research(CHECKSUM, PROMPT, _compute(calls), repository=broken)
+        assert outcome == CACHE_BYPASS
+        assert artifact["notes"] == []
+        assert len(calls) == 1
+
+    def test_is_fresh_handles_naive_datetimes(self):
+        now = datetime.now(timezone.utc)
+        naive = (now - timedelta(hours=1)).replace(tzinfo=None)
+        assert is_fresh({"computed_at": naive}, ttl_hours=2, now=now)
+        assert not is_fresh({"computed_at": naive}, ttl_hours=0.5, now=now)
+        assert not is_fresh({"lock_owner": "w1"}, ttl_hours=2, now=now)
@@ -7,10 +7,19 @@ Validates:
 - invalidate("company") propagates to company-dependent subgraph only
 - invalidate("priors") propagates to annotations → persona → fit_signal
 - No cross-contamination (company change does NOT stale JD-only stages)
+- topological_levels groups independent stages for concurrent execution
+- dag_closures precomputes the same closures as bitmasks, per configuration
 """
 
+import pytest
 
-from src.preenrich.dag import STAGE_ORDER, invalidate
+from src.preenrich.dag import (
+    _BLUEPRINT_DEPENDENCIES,
+    STAGE_ORDER,
+    dag_closures,
+    invalidate,
+    topological_levels,
+)
 
 # ---------------------------------------------------------------------------
 # Stage order
@@ -187,3 +196,65 @@ def test_empty_invalidation():
 def test_unknown_input_is_ignored():
     """Unknown input keys produce no invalidation."""
     assert invalidate({"nonexistent_input"}) == set()
+
+
+# ---------------------------------------------------------------------------
+# Topological levels
+# ---------------------------------------------------------------------------
+
+
+def test_topological_levels_group_independent_stages():
+    """Stages whose dependencies are all satisfied share a level, in input order."""
+    levels = topological_levels(["a", "b", "c", "d"], {"b": ["a"], "c": ["a"], "d": ["b", "c"]})
+    assert levels == [["a"], ["b", "c"], ["d"]]
+
+
+def test_topological_levels_ignore_dependencies_outside_run():
+    """Dependencies not being scheduled are prerequisites, not levels."""
+    assert topological_levels(["b", "c"], {"b": ["a"], "c": ["b"]}) == [["b"], ["c"]]
+
+
+def test_topological_levels_blueprint_dag():
+    """Blueprint DAG parallelises the research/annotation fan-out."""
+    levels = topological_levels(list(_BLUEPRINT_DEPENDENCIES), _BLUEPRINT_DEPENDENCIES)
+    assert levels[0] == ["jd_structure"]
+    assert levels[-1] == ["blueprint_assembly"]
+    assert sum(len(level) for level in levels) == len(_BLUEPRINT_DEPENDENCIES)
+    assert len(levels) < len(_BLUEPRINT_DEPENDENCIES)
+    position = {stage: i for i, level in enumerate(levels) for stage in level}
+    for stage, deps in _BLUEPRINT_DEPENDENCIES.items():
+        for dep in deps:
+            assert position[dep] < position[stage]
+
+
+def test_topological_levels_reject_cycles():
+    with pytest.raises(ValueError, match="cycle"):
+        topological_levels(["a", "b"], {"a": ["b"], "b": ["a"]})
+
+
+# ---------------------------------------------------------------------------
+# Precomputed closures
+# ---------------------------------------------------------------------------
+
+
+def test_closures_round_trip_stage_masks():
+    closures = dag_closures()
+    assert closures.stage_set(closures.mask(["persona", "annotations", "unknown"])) == {"persona", "annotations"}
+    assert closures.stage_set(closures.closure_mask(["annotations"])) == {"annotations", "persona"}
+    assert closures.stage_set(closures.input_mask({"priors"})) == invalidate({"priors"})
+
+
+def test_closures_are_cached_per_configuration(monkeypatch):
+    legacy = dag_closures()
+    assert dag_closures() is legacy
+
+    monkeypatch.setenv("PREENRICH_BLUEPRINT_ENABLED", "true")
+    blueprint = dag_closures()
+    assert blueprint is not legacy
+    assert blueprint.stage_set(blueprint.input_mask({"taxonomy"})) == invalidate({"taxonomy"})
+    assert "jd_structure" not in invalidate({"taxonomy"})
+    assert {"classification", "research_enrichment", "blueprint_assembly"} <= invalidate({"taxonomy"})
+
+    monkeypatch.setenv("PREENRICH_PERSONA_COMPAT_ENABLED", "false")
+    assert "persona_compat" not in dag_closures().stages
+    assert invalidate({"priors"}) == {"annotations", "blueprint_assembly"}
@@ -0,0 +1,199 @@
+"""
+Level-parallel run_sequence (PREENRICH_STAGE_PARALLELISM > 1).
+
+Uses mongomock for Mongo and stage names outside the production DAG so the
+test controls dependencies through each stage's ``dependencies`` attribute.
+
+Verifies:
+- Stages on the same DAG level run concurrently
+- Downstream stages see upstream output patches
+- Patches and summary are merged in stage order regardless of finish order
+- A failure stops only its downstream branch; lifecycle stays un-ready
+- Completed-at-checksum stages are skipped
+"""
+
+import hashlib
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+
+try:
+    import mongomock
+    HAS_MONGOMOCK = True
+except ImportError:
+    HAS_MONGOMOCK = False
+
+from src.preenrich.dispatcher import run_sequence, stage_parallelism
+from src.preenrich.types import StageContext, StageResult, StageStatus, StepConfig
+
+pytestmark = pytest.mark.skipif(
+    not HAS_MONGOMOCK,
+    reason="mongomock not installed",
+)
+
+WORKER_ID = "test-worker-par"
+JD_CHECKSUM = "sha256:" + hashlib.sha256(b"parallel jd").hexdigest()
+
+
+@pytest.fixture(autouse=True)
+def parallel_env(monkeypatch):
+    monkeypatch.setenv("PREENRICH_STAGE_PARALLELISM", "4")
+
+
+def _make_db():
+    return mongomock.MongoClient()["jobs"]
+
+
+def _insert_job(db: Any, stages: Dict[str, Any] = None) -> Dict[str, Any]:
+    from bson import ObjectId
+    job_doc = {
+        "_id": ObjectId(),
+        "title": "AI Engineer",
+        "company": "Acme",
+        "lifecycle": "preenriching",
+        "lease_owner": WORKER_ID,
+        "lease_expires_at": datetime(2099, 1, 1, tzinfo=timezone.utc),
+        "pre_enrichment": {"jd_checksum": JD_CHECKSUM, "stages": stages or {}},
+    }
+    db["level-2"].insert_one(job_doc)
+    return job_doc
+
+
+def _make_ctx(job_doc: Dict[str, Any]) -> StageContext:
+    return StageContext(
+        job_doc=job_doc,
+        jd_checksum=JD_CHECKSUM,
+        company_checksum="sha256:acme",
+        input_snapshot_id=JD_CHECKSUM,
+        attempt_number=1,
+        config=StepConfig(provider="claude"),
+        shadow_mode=False,
+    )
+
+
+def _make_stage(name: str, deps: List[str], *, delay: float = 0.0, fail: bool = False, seen=None):
+    """Mock stage that sleeps, records the job_doc it was given, then succeeds or raises."""
+    stage = MagicMock()
+    stage.name = name
+    stage.dependencies = deps
+
+    def run(ctx):
+        if seen is not None:
+            seen[name] = dict(ctx.job_doc)
+        time.sleep(delay)
+        if fail:
+            raise RuntimeError(f"Stage {name} intentionally failed")
+        return StageResult(
+            output={f"{name}_output": f"value_from_{name}", "last_writer": name},
+            provider_used="claude",
+            model_used="claude-haiku-4-5",
+            prompt_version="v1",
+            duration_ms=int(delay * 1000),
+        )
+
+    stage.run.side_effect = run
+    return stage
+
+
+class TestStageParallelism:
+    def test_default_is_sequential(self, monkeypatch):
+        monkeypatch.delenv("PREENRICH_STAGE_PARALLELISM", raising=False)
+        assert stage_parallelism() == 1
+
+    def test_invalid_value_falls_back_to_sequential(self, monkeypatch):
+        monkeypatch.setenv("PREENRICH_STAGE_PARALLELISM", "many")
+        assert stage_parallelism() == 1
+
+
+class TestLevelParallelRunSequence:
+    def test_same_level_stages_run_concurrently(self):
+        db = _make_db()
+        job_doc = _insert_job(db)
+        # Each leaf waits until all three are inside run(): only possible if they overlap
+        barrier = threading.Barrier(3, timeout=5)
+
+        def tracked(name):
+            stage = _make_stage(name, ["root"])
+            inner = stage.run.side_effect
+
+            def run(ctx):
+                barrier.wait()
+                return inner(ctx)
+
+            stage.run.side_effect = run
+            return stage
+
+        stages = [_make_stage("root", [])] + [tracked(f"leaf{i}") for i in range(3)]
+        summary = run_sequence(db, _make_ctx(job_doc), stages, WORKER_ID)
+
+        assert not barrier.broken
+        assert summary["completed"] == ["root", "leaf0", "leaf1", "leaf2"]
+        assert db["level-2"].find_one({"_id": job_doc["_id"]})["lifecycle"] == "ready"
+
+    def test_downstream_stage_sees_upstream_patches(self):
+        db = _make_db()
+        job_doc = _insert_job(db)
+        seen: Dict[str, Dict[str, Any]] = {}
+        stages = [
+            _make_stage("a", [], seen=seen),
+            _make_stage("b", ["a"], seen=seen),
+            _make_stage("c", ["a"], seen=seen),
+            _make_stage("d", ["b", "c"], seen=seen),
+        ]
+
+        run_sequence(db, _make_ctx(job_doc), stages, WORKER_ID)
+
+        assert seen["b"]["a_output"] == "value_from_a"
+        assert "c_output" not in seen["b"]  # siblings are isolated
+        assert seen["d"]["b_output"] == "value_from_b"
+        assert seen["d"]["c_output"] == "value_from_c"
+        assert seen["d"]["pre_enrichment"]["stages"]["c"]["status"] == StageStatus.COMPLETED
+
+    def test_merge_order_follows_stage_order(self):
+        db = _make_db()
+        job_doc = _insert_job(db)
+        ctx = _make_ctx(job_doc)
+        # "slow" finishes last but is listed first, so "fast" wins the shared key
+        stages = [_make_stage("slow", [], delay=0.1), _make_stage("fast", [])]
+
+        summary = run_sequence(db, ctx, stages, WORKER_ID)
+
+        assert summary["completed"] == ["slow", "fast"]
+        assert list(summary["fallback_counts"]) == ["slow", "fast"]
+        assert ctx.job_doc["last_writer"] == "fast"
+
+    def test_failure_stops_only_its_branch(self):
+        db = _make_db()
+        job_doc = _insert_job(db)
+        stages = [
+            _make_stage("root", []),
+            _make_stage("broken", ["root"], fail=True),
+            _make_stage("healthy", ["root"]),
+            _make_stage("after_broken", ["broken"]),
+            _make_stage("after_healthy", ["healthy"]),
+        ]
+
+        summary = run_sequence(db, _make_ctx(job_doc), stages, WORKER_ID)
+
+        assert summary["failed"] == ["broken"]
+        assert summary["completed"] == ["root", "healthy", "after_healthy"]
+        stages[3].run.assert_not_called()
+        assert db["level-2"].find_one({"_id": job_doc["_id"]})["lifecycle"] == "preenriching"
+
+    def test_completed_stages_are_skipped(self):
+        db = _make_db()
+        job_doc = _insert_job(
+            db,
+            stages={"a": {"status": StageStatus.COMPLETED, "jd_checksum_at_completion": JD_CHECKSUM}},
+        )
+        stages = [_make_stage("a", []), _make_stage("b", ["a"])]
+
+        summary = run_sequence(db, _make_ctx(job_doc), stages, WORKER_ID)
+
+        assert summary["skipped"] == ["a"]
+        assert summary["completed"] == ["b"]
+        stages[0].run.assert_not_called()
@@ -14,6 +14,7 @@ def test_index_plan_contains_required_collections():
         "work_items",
         "preenrich_stage_runs",
         "preenrich_job_runs",
+        "work_item_metrics",
     }
 
 
@@ -32,3 +33,10 @@ def test_work_item_plan_uses_valid_partial_ttl_shape():
     assert ttl_spec["kwargs"]["partialFilterExpression"] == {
         "status": {"$in": list(TERMINAL_WORK_ITEM_STATUSES)}
     }
+
+
+def test_plan_includes_work_item_metrics_ttl():
+    plan = build_index_plan()["work_item_metrics"]
+    ttl_spec = next(spec for spec in plan if spec["kwargs"]["name"] == "expires_at_ttl")
+    assert ttl_spec["keys"] == [("expires_at", 1)]
+    assert ttl_spec["kwargs"]["expireAfterSeconds"] == 0
@@ -366,6 +366,76 @@ def test_research_stage_writes_cache_refs_and_stakeholders(monkeypatch):
     assert stage_output["role_profile"]["status"] == "completed"
 
 
+def test_research_stage_reuses_company_artifact_across_jobs(monkeypatch):
+    import mongomock
+
+    from src.common.repositories.company_research_artifact_repository import AtlasCompanyResearchArtifactRepository
+    from src.preenrich.research_transport import CodexResearchTransport
+
+    monkeypatch.setenv("PREENRICH_RESEARCH_ENRICHMENT_V2_ENABLED", "true")
+    monkeypatch.setenv("WEB_RESEARCH_ENABLED", "true")
+    monkeypatch.setenv("PREENRICH_RESEARCH_COMPANY_ARTIFACT_CACHE_ENABLED", "true")
+    _mock_live_research_transport(monkeypatch)
+    company_prompts = []
+    fake_invoke = CodexResearchTransport.invoke_json
+
+    def _counting_invoke(self, *, prompt: str, **kwargs):
+        if "P-research-company@" in prompt:
+            company_prompts.append(kwargs["job_id"])
+        return fake_invoke(self, prompt=prompt, **kwargs)
+
+    monkeypatch.setattr(CodexResearchTransport, "invoke_json", _counting_invoke)
+    repo = AtlasCompanyResearchArtifactRepository.__new__(AtlasCompanyResearchArtifactRepository)
+    collection = mongomock.MongoClient()["jobs"]["research_company_artifacts"]
+    collection.create_index([("company_checksum", 1), ("prompt_version", 1)], unique=True)
+    monkeypatch.setattr(repo, "_get_collection", lambda: collection)
+    monkeypatch.setattr(
+        "src.preenrich.company_research_cache.get_company_research_artifact_repository", lambda: repo
+    )
+
+    first = ResearchEnrichmentStage().run(_context()).stage_output
+    second = ResearchEnrichmentStage().run(_context()).stage_output
+
+    assert len(company_prompts) == 1
+    assert first["cache_refs"]["company_artifact_outcome"] == "computed"
+    assert second["cache_refs"]["company_artifact_outcome"] == "hit"
+    assert second["company_profile"]["canonical_domain"] == first["company_profile"]["canonical_domain"]
+    assert second["company_profile"]["status"] == "completed"
+
+
+def test_research_stage_skips_company_artifact_cache_without_company(monkeypatch):
+    from src.preenrich.research_transport import CodexResearchTransport
+
+    monkeypatch.setenv("PREENRICH_RESEARCH_ENRICHMENT_V2_ENABLED", "true")
+    monkeypatch.setenv("WEB_RESEARCH_ENABLED", "true")
+    monkeypatch.setenv("PREENRICH_RESEARCH_COMPANY_ARTIFACT_CACHE_ENABLED", "true")
+    _mock_live_research_transport(monkeypatch)
+    company_prompts = []
+    fake_invoke = CodexResearchTransport.invoke_json
+
+    def _counting_invoke(self, *, prompt: str, **kwargs):
+        if "P-research-company@" in prompt:
+            company_prompts.append(kwargs["job_id"])
+        return fake_invoke(self, prompt=prompt, **kwargs)
+
+    def _no_repository():
+        raise AssertionError("companyless jobs must not touch the shared artifact cache")
+
+    monkeypatch.setattr(CodexResearchTransport, "invoke_json", _counting_invoke)
+    monkeypatch.setattr(
+        "src.preenrich.company_research_cache.get_company_research_artifact_repository", _no_repository
+    )
+
+    outcomes = []
+    for _ in range(2):
+        ctx = _context()
+        ctx.job_doc["company"] = "  "
+        outcomes.append(ResearchEnrichmentStage().run(ctx).stage_output["cache_refs"]["company_artifact_outcome"])
+
+    assert len(company_prompts) == 2
+    assert outcomes == [None, None]
+
+
 def test_research_stage_accepts_richer_live_shapes_after_normalization(monkeypatch):
     monkeypatch.setenv("PREENRICH_RESEARCH_ENRICHMENT_V2_ENABLED", "true")
     monkeypatch.setenv("WEB_RESEARCH_ENABLED", "true")
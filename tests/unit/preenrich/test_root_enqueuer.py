@@ -219,3 +219,32 @@ def test_parse_canary_allowlist_ignores_empty_entries():
 def test_canary_allowlist_takes_precedence_over_pct():
     assert canary_allows("a", allowlist={"a"}, pct=0) is True
     assert canary_allows("b", allowlist={"a"}, pct=100) is False
+
+
+def test_request_preenrich_tags_origin_and_enqueues(monkeypatch, mock_db):
+    monkeypatch.setenv("PREENRICH_STAGE_DAG_ENABLED", "true")
+    monkeypatch.setenv("PREENRICH_DAG_CANARY_PCT", "0")
+    job_id = ObjectId()
+    mock_db["level-2"].insert_one({"_id": job_id, "description": "Own the ML platform", "company": "Acme AI"})
+
+    stats = RootEnqueuer(mock_db).request_preenrich([str(job_id)], origin="backfill")
+
+    assert stats == {"selected": 1, "enqueued": 1, "skipped": 0}
+    level2_doc = mock_db["level-2"].find_one({"_id": job_id})
+    assert level2_doc["preenrich_origin"] == "backfill"
+    assert level2_doc["pre_enrichment"]["origin"] == "backfill"
+    assert level2_doc["selected_at"] is not None
+    assert mock_db["work_items"].find_one({"subject_id": str(job_id)})["origin"] == "backfill"
+
+
+def test_request_preenrich_skips_jobs_already_owned(monkeypatch, mock_db):
+    monkeypatch.setenv("PREENRICH_STAGE_DAG_ENABLED", "false")
+    owned = _insert_selected_job(mock_db, orchestration="dag")
+    selected = _insert_selected_job(mock_db)
+
+    stats = RootEnqueuer(mock_db).request_preenrich([owned, selected, ObjectId()], origin="interactive")
+
+    assert stats == {"selected": 1, "enqueued": 0, "skipped": 2}
+    assert mock_db["level-2"].find_one({"_id": selected})["preenrich_origin"] == "interactive"
+    assert "preenrich_origin" not in mock_db["level-2"].find_one({"_id": owned})
+    assert mock_db["work_items"].count_documents({}) == 0
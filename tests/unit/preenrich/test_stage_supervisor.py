@@ -0,0 +1,229 @@
+"""Tests for the adaptive preenrich stage supervisor."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import mongomock
+import pytest
+from bson import ObjectId
+
+from src.pipeline.queue import WorkItemQueue
+from src.preenrich.checksums import company_checksum, jd_checksum
+from src.preenrich.root_enqueuer import build_stage_states
+from src.preenrich.schema import idempotency_key, input_snapshot_id
+from src.preenrich.stage_supervisor import StageDemand, StageSupervisor, plan_allocation
+from src.preenrich.stage_worker import StageWorker
+from src.preenrich.types import StageResult
+
+
+@pytest.fixture
+def mock_db():
+    db = mongomock.MongoClient()["jobs"]
+    WorkItemQueue(db).ensure_indexes()
+    return db
+
+
+class _HappyStage:
+    name = "jd_structure"
+
+    def run(self, ctx):
+        return StageResult(
+            output={"processed_jd_sections": [{"section_type": "summary", "content": "ok"}]},
+            provider_used="codex",
+            model_used="gpt-5.4",
+            prompt_version="v1",
+            duration_ms=5,
+        )
+
+
+def _insert_job_with_root_item(db: Any) -> ObjectId:
+    job_id = ObjectId()
+    jd_cs = jd_checksum("Build reliable AI systems")
+    company_cs = company_checksum("Acme", None)
+    snapshot_id = input_snapshot_id(jd_cs, company_cs, "iteration4.v1")
+    db["level-2"].insert_one(
+        {
+            "_id": job_id,
+            "job_id": f"job-{job_id}",
+            "title": "AI Platform Engineer",
+            "company": "Acme",
+            "description": "Build reliable AI systems",
+            "lifecycle": "preenriching",
+            "pre_enrichment": {
+                "orchestration": "dag",
+                "dag_version": "iteration4.v1",
+                "input_snapshot_id": snapshot_id,
+                "jd_checksum": jd_cs,
+                "company_checksum": company_cs,
+                "stage_states": build_stage_states(snapshot_id),
+                "pending_next_stages": [],
+            },
+            "observability": {"langfuse_session_id": f"job:{job_id}"},
+        }
+    )
+    WorkItemQueue(db).enqueue(
+        task_type="preenrich.jd_structure",
+        lane="preenrich",
+        consumer_mode="native_stage_dag",
+        subject_type="job",
+        subject_id=str(job_id),
+        priority=100,
+        available_at=None,
+        max_attempts=3,
+        idempotency_key=idempotency_key("jd_structure", str(job_id), snapshot_id),
+        correlation_id=f"job:{job_id}",
+        payload={"stage_name": "jd_structure", "input_snapshot_id": snapshot_id},
+    )
+    return job_id
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+class TestPlanAllocation:
+    def test_every_backlogged_stage_gets_a_worker_before_water_filling(self):
+        allocation = plan_allocation(
+            [
+                StageDemand("jd_structure", "none", backlog=100),
+                StageDemand("jd_facts", "codex", backlog=2),
+                StageDemand("persona", "codex", backlog=0),
+            ],
+            max_workers=4,
+            stage_caps={"jd_structure": 5, "jd_facts": 5, "persona": 5},
+            provider_caps={},
+        )
+        assert allocation == {"jd_structure": 3, "jd_facts": 1, "persona": 0}
+
+    def test_claim_wait_shifts_workers(self):
+        allocation = plan_allocation(
+            [
+                StageDemand("jd_structure", "none", backlog=10),
+                StageDemand("jd_facts", "codex", backlog=10, claim_wait_p95_ms=300_000),
+            ],
+            max_workers=4,
+            stage_caps={"jd_structure": 4, "jd_facts": 4},
+            provider_caps={},
+        )
+        assert allocation == {"jd_facts": 3, "jd_structure": 1}
+
+    def test_respects_stage_backlog_and_provider_caps(self):
+        allocation = plan_allocation(
+            [
+                StageDemand("jd_facts", "codex", backlog=50),
+                StageDemand("classification", "codex", backlog=50),
+                StageDemand("jd_structure", "none", backlog=1),
+            ],
+            max_workers=8,
+            stage_caps={"jd_facts": 2, "classification": 2, "jd_structure": 2},
+            provider_caps={"codex": 3},
+        )
+        assert allocation["jd_facts"] + allocation["classification"] == 3
+        assert allocation["jd_structure"] == 1
+
+
+def test_unknown_stage_rejected(mock_db):
+    with pytest.raises(ValueError, match="nope"):
+        StageSupervisor(mock_db, stages=["jd_structure", "nope"])
+
+
+def test_read_demand_uses_rollup(mock_db):
+    _insert_job_with_root_item(mock_db)
+    supervisor = StageSupervisor(mock_db, stages=["jd_structure", "jd_extraction"])
+
+    demand = {item.stage_name: item for item in supervisor.read_demand()}
+
+    assert demand["jd_structure"].backlog == 1
+    assert demand["jd_extraction"].backlog == 0
+
+
+def test_supervisor_scales_up_drains_and_scales_down(mock_db, monkeypatch):
+    monkeypatch.setenv("PREENRICH_SUPERVISOR_RECONCILE_SECONDS", "3600")
+    _insert_job_with_root_item(mock_db)
+    supervisor = StageSupervisor(
+        mock_db,
+        stages=["jd_structure"],
+        max_workers=2,
+        worker_factory=lambda stage_name, worker_id: StageWorker(
+            mock_db,
+            stage_name=stage_name,
+            worker_id=worker_id,
+            stage_factories={"jd_structure": _HappyStage},
+        ),
+        idle_seconds=0.01,
+    )
+    try:
+        assert supervisor.rebalance() == {"jd_structure": 1}
+        assert _wait_until(lambda: supervisor.stats["processed"] == 1)
+        done = mock_db["work_items"].find_one({"task_type": "preenrich.jd_structure"})
+        assert done["status"] == "done"
+
+        assert supervisor.rebalance() == {"jd_structure": 0}
+        assert _wait_until(lambda: not any(slot.thread.is_alive() for slot in supervisor.slots))
+    finally:
+        supervisor.shutdown(drain_seconds=5)
+
+    assert all(not slot.thread.is_alive() for slot in supervisor.slots)
+    assert supervisor.stats["errors"] == 0
+
+
+def test_run_stops_and_drains(mock_db):
+    supervisor = StageSupervisor(mock_db, stages=["jd_structure"], idle_seconds=0.01)
+    stats = supervisor.run(max_cycles=1)
+    assert stats["rebalances"] == 1
+    assert supervisor.stop_event.is_set()
+
+
+class _ExhaustedLimiter:
+    max_wait_seconds = 30.0
+
+    def acquire(self):
+        return False
+
+
+def test_rate_limited_item_is_released_not_run(mock_db, monkeypatch):
+    monkeypatch.setenv("PREENRICH_SUPERVISOR_RECONCILE_SECONDS", "3600")
+    monkeypatch.setattr("src.preenrich.stage_supervisor._provider_rate_limiter", lambda provider: _ExhaustedLimiter())
+    job_id = _insert_job_with_root_item(mock_db)
+    runs = []
+
+    class _RecordingStage(_HappyStage):
+        def run(self, ctx):
+            runs.append(ctx)
+            return super().run(ctx)
+
+    supervisor = StageSupervisor(
+        mock_db,
+        stages=["jd_structure"],
+        max_workers=1,
+        worker_factory=lambda stage_name, worker_id: StageWorker(
+            mock_db,
+            stage_name=stage_name,
+            worker_id=worker_id,
+            stage_factories={"jd_structure": _RecordingStage},
+        ),
+        idle_seconds=0.01,
+    )
+    try:
+        supervisor.rebalance()
+        assert _wait_until(lambda: supervisor.stats["released"] >= 1)
+    finally:
+        supervisor.shutdown(drain_seconds=5)
+
+    assert runs == []
+    assert supervisor.stats["processed"] == 0
+    item = mock_db["work_items"].find_one({"task_type": "preenrich.jd_structure"})
+    assert item["status"] == "pending"
+    assert item["lease_owner"] is None
+    assert item["attempt_count"] == 0
+    assert item["available_at"].replace(tzinfo=None) > item["updated_at"].replace(tzinfo=None)
+    state = mock_db["level-2"].find_one({"_id": job_id})["pre_enrichment"]["stage_states"]["jd_structure"]
+    assert state["status"] == "pending"
+    assert state["lease_owner"] is None
@@ -9,6 +9,7 @@ import mongomock
 import pytest
 from bson import ObjectId
 
+from src.common.llm_scheduler import current_scheduling_context
 from src.pipeline.queue import WorkItemQueue
 from src.preenrich.blueprint_config import current_input_snapshot_id
 from src.preenrich.checksums import company_checksum, jd_checksum
@@ -246,7 +247,7 @@ def test_phase_a_success_can_be_drained_by_sweeper_when_inline_enqueue_is_skippe
     _enqueue_stage(mock_db, job_id=job_id, stage_name="jd_structure", snapshot_id=snapshot_id)
 
     class _StageWorkerNoInline(StageWorker):
-        def _inline_phase_b_enqueue(self, *, level2_id, now=None):
+        def _inline_phase_b_enqueue(self, *, level2_id, now=None, level2_doc=None):
             return {"jobs": 0, "entries": 0}
 
     worker = _StageWorkerNoInline(
@@ -272,6 +273,129 @@ def test_phase_a_success_can_be_drained_by_sweeper_when_inline_enqueue_is_skippe
     assert mock_db["work_items"].count_documents({"task_type": "preenrich.jd_extraction"}) == 1
 
 
+def test_downstream_stages_inherit_claim_origin(mock_db):
+    job_id = _insert_job(mock_db)
+    snapshot_id = mock_db["level-2"].find_one({"_id": job_id})["pre_enrichment"]["input_snapshot_id"]
+    root = _enqueue_stage(mock_db, job_id=job_id, stage_name="jd_structure", snapshot_id=snapshot_id)
+    mock_db["work_items"].update_one({"_id": root["_id"]}, {"$set": {"origin": "interactive"}})
+    worker = StageWorker(
+        mock_db,
+        stage_name="jd_structure",
+        worker_id="worker-a",
+        stage_factories={"jd_structure": _HappyStage},
+    )
+
+    assert worker.process_one()["status"] == "completed"
+
+    pending = mock_db["level-2"].find_one({"_id": job_id})["pre_enrichment"]["pending_next_stages"]
+    assert {entry["origin"] for entry in pending} == {"interactive"}
+    downstream = mock_db["work_items"].find_one({"task_type": "preenrich.jd_extraction"})
+    assert downstream["origin"] == "interactive"
+
+
+@pytest.mark.parametrize("origin, priority", [("interactive", "interactive"), (None, "batch"), ("backfill", "backfill")])
+def test_stage_llm_calls_are_scheduled_by_claim_origin(mock_db, origin, priority):
+    job_id = _insert_job(mock_db)
+    snapshot_id = mock_db["level-2"].find_one({"_id": job_id})["pre_enrichment"]["input_snapshot_id"]
+    root = _enqueue_stage(mock_db, job_id=job_id, stage_name="jd_structure", snapshot_id=snapshot_id)
+    mock_db["work_items"].update_one({"_id": root["_id"]}, {"$set": {"origin": origin}})
+    seen = {}
+
+    class _SchedulingStage(_HappyStage):
+        def run(self, ctx):
+            seen["context"] = current_scheduling_context()
+            return super().run(ctx)
+
+    worker = StageWorker(
+        mock_db,
+        stage_name="jd_structure",
+        worker_id="worker-a",
+        stage_factories={"jd_structure": _SchedulingStage},
+    )
+
+    assert worker.process_one()["status"] == "completed"
+    assert seen["context"] == (priority, str(job_id))
+    assert current_scheduling_context() == (None, None)
+
+
+def test_stage_success_persists_in_constant_round_trips(mock_db, monkeypatch):
+    job_id = _insert_job(mock_db)
+    snapshot_id = mock_db["level-2"].find_one({"_id": job_id})["pre_enrichment"]["input_snapshot_id"]
+    _enqueue_stage(mock_db, job_id=job_id, stage_name="jd_structure", snapshot_id=snapshot_id)
+
+    calls: list[str] = []
+    recording = [False]
+    depth = [0]  # mongomock implements bulk/find-and-modify on top of the single-document methods
+    for collection_name in (
+        "level-2",
+        "work_items",
+        "work_item_metrics",
+        "preenrich_stage_runs",
+        "preenrich_job_runs",
+        "jd_facts",
+    ):
+        collection = mock_db[collection_name]
+        for method in ("insert_one", "update_one", "bulk_write", "find", "find_one", "find_one_and_update"):
+            original = getattr(collection, method)
+
+            def _counted(*args, _original=original, _name=f"{collection_name}.{method}", **kwargs):
+                if recording[0] and depth[0] == 0:
+                    calls.append(_name)
+                depth[0] += 1
+                try:
+                    return _original(*args, **kwargs)
+                finally:
+                    depth[0] -= 1
+
+            monkeypatch.setattr(collection, method, _counted)
+
+    class _ArtifactStage:
+        name = "jd_structure"
+
+        def run(self, ctx):
+            recording[0] = True  # count only what happens after the stage itself returns
+            return StageResult(
+                output={"processed_jd_sections": [{"section_type": "summary", "content": "ok"}]},
+                provider_used="codex",
+                model_used="gpt-5.4",
+                artifact_writes=[
+                    ArtifactWrite(
+                        collection="jd_facts",
+                        unique_filter={"job_id": str(ctx.job_doc["_id"])},
+                        document={"job_id": str(ctx.job_doc["_id"]), "title": "AI Platform Engineer"},
+                        ref_name="jd_facts",
+                    )
+                ],
+            )
+
+    worker = StageWorker(
+        mock_db,
+        stage_name="jd_structure",
+        worker_id="worker-a",
+        stage_factories={"jd_structure": _ArtifactStage},
+    )
+    result = worker.process_one()
+
+    assert result["status"] == "completed"
+    assert calls == [
+        "jd_facts.find_one_and_update",  # artifact upsert + read-back
+        "level-2.find_one_and_update",  # phase A, returns the doc phase B drains from
+        "preenrich_stage_runs.update_one",
+        "work_items.bulk_write",  # downstream enqueue, no duplicate read-back
+        "work_item_metrics.bulk_write",  # enqueued transitions
+        "level-2.bulk_write",  # outbox marked enqueued
+        "work_items.find_one_and_update",  # mark_done, returns the prior status for metrics
+        "work_item_metrics.bulk_write",  # completed transition
+        "level-2.update_one",  # cv_ready compare-and-set, no pre-read
+    ]
+    pending = mock_db["level-2"].find_one({"_id": job_id})["pre_enrichment"]["pending_next_stages"]
+    assert pending and all(entry["enqueued_at"] is not None for entry in pending)
+    downstream = mock_db["work_items"].find_one({"task_type": "preenrich.jd_extraction"})
+    assert downstream is not None
+    state = mock_db["level-2"].find_one({"_id": job_id})["pre_enrichment"]["stage_states"]["jd_extraction"]
+    assert state["work_item_id"] == downstream["_id"]
+
+
 def test_stage_context_carries_tracer_handle(mock_db):
     job_id = _insert_job(mock_db)
     snapshot_id = mock_db["level-2"].find_one({"_id": job_id})["pre_enrichment"]["input_snapshot_id"]
@@ -11,14 +11,18 @@ from bson import ObjectId
 
 from src.pipeline.queue import WorkItemQueue
 from src.preenrich import sweepers as sweepers_module
+from src.preenrich.blueprint_config import current_dag_version, current_input_snapshot_id, taxonomy_version
 from src.preenrich.checksums import company_checksum, jd_checksum
 from src.preenrich.root_enqueuer import build_stage_states
 from src.preenrich.schema import idempotency_key, input_snapshot_id
+from src.preenrich.stage_registry import iter_stage_definitions
 from src.preenrich.sweepers import (
     drain_pending_next_stages,
     finalize_cv_ready,
+    invalidate_input_version,
     invalidate_snapshot_if_changed,
     release_expired_stage_leases,
+    snapshot_invalidator_scan,
 )
 
 
@@ -132,6 +136,82 @@ def test_drain_pending_next_stages_enqueues_once(mock_db):
     assert mock_db["work_items"].count_documents({"task_type": "preenrich.jd_extraction"}) == 1
 
 
+def _pending_entry(job_id: ObjectId, snapshot_id: str, stage_name: str) -> dict[str, Any]:
+    return {
+        "idempotency_key": idempotency_key(stage_name, str(job_id), snapshot_id),
+        "task_type": f"preenrich.{stage_name}",
+        "priority": 100,
+        "max_attempts": 3,
+        "correlation_id": f"job:{job_id}",
+        "payload": {"stage_name": stage_name, "input_snapshot_id": snapshot_id},
+        "enqueued_at": None,
+    }
+
+
+def test_drain_pending_next_stages_batches_round_trips(mock_db, monkeypatch):
+    jobs = [_insert_job(mock_db) for _ in range(4)]
+    for job_id, snapshot_id in jobs:
+        mock_db["level-2"].update_one(
+            {"_id": job_id},
+            {
+                "$set": {
+                    "pre_enrichment.pending_next_stages": [
+                        _pending_entry(job_id, snapshot_id, "jd_extraction"),
+                        _pending_entry(job_id, snapshot_id, "company_research"),
+                    ]
+                }
+            },
+        )
+    # One entry was already enqueued by an earlier, interrupted drain
+    first_job, first_snapshot = jobs[0]
+    WorkItemQueue(mock_db).enqueue_many(
+        [
+            {
+                "task_type": "preenrich.jd_extraction",
+                "lane": "preenrich",
+                "consumer_mode": "native_stage_dag",
+                "subject_type": "job",
+                "subject_id": str(first_job),
+                "priority": 100,
+                "max_attempts": 3,
+                "idempotency_key": idempotency_key("jd_extraction", str(first_job), first_snapshot),
+                "correlation_id": f"job:{first_job}",
+                "payload": {"stage_name": "jd_extraction"},
+            }
+        ]
+    )
+    calls: list[str] = []
+    depth = [0]  # mongomock implements bulk_write on top of the single-document methods
+    for collection_name in ("level-2", "work_items"):
+        collection = mock_db[collection_name]
+        for method in ("insert_one", "update_one", "bulk_write", "find", "find_one"):
+            original = getattr(collection, method)
+
+            def _counted(*args, _original=original, _name=f"{collection_name}.{method}", **kwargs):
+                if depth[0] == 0:
+                    calls.append(_name)
+                depth[0] += 1
+                try:
+                    return _original(*args, **kwargs)
+                finally:
+                    depth[0] -= 1
+
+            monkeypatch.setattr(collection, method, _counted)
+
+    stats = drain_pending_next_stages(mock_db)
+
+    assert stats == {"jobs": 4, "entries": 8}
+    assert sorted(calls) == ["level-2.bulk_write", "level-2.find", "work_items.bulk_write", "work_items.find"]
+    assert mock_db["work_items"].count_documents({}) == 8
+    for job_id, _snapshot_id in jobs:
+        doc = mock_db["level-2"].find_one({"_id": job_id})
+        pre = doc["pre_enrichment"]
+        assert all(entry["enqueued_at"] is not None for entry in pre["pending_next_stages"])
+        for stage_name in ("jd_extraction", "company_research"):
+            work_item = mock_db["work_items"].find_one({"subject_id": str(job_id), "task_type": f"preenrich.{stage_name}"})
+            assert pre["stage_states"][stage_name]["work_item_id"] == work_item["_id"]
+
+
 def test_finalize_cv_ready_is_cas_suppressed_after_first_success(mock_db):
     job_id, snapshot_id = _insert_job(mock_db)
     set_doc = {"lifecycle": "preenriching"}
@@ -159,6 +239,35 @@ def test_finalize_cv_ready_is_cas_suppressed_after_first_success(mock_db):
     assert doc["pre_enrichment"]["cv_ready_at"] is not None
 
 
+def test_finalize_cv_ready_with_prefetched_doc_is_judged_by_the_server(mock_db):
+    job_id, snapshot_id = _insert_job(mock_db)
+    # The caller's copy predates its sibling stages completing
+    stale_doc = mock_db["level-2"].find_one({"_id": job_id})
+    stages = [stage.name for stage in iter_stage_definitions() if stage.required_for_cv_ready]
+
+    set_doc = {}
+    for stage_name in stages[:-1]:
+        set_doc[f"pre_enrichment.stage_states.{stage_name}.status"] = "completed"
+    mock_db["level-2"].update_one({"_id": job_id}, {"$set": set_doc})
+    assert finalize_cv_ready(mock_db, level2_id=job_id, doc=stale_doc) is False
+
+    mock_db["level-2"].update_one(
+        {"_id": job_id},
+        {
+            "$set": {f"pre_enrichment.stage_states.{stages[-1]}.status": "completed"},
+            "$push": {"pre_enrichment.pending_next_stages": _pending_entry(job_id, snapshot_id, "jd_extraction")},
+        },
+    )
+    assert finalize_cv_ready(mock_db, level2_id=job_id, doc=stale_doc) is False  # outbox not drained
+
+    mock_db["level-2"].update_one(
+        {"_id": job_id},
+        {"$set": {"pre_enrichment.pending_next_stages.0.enqueued_at": datetime.now(timezone.utc)}},
+    )
+    assert finalize_cv_ready(mock_db, level2_id=job_id, doc=stale_doc) is True
+    assert mock_db["level-2"].find_one({"_id": job_id})["lifecycle"] == "cv_ready"
+
+
 def test_release_expired_stage_leases_requeues_work_and_clears_stage_lease(mock_db):
     job_id, snapshot_id = _insert_job(mock_db)
     work_item = WorkItemQueue(mock_db).enqueue(
@@ -392,3 +501,164 @@ def test_invalidate_snapshot_emits_sweeper_event(mock_db, capture_sweeper_events
     )
     assert event["metadata"]["rerooted"] is True
     assert event["metadata"]["old_input_snapshot_id"] != event["metadata"]["new_input_snapshot_id"]
+
+
+def _insert_blueprint_job(db: Any, *, taxonomy: str | None = None, completed: bool = True) -> tuple[ObjectId, str]:
+    """Insert a blueprint DAG job whose stages all completed at its snapshot."""
+    job_id = ObjectId()
+    description = "Build reliable AI systems"
+    jd_cs = jd_checksum(description)
+    company_cs = company_checksum("Acme", None)
+    snapshot_id = current_input_snapshot_id(jd_cs, company_cs)
+    states = build_stage_states(snapshot_id)
+    if completed:
+        for state in states.values():
+            state.update({"status": "completed", "output_ref": {"stage": "done"}})
+    db["level-2"].insert_one(
+        {
+            "_id": job_id,
+            "job_id": f"job-{job_id}",
+            "company": "Acme",
+            "description": description,
+            "lifecycle": "preenriching",
+            "pre_enrichment": {
+                "orchestration": "dag",
+                "dag_version": current_dag_version(),
+                "taxonomy_version": taxonomy or taxonomy_version(),
+                "input_snapshot_id": snapshot_id,
+                "jd_checksum": jd_cs,
+                "company_checksum": company_cs,
+                "stage_states": states,
+                "pending_next_stages": [],
+            },
+            "observability": {"langfuse_session_id": f"job:{job_id}"},
+        }
+    )
+    return job_id, snapshot_id
+
+
+@pytest.fixture
+def blueprint_env(monkeypatch):
+    monkeypatch.setenv("PREENRICH_BLUEPRINT_ENABLED", "true")
+
+
+def _pending_stages(db: Any, job_id: ObjectId) -> set[str]:
+    return {
+        item["payload"]["stage_name"]
+        for item in db["work_items"].find({"subject_id": str(job_id), "status": "pending"})
+    }
+
+
+def test_company_change_resets_only_company_dependent_stages(mock_db, blueprint_env):
+    job_id, snapshot_id = _insert_blueprint_job(mock_db)
+    mock_db["level-2"].update_one({"_id": job_id}, {"$set": {"company": "Acme Robotics"}})
+
+    assert invalidate_snapshot_if_changed(mock_db, level2_id=job_id) is True
+
+    pre = mock_db["level-2"].find_one({"_id": job_id})["pre_enrichment"]
+    states = pre["stage_states"]
+    assert pre["input_snapshot_id"] != snapshot_id
+    assert {name for name, state in states.items() if state["status"] == "completed"} == {
+        "jd_structure",
+        "jd_facts",
+        "classification",
+        "annotations",
+        "persona_compat",
+    }
+    assert all(state["input_snapshot_id"] == pre["input_snapshot_id"] for state in states.values())
+    assert states["application_surface"]["output_ref"] == {"stage": "done"}
+    assert _pending_stages(mock_db, job_id) == {"application_surface"}
+
+
+def test_invalidate_input_version_resets_taxonomy_dependents_in_bulk(mock_db, blueprint_env):
+    stale_ids = [_insert_blueprint_job(mock_db, taxonomy="old")[0] for _ in range(3)]
+    current_id, current_snapshot = _insert_blueprint_job(mock_db)
+
+    stats = invalidate_input_version(mock_db, "taxonomy")
+
+    assert stats == {"matched": 3, "invalidated": 3, "enqueued": 3}
+    expected_snapshot = current_snapshot  # same inputs, now at the current taxonomy
+    for job_id in stale_ids:
+        pre = mock_db["level-2"].find_one({"_id": job_id})["pre_enrichment"]
+        assert pre["taxonomy_version"] == taxonomy_version()
+        assert pre["input_snapshot_id"] == expected_snapshot
+        states = pre["stage_states"]
+        assert states["jd_facts"]["status"] == "completed"
+        assert states["annotations"]["status"] == "completed"
+        assert states["classification"]["status"] == "pending"
+        assert states["blueprint_assembly"]["status"] == "pending"
+        assert states["classification"]["work_item_id"] is not None
+        assert _pending_stages(mock_db, job_id) == {"classification"}
+    assert _pending_stages(mock_db, current_id) == set()
+    assert invalidate_input_version(mock_db, "taxonomy")["matched"] == 0
+
+
+def test_invalidate_input_version_leaves_concurrently_moved_jobs_alone(mock_db, blueprint_env, monkeypatch):
+    moved_id, _ = _insert_blueprint_job(mock_db, taxonomy="old")
+    stale_id, _ = _insert_blueprint_job(mock_db, taxonomy="old")
+    plan_stage_reset = sweepers_module.plan_stage_reset
+
+    def plan_then_move(pre, **kwargs):
+        # Another writer moves one job to a new snapshot after it was read
+        mock_db["level-2"].update_one({"_id": moved_id}, {"$set": {"pre_enrichment.input_snapshot_id": "moved"}})
+        return plan_stage_reset(pre, **kwargs)
+
+    monkeypatch.setattr(sweepers_module, "plan_stage_reset", plan_then_move)
+    stats = invalidate_input_version(mock_db, "taxonomy")
+
+    assert stats == {"matched": 2, "invalidated": 1, "enqueued": 1}
+    assert _pending_stages(mock_db, moved_id) == set()
+    assert _pending_stages(mock_db, stale_id) == {"classification"}
+    moved = mock_db["level-2"].find_one({"_id": moved_id})["pre_enrichment"]
+    assert moved["input_snapshot_id"] == "moved"
+    assert moved["taxonomy_version"] == "old"
+
+
+def test_invalidate_input_version_revives_priors_stages_in_place(mock_db, blueprint_env):
+    job_id, snapshot_id = _insert_blueprint_job(mock_db)
+    queue = WorkItemQueue(mock_db)
+    done = queue.enqueue(
+        task_type="preenrich.annotations",
+        lane="preenrich",
+        consumer_mode="native_stage_dag",
+        subject_type="job",
+        subject_id=str(job_id),
+        priority=100,
+        available_at=None,
+        max_attempts=3,
+        idempotency_key=idempotency_key("annotations", str(job_id), snapshot_id),
+        correlation_id=f"job:{job_id}",
+        payload={"stage_name": "annotations", "input_snapshot_id": snapshot_id},
+    ).document
+    mock_db["work_items"].update_one({"_id": done["_id"]}, {"$set": {"status": "done"}})
+
+    with pytest.raises(ValueError, match="priors"):
+        invalidate_input_version(mock_db, "priors")
+    stats = invalidate_input_version(mock_db, "priors", version="7")
+
+    assert stats == {"matched": 1, "invalidated": 1, "enqueued": 1}
+    pre = mock_db["level-2"].find_one({"_id": job_id})["pre_enrichment"]
+    assert pre["input_snapshot_id"] == snapshot_id
+    assert pre["priors_version"] == "7"
+    reset = {name for name, state in pre["stage_states"].items() if state["status"] != "completed"}
+    assert reset == {"annotations", "persona_compat", "blueprint_assembly"}
+    assert mock_db["work_items"].find_one({"_id": done["_id"]})["status"] == "pending"
+
+
+def test_snapshot_invalidator_scan_stamps_unchanged_jobs(mock_db, monkeypatch):
+    now = datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)
+    unchanged_id, _ = _insert_job(mock_db)
+    changed_id, _ = _insert_job(mock_db)
+    recent_id, _ = _insert_job(mock_db)
+    mock_db["level-2"].update_one({"_id": changed_id}, {"$set": {"description": "Something else entirely"}})
+    mock_db["level-2"].update_one(
+        {"_id": recent_id},
+        {"$set": {"description": "Changed too", "pre_enrichment.snapshot_revalidated_at": now - timedelta(seconds=30)}},
+    )
+
+    stats = snapshot_invalidator_scan(mock_db, now=now)
+
+    assert stats == {"invalidated": 1, "revalidated": 1, "taxonomy_invalidated": 0}
+    stamped = mock_db["level-2"].find_one({"_id": unchanged_id})["pre_enrichment"]["snapshot_revalidated_at"]
+    assert stamped.replace(tzinfo=timezone.utc) == now
+    assert snapshot_invalidator_scan(mock_db, now=now + timedelta(seconds=10))["revalidated"] == 0
@@ -0,0 +1,114 @@
+"""Tests for the validated-artifact cache."""
+
+from __future__ import annotations
+
+import pytest
+from pydantic import BaseModel, ValidationError, field_validator
+
+from src.preenrich import validation_cache
+from src.preenrich.validation_cache import (
+    ValidatedArtifactCache,
+    get_validation_cache,
+    reset_validation_cache,
+    validate_artifact,
+)
+
+
+class _Confidence(BaseModel):
+    band: str
+    score: float
+
+
+class _Doc(BaseModel):
+    title: str
+    tags: list[str] = []
+    confidence: _Confidence
+
+    @field_validator("title")
+    @classmethod
+    def _strip(cls, value: str) -> str:
+        _Doc.validator_calls += 1
+        return value.strip()
+
+
+_Doc.validator_calls = 0
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.delenv("PREENRICH_VALIDATION_CACHE_ENABLED", raising=False)
+    monkeypatch.delenv("PREENRICH_VALIDATION_CACHE_SIZE", raising=False)
+    reset_validation_cache()
+    _Doc.validator_calls = 0
+    yield
+    reset_validation_cache()
+
+
+def _payload(title: str = " Staff Engineer ") -> dict:
+    return {"title": title, "tags": ["ai"], "confidence": {"band": "high", "score": 0.9}}
+
+
+def test_hit_skips_validators_and_returns_independent_instances():
+    first = validate_artifact(_Doc, _payload())
+    second = validate_artifact(_Doc, _payload())
+
+    assert _Doc.validator_calls == 1
+    assert second == first
+    assert second.title == "Staff Engineer"
+    second.confidence.band = "medium"
+    second.tags.append("mutated")
+    third = validate_artifact(_Doc, _payload())
+    assert third.confidence.band == "high"
+    assert third.tags == ["ai"]
+
+
+def test_key_includes_content_context_artifact_id_and_schema_version():
+    validate_artifact(_Doc, _payload())
+    validate_artifact(_Doc, _payload(title="Principal Engineer"))
+    validate_artifact(_Doc, _payload(), context={"target": ["recruiter"]})
+    validate_artifact(_Doc, _payload(), artifact_id="a1")
+    validate_artifact(_Doc, _payload(), artifact_id="a1", schema_version="v2")
+
+    assert _Doc.validator_calls == 5
+    assert get_validation_cache().misses == 5
+
+
+def test_validation_errors_are_not_cached():
+    bad = {"title": "x", "confidence": {"band": "high"}}
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            validate_artifact(_Doc, bad)
+    assert len(get_validation_cache()) == 0
+
+
+def test_disabled_flag_always_validates(monkeypatch):
+    monkeypatch.setenv("PREENRICH_VALIDATION_CACHE_ENABLED", "false")
+    validate_artifact(_Doc, _payload())
+    validate_artifact(_Doc, _payload())
+    assert _Doc.validator_calls == 2
+
+
+def test_unpicklable_payload_falls_back_to_plain_validation():
+    payload = _payload()
+    payload["confidence"] = {"band": "high", "score": 0.9, "extra": lambda: None}
+    validate_artifact(_Doc, payload)
+    validate_artifact(_Doc, payload)
+    assert _Doc.validator_calls == 2
+
+
+def test_lru_evicts_least_recently_used():
+    cache = ValidatedArtifactCache(max_entries=2)
+    cache.put(("a",), b"1")
+    cache.put(("b",), b"2")
+    assert cache.get(("a",)) == b"1"
+    cache.put(("c",), b"3")
+
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) == b"1"
+    assert len(cache) == 2
+
+
+def test_cache_size_comes_from_env(monkeypatch):
+    monkeypatch.setenv("PREENRICH_VALIDATION_CACHE_SIZE", "3")
+    reset_validation_cache()
+    assert validation_cache.get_validation_cache().max_entries == 3
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import requests
+
+from scripts.benchmark_async_scrape import FakeLinkedInServer, run_benchmark
+from src.services.linkedin_scraper import _parse_job_html
+
+
+def test_fake_server_serves_parseable_pages_and_configured_statuses():
+    with FakeLinkedInServer(latency_seconds=0, status_by_job={"9": 429}) as server:
+        page = requests.get(server.url_template.format(job_id="1"), timeout=5)
+        limited = requests.get(server.url_template.format(job_id="9"), timeout=5)
+
+    assert page.status_code == 200
+    assert _parse_job_html("1", page.text).company == "Acme Labs"
+    assert limited.status_code == 429
+    assert server.requests == 2
+
+
+def test_benchmark_runs_both_modes_over_the_same_jobs():
+    results = run_benchmark(jobs=20, latency_ms=20, concurrency=8, parse_processes=0)
+
+    assert results["serial"]["succeeded"] == results["async"]["succeeded"] == 20
+    assert 1 < results["async"]["server_max_concurrent"] <= 8
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from scripts.benchmark_claim_batch import run_benchmark
+
+
+def test_batched_claims_cut_round_trips_and_resolve_every_hit():
+    results = run_benchmark(items=40, rtt_ms=0.0, batch_sizes=(1, 10))
+
+    assert {result["claimed"] for result in results.values()} == {40}
+    assert {result["hits_resolved"] for result in results.values()} == {40}
+    assert results["batch-10"]["round_trips_per_claim"] * 5 < results["next"]["round_trips_per_claim"]
+    assert results["batch-1"]["round_trips_per_claim"] > results["batch-10"]["round_trips_per_claim"]
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from scripts.benchmark_dedupe_filter import run_benchmark
+
+
+def test_benchmark_reports_fp_rate_near_target_and_lookup_reduction():
+    result = run_benchmark(keys=20_000, probes=20_000, duplicate_share=0.1)
+
+    assert result["measured_fp_rate"] < 0.02
+    assert result["serialized_mb"] >= result["memory_mb"]
+    # Stored keys always reach Mongo; absent ones only on a false positive
+    assert 0.1 <= result["mongo_lookup_share"] < 0.13
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import pytest
+
+from scripts.benchmark_fair_share_claims import percentile, run_benchmark, simulate
+
+
+def test_percentile_nearest_rank():
+    assert percentile([], 0.95) is None
+    assert percentile([1.0, 2.0, 3.0, 4.0], 0.5) == 2.0
+    assert percentile([float(value) for value in range(1, 101)], 0.95) == 95.0
+
+
+def test_fair_share_cuts_interactive_latency_under_backfill():
+    results = run_benchmark(backfill_jobs=200, interactive_jobs=10, cron_jobs=10, workers=2)
+
+    legacy = results["priority"]["origins"]
+    fair = results["fair_share"]["origins"]
+    assert fair["interactive"]["jobs"] == legacy["interactive"]["jobs"] == 10
+    assert fair["backfill"]["jobs"] == 200
+    assert fair["interactive"]["latency_p95_seconds"] * 10 < legacy["interactive"]["latency_p95_seconds"]
+    assert results["fair_share"]["makespan_seconds"] == results["priority"]["makespan_seconds"]
+
+
+def test_unknown_policy_rejected():
+    with pytest.raises(ValueError, match="policy"):
+        simulate("lifo", backfill_jobs=1)
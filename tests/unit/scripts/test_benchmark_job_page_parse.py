@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import pytest
+
+from scripts.benchmark_job_page_parse import DEFAULT_PAGES_DIR, load_pages, run_benchmark
+
+
+def test_benchmark_reports_parity_and_speedup():
+    result = run_benchmark(rounds=3)
+
+    assert result["mismatched_pages"] == []
+    assert result["beautifulsoup"]["pages"] == result["lxml"]["pages"] == 3 * len(load_pages(DEFAULT_PAGES_DIR))
+    assert result["speedup"] > 1.0
+
+
+def test_empty_pages_dir_rejected(tmp_path):
+    with pytest.raises(ValueError, match="No linkedin"):
+        run_benchmark(tmp_path, rounds=1)
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import pytest
+
+from scripts.benchmark_proxy_selection import build_population, run_benchmark, simulate
+
+
+def test_population_shares():
+    population = build_population(100)
+    assert sum(1 for proxy in population if proxy.success_rate == 0.0) == 40
+    assert len({proxy.url for proxy in population}) == 100
+
+
+def test_health_selection_raises_success_and_cuts_timeouts():
+    results = run_benchmark(proxies=60, requests=1500)
+
+    random_pick, health = results["random"], results["health"]
+    assert health["attempt_success_rate"] > random_pick["attempt_success_rate"] + 0.2
+    assert health["timeouts"] * 3 < random_pick["timeouts"]
+    assert health["served_via_proxy"] > random_pick["served_via_proxy"]
+
+
+def test_unknown_policy_rejected():
+    with pytest.raises(ValueError, match="policy"):
+        simulate("round_robin", proxies=2, requests=1)
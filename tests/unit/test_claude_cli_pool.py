@@ -0,0 +1,285 @@
+"""
+Unit tests for src/common/claude_cli_pool.py
+
+Runs the pool against tests/fixtures/fake_claude_cli.py, a stand-in binary
+that speaks the CLI's stream-json protocol.
+"""
+
+import asyncio
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.common.claude_cli_pool import (
+    ClaudeCLIPool,
+    CLIWorkerError,
+    build_stream_command,
+    get_cli_pool,
+    pooled_request,
+    shutdown_cli_pools,
+)
+
+FAKE_CLI = [sys.executable, str(Path(__file__).parents[1] / "fixtures" / "fake_claude_cli.py")]
+
+
+def _payload(event):
+    return json.loads(event["result"])
+
+
+class TestBuildStreamCommand:
+    """Tests for the streaming command line."""
+
+    def test_stream_json_flags_and_tools_disabled(self):
+        cmd = build_stream_command("claude-haiku-4-5-20251001", cli_command=["claude"])
+        assert cmd[:2] == ["claude", "-p"]
+        assert cmd[cmd.index("--input-format") + 1] == "stream-json"
+        assert cmd[cmd.index("--output-format") + 1] == "stream-json"
+        assert cmd[cmd.index("--model") + 1] == "claude-haiku-4-5-20251001"
+        assert cmd[-2:] == ["--tools", ""]
+
+    def test_tools_left_enabled(self):
+        cmd = build_stream_command("m", allow_tools=True, cli_command=["claude"])
+        assert "--tools" not in cmd
+
+
+class TestClaudeCLIPool:
+    """Pool behaviour against the fake CLI."""
+
+    @pytest.mark.asyncio
+    async def test_request_returns_result_event(self):
+        pool = ClaudeCLIPool("model-x", size=1, cli_command=FAKE_CLI)
+        try:
+            event = await pool.request("hello", timeout=10)
+        finally:
+            await pool.close()
+
+        payload = _payload(event)
+        assert payload["echo"] == "hello"
+        assert payload["model"] == "model-x"
+        assert event["total_cost_usd"] == 0.0012
+
+    @pytest.mark.asyncio
+    async def test_start_prewarms_workers(self):
+        pool = ClaudeCLIPool("m", size=2, cli_command=FAKE_CLI)
+        try:
+            await pool.start()
+            assert pool.get_stats()["idle"] == 2
+            await pool.request("a", timeout=10)
+            # The request used a pre-spawned worker; its replacement is spawned in the background
+            assert pool.get_stats()["spawned"] >= 2
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_worker_recycled_after_max_calls(self):
+        pool = ClaudeCLIPool("m", size=1, max_calls_per_worker=2, cli_command=FAKE_CLI)
+        try:
+            first = _payload(await pool.request("a", timeout=10))
+            second = _payload(await pool.request("b", timeout=10))
+            third = _payload(await pool.request("c", timeout=10))
+        finally:
+            await pool.close()
+
+        assert first["pid"] == second["pid"]
+        assert second["calls"] == 2
+        assert third["pid"] != first["pid"]
+        assert third["calls"] == 1
+        assert pool.stats["recycled"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_crashed_worker_is_replaced(self):
+        pool = ClaudeCLIPool("m", size=1, max_calls_per_worker=5, cli_command=FAKE_CLI)
+        try:
+            before = _payload(await pool.request("a", timeout=10))
+            with pytest.raises(CLIWorkerError):
+                await pool.request("CRASH", timeout=10)
+            after = _payload(await pool.request("b", timeout=10))
+        finally:
+            await pool.close()
+
+        assert after["pid"] != before["pid"]
+        assert pool.stats["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_recycles_worker(self):
+        pool = ClaudeCLIPool("m", size=1, max_calls_per_worker=5, cli_command=FAKE_CLI)
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await pool.request("SLOW", timeout=0.5)
+            event = await pool.request("fast", timeout=10)
+        finally:
+            await pool.close()
+
+        assert _payload(event)["calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded_by_size(self):
+        pool = ClaudeCLIPool("m", size=2, cli_command=FAKE_CLI)
+        try:
+            events = await asyncio.gather(*(pool.request(f"p{i}", timeout=10) for i in range(5)))
+        finally:
+            await pool.close()
+
+        assert sorted(_payload(e)["echo"] for e in events) == [f"p{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_close_waits_for_replacements_and_kills_every_worker(self, monkeypatch):
+        workers = []
+        original_spawn = ClaudeCLIPool._spawn
+
+        async def spawn(pool):
+            worker = await original_spawn(pool)
+            workers.append(worker)
+            return worker
+
+        monkeypatch.setattr(ClaudeCLIPool, "_spawn", spawn)
+        pool = ClaudeCLIPool("m", size=2, cli_command=FAKE_CLI)
+        await pool.start()
+        await pool.request("a", timeout=10)
+        # The recycle and its replacement spawn are still pending here
+        await pool.close()
+
+        assert not pool._background
+        assert len(workers) == 3
+        assert all(worker.process.returncode is not None for worker in workers)
+
+
+class TestPoolRegistry:
+    """The process-wide pools on the dedicated loop thread."""
+
+    def test_registry_reuses_pool_across_loops(self):
+        try:
+            pool_a = get_cli_pool("m", cli_command=FAKE_CLI)
+            first = asyncio.run(pooled_request("m", "a", timeout=10))
+            second = asyncio.run(pooled_request("m", "b", timeout=10))
+            assert get_cli_pool("m") is pool_a
+            assert get_cli_pool("m", allow_tools=True, cli_command=FAKE_CLI) is not pool_a
+        finally:
+            shutdown_cli_pools()
+
+        assert _payload(first)["echo"] == "a"
+        assert _payload(second)["echo"] == "b"
+        assert pool_a._closed
+
+    def test_shutdown_is_idempotent_and_pools_restart(self):
+        shutdown_cli_pools()
+        try:
+            pool = get_cli_pool("m", cli_command=FAKE_CLI)
+            shutdown_cli_pools()
+            assert get_cli_pool("m", cli_command=FAKE_CLI) is not pool
+        finally:
+            shutdown_cli_pools()
+
+
+class TestClaudeCLIInvokeAsync:
+    """ClaudeCLI.invoke_async routes through the pool when enabled."""
+
+    @pytest.fixture
+    def pooled_env(self, monkeypatch):
+        monkeypatch.setenv("CLAUDE_CLI_POOL_ENABLED", "true")
+        # CLAUDE_CLI_PATH takes a single executable, so point the default command at the fake script
+        import src.common.claude_cli_pool as pool_module
+
+        original = pool_module.build_stream_command
+
+        def build(model, allow_tools=False, cli_command=None):
+            return original(model, allow_tools, cli_command or FAKE_CLI)
+
+        monkeypatch.setattr(pool_module, "build_stream_command", build)
+        yield
+        shutdown_cli_pools()
+
+    @pytest.mark.asyncio
+    async def test_invoke_async_parses_json_and_cost(self, pooled_env):
+        from src.common.claude_cli import ClaudeCLI
+
+        cli = ClaudeCLI(tier="low")
+        try:
+            result = await cli.invoke_async("extract", job_id="j1")
+        finally:
+            shutdown_cli_pools()
+
+        assert result.success is True
+        assert result.result["echo"] == "extract"
+        assert result.result["model"] == cli.model
+        assert result.input_tokens == 11
+        assert result.output_tokens == 7
+        assert result.cost_usd == 0.0012
+
+    @pytest.mark.asyncio
+    async def test_invoke_async_reports_cli_errors(self, pooled_env):
+        from src.common.claude_cli import ClaudeCLI
+
+        cli = ClaudeCLI(tier="low")
+        try:
+            error_result = await cli.invoke_async("ERROR", job_id="j1")
+            text_result = await cli.invoke_async("TEXT", job_id="j1", validate_json=False)
+        finally:
+            shutdown_cli_pools()
+
+        assert error_result.success is False
+        assert "something broke" in error_result.error
+        assert text_result.success is True
+        assert text_result.raw_result.startswith("plain answer")
+
+    @pytest.mark.asyncio
+    async def test_invoke_batch_uses_pool(self, pooled_env):
+        from src.common.claude_cli import ClaudeCLI
+
+        cli = ClaudeCLI(tier="low")
+        items = [{"job_id": str(i), "prompt": f"job {i}"} for i in range(4)]
+        try:
+            results = await cli.invoke_batch(items, max_concurrent=2)
+        finally:
+            shutdown_cli_pools()
+
+        assert [r.result["echo"] for r in results] == [f"job {i}" for i in range(4)]
+
+    @pytest.mark.asyncio
+    async def test_unified_llm_uses_pool_transparently(self, pooled_env):
+        from src.common.unified_llm import UnifiedLLM
+
+        llm = UnifiedLLM(tier="low")
+        try:
+            result = await llm.invoke("grade", system="sys", job_id="j1")
+        finally:
+            shutdown_cli_pools()
+
+        assert result.success is True
+        assert result.backend == "claude_cli"
+        assert result.parsed_json["echo"] == "sys\n\ngrade"
+
+    def test_invoke_unified_sync_returns_and_leaves_no_workers(self, pooled_env, monkeypatch):
+        from src.common.unified_llm import invoke_unified_sync
+
+        workers = []
+        original_spawn = ClaudeCLIPool._spawn
+
+        async def spawn(pool):
+            worker = await original_spawn(pool)
+            workers.append(worker)
+            return worker
+
+        monkeypatch.setattr(ClaudeCLIPool, "_spawn", spawn)
+        results = []
+
+        def call_twice():
+            # Each call runs in its own asyncio.run() loop; recycles and
+            # replacements must not keep that loop from finishing
+            for prompt in ("first", "second"):
+                results.append(invoke_unified_sync(prompt, tier="low", job_id="j1"))
+
+        caller = threading.Thread(target=call_twice, daemon=True)
+        caller.start()
+        caller.join(timeout=30)
+        assert not caller.is_alive(), "invoke_unified_sync did not return"
+
+        assert [r.parsed_json["echo"] for r in results] == ["first", "second"]
+        assert all(r.backend == "claude_cli" for r in results)
+
+        shutdown_cli_pools()
+        assert workers
+        assert all(worker.process.returncode is not None for worker in workers)
@@ -0,0 +1,192 @@
+"""
+Unit tests for src/common/cost_ledger.py
+
+Uses mongomock for the ledger and rollup collections.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import mongomock
+import pytest
+
+from src.common.cost_ledger import (
+    CostLedger,
+    get_cost_ledger,
+    reset_cost_ledger,
+    set_cost_ledger,
+)
+from src.common.token_tracker import (
+    TokenTracker,
+    TokenUsage,
+    get_token_tracker_registry,
+    reset_token_tracker_registry,
+)
+
+
+@pytest.fixture
+def db():
+    return mongomock.MongoClient()["jobs"]
+
+
+@pytest.fixture
+def ledger(db):
+    ledger = CostLedger(db["llm_cost_ledger"], db["llm_cost_rollups"], batch_size=3)
+    ledger.ensure_indexes()
+    return ledger
+
+
+def _usage(cost=0.01, hours_ago=0, run_id=None, job_id=None, provider="openai", layer="layer2",
+           cache_hit=False):
+    return TokenUsage(
+        provider=provider,
+        model="gpt-4o",
+        input_tokens=100,
+        output_tokens=50,
+        estimated_cost_usd=cost,
+        layer=layer,
+        run_id=run_id,
+        job_id=job_id,
+        timestamp=datetime.utcnow() - timedelta(hours=hours_ago),
+        cache_hit=cache_hit,
+        saved_cost_usd=0.02 if cache_hit else 0.0,
+    )
+
+
+class TestCostLedgerWrites:
+    """Batching and rollup maintenance."""
+
+    def test_buffers_until_batch_size(self, ledger, db):
+        ledger.record(_usage())
+        ledger.record(_usage())
+        assert db["llm_cost_ledger"].count_documents({}) == 0
+
+        ledger.record(_usage())
+        assert db["llm_cost_ledger"].count_documents({}) == 3
+        assert ledger.get_stats()["pending"] == 0
+
+    def test_flushes_when_oldest_entry_is_stale(self, db):
+        ledger = CostLedger(db["llm_cost_ledger"], db["llm_cost_rollups"], batch_size=100,
+                            flush_interval_seconds=0.0)
+        ledger.record(_usage())
+        assert db["llm_cost_ledger"].count_documents({}) == 1
+
+    def test_rollups_merge_a_batch_into_one_update_per_bucket(self, ledger, db):
+        for _ in range(3):
+            ledger.record(_usage(cost=0.5, run_id="run-1", job_id="job-1"))
+
+        rollups = db["llm_cost_rollups"]
+        # hour + day + job + run
+        assert rollups.count_documents({}) == 4
+        job = rollups.find_one({"granularity": "job", "key": "job-1"})
+        assert job["cost_usd"] == pytest.approx(1.5)
+        assert job["calls"] == 3
+        run = rollups.find_one({"granularity": "run", "key": "run-1"})
+        assert run["by_provider"]["openai"]["calls"] == 3
+        assert run["by_layer"]["layer2"]["input_tokens"] == 300
+
+    def test_failed_append_keeps_batch_for_retry(self, db):
+        broken = MagicMock()
+        broken.insert_many.side_effect = ConnectionError("down")
+        ledger = CostLedger(broken, db["llm_cost_rollups"], batch_size=1)
+
+        ledger.record(_usage())
+        assert ledger.get_stats()["pending"] == 1
+        assert ledger.stats["errors"] == 1
+
+        ledger.ledger_collection = db["llm_cost_ledger"]
+        assert ledger.flush() == 1
+        assert db["llm_cost_ledger"].count_documents({}) == 1
+
+
+class TestCostLedgerReads:
+    """Rollup reads."""
+
+    def test_hourly_and_daily_costs_zero_filled(self, ledger):
+        ledger.record(_usage(cost=0.1, hours_ago=0))
+        ledger.record(_usage(cost=0.2, hours_ago=2))
+        ledger.record(_usage(cost=0.3, hours_ago=30))  # outside 24h window
+
+        hourly = ledger.get_hourly_costs(24)
+        assert len(hourly) == 24
+        assert hourly[-1]["cost_usd"] == pytest.approx(0.1)
+        assert hourly[-3]["cost_usd"] == pytest.approx(0.2)
+        assert sum(h["calls"] for h in hourly) == 2
+
+        daily = ledger.get_daily_costs(7)
+        assert len(daily) == 7
+        assert sum(d["cost_usd"] for d in daily) == pytest.approx(0.6)
+
+    def test_reads_include_unflushed_usages(self, ledger):
+        ledger.record(_usage(cost=0.25, job_id="job-9"))
+        assert ledger.get_job_cost("job-9") == pytest.approx(0.25)
+
+    def test_run_summary_from_rollups(self, ledger):
+        ledger.record(_usage(cost=0.1, run_id="run-1", provider="openai", layer="layer2"))
+        ledger.record(_usage(cost=0.0, run_id="run-1", provider="anthropic", layer="layer6",
+                             cache_hit=True))
+
+        summary = ledger.get_run_summary("run-1")
+        assert summary.calls_count == 2
+        assert summary.total_tokens == 300
+        assert summary.total_cost_usd == pytest.approx(0.1)
+        assert summary.cache_hits == 1
+        assert summary.saved_cost_usd == pytest.approx(0.02)
+        assert set(summary.by_provider) == {"openai", "anthropic"}
+        assert summary.by_layer["layer6"]["calls"] == 1
+
+        assert ledger.get_run_summary("missing").calls_count == 0
+
+    def test_history_survives_restart(self, db):
+        first = CostLedger(db["llm_cost_ledger"], db["llm_cost_rollups"])
+        first.record(_usage(cost=0.4, job_id="job-1", run_id="run-1"))
+        first.flush()
+
+        # New process: fresh tracker and ledger over the same database
+        tracker = TokenTracker(ledger=CostLedger(db["llm_cost_ledger"], db["llm_cost_rollups"]))
+        assert tracker.get_job_cost("job-1") == pytest.approx(0.4)
+        assert tracker.get_run_summary("run-1").total_cost_usd == pytest.approx(0.4)
+        assert tracker.ledger.get_hourly_costs(1)[0]["cost_usd"] == pytest.approx(0.4)
+
+
+class TestCostLedgerIntegration:
+    """Wiring into TokenTracker and MetricsCollector."""
+
+    @pytest.fixture(autouse=True)
+    def clean_globals(self):
+        reset_cost_ledger()
+        reset_token_tracker_registry()
+        yield
+        reset_cost_ledger()
+        reset_token_tracker_registry()
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("COST_LEDGER_ENABLED", raising=False)
+        assert get_cost_ledger() is None
+
+    def test_tracker_appends_to_ledger(self, ledger, db):
+        tracker = TokenTracker(ledger=ledger)
+        tracker.track_usage("openai", "gpt-4o", 1000, 500, run_id="r", job_id="j")
+        ledger.flush()
+
+        doc = db["llm_cost_ledger"].find_one()
+        assert doc["run_id"] == "r"
+        assert doc["cost_usd"] == pytest.approx(tracker.get_job_cost("j"))
+
+    def test_registry_trackers_pick_up_installed_ledger(self, ledger):
+        set_cost_ledger(ledger)
+        tracker = get_token_tracker_registry().get_or_create("openai")
+        assert tracker.ledger is ledger
+
+    def test_cost_history_reads_ledger(self, ledger):
+        from src.common.metrics import MetricsCollector
+
+        ledger.record(_usage(cost=0.5))
+        set_cost_ledger(ledger)
+
+        collector = MetricsCollector(token_registry=MagicMock(_trackers={}),
+                                     rate_registry=MagicMock(), circuit_registry=MagicMock())
+        history = collector.get_cost_history(period="hourly", count=24)
+
+        assert len(history["costs"]) == 24
+        assert history["summary"]["total_cost_usd"] == pytest.approx(0.5)
@@ -0,0 +1,69 @@
+"""
+Unit tests for the lxml job-page fast path.
+
+Every fixture under tests/fixtures/job_pages is parsed twice, once through the
+lxml fast path and once through the BeautifulSoup extractors, and both must
+match the golden fields in expected.json.
+"""
+
+import dataclasses
+import json
+from pathlib import Path
+
+import pytest
+
+from src.services.indeed_scraper import _parse_indeed_html
+from src.services.job_html_fastpath import fast_parse_enabled, parse_indeed_fields, parse_linkedin_fields
+from src.services.linkedin_scraper import ParseError, _parse_job_html
+
+FIXTURES = Path(__file__).resolve().parent.parent / "fixtures" / "job_pages"
+EXPECTED = json.loads((FIXTURES / "expected.json").read_text(encoding="utf-8"))
+# Pages the fast path declines (tag soup lxml would repair differently)
+SOUP_ONLY = {"linkedin_malformed.html"}
+
+
+def _parse(name: str) -> dict:
+    html = (FIXTURES / name).read_text(encoding="utf-8")
+    if name.startswith("linkedin"):
+        data = _parse_job_html("4012345678", html)
+    else:
+        data = _parse_indeed_html("abc123", "https://www.indeed.com/viewjob?jk=abc123", html)
+    return {key: value for key, value in dataclasses.asdict(data).items() if key in EXPECTED[name]}
+
+
+def _fast_fields(name: str):
+    html = (FIXTURES / name).read_text(encoding="utf-8")
+    return parse_linkedin_fields(html) if name.startswith("linkedin") else parse_indeed_fields(html)
+
+
+@pytest.mark.parametrize("name", sorted(EXPECTED))
+def test_fast_path_matches_golden_fields(name, monkeypatch):
+    monkeypatch.delenv("SCRAPER_FAST_PARSE_ENABLED", raising=False)
+    if name in SOUP_ONLY:
+        assert _fast_fields(name) is None
+    else:
+        assert _fast_fields(name) == EXPECTED[name]
+    assert _parse(name) == EXPECTED[name]
+
+
+@pytest.mark.parametrize("name", sorted(EXPECTED))
+def test_beautifulsoup_path_matches_golden_fields(name, monkeypatch):
+    monkeypatch.setenv("SCRAPER_FAST_PARSE_ENABLED", "false")
+    assert _parse(name) == EXPECTED[name]
+
+
+def test_fast_parse_flag(monkeypatch):
+    monkeypatch.delenv("SCRAPER_FAST_PARSE_ENABLED", raising=False)
+    assert fast_parse_enabled()
+    monkeypatch.setenv("SCRAPER_FAST_PARSE_ENABLED", " False ")
+    assert not fast_parse_enabled()
+
+
+def test_fast_path_declines_pages_missing_required_fields(monkeypatch):
+    monkeypatch.delenv("SCRAPER_FAST_PARSE_ENABLED", raising=False)
+    html = "<html><body><h1>Only a title</h1></body></html>"
+
+    assert parse_linkedin_fields(html) is None
+    assert parse_indeed_fields(html) is None
+    with pytest.raises(ParseError, match="company"):
+        _parse_job_html("1", html)
@@ -0,0 +1,274 @@
+"""
+Unit tests for src/common/llm_cache.py
+
+Covers the content-addressed LLM response cache and its integration with
+UnifiedLLM, ClaudeCLI and TokenTracker.
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.common.llm_cache import (
+    CachedResponse,
+    LLMResponseCache,
+    MongoCacheBackend,
+    SQLiteCacheBackend,
+    build_cache_key,
+    get_llm_response_cache,
+    reset_llm_response_cache,
+    set_llm_response_cache,
+)
+from src.common.token_tracker import TokenTracker
+
+
+@pytest.fixture
+def sqlite_cache(tmp_path):
+    """Fresh SQLite-backed cache installed as the global cache."""
+    cache = LLMResponseCache(SQLiteCacheBackend(str(tmp_path / "cache.sqlite3")))
+    set_llm_response_cache(cache)
+    yield cache
+    reset_llm_response_cache()
+
+
+def _entry(content='{"a": 1}', cost=0.02):
+    return CachedResponse(
+        content=content,
+        parsed_json={"a": 1},
+        model="claude-sonnet-4-5-20250929",
+        tier="middle",
+        backend="claude_cli",
+        input_tokens=1000,
+        output_tokens=200,
+        cost_usd=cost,
+    )
+
+
+class TestBuildCacheKey:
+    """Tests for cache key derivation."""
+
+    def test_key_is_deterministic(self):
+        k1 = build_cache_key("m", "middle", "sys", "prompt", "v1")
+        k2 = build_cache_key("m", "middle", "sys", "prompt", "v1")
+        assert k1 == k2
+        assert len(k1) == 64
+
+    @pytest.mark.parametrize(
+        "override",
+        [
+            {"model": "other"},
+            {"tier": "high"},
+            {"system": "other sys"},
+            {"prompt": "other prompt"},
+            {"schema_version": "v2"},
+            {"validate_json": False},
+        ],
+    )
+    def test_each_component_changes_key(self, override):
+        base = dict(model="m", tier="middle", system="sys", prompt="prompt", schema_version="v1")
+        assert build_cache_key(**base) != build_cache_key(**{**base, **override})
+
+    def test_none_and_empty_system_are_equivalent(self):
+        assert build_cache_key("m", "low", None, "p") == build_cache_key("m", "low", "", "p")
+
+
+class TestLLMResponseCache:
+    """Tests for cache get/put, TTL, eviction and stats."""
+
+    def test_miss_then_hit(self, sqlite_cache):
+        assert sqlite_cache.get("k") is None
+        sqlite_cache.put("k", _entry())
+
+        hit = sqlite_cache.get("k")
+        assert hit is not None
+        assert hit.parsed_json == {"a": 1}
+        assert hit.backend == "claude_cli"
+
+    def test_stats_report_hit_rate_and_savings(self, sqlite_cache):
+        sqlite_cache.get("k")
+        sqlite_cache.put("k", _entry(cost=0.05))
+        sqlite_cache.get("k")
+        sqlite_cache.get("k")
+
+        stats = sqlite_cache.get_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(2 / 3, abs=1e-3)
+        assert stats["saved_cost_usd"] == pytest.approx(0.10)
+        assert stats["entries"] == 1
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        cache = LLMResponseCache(SQLiteCacheBackend(str(tmp_path / "c.db")), ttl_seconds=60)
+        entry = _entry()
+        entry.created_at = time.time() - 120
+        cache.put("k", entry)
+
+        assert cache.get("k") is None
+        assert cache.backend.count() == 0
+
+    def test_size_bound_evicts_least_recently_used(self, tmp_path):
+        cache = LLMResponseCache(SQLiteCacheBackend(str(tmp_path / "c.db")), max_entries=2)
+        cache.put("a", _entry())
+        time.sleep(0.01)
+        cache.put("b", _entry())
+        time.sleep(0.01)
+        cache.get("a")  # refresh "a" so "b" becomes the LRU entry
+        time.sleep(0.01)
+        cache.put("c", _entry())
+
+        assert cache.backend.count() == 2
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_backend_errors_degrade_to_miss(self):
+        backend = MagicMock()
+        backend.get.side_effect = RuntimeError("db down")
+        backend.put.side_effect = RuntimeError("db down")
+        cache = LLMResponseCache(backend)
+
+        assert cache.get("k") is None
+        cache.put("k", _entry())  # must not raise
+
+    def test_mongo_backend_roundtrip(self):
+        import mongomock
+
+        collection = mongomock.MongoClient()["jobs"]["llm_response_cache"]
+        cache = LLMResponseCache(MongoCacheBackend(collection), max_entries=1)
+        cache.put("a", _entry())
+        cache.put("b", _entry())
+
+        assert collection.count_documents({}) == 1
+        assert cache.get("b").content == '{"a": 1}'
+
+    def test_disabled_by_default(self, monkeypatch):
+        reset_llm_response_cache()
+        monkeypatch.delenv("LLM_RESPONSE_CACHE_ENABLED", raising=False)
+        assert get_llm_response_cache() is None
+
+
+class TestTokenTrackerCacheHits:
+    """Cache hits are tracked as zero-cost calls with savings recorded."""
+
+    def test_cache_hit_is_zero_cost(self):
+        tracker = TokenTracker()
+        usage = tracker.track_usage(
+            "anthropic", "gpt-4o", 1000, 500, cache_hit=True, saved_cost_usd=0.03
+        )
+
+        assert usage.estimated_cost_usd == 0.0
+        summary = tracker.get_summary()
+        assert summary.total_cost_usd == 0.0
+        assert summary.cache_hits == 1
+        assert summary.saved_cost_usd == pytest.approx(0.03)
+
+    def test_cache_hit_saving_defaults_to_estimate(self):
+        tracker = TokenTracker()
+        usage = tracker.track_usage("openai", "gpt-4o", 1_000_000, 0, cache_hit=True)
+        assert usage.saved_cost_usd == pytest.approx(2.50)
+
+
+class TestUnifiedLLMCaching:
+    """UnifiedLLM serves repeated prompts from the cache."""
+
+    @pytest.fixture
+    def mock_cli(self, mocker):
+        mock_cli_class = mocker.patch("src.common.unified_llm.ClaudeCLI")
+        mock_cli_class.get_tier_cost_estimate.return_value = 0.01
+        mock_result = MagicMock()
+        mock_result.success = True
+        mock_result.result = {"pain_points": ["p1"]}
+        mock_result.raw_result = None
+        mock_result.model = "claude-haiku-4-5-20251001"
+        mock_result.tier = "low"
+        mock_result.input_tokens = None
+        mock_result.output_tokens = None
+        mock_result.cost_usd = None
+        mock_cli_class.return_value.invoke.return_value = mock_result
+        return mock_cli_class
+
+    @pytest.mark.asyncio
+    async def test_second_call_is_served_from_cache(self, sqlite_cache, mock_cli, mocker):
+        from src.common.unified_llm import UnifiedLLM
+
+        tracker = TokenTracker()
+        mocker.patch("src.common.unified_llm.get_global_tracker", return_value=tracker)
+        llm = UnifiedLLM(tier="low")
+
+        first = await llm.invoke("Extract", system="sys", job_id="j1")
+        second = await llm.invoke("Extract", system="sys", job_id="j1")
+
+        assert mock_cli.return_value.invoke.call_count == 1
+        assert mock_cli.return_value.invoke.call_args.kwargs["use_cache"] is False
+        assert first.cached is False
+        assert second.cached is True
+        assert second.cost_usd == 0.0
+        assert second.parsed_json == {"pain_points": ["p1"]}
+        assert second.backend == "claude_cli"
+        assert tracker.get_summary().cache_hits == 1
+        assert tracker.get_summary().saved_cost_usd == pytest.approx(0.01)
+
+    @pytest.mark.asyncio
+    async def test_use_cache_false_bypasses(self, sqlite_cache, mock_cli):
+        from src.common.unified_llm import UnifiedLLM
+
+        llm = UnifiedLLM(tier="low")
+        await llm.invoke("Extract", job_id="j1")
+        result = await llm.invoke("Extract", job_id="j1", use_cache=False)
+
+        assert result.cached is False
+        assert mock_cli.return_value.invoke.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_schema_version_change_misses(self, sqlite_cache, mock_cli):
+        from src.common.unified_llm import UnifiedLLM
+
+        llm = UnifiedLLM(tier="low")
+        await llm.invoke("Extract", job_id="j1", schema_version="v1")
+        await llm.invoke("Extract", job_id="j1", schema_version="v2")
+
+        assert mock_cli.return_value.invoke.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_research_steps_are_not_cached(self, sqlite_cache, mock_cli):
+        from src.common.unified_llm import UnifiedLLM
+
+        llm = UnifiedLLM(step_name="research_company")
+        await llm.invoke("Research", job_id="j1")
+        await llm.invoke("Research", job_id="j1")
+
+        assert mock_cli.return_value.invoke.call_count == 2
+        assert sqlite_cache.get_stats()["misses"] == 0
+
+
+class TestClaudeCLICaching:
+    """ClaudeCLI.invoke skips the subprocess on a cache hit."""
+
+    def test_cli_hit_skips_subprocess(self, sqlite_cache, mocker):
+        from src.common.claude_cli import ClaudeCLI
+
+        run = mocker.patch("src.common.claude_cli.subprocess.run")
+        run.return_value = MagicMock(returncode=0, stdout='{"ok": true}', stderr="")
+        cli = ClaudeCLI(tier="low")
+
+        first = cli.invoke("prompt", job_id="j1")
+        second = cli.invoke("prompt", job_id="j1")
+
+        assert run.call_count == 1
+        assert first.cached is False
+        assert second.cached is True
+        assert second.result == {"ok": True}
+        assert second.cost_usd == 0.0
+
+    def test_cli_tool_calls_are_not_cached(self, sqlite_cache, mocker):
+        from src.common.claude_cli import ClaudeCLI
+
+        run = mocker.patch("src.common.claude_cli.subprocess.run")
+        run.return_value = MagicMock(returncode=0, stdout='{"ok": true}', stderr="")
+        cli = ClaudeCLI(tier="low")
+
+        cli.invoke("prompt", job_id="j1", allow_tools=True)
+        cli.invoke("prompt", job_id="j1", allow_tools=True)
+
+        assert run.call_count == 2
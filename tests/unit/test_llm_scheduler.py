@@ -0,0 +1,296 @@
+"""
+Unit tests for src/common/llm_scheduler.py
+
+Covers concurrency caps, token-per-minute budgets, priority classes,
+per-job fair queuing, cancellation and metrics exposure.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.common.llm_scheduler import (
+    LLMScheduler,
+    Priority,
+    TokenBucket,
+    current_scheduling_context,
+    estimate_tokens,
+    get_llm_scheduler,
+    llm_scheduling_context,
+    provider_for_model,
+    reset_llm_scheduler,
+    scheduled_llm_call,
+)
+from src.common.utils import run_async
+
+
+@pytest.fixture(autouse=True)
+def fresh_scheduler():
+    reset_llm_scheduler()
+    yield
+    reset_llm_scheduler()
+
+
+async def _hold(scheduler, order, label, provider="p", priority="batch", job_key=None, hold=0.01, tokens=10):
+    async with scheduler.slot(provider, tokens, priority, job_key):
+        order.append(label)
+        await asyncio.sleep(hold)
+
+
+class TestHelpers:
+    """Tests for small helper functions."""
+
+    def test_priority_parse(self):
+        assert Priority.parse("interactive") is Priority.INTERACTIVE
+        assert Priority.parse("BACKFILL") is Priority.BACKFILL
+        assert Priority.parse(1) is Priority.BATCH
+
+    def test_estimate_tokens(self):
+        assert estimate_tokens("x" * 400, expected_output_tokens=100) == 200
+
+    def test_provider_for_model(self):
+        assert provider_for_model("gpt-4o") == "openai"
+        assert provider_for_model("claude-opus-4-5-20251101") == "anthropic"
+        assert provider_for_model("anthropic/claude-3-5-haiku") == "openrouter"
+
+    def test_token_bucket_refill(self):
+        bucket = TokenBucket(tokens_per_minute=6000)  # 100 tokens/s
+        bucket.consume(6000)
+        wait = bucket.time_until(50)
+        assert 0.3 < wait <= 0.5
+        assert TokenBucket(None).time_until(10**9) == 0.0
+
+
+class TestLLMScheduler:
+    """Admission control behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self):
+        scheduler = LLMScheduler(budgets={"p": (2, None)})
+        active = 0
+        peak = 0
+
+        async def call():
+            nonlocal active, peak
+            async with scheduler.slot("p", 10):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(call() for _ in range(10)))
+        assert peak == 2
+        assert scheduler.get_stats()["providers"]["p"]["completed"] == 10
+
+    @pytest.mark.asyncio
+    async def test_interactive_overtakes_queued_batch(self):
+        scheduler = LLMScheduler(budgets={"p": (1, None)})
+        order = []
+        blocker = await scheduler.acquire("p", 10)
+
+        tasks = [asyncio.create_task(_hold(scheduler, order, f"batch{i}")) for i in range(3)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(_hold(scheduler, order, "backfill", priority="backfill")))
+        tasks.append(asyncio.create_task(_hold(scheduler, order, "interactive", priority="interactive")))
+        await asyncio.sleep(0.01)
+
+        scheduler.release(blocker)
+        await asyncio.gather(*tasks)
+        assert order == ["interactive", "batch0", "batch1", "batch2", "backfill"]
+
+    @pytest.mark.asyncio
+    async def test_fair_round_robin_across_jobs(self):
+        scheduler = LLMScheduler(budgets={"p": (1, None)})
+        order = []
+        blocker = await scheduler.acquire("p", 10)
+
+        tasks = [
+            asyncio.create_task(_hold(scheduler, order, f"A{i}", job_key="A", hold=0))
+            for i in range(3)
+        ]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(_hold(scheduler, order, "B0", job_key="B", hold=0)))
+        await asyncio.sleep(0.01)
+
+        scheduler.release(blocker)
+        await asyncio.gather(*tasks)
+        assert order == ["A0", "B0", "A1", "A2"]
+
+    @pytest.mark.asyncio
+    async def test_tokens_per_minute_budget_delays_admission(self):
+        scheduler = LLMScheduler(budgets={"p": (10, 6000)})  # 100 tokens/s
+        first = await scheduler.acquire("p", 6000)
+        scheduler.release(first)
+
+        start = time.monotonic()
+        grant = await scheduler.acquire("p", 50)
+        waited = time.monotonic() - start
+        scheduler.release(grant)
+
+        assert waited >= 0.3
+        assert grant.wait_seconds >= 0.3
+
+    @pytest.mark.asyncio
+    async def test_actual_usage_refunds_estimate(self):
+        scheduler = LLMScheduler(budgets={"p": (10, 6000)})
+        grant = await scheduler.acquire("p", 6000)
+        grant.actual_tokens = 100
+        scheduler.release(grant)
+
+        start = time.monotonic()
+        scheduler.release(await scheduler.acquire("p", 1000))
+        assert time.monotonic() - start < 0.2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        scheduler = LLMScheduler(budgets={"p": (1, None)})
+        blocker = await scheduler.acquire("p", 10)
+        waiter = asyncio.create_task(scheduler.acquire("p", 10))
+        await asyncio.sleep(0.01)
+        assert scheduler.get_stats()["providers"]["p"]["queued"] == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert scheduler.get_stats()["providers"]["p"]["queued"] == 0
+
+        scheduler.release(blocker)
+        scheduler.release(await asyncio.wait_for(scheduler.acquire("p", 10), timeout=1))
+
+    def test_token_wait_survives_caller_loop_closing(self):
+        scheduler = LLMScheduler(budgets={"p": (10, 6000)})  # 100 tokens/s
+        scheduler.release(asyncio.run(scheduler.acquire("p", 6000)))
+
+        # Token-blocked waiter whose asyncio.run() times out and closes its loop
+        async def give_up():
+            await asyncio.wait_for(scheduler.acquire("p", 20), timeout=0.01)
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(give_up())
+        assert scheduler.get_stats()["providers"]["p"]["queued"] == 0
+
+        grant = asyncio.run(asyncio.wait_for(scheduler.acquire("p", 20), timeout=2))
+        scheduler.release(grant)
+
+    def test_waiter_on_closed_loop_is_dropped(self):
+        scheduler = LLMScheduler(budgets={"p": (1, None)})
+        blocker = asyncio.run(scheduler.acquire("p", 10))
+
+        # A loop closed without cancelling its pending acquire()
+        abandoned_loop = asyncio.new_event_loop()
+        abandoned_loop.create_task(scheduler.acquire("p", 10))
+        abandoned_loop.run_until_complete(asyncio.sleep(0))
+        abandoned_loop.close()
+
+        scheduler.release(blocker)
+        stats = scheduler.get_stats()["providers"]["p"]
+        assert stats["queued"] == 0 and stats["in_flight"] == 0
+        scheduler.release(asyncio.run(asyncio.wait_for(scheduler.acquire("p", 10), timeout=1)))
+
+    def test_shared_across_event_loops_in_threads(self):
+        scheduler = LLMScheduler(budgets={"p": (1, None)})
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        async def call():
+            nonlocal active, peak
+            async with scheduler.slot("p", 10):
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                await asyncio.sleep(0.02)
+                with lock:
+                    active -= 1
+
+        threads = [threading.Thread(target=lambda: asyncio.run(call())) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert peak == 1
+        assert scheduler.get_stats()["providers"]["p"]["completed"] == 4
+
+    @pytest.mark.asyncio
+    async def test_interactive_p95_stays_low_under_batch_load(self):
+        """Simulated load: 60 batch calls from 6 jobs plus 10 interactive arrivals."""
+        scheduler = LLMScheduler(budgets={"p": (3, None)})
+
+        async def call(priority, job_key, delay=0.0):
+            await asyncio.sleep(delay)
+            async with scheduler.slot("p", 10, priority, job_key):
+                await asyncio.sleep(0.01)
+
+        batch = [call("batch", f"job{i % 6}") for i in range(60)]
+        interactive = [call("interactive", f"user{i}", delay=0.02 * i) for i in range(10)]
+        start = time.monotonic()
+        await asyncio.gather(*batch, *interactive)
+        elapsed = time.monotonic() - start
+
+        waits = scheduler.get_stats()["wait_by_priority"]
+        assert waits["interactive"]["count"] == 10
+        assert waits["interactive"]["p95_wait_seconds"] < 0.05
+        assert waits["batch"]["p95_wait_seconds"] > waits["interactive"]["p95_wait_seconds"]
+        # 70 calls x 10ms over 3 slots: close to the ideal ~0.24s, not serialized (~0.7s)
+        assert elapsed < 0.6
+
+
+class TestIntegration:
+    """Scheduler wiring into UnifiedLLM and MetricsCollector."""
+
+    @pytest.mark.asyncio
+    async def test_scheduled_llm_call_uses_context(self):
+        with llm_scheduling_context(priority="interactive", job_key="job-1"):
+            async with scheduled_llm_call("claude_cli", "prompt") as grant:
+                assert grant.priority is Priority.INTERACTIVE
+                assert grant.job_key == "job-1"
+
+    @pytest.mark.asyncio
+    async def test_context_survives_run_async_from_a_running_loop(self):
+        async def nested():
+            return current_scheduling_context()
+
+        with llm_scheduling_context(priority="interactive", job_key="job-1"):
+            assert run_async(nested()) == ("interactive", "job-1")
+
+    @pytest.mark.asyncio
+    async def test_scheduled_llm_call_disabled(self, monkeypatch):
+        monkeypatch.setenv("LLM_SCHEDULER_ENABLED", "false")
+        async with scheduled_llm_call("claude_cli", "prompt") as grant:
+            assert grant is None
+
+    @pytest.mark.asyncio
+    async def test_unified_llm_goes_through_scheduler(self, mocker):
+        from src.common.unified_llm import UnifiedLLM
+
+        mock_cli_class = mocker.patch("src.common.unified_llm.ClaudeCLI")
+        mock_result = MagicMock(
+            success=True, result={"ok": True}, raw_result=None, model="m", tier="low",
+            input_tokens=120, output_tokens=30, cost_usd=0.001,
+        )
+        mock_cli_class.return_value.invoke.return_value = mock_result
+
+        llm = UnifiedLLM(tier="low", priority="interactive")
+        result = await llm.invoke("prompt", job_id="job-9")
+
+        assert result.success is True
+        stats = get_llm_scheduler().get_stats()
+        assert stats["providers"]["claude_cli"]["completed"] == 1
+        assert stats["wait_by_priority"]["interactive"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_metrics_collector_exposes_queue_wait(self):
+        from src.common.metrics import MetricsCollector
+
+        async with get_llm_scheduler().slot("claude_cli", 10, "batch"):
+            pass
+
+        collector = MetricsCollector(token_registry=MagicMock(), rate_registry=MagicMock(),
+                                     circuit_registry=MagicMock())
+        metrics = collector.get_llm_scheduler_metrics()
+        assert metrics["wait_by_priority"]["batch"]["count"] == 1
+        assert "p95_wait_seconds" in metrics["wait_by_priority"]["interactive"]
@@ -2,15 +2,18 @@
 Unit tests for src/common/rate_limiter.py
 
 Tests rate limiting infrastructure including:
-- RateLimiter: Per-minute and daily limits with sliding window
+- RateLimiter: Per-minute (GCRA) and daily limits, local and Redis-shared
 - RateLimiterRegistry: Global registry management
 - Thread safety and concurrent access
 - Error handling and timeout scenarios
 """
 
+import asyncio
+import heapq
+import itertools
 import threading
 from datetime import datetime
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -93,9 +96,10 @@ class TestRateLimiterInit:
         """Should initialize empty tracking structures."""
         limiter = RateLimiter(provider="test")
 
-        assert len(limiter._minute_window) == 0
+        assert limiter._tat == 0.0
         assert limiter._daily_count == 0
         assert limiter._daily_reset_date is None
+        assert limiter.backend == "local"
 
 
 class TestRateLimiterCheck:
@@ -187,7 +191,7 @@ class TestRateLimiterAcquire:
 
         assert result is True
         assert limiter._daily_count == 1
-        assert len(limiter._minute_window) == 1
+        assert limiter.get_stats().requests_this_minute == 1
 
     @patch("time.sleep")
     @patch("src.common.rate_limiter.datetime")
@@ -487,13 +491,13 @@ class TestRateLimiterReset:
         limiter.acquire()
 
         assert limiter._daily_count == 3
-        assert len(limiter._minute_window) == 3
+        assert limiter.get_stats().requests_this_minute == 3
 
         # Reset
         limiter.reset()
 
         assert limiter._daily_count == 0
-        assert len(limiter._minute_window) == 0
+        assert limiter._tat == 0.0
         assert limiter._daily_reset_date is None
 
         stats = limiter.get_stats()
@@ -926,3 +930,229 @@ class TestRateLimitStatsDataclass:
         assert stats.requests_today == 50
         assert stats.waits_count == 10
         assert stats.total_wait_time_seconds == 25.5
+
+
+class TestRateLimiterGCRA:
+    """Tests for GCRA pacing: bursts, exact waits and steady refill."""
+
+    @patch("time.time")
+    @patch("src.common.rate_limiter.datetime")
+    def test_refills_one_slot_per_emission_interval(self, mock_datetime, mock_time):
+        """After a full burst, one request frees up every 60/rpm seconds."""
+        mock_datetime.utcnow.return_value = datetime(2025, 11, 30, 10, 0, 0)
+        mock_time.return_value = 1000.0
+        limiter = RateLimiter(provider="test", requests_per_minute=6)  # 10s interval
+
+        for _ in range(6):
+            assert limiter.acquire() is True
+        assert limiter.check() is False
+
+        mock_time.return_value = 1009.0
+        assert limiter.check() is False
+
+        mock_time.return_value = 1010.0
+        assert limiter.check() is True
+        limiter.acquire()
+        assert limiter.check() is False
+
+    @patch("time.sleep")
+    @patch("time.time")
+    @patch("src.common.rate_limiter.datetime")
+    def test_acquire_sleeps_exactly_once_for_exact_wait(self, mock_datetime, mock_time, mock_sleep):
+        """Blocking acquire should sleep once, for exactly the reserved slot."""
+        mock_datetime.utcnow.return_value = datetime(2025, 11, 30, 10, 0, 0)
+        mock_time.return_value = 1000.0
+        limiter = RateLimiter(provider="test", requests_per_minute=2)  # 30s interval
+
+        limiter.acquire()
+        limiter.acquire()
+        assert limiter.acquire() is True
+        assert limiter.acquire() is True
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [30.0, 60.0]
+        stats = limiter.get_stats()
+        assert stats.waits_count == 2
+        assert stats.total_wait_time_seconds == 90.0
+
+    @patch("time.time")
+    @patch("src.common.rate_limiter.datetime")
+    def test_no_wait_mode_raises_per_minute_immediately(self, mock_datetime, mock_time):
+        """allow_wait=False should raise instead of sleeping."""
+        mock_datetime.utcnow.return_value = datetime(2025, 11, 30, 10, 0, 0)
+        mock_time.return_value = 1000.0
+        limiter = RateLimiter(provider="openai", requests_per_minute=1, allow_wait=False)
+
+        limiter.acquire()
+        with pytest.raises(RateLimitExceededError) as exc_info:
+            limiter.acquire()
+
+        assert exc_info.value.limit_type == "per_minute"
+        assert exc_info.value.current == 1
+
+    @patch("time.time", return_value=1000.0)
+    def test_large_limits_stay_constant_time(self, mock_time):
+        """State is a single timestamp regardless of how many requests are in flight."""
+        limiter = RateLimiter(provider="test", requests_per_minute=100_000)
+
+        for _ in range(50_000):
+            limiter.acquire()
+
+        assert limiter.get_stats().requests_this_minute == 50_000
+        assert isinstance(limiter._tat, float)
+
+
+class FakeClock:
+    """
+    Fake wall clock with an asyncio.sleep that advances it.
+
+    Like a real event loop, timers fire up to `early` seconds before their
+    deadline; the clock still moves forward by at least `resolution` each time.
+    """
+
+    def __init__(self, start: float, early: float = 0.0, resolution: float = 1e-4):
+        self.now = start
+        self.early = early
+        self.resolution = resolution
+        self._timers = []
+        self._seq = itertools.count()
+
+    def time(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._timers, (self.now + seconds, next(self._seq), future))
+        await future
+
+    async def run(self, awaitable, _yield=asyncio.sleep):
+        """Drive awaitable to completion, firing timers in deadline order."""
+        task = asyncio.ensure_future(awaitable)
+        while not task.done():
+            for _ in range(10):
+                await _yield(0)
+            if self._timers and not task.done():
+                deadline, _, future = heapq.heappop(self._timers)
+                self.now = max(deadline - self.early, self.now + self.resolution)
+                future.set_result(None)
+        return task.result()
+
+
+class TestRateLimiterAsyncWakeup:
+    """Tests for reservation-based async waiting."""
+
+    @pytest.mark.asyncio
+    async def test_waiters_wake_in_order_at_their_slot(self):
+        """Concurrent waiters each wake at their own slot, never before it, even if timers fire early."""
+        clock = FakeClock(start=1000.0, early=0.001)
+        limiter = RateLimiter(provider="test", requests_per_minute=1200)  # 50ms interval
+        woke = []
+
+        async def waiter(i):
+            await limiter.acquire_async()
+            woke.append((i, clock.now - 1000.0))
+
+        with patch("time.time", clock.time), patch("asyncio.sleep", clock.sleep):
+            for _ in range(1200):
+                await limiter.acquire_async()
+            await clock.run(asyncio.gather(*(waiter(i) for i in range(4))))
+
+        assert [i for i, _ in woke] == [0, 1, 2, 3]
+        for i, elapsed in woke:
+            slot = 0.05 * (i + 1)
+            assert elapsed >= slot - 1e-9
+            assert elapsed == pytest.approx(slot, abs=0.002)
+        assert limiter.get_stats().waits_count == 4
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_returns_its_slot(self):
+        """A cancelled waiter should not consume budget."""
+        limiter = RateLimiter(provider="test", requests_per_minute=60, daily_limit=100)
+        for _ in range(60):
+            await limiter.acquire_async()
+
+        waiter = asyncio.create_task(limiter.acquire_async())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert limiter.get_stats().total_requests == 60
+        assert limiter.get_remaining_daily() == 40
+        assert limiter.check() is False
+
+
+class TestRateLimiterRedisBackend:
+    """Tests for the shared Redis budget (fakeredis with Lua support)."""
+
+    @pytest.fixture
+    def redis_client(self):
+        pytest.importorskip("lupa")  # fakeredis needs lupa to run Lua scripts
+        import fakeredis
+
+        return fakeredis.FakeRedis()
+
+    def test_limiters_in_different_processes_share_one_budget(self, redis_client):
+        """Two limiters on the same provider draw from the same bucket."""
+        a = RateLimiter(provider="openai", requests_per_minute=3, allow_wait=False, redis=redis_client)
+        b = RateLimiter(provider="openai", requests_per_minute=3, allow_wait=False, redis=redis_client)
+
+        assert a.backend == "redis"
+        assert a.acquire() and b.acquire() and a.acquire()
+        assert b.check() is False
+        with pytest.raises(RateLimitExceededError):
+            b.acquire()
+
+        other = RateLimiter(provider="anthropic", requests_per_minute=3, redis=redis_client)
+        assert other.check() is True
+
+    def test_check_does_not_consume(self, redis_client):
+        """check() must not advance the shared state."""
+        limiter = RateLimiter(provider="test", requests_per_minute=1, redis=redis_client)
+
+        for _ in range(5):
+            assert limiter.check() is True
+        assert limiter.acquire() is True
+        assert limiter.check() is False
+
+    def test_daily_limit_is_shared(self, redis_client):
+        """Daily counters live in Redis and are visible to every process."""
+        a = RateLimiter(provider="firecrawl", requests_per_minute=100, daily_limit=3, redis=redis_client)
+        b = RateLimiter(provider="firecrawl", requests_per_minute=100, daily_limit=3, redis=redis_client)
+
+        a.acquire()
+        a.acquire()
+        assert b.get_remaining_daily() == 1
+        b.acquire()
+
+        assert a.acquire() is False
+        assert a.get_remaining_daily() == 0
+        assert b.to_dict()["stats"]["total_requests"] == 1
+
+    def test_returns_wait_for_reserved_slot(self, redis_client):
+        """Limited requests reserve a slot one emission interval out."""
+        limiter = RateLimiter(provider="test", requests_per_minute=2, redis=redis_client)
+        limiter.acquire()
+        limiter.acquire()
+
+        outcome, wait = limiter._reserve(max_wait=60.0)
+
+        assert outcome == 0
+        assert 29.0 < wait <= 30.0
+        assert limiter.get_stats().requests_this_minute == 3
+
+    def test_falls_back_to_local_when_redis_fails(self, redis_client):
+        """Redis errors degrade to process-local limiting instead of failing calls."""
+        limiter = RateLimiter(provider="test", requests_per_minute=1, redis=redis_client)
+        limiter._script = MagicMock(side_effect=ConnectionError("down"))
+
+        assert limiter.acquire() is True
+        assert limiter.check() is False
+
+    @patch.dict("os.environ", {"RATE_LIMITER_REDIS_URL": "redis://localhost:1/0"})
+    def test_get_rate_limiter_without_reachable_redis_stays_local(self):
+        """An unreachable RATE_LIMITER_REDIS_URL should not break limiter creation."""
+        reset_global_registry()
+        try:
+            assert get_rate_limiter("openai").backend == "local"
+        finally:
+            reset_global_registry()
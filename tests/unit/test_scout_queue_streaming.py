@@ -0,0 +1,120 @@
+"""Tests for streaming reads and atomic compaction in the scout queue."""
+
+from __future__ import annotations
+
+import json
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from src.common import scout_queue
+
+
+@pytest.fixture
+def scout_dir(tmp_path, monkeypatch) -> Path:
+    monkeypatch.setenv("SCOUT_QUEUE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _write(path: Path, entries: list[dict]) -> None:
+    path.write_text("".join(json.dumps(entry) + "\n" for entry in entries), encoding="utf-8")
+
+
+def _ids(entries) -> list[str]:
+    return [entry["job_id"] for entry in entries]
+
+
+def test_dequeue_batch_streams_lifo_tail_and_rewrites_rest(scout_dir):
+    _write(scout_dir / "queue.jsonl", [{"job_id": f"j{index}"} for index in range(10)])
+
+    assert _ids(scout_queue.dequeue_batch(3)) == ["j7", "j8", "j9"]
+    assert _ids(scout_queue._read_jsonl(scout_dir / "queue.jsonl")) == [f"j{index}" for index in range(7)]
+    assert _ids(scout_queue.dequeue_batch(50)) == [f"j{index}" for index in range(7)]
+    assert scout_queue.dequeue_batch(5) == []
+    assert sorted(path.name for path in scout_dir.iterdir()) == ["queue.jsonl", "queue.jsonl.lock"]
+
+
+def test_write_jsonl_leaves_original_intact_when_stream_fails(scout_dir):
+    target = scout_dir / "queue.jsonl"
+    _write(target, [{"job_id": "keep"}])
+
+    def _broken():
+        yield {"job_id": "partial"}
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        scout_queue._write_jsonl(target, _broken())
+
+    assert _ids(scout_queue._read_jsonl(target)) == ["keep"]
+    assert [path.name for path in scout_dir.iterdir()] == ["queue.jsonl"]
+
+
+def test_iter_scored_chunks_claims_file_and_redelivers_after_early_stop(scout_dir):
+    _write(scout_dir / "scored.jsonl", [{"job_id": f"s{index}"} for index in range(5)])
+
+    chunks = scout_queue.iter_scored_chunks(chunk_size=2)
+    assert _ids(next(chunks)) == ["s0", "s1"]
+    # Jobs scored mid-drain start a fresh file
+    scout_queue.append_scored([{"job_id": "late"}])
+    assert scout_queue.scored_length() == 1
+    chunks.close()
+
+    assert _ids(scout_queue.read_and_clear_scored()) == ["s0", "s1", "s2", "s3", "s4", "late"]
+    assert scout_queue.read_and_clear_scored() == []
+    assert not (scout_dir / "scored.jsonl.draining").exists()
+
+
+def test_iter_pool_chunks_reads_snapshot(scout_dir):
+    scout_queue.append_to_pool([{"job_id": "p1"}, {"job_id": "p2"}, {"job_id": "p3"}])
+
+    seen = []
+    for chunk in scout_queue.iter_pool_chunks(chunk_size=2):
+        seen.extend(_ids(chunk))
+        scout_queue.append_to_pool([{"job_id": f"after-{len(seen)}"}])
+
+    assert seen == ["p1", "p2", "p3"]
+    assert len(scout_queue.read_pool()) == 5
+
+
+def test_purges_compact_only_when_entries_dropped(scout_dir):
+    now = datetime.now(timezone.utc)
+    pool_file = scout_dir / "scored_pool.jsonl"
+    _write(pool_file, [{"job_id": "fresh", "pooled_at": now.isoformat()}])
+    inode = pool_file.stat().st_ino
+
+    assert scout_queue.purge_pool() == 0
+    assert pool_file.stat().st_ino == inode
+
+    _write(pool_file, [
+        {"job_id": "fresh", "pooled_at": now.isoformat()},
+        {"job_id": "old", "pooled_at": (now - timedelta(hours=72)).isoformat()},
+        {"job_id": "bad", "pooled_at": "not a date"},
+    ])
+    assert scout_queue.purge_pool() == 2
+    assert _ids(scout_queue.read_pool()) == ["fresh"]
+
+    _write(scout_dir / "queue.jsonl", [
+        {"job_id": "new", "enqueued_at": now.isoformat()},
+        {"job_id": "stale", "enqueued_at": (now - timedelta(hours=72)).isoformat()},
+        {"job_id": "undated", "enqueued_at": ""},
+    ])
+    assert scout_queue.purge_stale(max_age_hours=48) == 1
+    assert _ids(scout_queue._read_jsonl(scout_dir / "queue.jsonl")) == ["new", "undated"]
+
+
+def test_chunked_drain_keeps_memory_bounded(scout_dir):
+    description = "x" * 2_000
+    _write(scout_dir / "scored.jsonl", [{"job_id": f"s{index}", "description": description} for index in range(5_000)])
+
+    tracemalloc.start()
+    drained = 0
+    for chunk in scout_queue.iter_scored_chunks(chunk_size=100):
+        drained += len(chunk)
+    _, streaming_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert drained == 5_000
+    # 5k entries of ~2 KB is ~10 MB; a 100-entry chunk is ~200 KB
+    assert streaming_peak < 2 * 1024 * 1024
@@ -1178,3 +1178,49 @@ class TestRunCostSummary:
         assert summary.duration_seconds == 5.5
         assert "layer2" in summary.by_layer
         assert "openai" in summary.by_provider
+
+
+class TestIncrementalAggregates:
+    """Aggregates are maintained on write and raw usages are bounded."""
+
+    def test_ring_buffer_bounds_raw_usages_but_not_totals(self):
+        tracker = TokenTracker(max_usages=5)
+        for i in range(20):
+            tracker.track_usage("openai", "gpt-4o", 1000, 0, run_id="run_1", job_id="job_A")
+
+        assert len(tracker.get_usages()) == 5
+        summary = tracker.get_summary()
+        assert summary.calls_count == 20
+        assert tracker.get_run_summary("run_1").calls_count == 20
+        assert tracker.get_job_cost("job_A") == pytest.approx(summary.total_cost_usd)
+
+    def test_summary_is_a_snapshot(self):
+        tracker = TokenTracker()
+        tracker.track_usage("openai", "gpt-4o", 1000, 500, layer="layer2")
+
+        summary = tracker.get_summary()
+        summary.by_layer["layer2"]["calls"] = 99
+
+        assert tracker.get_summary().by_layer["layer2"]["calls"] == 1
+
+    def test_hourly_and_daily_costs_from_buckets(self):
+        tracker = TokenTracker()
+        tracker.track_usage("openai", "gpt-4o", 1_000_000, 0)
+
+        hourly = tracker.get_hourly_costs(24)
+        daily = tracker.get_daily_costs(7)
+
+        assert len(hourly) == 24 and len(daily) == 7
+        assert hourly[-1]["cost_usd"] == pytest.approx(2.50)
+        assert hourly[-1]["calls"] == 1
+        assert daily[-1]["cost_usd"] == pytest.approx(2.50)
+        assert sum(h["calls"] for h in hourly[:-1]) == 0
+
+    def test_reset_clears_aggregates(self):
+        tracker = TokenTracker()
+        tracker.track_usage("openai", "gpt-4o", 1000, 500, run_id="r", job_id="j")
+        tracker.reset()
+
+        assert tracker.get_summary().calls_count == 0
+        assert tracker.get_runs() == []
+        assert tracker.get_job_cost("j") == 0.0